@@ -0,0 +1,74 @@
+"""
+Micro-benchmark the JSON codecs on real-shaped REST and hub payloads.
+
+Each installed codec encodes and decodes an Order search response, a Bar
+response and a GatewayQuote hub frame; the hub frame is also run through the
+SignalR protocol parser the realtime connections use.
+
+Usage:
+    python benchmarks/bench_codec.py [--iterations N]
+"""
+
+import argparse
+import time
+
+from payloads import envelope, make_bars, make_orders, make_quote
+
+from projectx_sdk import codec
+from projectx_sdk.codec import get_codec
+from projectx_sdk.realtime.connection import CodecHubProtocol
+
+RS = chr(0x1E)
+
+
+def per_call_us(call, iterations):
+    """Return the mean time of ``call`` in microseconds."""
+    for _ in range(min(100, iterations)):
+        call()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        call()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    payloads = {
+        "Order search (50)": envelope(orders=make_orders(50)),
+        "Bars (1000)": envelope(bars=make_bars(1000)),
+        "GatewayQuote": make_quote(),
+    }
+    quote_frame = (
+        get_codec("json")
+        .dumps(
+            {"type": 1, "target": "GatewayQuote", "arguments": ["CON.F.US.ENQ.H25", make_quote()]}
+        )
+        .decode("utf-8")
+        + RS
+    )
+
+    names = ["json"] + [name for name in ("orjson", "msgspec") if getattr(codec, name)]
+    print(f"{'payload':<22}{'codec':<10}{'encode us':>12}{'decode us':>12}")
+    for label, payload in payloads.items():
+        body = get_codec("json").dumps(payload)
+        iterations = args.iterations if len(body) < 50000 else max(1, args.iterations // 20)
+        for name in names:
+            instance = get_codec(name)
+            encode = per_call_us(lambda: instance.dumps(payload), iterations)
+            decode = per_call_us(lambda: instance.loads(body), iterations)
+            print(f"{label:<22}{name:<10}{encode:>12.2f}{decode:>12.2f}")
+
+    print()
+    print(f"{'hub frame':<22}{'codec':<10}{'parse us':>12}")
+    for name in names:
+        protocol = CodecHubProtocol(name)
+        parse = per_call_us(lambda: protocol.parse_messages(quote_frame), args.iterations)
+        print(f"{'GatewayQuote':<22}{name:<10}{parse:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
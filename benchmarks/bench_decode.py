@@ -0,0 +1,90 @@
+"""
+Compare response decoding strategies on large bar and trade payloads.
+
+"dict" is the original path (``response.json()`` followed by
+``Model.model_validate(dict)``); "bytes" validates the raw body directly with
+``Model.model_validate_json`` as ProjectXClient does when a service passes its
+response model. Reports CPU time per decode and the peak memory traced while
+decoding.
+
+Usage:
+    python benchmarks/bench_decode.py [--bars N] [--trades N] [--repeat N]
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+
+from payloads import envelope, make_bars, make_trades
+
+from projectx_sdk.models import BarResponse, TradeSearchResponse
+
+
+def decode_dict(body, model):
+    """Decode through an intermediate dict tree."""
+    return model.model_validate(json.loads(body))
+
+
+def decode_bytes(body, model):
+    """Validate the raw bytes directly."""
+    return model.model_validate_json(body)
+
+
+def cpu_time(decode, body, model, repeat):
+    """Return the best CPU time of ``repeat`` decodes, in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.process_time()
+        decode(body, model)
+        best = min(best, time.process_time() - start)
+    return best * 1e3
+
+
+def peak_memory(decode, body, model):
+    """Return the peak traced allocation of one decode, in MiB."""
+    tracemalloc.start()
+    try:
+        result = decode(body, model)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return peak / (1024 * 1024)
+
+
+def compare(name, body, model, repeat):
+    """Print CPU and memory figures for both strategies."""
+    print(f"{name} ({len(body) / (1024 * 1024):.1f} MiB body)")
+    results = {}
+    for label, decode in (("dict", decode_dict), ("bytes", decode_bytes)):
+        results[label] = (cpu_time(decode, body, model, repeat), peak_memory(decode, body, model))
+        cpu, peak = results[label]
+        print(f"  {label:<6} cpu {cpu:9.1f} ms   peak {peak:8.1f} MiB")
+
+    (dict_cpu, dict_peak), (bytes_cpu, bytes_peak) = results["dict"], results["bytes"]
+    print(
+        f"  saved  cpu {100 * (1 - bytes_cpu / dict_cpu):8.1f} %    "
+        f"peak {100 * (1 - bytes_peak / dict_peak):7.1f} %"
+    )
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--bars", type=int, default=20000)
+    parser.add_argument("--trades", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    bars_body = json.dumps(envelope(bars=make_bars(args.bars))).encode("utf-8")
+    trades_body = json.dumps(envelope(trades=make_trades(args.trades))).encode("utf-8")
+
+    compare(f"BarResponse, {args.bars} bars", bars_body, BarResponse, args.repeat)
+    compare(
+        f"TradeSearchResponse, {args.trades} trades", trades_body, TradeSearchResponse, args.repeat
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+"""
+Compare the HTTP/1.1 session pool with the multiplexed HTTP/2 pool.
+
+A local stand-in gateway, running in its own process, answers
+``History/retrieveBars`` after a fixed delay both over HTTP/1.1 keep-alive and
+over cleartext HTTP/2. Each round issues the same number of concurrent calls
+from a thread pool through one shared client: SessionPool needs a connection
+per call in flight, HTTP2Pool sends them all as streams of one connection.
+Reports the wall time of a cold round (connections opened on demand) and of
+warm rounds, and how many connections each transport opened.
+
+The stand-in speaks cleartext, so a cold round only pays for TCP connects; over
+TLS to the real gateway every extra HTTP/1.1 connection also costs a handshake.
+
+Usage:
+    python benchmarks/bench_http2.py [--calls 100] [--bars 100] [--latency-ms 50] [--rounds 5]
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import h2.config
+import h2.connection
+import h2.events
+from payloads import envelope, make_bars
+
+from projectx_sdk import ProjectXClient
+from projectx_sdk.transport import HTTP2Pool, SessionPool
+
+START = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Keep-alive HTTP/1.1 handler answering every POST after the server's latency."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        """Answer with the canned History/retrieveBars response."""
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        time.sleep(self.server.latency)
+        body = self.server.body
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        """Silence request logging."""
+        pass
+
+
+class StandInServer(ThreadingHTTPServer):
+    """Threaded HTTP/1.1 stand-in server."""
+
+    daemon_threads = True
+    request_queue_size = 512
+
+
+class H2StandIn(asyncio.Protocol):
+    """Cleartext HTTP/2 stand-in connection answering every request after a delay."""
+
+    def __init__(self, latency, body):
+        """Set up the connection state machine."""
+        config = h2.config.H2Configuration(client_side=False)
+        self.conn = h2.connection.H2Connection(config=config)
+        self.latency = latency
+        self.body = body
+        self.window_open = asyncio.Event()
+
+    def connection_made(self, transport):
+        """Send the server preface."""
+        self.transport = transport
+        self.conn.initiate_connection()
+        transport.write(self.conn.data_to_send())
+
+    def data_received(self, data):
+        """Answer each request once its body is complete."""
+        for event in self.conn.receive_data(data):
+            if isinstance(event, h2.events.DataReceived):
+                self.conn.acknowledge_received_data(event.flow_controlled_length, event.stream_id)
+            elif isinstance(event, h2.events.StreamEnded):
+                asyncio.ensure_future(self.respond(event.stream_id))
+            elif isinstance(event, h2.events.WindowUpdated):
+                self.window_open.set()
+        self.transport.write(self.conn.data_to_send())
+
+    async def respond(self, stream_id):
+        """Send the canned response, respecting flow control."""
+        await asyncio.sleep(self.latency)
+        self.conn.send_headers(
+            stream_id,
+            [
+                (":status", "200"),
+                ("content-type", "application/json"),
+                ("content-length", str(len(self.body))),
+            ],
+        )
+        body = self.body
+        while body:
+            size = min(
+                self.conn.local_flow_control_window(stream_id),
+                self.conn.max_outbound_frame_size,
+                len(body),
+            )
+            if size <= 0:
+                self.window_open.clear()
+                await self.window_open.wait()
+                continue
+            self.conn.send_data(stream_id, body[:size], end_stream=size == len(body))
+            body = body[size:]
+            self.transport.write(self.conn.data_to_send())
+        self.transport.write(self.conn.data_to_send())
+
+
+def serve(latency, bars, port_queue):
+    """Run both stand-in servers, reporting their ports through ``port_queue``."""
+    body = json.dumps(envelope(bars=make_bars(bars))).encode("utf-8")
+
+    http1 = StandInServer(("127.0.0.1", 0), StandInHandler)
+    http1.latency = latency
+    http1.body = body
+    threading.Thread(target=http1.serve_forever, daemon=True).start()
+
+    loop = asyncio.new_event_loop()
+    http2 = loop.run_until_complete(
+        loop.create_server(lambda: H2StandIn(latency, body), "127.0.0.1", 0)
+    )
+    port_queue.put((http1.server_address[1], http2.sockets[0].getsockname()[1]))
+    loop.run_forever()
+
+
+def run_round(client, calls):
+    """Issue ``calls`` concurrent retrieve_bars calls; return the wall time."""
+    with ThreadPoolExecutor(max_workers=calls) as executor:
+        started = time.perf_counter()
+        results = list(
+            executor.map(
+                lambda _: client.history.retrieve_bars("CON.F.US.ENQ.H25", START, START),
+                range(calls),
+            )
+        )
+        elapsed = time.perf_counter() - started
+    assert len(results) == calls
+    return elapsed
+
+
+def measure(name, port, transport, calls, rounds):
+    """Print the cold and warm round times of one transport."""
+    client = ProjectXClient(
+        token="bench-token",
+        base_url=f"http://127.0.0.1:{port}",
+        transport=transport,
+        rate_limiter=False,
+        retry_policy=False,
+    )
+    try:
+        cold = run_round(client, calls)
+        warm = statistics.median(run_round(client, calls) for _ in range(rounds))
+        stats = transport.stats()
+    finally:
+        client.close()
+
+    connections = stats.get("new_connections", stats.get("open_connections"))
+    print(f"{name:10s} {cold * 1000:10.1f} ms {warm * 1000:10.1f} ms {connections:12d}")
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--calls", type=int, default=100, help="concurrent calls per round")
+    parser.add_argument("--bars", type=int, default=100, help="bars per response")
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--rounds", type=int, default=5, help="warm rounds (median reported)")
+    args = parser.parse_args()
+
+    port_queue: multiprocessing.Queue = multiprocessing.Queue()
+    server = multiprocessing.Process(
+        target=serve, args=(args.latency_ms / 1000, args.bars, port_queue), daemon=True
+    )
+    server.start()
+    http1_port, http2_port = port_queue.get(timeout=10)
+
+    print(
+        f"{args.calls} concurrent History/retrieveBars calls, {args.bars} bars each, "
+        f"{args.latency_ms:.1f} ms server latency"
+    )
+    print(f"{'transport':10s} {'cold':>13s} {'warm':>13s} {'connections':>12s}")
+    try:
+        measure(
+            "HTTP/1.1",
+            http1_port,
+            SessionPool(max_connections_per_host=args.calls),
+            args.calls,
+            args.rounds,
+        )
+        measure(
+            "HTTP/2",
+            http2_port,
+            HTTP2Pool(prior_knowledge=True, max_bulk_streams=args.calls),
+            args.calls,
+            args.rounds,
+        )
+    finally:
+        server.terminate()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Benchmark the SDK's own per-call overhead without a network.
+
+Every call goes through the full ProjectXClient stack (token handling, URL
+building, JSON, error mapping and pydantic validation), but is answered by an
+in-process FakeTransport, so the numbers are reproducible offline.
+
+Usage:
+    python benchmarks/bench_sdk_overhead.py [--iterations N]
+"""
+
+import argparse
+import statistics
+import time
+from datetime import datetime, timedelta, timezone
+
+from payloads import envelope, make_bars, make_orders, make_positions
+
+from projectx_sdk import OrderSide, OrderType, ProjectXClient
+from projectx_sdk.transport import FakeTransport
+
+
+def build_client():
+    """Build a client whose transport answers from canned payloads."""
+    fake = FakeTransport(
+        routes={
+            "Order/place": envelope(orderId=123456),
+            "Order/searchOpen": envelope(orders=make_orders(20)),
+            "Position/searchOpen": envelope(positions=make_positions(5)),
+            "History/retrieveBars": envelope(bars=make_bars(1000)),
+        }
+    )
+    return ProjectXClient(username="bench", api_key="bench", transport=fake)
+
+
+def measure(name, call, iterations):
+    """Run ``call`` repeatedly and print latency percentiles and throughput."""
+    for _ in range(min(50, iterations)):
+        call()
+
+    samples = []
+    started = time.perf_counter()
+    for _ in range(iterations):
+        t0 = time.perf_counter()
+        call()
+        samples.append(time.perf_counter() - t0)
+    elapsed = time.perf_counter() - started
+
+    samples.sort()
+    p50 = samples[len(samples) // 2] * 1e6
+    p99 = samples[int(len(samples) * 0.99) - 1] * 1e6
+    print(
+        f"{name:<32} p50 {p50:9.1f} us   p99 {p99:9.1f} us   "
+        f"mean {statistics.mean(samples) * 1e6:9.1f} us   {iterations / elapsed:10.0f} calls/s"
+    )
+
+
+def main():
+    """Run the benchmark suite."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    client = build_client()
+    end = datetime(2025, 1, 3, tzinfo=timezone.utc)
+    start = end - timedelta(days=1)
+
+    measure(
+        "orders.place",
+        lambda: client.orders.place(1, "CON.F.US.ENQ.H25", OrderType.MARKET, OrderSide.BUY, 1),
+        args.iterations,
+    )
+    measure("orders.search_open (20)", lambda: client.orders.search_open(1), args.iterations)
+    measure("positions.search_open (5)", lambda: client.positions.search_open(1), args.iterations)
+    measure(
+        "history.retrieve_bars (1000)",
+        lambda: client.history.retrieve_bars("CON.F.US.ENQ.H25", start, end),
+        max(1, args.iterations // 20),
+    )
+
+
+if __name__ == "__main__":
+    main()
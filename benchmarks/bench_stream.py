@@ -0,0 +1,76 @@
+"""
+Compare buffered and streamed decoding of a large bar response.
+
+"buffered" is ``history.retrieve_bars``, which validates the whole body into a
+list of Bar models; "streamed" is ``history.stream_bars``, which decodes bars
+incrementally while the body is read in 64 KiB chunks and lets each one go once
+it has been consumed. Reports wall time and the peak memory traced while
+iterating over every bar.
+
+Usage:
+    python benchmarks/bench_stream.py [--bars N ...]
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+from payloads import envelope, make_bars
+
+from projectx_sdk import ProjectXClient
+from projectx_sdk.transport import FakeTransport, TransportResponse
+
+START = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def buffered(client):
+    """Retrieve every bar at once."""
+    for _ in client.history.retrieve_bars("CON.F.US.ENQ.H25", START, START, limit=0):
+        pass
+
+
+def streamed(client):
+    """Stream bars one by one."""
+    for _ in client.history.stream_bars("CON.F.US.ENQ.H25", START, START, limit=0):
+        pass
+
+
+def measure(consume, client):
+    """Return the wall time in ms and the peak traced allocation in MiB."""
+    tracemalloc.start()
+    try:
+        start = time.perf_counter()
+        consume(client)
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return elapsed * 1e3, peak / (1024 * 1024)
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--bars", type=int, nargs="+", default=[10000, 50000, 200000])
+    args = parser.parse_args()
+
+    for count in args.bars:
+        # The body is built before tracing starts, as if it were arriving from the socket
+        body = json.dumps(envelope(bars=make_bars(count))).encode("utf-8")
+        response = TransportResponse(content=body, headers={"Content-Type": "application/json"})
+        client = ProjectXClient(
+            token="bench-token",
+            transport=FakeTransport(routes={"History/retrieveBars": response}),
+            rate_limiter=False,
+        )
+
+        print(f"{count} bars ({len(body) / (1024 * 1024):.1f} MiB body)")
+        for label, consume in (("buffered", buffered), ("streamed", streamed)):
+            elapsed, peak = measure(consume, client)
+            print(f"  {label:<9} {elapsed:9.1f} ms   peak {peak:8.2f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+Benchmark throughput of one ProjectXClient shared by a growing number of threads.
+
+A local keep-alive HTTP server, running in its own process so it does not compete
+for the GIL, stands in for the gateway and answers every call after a fixed
+delay, as a network round trip would. Each thread count issues the same number
+of calls per thread through a single shared client; with the client being
+thread-safe and the session pool large enough, throughput grows linearly with
+the threads until the client's CPU time per call (about 1 ms with requests and
+pydantic, serialized by the GIL) becomes the limit.
+
+Usage:
+    python benchmarks/bench_threads.py [--threads 1,2,4,8,16,32] [--calls 20] [--latency-ms 50]
+"""
+
+import argparse
+import json
+import multiprocessing
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from payloads import envelope, make_positions
+
+from projectx_sdk import ProjectXClient
+from projectx_sdk.transport import SessionPool
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Keep-alive handler answering every POST after the server's latency."""
+
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately; avoid Nagle/delayed-ACK stalls
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        """Answer with a canned Position/searchOpen response."""
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        time.sleep(self.server.latency)
+        body = self.server.body
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        """Silence request logging."""
+        pass
+
+
+class StandInServer(ThreadingHTTPServer):
+    """Threaded stand-in server."""
+
+    daemon_threads = True
+    request_queue_size = 256
+
+
+def serve(latency, port_queue):
+    """Run the stand-in server, reporting its port through ``port_queue``."""
+    server = StandInServer(("127.0.0.1", 0), StandInHandler)
+    server.latency = latency
+    server.body = json.dumps(envelope(positions=make_positions(5))).encode("utf-8")
+    port_queue.put(server.server_address[1])
+    server.serve_forever()
+
+
+def run(client, threads, calls):
+    """Issue ``calls`` requests from each of ``threads`` threads; return calls per second."""
+    barrier = threading.Barrier(threads + 1)
+
+    def worker():
+        barrier.wait()
+        for _ in range(calls):
+            client.positions.search_open(7)
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    for worker_thread in workers:
+        worker_thread.start()
+    barrier.wait()
+    started = time.perf_counter()
+    for worker_thread in workers:
+        worker_thread.join()
+    return threads * calls / (time.perf_counter() - started)
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--threads", default="1,2,4,8,16,32")
+    parser.add_argument("--calls", type=int, default=20, help="calls per thread")
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    args = parser.parse_args()
+    thread_counts = [int(n) for n in args.threads.split(",")]
+
+    port_queue: multiprocessing.Queue = multiprocessing.Queue()
+    server = multiprocessing.Process(
+        target=serve, args=(args.latency_ms / 1000, port_queue), daemon=True
+    )
+    server.start()
+    port = port_queue.get(timeout=10)
+
+    # One pooled connection per thread; rate limiting off to measure the client itself
+    client = ProjectXClient(
+        token="bench-token",
+        base_url=f"http://127.0.0.1:{port}",
+        transport=SessionPool(max_connections_per_host=max(thread_counts)),
+        rate_limiter=False,
+    )
+
+    print(f"{args.calls} calls per thread, {args.latency_ms:.1f} ms server latency")
+    baseline = None
+    try:
+        for threads in thread_counts:
+            run(client, threads, min(args.calls, 5))  # warm up the pooled connections
+            throughput = run(client, threads, args.calls)
+            baseline = baseline or throughput / threads
+            efficiency = throughput / (baseline * threads)
+            print(
+                f"{threads:3d} threads {throughput:10.0f} calls/s   "
+                f"speedup {throughput / baseline:5.1f}x   efficiency {efficiency:6.1%}"
+            )
+    finally:
+        client.close()
+        server.terminate()
+
+
+if __name__ == "__main__":
+    main()
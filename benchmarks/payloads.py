@@ -0,0 +1,107 @@
+"""Real-shaped ProjectX Gateway payloads shared by the benchmark scripts."""
+
+from datetime import datetime, timedelta, timezone
+
+_START = datetime(2025, 1, 2, 14, 30, tzinfo=timezone.utc)
+
+
+def envelope(**fields):
+    """Wrap fields in the gateway's success envelope."""
+    return {"success": True, "errorCode": 0, "errorMessage": None, **fields}
+
+
+def make_bars(count):
+    """Build ``count`` one-minute OHLCV bars."""
+    bars = []
+    price = 21500.0
+    for i in range(count):
+        bars.append(
+            {
+                "t": (_START + timedelta(minutes=i)).isoformat(),
+                "o": price,
+                "h": price + 2.5,
+                "l": price - 1.75,
+                "c": price + 0.5,
+                "v": 1000 + i % 500,
+            }
+        )
+        price += 0.25 if i % 3 else -0.5
+    return bars
+
+
+def make_trades(count, account_id=1):
+    """Build ``count`` executed trades."""
+    return [
+        {
+            "id": 100000 + i,
+            "accountId": account_id,
+            "contractId": "CON.F.US.ENQ.H25",
+            "creationTimestamp": (_START + timedelta(seconds=i)).isoformat(),
+            "price": 21500.0 + (i % 40) * 0.25,
+            "profitAndLoss": None if i % 2 else 12.5,
+            "fees": 1.34,
+            "side": i % 2,
+            "size": 1 + i % 3,
+            "voided": False,
+            "orderId": 500000 + i,
+        }
+        for i in range(count)
+    ]
+
+
+def make_orders(count, account_id=1):
+    """Build ``count`` working orders."""
+    return [
+        {
+            "id": 500000 + i,
+            "accountId": account_id,
+            "contractId": "CON.F.US.ENQ.H25",
+            "creationTimestamp": (_START + timedelta(seconds=i)).isoformat(),
+            "updateTimestamp": (_START + timedelta(seconds=i + 1)).isoformat(),
+            "status": 1,
+            "type": 1,
+            "side": i % 2,
+            "size": 1,
+            "limitPrice": 21500.0 + (i % 40) * 0.25,
+            "stopPrice": None,
+            "trailPrice": None,
+            "customTag": f"strategy-a-{i}",
+            "linkedOrderId": None,
+        }
+        for i in range(count)
+    ]
+
+
+def make_positions(count, account_id=1):
+    """Build ``count`` open positions."""
+    return [
+        {
+            "id": 9000 + i,
+            "accountId": account_id,
+            "contractId": "CON.F.US.ENQ.H25",
+            "creationTimestamp": (_START + timedelta(seconds=i)).isoformat(),
+            "type": 1,
+            "size": 1 + i % 4,
+            "averagePrice": 21500.0 + i * 0.25,
+        }
+        for i in range(count)
+    ]
+
+
+def make_quote(contract_id="CON.F.US.ENQ.H25"):
+    """Build a GatewayQuote hub payload."""
+    return {
+        "symbol": "F.US.ENQ",
+        "symbolName": "/NQ",
+        "lastPrice": 21500.25,
+        "bestBid": 21500.0,
+        "bestAsk": 21500.25,
+        "change": 35.5,
+        "changePercent": 0.0016,
+        "open": 21460.0,
+        "high": 21520.75,
+        "low": 21441.5,
+        "volume": 183211,
+        "lastUpdated": _START.isoformat(),
+        "timestamp": _START.isoformat(),
+    }
@@ -6,11 +6,15 @@ A Python client library for interacting with the ProjectX Gateway API.
 
 __version__ = "0.1.0"
 
+from projectx_sdk.async_client import AsyncProjectXClient
 from projectx_sdk.client import ProjectXClient
 from projectx_sdk.endpoints.history import TimeUnit
 from projectx_sdk.exceptions import (
     AuthenticationError,
+    CircuitOpenError,
+    DeadlineExceededError,
     ProjectXError,
+    RateLimitError,
     RequestError,
     ResourceNotFoundError,
 )
@@ -19,12 +23,16 @@ from projectx_sdk.utils.constants import OrderSide, OrderType
 
 __all__ = [
     "ProjectXClient",
+    "AsyncProjectXClient",
     "RealTimeClient",
     "OrderType",
     "OrderSide",
     "TimeUnit",
     "ProjectXError",
     "AuthenticationError",
+    "CircuitOpenError",
+    "DeadlineExceededError",
+    "RateLimitError",
     "RequestError",
     "ResourceNotFoundError",
 ]
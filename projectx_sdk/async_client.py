@@ -0,0 +1,751 @@
+"""Asyncio client for ProjectX Gateway API."""
+
+import asyncio
+import logging
+import socket
+import time
+from typing import Any, AsyncIterator, Dict, Optional, Type, Union
+
+import pydantic
+import requests
+
+from projectx_sdk.auth import Authenticator
+from projectx_sdk.cache import ResponseCache
+from projectx_sdk.circuit import CircuitBreaker
+from projectx_sdk.client import (
+    ProjectXClient,
+    _check_status,
+    _check_success,
+    _encode_body,
+    _normalize_path,
+    _parse_model_response,
+    _parse_response,
+    _resolve_cache,
+    _resolve_circuit_breaker,
+    _resolve_hedge_policy,
+    _resolve_rate_limiter,
+    _resolve_retry_policy,
+    _resolve_token_cache,
+    _retry_after,
+    _warm_up_hosts,
+)
+from projectx_sdk.coalesce import AsyncSingleFlight, request_key
+from projectx_sdk.codec import JSONCodec, get_codec
+from projectx_sdk.deadline import Deadline, resolve_deadline
+from projectx_sdk.endpoints import (
+    AsyncAccountService,
+    AsyncContractService,
+    AsyncHistoryService,
+    AsyncOrderService,
+    AsyncPositionService,
+    AsyncTradeService,
+)
+from projectx_sdk.exceptions import DeadlineExceededError, ProjectXError, RequestError
+from projectx_sdk.hedge import HedgePolicy
+from projectx_sdk.hooks import RequestEvent, RequestHooks
+from projectx_sdk.metrics import MetricsSetting, resolve_metrics
+from projectx_sdk.ratelimit import RateLimiter
+from projectx_sdk.realtime import RealTimeClient
+from projectx_sdk.retry import RetryPolicy, RetrySetting, resolve_policy
+from projectx_sdk.streaming import JSONArrayStream
+from projectx_sdk.token_cache import TokenCache
+from projectx_sdk.tracing import Tracer, trace
+from projectx_sdk.transport import AsyncSessionPool, AsyncTransport
+
+from projectx_sdk.models.base import BaseResponse
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncProjectXClient:
+    """
+    Asyncio client for interacting with the ProjectX Gateway API.
+
+    Mirrors ProjectXClient, but every service method is a coroutine and all
+    requests share one pooled async HTTP transport, so a single event loop can
+    keep many REST calls in flight at once::
+
+        async with AsyncProjectXClient(username="...", api_key="...") as client:
+            positions, orders = await asyncio.gather(
+                client.positions.search_open(account_id),
+                client.orders.search_open(account_id),
+            )
+
+    Requires httpx (``pip install projectx-sdk[async]``).
+    """
+
+    ENVIRONMENT_URLS = ProjectXClient.ENVIRONMENT_URLS
+    USER_HUB_URLS = ProjectXClient.USER_HUB_URLS
+    MARKET_HUB_URLS = ProjectXClient.MARKET_HUB_URLS
+
+    def __init__(
+        self,
+        username: Optional[str] = None,
+        api_key: Optional[str] = None,
+        password: Optional[str] = None,
+        device_id: Optional[str] = None,
+        app_id: Optional[str] = None,
+        verify_key: Optional[str] = None,
+        environment: str = "demo",
+        token: Optional[str] = None,
+        base_url: Optional[str] = None,
+        timeout: int = 30,
+        transport: Optional[AsyncTransport] = None,
+        codec: Union[str, JSONCodec, None] = None,
+        rate_limiter: Union[RateLimiter, bool, None] = None,
+        retry_policy: Union[RetryPolicy, bool, None] = None,
+        coalesce: Union[AsyncSingleFlight, bool, None] = None,
+        cache: Union[ResponseCache, bool, None] = None,
+        circuit_breaker: Union[CircuitBreaker, bool, None] = None,
+        hedge_policy: Union[HedgePolicy, bool, None] = None,
+        hooks: Optional[RequestHooks] = None,
+        metrics: MetricsSetting = None,
+        tracer: Optional[Tracer] = None,
+        auto_refresh: bool = False,
+        token_cache: Union[TokenCache, bool, None] = None,
+    ):
+        """
+        Initialize a new asyncio ProjectX client.
+
+        Accepts the same authentication methods as ProjectXClient. The initial
+        login (if credentials are given) happens synchronously in the constructor;
+        later token renewals run in the default executor so they never block
+        the event loop.
+
+        Args:
+            username: User's username
+            api_key: User's API key (for API key auth)
+            password: User's password (for application auth)
+            device_id: Device ID (for application auth)
+            app_id: Application ID (for application auth)
+            verify_key: Verification key (for application auth)
+            environment: Environment name (e.g., 'topstepx', 'demo', etc.)
+            token: Existing auth token (if you already have one)
+            base_url: Override the base URL (if not using an environment)
+            timeout: Request timeout in seconds
+            transport: Async transport shared by all services. A default
+                keep-alive AsyncSessionPool is created if not provided.
+                close() only closes a transport the client created.
+            codec: JSON codec for request and response bodies and real-time hub
+                frames (see ProjectXClient)
+            rate_limiter: Client-side rate limiter (see ProjectXClient). Waits
+                are awaited, so a throttled family never blocks the event loop.
+            retry_policy: Retry policy for failed requests (see ProjectXClient).
+                Backoff delays are awaited; the policy's ``sleep`` is not used.
+            coalesce: Share one network call between identical read-only requests
+                awaited concurrently (see ProjectXClient). Pass True or an
+                AsyncSingleFlight to enable; off by default.
+            cache: Response cache for reference data (see ProjectXClient)
+            circuit_breaker: Per-endpoint-family circuit breaker (see ProjectXClient)
+            hedge_policy: Hedging of slow latency-critical reads (see
+                ProjectXClient). The losing attempt is cancelled.
+            hooks: Request lifecycle hooks (see ProjectXClient). Hooks are plain
+                functions run inline on the event loop.
+            metrics: Metrics registry for requests, real-time and token refreshes
+                (see ProjectXClient)
+            tracer: Tracer recording spans (see ProjectXClient). Spans follow
+                the task that started them.
+            auto_refresh: Renew the token ahead of its expiry from a background
+                task, started with the first request, so requests never wait
+                for a renewal. Cancelled by ``close()``.
+            token_cache: On-disk token cache shared by the processes of the
+                host (see ProjectXClient)
+        """
+        # Set up the base URL
+        if base_url:
+            self.base_url = base_url
+        elif environment in self.ENVIRONMENT_URLS:
+            self.base_url = self.ENVIRONMENT_URLS[environment]
+        else:
+            raise ValueError(f"Unknown environment: {environment}. Use base_url parameter instead.")
+
+        self.environment = environment
+        self.timeout = timeout
+        self.codec = get_codec(codec)
+        self.rate_limiter = _resolve_rate_limiter(rate_limiter)
+        self.retry_policy = _resolve_retry_policy(retry_policy)
+        self.coalescer = AsyncSingleFlight() if coalesce is True else (coalesce or None)
+        self.cache = _resolve_cache(cache)
+        self.circuit_breaker = _resolve_circuit_breaker(circuit_breaker)
+        self.hedge_policy = _resolve_hedge_policy(hedge_policy)
+        self.hooks = hooks or RequestHooks()
+        self.metrics = resolve_metrics(metrics)
+        self.tracer = tracer
+
+        # Pooled keep-alive connections shared by every service
+        self._owns_transport = transport is None
+        self.transport = transport or AsyncSessionPool()
+
+        # Set up the authenticator
+        self.auth = Authenticator(
+            base_url=self.base_url,
+            username=username,
+            api_key=api_key,
+            password=password,
+            device_id=device_id,
+            app_id=app_id,
+            verify_key=verify_key,
+            token=token,
+            timeout=timeout,
+            metrics=self.metrics,
+            tracer=tracer,
+            token_cache=_resolve_token_cache(token_cache),
+        )
+
+        # Initialize service endpoints
+        self.accounts = AsyncAccountService(self)
+        self.contracts = AsyncContractService(self)
+        self.history = AsyncHistoryService(self)
+        self.orders = AsyncOrderService(self)
+        self.positions = AsyncPositionService(self)
+        self.trades = AsyncTradeService(self)
+
+        # Real-time client (lazy-initialized)
+        self._realtime: Optional[RealTimeClient] = None
+
+        # Background connection warming (see warm_up)
+        self._keep_warm: Optional[asyncio.Task] = None
+
+        # Background token renewal (see auto_refresh)
+        self.auto_refresh = auto_refresh
+        self._refresher: Optional[asyncio.Task] = None
+
+    @property
+    def realtime(self) -> RealTimeClient:
+        """
+        Get the asyncio real-time client for WebSocket connections.
+
+        This is lazy-initialized on first access and must be started with
+        ``await client.realtime.start()``. Hub callbacks run on the same event
+        loop, so they can schedule service calls such as
+        ``client.orders.place(...)`` directly.
+
+        Returns:
+            The real-time client
+        """
+        if not self._realtime:
+            self._realtime = RealTimeClient(
+                auth_token=self.auth.get_token(),
+                environment=self.environment,
+                user_hub_url=self.USER_HUB_URLS.get(self.environment),
+                market_hub_url=self.MARKET_HUB_URLS.get(self.environment),
+                codec=self.codec,
+                on_account_update=self.cache.on_account_update if self.cache else None,
+                metrics=self.metrics,
+                tracer=self.tracer,
+            )
+        return self._realtime
+
+    async def _get_token(self, deadline: Optional[Deadline] = None) -> str:
+        """Get a valid token, renewing it off the event loop if necessary."""
+        if self.auto_refresh and self._refresher is None:
+            self.auth.background_refresh = True
+            self._refresher = asyncio.create_task(self._run_refresher())
+
+        token: str
+        if self.auth.needs_refresh():
+            loop = asyncio.get_running_loop()
+            token = await loop.run_in_executor(None, self.auth.get_token, deadline)
+        else:
+            token = self.auth.get_token()
+        return token
+
+    async def _send_bounded(self, deadline: Optional[Deadline], path: str, **kwargs) -> Any:
+        """Send a request over the transport, giving up when the deadline passes."""
+        if deadline is None:
+            try:
+                return await self.transport.request(**kwargs)
+            except requests.RequestException as e:
+                raise RequestError(f"Request failed: {str(e)}") from e
+
+        kwargs["timeout"] = deadline.limit(kwargs.get("timeout"), path)
+        try:
+            return await asyncio.wait_for(self.transport.request(**kwargs), deadline.remaining())
+        except asyncio.TimeoutError as e:
+            raise deadline.exceeded(path) from e
+        except requests.RequestException as e:
+            if isinstance(e, requests.Timeout) and deadline.expired:
+                raise deadline.exceeded(path) from e
+            raise RequestError(f"Request failed: {str(e)}") from e
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[int] = None,
+        response_model: Optional[Type[BaseResponse]] = None,
+        retry: RetrySetting = None,
+        idempotent: bool = False,
+        deadline: Optional[Deadline] = None,
+    ) -> Any:
+        """
+        Make an HTTP request to the API.
+
+        Args:
+            method: HTTP method ('GET', 'POST', etc.)
+            path: API path (will be appended to base URL)
+            params: Query parameters
+            data: Request body (form data)
+            json: Request body (JSON data)
+            headers: Additional headers
+            timeout: Request timeout (overrides client timeout)
+            response_model: Response model to validate the raw body into. When
+                given, the validated model is returned instead of a dict.
+            retry: Retry policy for this call (overrides the client's policy), or
+                False to disable retries
+            idempotent: Whether a mutating call is safe to retry (e.g. because it
+                carries a unique custom tag)
+            deadline: Deadline for the whole call, including token refresh,
+                rate limiting and retries (the earlier of it and the active
+                deadline applies)
+
+        Returns:
+            The parsed JSON response, or an instance of ``response_model``
+
+        Raises:
+            AuthenticationError: If authentication fails
+            RateLimitError: If the request was rate limited
+            DeadlineExceededError: If the deadline passes before the call completes
+            RequestError: If the request fails
+            ResourceNotFoundError: If the resource is not found
+            ProjectXError: For other API errors
+        """
+        path = _normalize_path(path)
+        request_headers = {"Accept": "application/json"}
+
+        if headers:
+            request_headers.update(headers)
+
+        request_timeout = timeout if timeout is not None else self.timeout
+        payload = json
+        body, json = _encode_body(self.codec, data, json, request_headers)
+        policy = resolve_policy(self.retry_policy, retry)
+        deadline = resolve_deadline(deadline)
+
+        def execute():
+            return self._execute(
+                method,
+                path,
+                params,
+                body,
+                json,
+                request_headers,
+                request_timeout,
+                response_model,
+                policy,
+                idempotent,
+                deadline,
+            )
+
+        # Only plain read requests may be cached or coalesced (see ProjectXClient.request)
+        if headers or data is not None or method.upper() not in ("GET", "POST"):
+            return await execute()
+
+        key = request_key(method, path, params, payload, response_model)
+        cache = self.cache if self.cache is not None and self.cache.ttl_for(path) else None
+        if cache is not None:
+            hit, value = cache.get(key)
+            if hit:
+                return value
+
+        coalescer = self.coalescer
+        if coalescer is not None and coalescer.applies_to(method, path):
+            result = await coalescer.do(key, execute, deadline)
+        else:
+            result = await execute()
+
+        if cache is not None:
+            cache.set(key, path, result)
+        return result
+
+    async def _execute(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]],
+        body: Any,
+        json: Optional[Dict[str, Any]],
+        headers: Dict[str, str],
+        timeout: Optional[int],
+        response_model: Optional[Type[BaseResponse]],
+        policy: Optional[RetryPolicy],
+        idempotent: bool,
+        deadline: Optional[Deadline] = None,
+    ) -> Any:
+        """Send a request, retrying failed attempts as the policy allows."""
+        if policy is not None:
+            policy.start()
+
+        def send():
+            return self._send(
+                method, path, params, body, json, headers, timeout, response_model, deadline
+            )
+
+        hedge = self.hedge_policy
+        if hedge is not None and not hedge.applies_to(method, path):
+            hedge = None
+
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                if hedge is not None:
+                    return await hedge.acall(path, send)
+                return await send()
+            except DeadlineExceededError:
+                raise
+            except ProjectXError as e:
+                delay = policy.next_delay(path, attempt, e, idempotent) if policy else None
+                if delay is None:
+                    e.attempts = attempt
+                    raise
+                # Give up now rather than sleep past the deadline
+                if deadline is not None and delay >= deadline.remaining():
+                    raise deadline.exceeded(f"retry of {path}") from e
+                await asyncio.sleep(delay)
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]],
+        body: Any,
+        json: Optional[Dict[str, Any]],
+        headers: Dict[str, str],
+        timeout: Optional[float],
+        response_model: Optional[Type[BaseResponse]],
+        deadline: Optional[Deadline] = None,
+    ) -> Any:
+        """Make a single attempt of a request (see request)."""
+        event = RequestEvent(method, path, len(body) if isinstance(body, (bytes, str)) else 0)
+        self.hooks.emit_before(event)
+        span = trace(self.tracer, f"{method} {path}", {"endpoint": path})
+
+        breaker = self.circuit_breaker
+        admission = None
+        started: Optional[float] = None
+        error: Optional[BaseException] = None
+
+        try:
+            # An attempt that cannot finish in time is not admitted by the breaker
+            if deadline is not None:
+                deadline.check(path)
+
+            # Make sure we have a token
+            token = await self._get_token(deadline)
+
+            url = f"{self.base_url}/api/{path}"
+            request_headers = {**headers, "Authorization": f"Bearer {token}"}
+            event.lap("token")
+
+            if self.rate_limiter is not None:
+                wait = self.rate_limiter.reserve(path, deadline)
+                if wait > 0:
+                    await asyncio.sleep(wait)
+
+            event.lap("rate_limit")
+
+            if deadline is not None:
+                timeout = deadline.limit(timeout, path)
+
+            # Fail fast while the endpoint family's circuit is open. Admitted only
+            # now, so that client-side failures above (token, rate limiter,
+            # deadline) are never recorded as outcomes of a gateway call.
+            if breaker is not None:
+                admission = breaker.before(path)
+                started = breaker.clock()
+
+            response = await self._send_bounded(
+                deadline,
+                path,
+                method=method,
+                url=url,
+                params=params,
+                data=body,
+                json=json,
+                headers=request_headers,
+                timeout=timeout,
+            )
+            event.record_response(response)
+
+            if self.rate_limiter is not None:
+                self.rate_limiter.record(path, response.status_code, _retry_after(response))
+
+            if response_model is not None:
+                model = _parse_model_response(response, path, response_model, self.codec)
+                event.lap("validate")
+                return model
+            data = _parse_response(response, path, self.codec)
+            event.lap("decode")
+            return data
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            if breaker is not None:
+                if isinstance(error, asyncio.CancelledError):
+                    # A cancelled call says nothing about the gateway
+                    breaker.release(admission)
+                else:
+                    # Only the round trip counts towards latency, not client-side waits
+                    duration = breaker.clock() - started if started is not None else 0.0
+                    breaker.after(admission, duration, error)
+
+            event.finish(error)
+            if self.metrics is not None:
+                self.metrics.observe_request(event)
+            if error is None:
+                self.hooks.emit_after(event)
+            else:
+                self.hooks.emit_error(event)
+            span.record_request(event)
+            span.end(error)
+
+    async def stream(
+        self,
+        method: str,
+        path: str,
+        key: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        timeout: Optional[int] = None,
+        item_model: Optional[Type[pydantic.BaseModel]] = None,
+        chunk_size: int = 65536,
+        deadline: Optional[Deadline] = None,
+    ) -> AsyncIterator[Any]:
+        """
+        Make an HTTP request and parse one list of its response incrementally.
+
+        The asyncio counterpart of ProjectXClient.stream; use it with ``async for``.
+
+        Args:
+            method: HTTP method ('GET', 'POST', etc.)
+            path: API path (will be appended to base URL)
+            key: Name of the top-level array to stream
+            params: Query parameters
+            json: Request body (JSON data)
+            timeout: Request timeout (overrides client timeout)
+            item_model: Model to validate each element into (dicts if not provided)
+            chunk_size: Bytes read from the connection at a time
+            deadline: Deadline for reading the whole response (the earlier of
+                it and the deadline active when iteration starts applies)
+
+        Yields:
+            Each element of the array, as a dict or an ``item_model`` instance
+
+        Raises:
+            AuthenticationError: If authentication fails
+            RateLimitError: If the request was rate limited
+            DeadlineExceededError: If the deadline passes before the body is read
+            RequestError: If the request fails or the body is not valid JSON
+            ResourceNotFoundError: If the resource is not found
+            ProjectXError: For other API errors
+        """
+        path = _normalize_path(path)
+        request_headers = {"Accept": "application/json"}
+        request_timeout = timeout if timeout is not None else self.timeout
+        body, json = _encode_body(self.codec, None, json, request_headers)
+        deadline = resolve_deadline(deadline)
+
+        token = await self._get_token(deadline)
+        request_headers["Authorization"] = f"Bearer {token}"
+
+        if self.rate_limiter is not None:
+            wait = self.rate_limiter.reserve(path, deadline)
+            if wait > 0:
+                await asyncio.sleep(wait)
+
+        response = await self._send_bounded(
+            deadline,
+            path,
+            method=method,
+            url=f"{self.base_url}/api/{path}",
+            params=params,
+            data=body,
+            json=json,
+            headers=request_headers,
+            timeout=request_timeout,
+            stream=True,
+        )
+
+        try:
+            if self.rate_limiter is not None:
+                self.rate_limiter.record(path, response.status_code, _retry_after(response))
+            if response.status_code >= 400 and hasattr(response, "aread"):
+                await response.aread()
+            _check_status(response, path, self.codec)
+
+            parser = JSONArrayStream(key)
+            chunks = response.aiter_bytes(chunk_size)
+            while not parser.done:
+                try:
+                    if deadline is None:
+                        chunk = await chunks.__anext__()
+                    else:
+                        chunk = await asyncio.wait_for(
+                            chunks.__anext__(), deadline.limit(None, path)
+                        )
+                except StopAsyncIteration:
+                    chunk = None
+                except asyncio.TimeoutError as e:
+                    raise deadline.exceeded(path) from e  # type: ignore[union-attr]
+                except requests.RequestException as e:
+                    raise RequestError(f"Request failed: {str(e)}") from e
+
+                try:
+                    items = parser.feed(chunk) if chunk is not None else parser.close()
+                except ValueError as e:
+                    raise RequestError(f"Invalid JSON response: {str(e)}") from e
+
+                for item in items:
+                    yield item_model.model_validate(item) if item_model is not None else item
+
+            _check_success(parser.envelope)
+        finally:
+            await response.aclose()
+
+    async def warm_up(
+        self, connections: int = 2, hubs: bool = False, keep_warm: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Do the setup work of the first requests ahead of time.
+
+        The asyncio counterpart of ``ProjectXClient.warm_up``: resolves the
+        API and hub hosts, gets a valid token, opens ``connections`` pooled
+        connections to the API (see AsyncSessionPool.warm_up) and optionally
+        starts the real-time hubs.
+
+        Args:
+            connections: Number of pooled connections to open to the API
+            hubs: Also connect the user and market hubs
+            keep_warm: Re-open dropped or idle-evicted connections every
+                ``keep_warm`` seconds in a background task, until ``close()``
+
+        Returns:
+            dict: Seconds spent per step (``dns`` per host, ``token``,
+            ``connect``, ``hubs``, or None if not started), the number of
+            ``connections`` opened and the total ``duration``
+
+        Raises:
+            AuthenticationError: If no valid token could be obtained
+            requests.ConnectionError: If the API could not be connected to
+        """
+        loop = asyncio.get_running_loop()
+        started = time.perf_counter()
+        report: Dict[str, Any] = {"dns": {}, "hubs": None}
+
+        urls = [
+            self.base_url,
+            self.USER_HUB_URLS.get(self.environment),
+            self.MARKET_HUB_URLS.get(self.environment),
+        ]
+        for host, port in _warm_up_hosts(urls):
+            step = time.perf_counter()
+            try:
+                await loop.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+            except OSError as e:
+                logger.warning(f"Could not resolve {host} during warm-up: {e}")
+                continue
+            report["dns"][host] = time.perf_counter() - step
+
+        step = time.perf_counter()
+        await self._get_token()
+        report["token"] = time.perf_counter() - step
+
+        step = time.perf_counter()
+        report["connections"] = await self.transport.warm_up(
+            self.base_url, connections, self.timeout
+        )
+        report["connect"] = time.perf_counter() - step
+
+        if hubs:
+            step = time.perf_counter()
+            await self.realtime.start()
+            report["hubs"] = time.perf_counter() - step
+
+        if keep_warm is not None:
+            self._stop_keep_warm()
+            self._keep_warm = asyncio.create_task(self._run_keep_warm(connections, keep_warm))
+
+        report["duration"] = time.perf_counter() - started
+        logger.info(
+            f"Warm-up took {report['duration'] * 1000:.1f} ms "
+            f"({report['connections']} connections opened)"
+        )
+        return report
+
+    async def _run_keep_warm(self, connections: int, interval: float):
+        """Keep pooled connections open until cancelled."""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.transport.warm_up(self.base_url, connections, self.timeout)
+            except Exception as e:
+                logger.warning(f"Keeping connections warm failed: {e}")
+
+    def _stop_keep_warm(self):
+        """Cancel the task keeping pooled connections open, if running."""
+        if self._keep_warm is not None:
+            self._keep_warm.cancel()
+            self._keep_warm = None
+
+    async def _run_refresher(self):
+        """Renew the token ahead of its expiry until cancelled."""
+        loop = asyncio.get_running_loop()
+        delay = self.auth.refresh_delay()
+        while True:
+            await asyncio.sleep(delay)
+            delay = await loop.run_in_executor(None, self.auth.refresh)
+
+    def _stop_refresher(self):
+        """Cancel the task renewing the token, if running."""
+        if self._refresher is not None:
+            self._refresher.cancel()
+            self._refresher = None
+        self.auth.background_refresh = False
+
+    def pool_stats(self) -> Dict[str, Any]:
+        """
+        Get statistics for the client's HTTP connection pool.
+
+        Returns:
+            dict: Connection pool counters (see AsyncSessionPool.stats)
+        """
+        return self.transport.stats()
+
+    async def close(self):
+        """Close all pooled HTTP connections held by the client."""
+        self._stop_keep_warm()
+        self._stop_refresher()
+        # A transport passed in may be shared with other clients
+        if self._owns_transport:
+            await self.transport.close()
+        self.auth.transport.close()
+
+    async def __aenter__(self):
+        """Enter the client context."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Exit the client context, closing pooled connections."""
+        await self.close()
+
+    async def get(self, path: str, **kwargs) -> Any:
+        """Make a GET request to the API."""
+        return await self.request("GET", path, **kwargs)
+
+    async def post(self, path: str, **kwargs) -> Any:
+        """Make a POST request to the API."""
+        return await self.request("POST", path, **kwargs)
+
+    async def put(self, path: str, **kwargs) -> Any:
+        """Make a PUT request to the API."""
+        return await self.request("PUT", path, **kwargs)
+
+    async def delete(self, path: str, **kwargs) -> Any:
+        """Make a DELETE request to the API."""
+        return await self.request("DELETE", path, **kwargs)
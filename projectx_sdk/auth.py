@@ -1,13 +1,95 @@
 """Authentication functionality for the ProjectX Gateway API."""
 
+import base64
+import json
+import logging
+import random
+import threading
+import time
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Any, Callable, Dict, Optional
 
 import requests
 
+from projectx_sdk.deadline import Deadline, resolve_deadline
 from projectx_sdk.exceptions import AuthenticationError
+from projectx_sdk.metrics import SDKMetrics
+from projectx_sdk.token_cache import TokenCache
+from projectx_sdk.tracing import Tracer, trace
+from projectx_sdk.transport.base import Transport
+from projectx_sdk.transport.pool import SessionPool
 from projectx_sdk.utils.constants import ENDPOINTS
 
+logger = logging.getLogger(__name__)
+
+
+def decode_jwt_claims(token: str) -> Dict[str, Any]:
+    """
+    Decode the claims of a JSON Web Token without verifying its signature.
+
+    Args:
+        token: The token
+
+    Returns:
+        dict: The token's claims (empty if it is not a JWT)
+    """
+    parts = token.split(".") if isinstance(token, str) else []
+    if len(parts) != 3:
+        return {}
+    try:
+        payload = base64.urlsafe_b64decode(parts[1] + "=" * (-len(parts[1]) % 4))
+        claims = json.loads(payload)
+    except ValueError:
+        return {}
+    return claims if isinstance(claims, dict) else {}
+
+
+def token_ttl(token: str, issued: bool = False) -> Optional[float]:
+    """
+    Get how long a token stays valid, from its ``exp`` claim.
+
+    Args:
+        token: The token
+        issued: Whether the token was issued just now (by a login or
+            validation), in which case its lifetime is taken from ``exp - iat``
+            so that a skewed local clock does not shorten or extend it
+
+    Returns:
+        float: Seconds until the token expires, or None if it carries no expiry
+    """
+    claims = decode_jwt_claims(token)
+    exp, iat = claims.get("exp"), claims.get("iat")
+    if not isinstance(exp, (int, float)):
+        return None
+    if issued and isinstance(iat, (int, float)) and exp > iat:
+        return float(exp - iat)
+    return exp - time.time()
+
+
+def issued_lifetime(token: str) -> Optional[float]:
+    """
+    Get how long a token was issued for, from its ``iat`` and ``exp`` claims.
+
+    Args:
+        token: The token
+
+    Returns:
+        float: Seconds from issue to expiry, or None if the token lacks either claim
+    """
+    claims = decode_jwt_claims(token)
+    exp, iat = claims.get("exp"), claims.get("iat")
+    if isinstance(exp, (int, float)) and isinstance(iat, (int, float)) and exp > iat:
+        return float(exp - iat)
+    return None
+
+
+class _Refresh:
+    """A token refresh in flight, whose outcome is shared by every waiter."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.error: Optional[BaseException] = None
+
 
 class Authenticator:
     """
@@ -30,6 +112,10 @@ class Authenticator:
         verify_key: Optional[str] = None,
         token: Optional[str] = None,
         timeout: int = 30,
+        transport: Optional[Transport] = None,
+        metrics: Optional[SDKMetrics] = None,
+        tracer: Optional[Tracer] = None,
+        token_cache: Optional[TokenCache] = None,
     ):
         """
         Initialize the authenticator.
@@ -44,21 +130,112 @@ class Authenticator:
             verify_key (str, optional): Verification key for app authentication
             token (str, optional): Existing token to use
             timeout (int, optional): Request timeout in seconds
+            transport (Transport, optional): Transport to send requests over.
+                A private SessionPool is created if not provided.
+            metrics (SDKMetrics, optional): Metrics counting logins and token
+                validations by outcome
+            tracer (Tracer, optional): Tracer recording token validation spans
+            token_cache (TokenCache, optional): On-disk cache shared with other
+                processes. A token cached for ``username`` is used instead of
+                logging in, and every token obtained is stored in it.
         """
         self.base_url = base_url
-        self.token = token
-        self.token_expiry = None if token is None else datetime.now() + timedelta(hours=24)
+        self.username = username
+        self.token_cache = token_cache
+        self.transport = transport or SessionPool()
+        # Guards the token and the refresh in flight; never held during a request
+        self._lock = threading.RLock()
+        self._refresh: Optional[_Refresh] = None
+        self._refreshes = 0
+        self._failed_refreshes = 0
+        self._refresh_time = 0.0
+        self._waits = 0
+        self._wait_time = 0.0
+        self._max_wait_time = 0.0
+        self.metrics = metrics
+        self.tracer = tracer
         self.timeout = timeout
 
-        # Default token expiry is 24 hours from issue
+        # Lifetime of tokens without an expiry claim, 24 hours from issue
         self.token_lifetime = timedelta(hours=24)
 
+        # Expiry on the monotonic clock, so wall clock jumps cannot expire the token
+        self._clock = time.monotonic
+        self._expires_at: Optional[float] = None
+        # Issued lifetime of the token, which caps the renewal windows
+        self._lifetime: Optional[float] = None
+        self.token = token
+        if token is not None:
+            ttl = token_ttl(token)
+            self._expires_at = self._clock() + (
+                ttl if ttl is not None else self.token_lifetime.total_seconds()
+            )
+            self._lifetime = issued_lifetime(token)
+
+        # Background refreshing (see start_refresher)
+        self.refresh_ahead = 3600.0
+        self.refresh_jitter = 600.0
+        self.refresh_retry_interval = 30.0
+        self.background_refresh = False
+        self._refresher: Optional[threading.Thread] = None
+        self._refresher_stop = threading.Event()
+
         # Authenticate if credentials are provided and no token exists
         if not self.token:
             if username and api_key:
-                self.authenticate_with_key(username, api_key)
+                self._login(lambda: self.authenticate_with_key(username, api_key))
             elif username and password and device_id and app_id and verify_key:
-                self.authenticate_with_app(username, password, device_id, app_id, verify_key)
+                self._login(
+                    lambda: self.authenticate_with_app(
+                        username, password, device_id, app_id, verify_key
+                    )
+                )
+
+    def _login(self, login: Callable[[], bool]) -> bool:
+        """
+        Use the cached token, or log in if none is cached.
+
+        The user's cache entry stays locked during the login, so processes
+        starting at the same time wait for the first one's login and reuse its
+        token. Logins of other users do not wait for it.
+
+        Args:
+            login: Logs in and stores the new token
+
+        Returns:
+            bool: True once a token is available
+        """
+        if self.token_cache is None or not self.username:
+            return login()
+
+        with self.token_cache.lock(self.base_url, self.username):
+            if self._use_cached_token():
+                return True
+            return login()
+
+    def _use_cached_token(self) -> bool:
+        """
+        Adopt the cached token if it expires later than the current one.
+
+        Returns:
+            bool: True if the cached token was adopted
+        """
+        if self.token_cache is None or not self.username:
+            return False
+        cached = self.token_cache.get(self.base_url, self.username)
+        if cached is None:
+            return False
+
+        token, expires_in = cached
+        with self._lock:
+            current = self.expires_in()
+            if token == self.token or (current is not None and current >= expires_in):
+                return False
+            self.token = token
+            self._expires_at = self._clock() + expires_in
+            self._lifetime = issued_lifetime(token)
+        logger.debug(f"Using cached token for {self.username}")
+        return True
 
     def authenticate_with_key(self, username, api_key):
         """
@@ -79,23 +256,25 @@ class Authenticator:
         payload = {"userName": username, "apiKey": api_key}
 
         try:
-            response = requests.post(endpoint, json=payload, timeout=self.timeout)
+            response = self.transport.post(endpoint, json=payload, timeout=self.timeout)
             response.raise_for_status()
 
             data = response.json()
 
             if not data.get("success", False):
+                self._record_refresh("login", "failure")
                 raise AuthenticationError(
                     f"Authentication failed: {data.get('errorMessage', 'Unknown error')}",
                     error_code=data.get("errorCode"),
                 )
 
-            self.token = data.get("token")
-            self.token_expiry = datetime.now() + self.token_lifetime
+            self._set_token(data.get("token"))
+            self._record_refresh("login", "success")
 
             return True
 
         except requests.RequestException as e:
+            self._record_refresh("login", "failure")
             raise AuthenticationError(f"Authentication request failed: {str(e)}")
 
     def authenticate_with_app(self, username, password, device_id, app_id, verify_key):
@@ -126,88 +305,350 @@ class Authenticator:
         }
 
         try:
-            response = requests.post(endpoint, json=payload, timeout=self.timeout)
+            response = self.transport.post(endpoint, json=payload, timeout=self.timeout)
             response.raise_for_status()
 
             data = response.json()
 
             if not data.get("success", False):
+                self._record_refresh("login", "failure")
                 raise AuthenticationError(
                     f"Authentication failed: {data.get('errorMessage', 'Unknown error')}",
                     error_code=data.get("errorCode"),
                 )
 
-            self.token = data.get("token")
-            self.token_expiry = datetime.now() + self.token_lifetime
+            self._set_token(data.get("token"))
+            self._record_refresh("login", "success")
 
             return True
 
         except requests.RequestException as e:
+            self._record_refresh("login", "failure")
             raise AuthenticationError(f"Authentication request failed: {str(e)}")
 
-    def validate_token(self):
+    def validate_token(self, deadline: Optional[Deadline] = None):
         """
         Validate and renew the current token if needed.
 
+        Args:
+            deadline (Deadline, optional): Deadline bounding the validation
+                request, in addition to ``timeout``
+
         Returns:
             bool: True if validation was successful
 
         Raises:
             AuthenticationError: If validation fails
+            DeadlineExceededError: If the deadline passes before validation completes
         """
         if not self.token:
             raise AuthenticationError("No token available for validation")
 
-        endpoint = f"{self.base_url}{ENDPOINTS['auth']['validate']}"
+        deadline = resolve_deadline(deadline)
+        timeout: float = self.timeout
+        if deadline is not None:
+            timeout = deadline.limit(timeout, "token refresh")
 
-        try:
-            response = requests.post(
-                endpoint, headers={"Authorization": f"Bearer {self.token}"}, timeout=self.timeout
-            )
-            response.raise_for_status()
+        with trace(self.tracer, "Authenticator.validate_token") as span:
+            endpoint = f"{self.base_url}{ENDPOINTS['auth']['validate']}"
 
-            data = response.json()
-
-            if not data.get("success", False):
-                raise AuthenticationError(
-                    f"Token validation failed: {data.get('errorMessage', 'Unknown error')}",
-                    error_code=data.get("errorCode"),
+            try:
+                response = self.transport.post(
+                    endpoint,
+                    headers={"Authorization": f"Bearer {self.token}"},
+                    timeout=timeout,
                 )
-
-            # Update token if a new one was provided
-            if "newToken" in data and data["newToken"]:
-                self.token = data["newToken"]
-                self.token_expiry = datetime.now() + self.token_lifetime
-
-            return True
-
-        except requests.RequestException as e:
-            raise AuthenticationError(f"Token validation request failed: {str(e)}")
-
-    def get_token(self):
+                response.raise_for_status()
+
+                data = response.json()
+
+                if not data.get("success", False):
+                    self._record_refresh("validate", "failure")
+                    # Keep other processes from picking up the rejected token
+                    if self.token_cache is not None and self.username:
+                        self.token_cache.delete(self.base_url, self.username, self.token)
+                    raise AuthenticationError(
+                        f"Token validation failed: {data.get('errorMessage', 'Unknown error')}",
+                        error_code=data.get("errorCode"),
+                    )
+
+                # Update token if a new one was provided
+                if "newToken" in data and data["newToken"]:
+                    self._set_token(data["newToken"])
+                    self._record_refresh("validate", "renewed")
+                    span.set_attribute("renewed", True)
+                else:
+                    self._record_refresh("validate", "success")
+                    span.set_attribute("renewed", False)
+
+                return True
+
+            except requests.RequestException as e:
+                self._record_refresh("validate", "failure")
+                if isinstance(e, requests.Timeout) and deadline is not None and deadline.expired:
+                    raise deadline.exceeded("token refresh") from e
+                raise AuthenticationError(f"Token validation request failed: {str(e)}")
+
+    def _record_refresh(self, kind, outcome):
+        """Count a login or token validation by its outcome."""
+        if self.metrics is not None:
+            self.metrics.token_refreshes.labels(kind, outcome).inc()
+
+    def get_token(self, deadline: Optional[Deadline] = None):
         """
         Get the current authentication token, validating if necessary.
 
+        Safe to call from many threads: a token that needs refreshing is
+        validated by exactly one of them, while the others wait for the
+        outcome of that validation instead of sending their own (see stats).
+
+        Args:
+            deadline (Deadline, optional): Deadline bounding both the wait for
+                another thread's refresh and this thread's own validation
+
         Returns:
             str: The current authentication token
 
         Raises:
             AuthenticationError: If no valid token is available
+            DeadlineExceededError: If the deadline passes before a token is available
         """
-        if not self.is_authenticated():
-            if self.token:
-                # Try to validate and refresh the token
-                self.validate_token()
-            else:
-                raise AuthenticationError("No authentication token available")
-        else:
-            # Check if token is close to expiry (less than 30 minutes remaining)
-            if self.token_expiry and (self.token_expiry - datetime.now() < timedelta(minutes=30)):
-                # Validate to try and get a fresh token
-                self.validate_token()
+        # Fast path: a fresh token is returned without locking
+        token = self.token
+        if token is not None and not self.needs_refresh():
+            return token
+
+        return self._refresh_once(resolve_deadline(deadline))
+
+    def _refresh_once(self, deadline: Optional[Deadline], force: bool = False):
+        """
+        Validate the token, or wait for the validation already in flight.
+
+        Args:
+            deadline: Deadline bounding the validation or the wait
+            force: Validate even if the token does not need refreshing
 
+        Returns:
+            str: The token after the validation
+        """
+        with self._lock:
+            in_flight = self._refresh
+            if in_flight is None:
+                # A refresh that finished while this thread was on its way made it unnecessary
+                if not force and self.token is not None and not self.needs_refresh():
+                    return self.token
+                if not self.token:
+                    raise AuthenticationError("No authentication token available")
+                refresh = self._refresh = _Refresh()
+
+        if in_flight is None:
+            started = time.perf_counter()
+            try:
+                # Another process may already have renewed the token
+                if force or not self._use_cached_token() or self.needs_refresh():
+                    if deadline is None:
+                        self.validate_token()
+                    else:
+                        with deadline:
+                            self.validate_token()
+            except BaseException as e:
+                refresh.error = e
+                raise
+            finally:
+                with self._lock:
+                    self._refresh = None
+                    self._refreshes += 1
+                    self._failed_refreshes += refresh.error is not None
+                    self._refresh_time += time.perf_counter() - started
+                refresh.done.set()
+            return self.token
+
+        started = time.perf_counter()
+        finished = in_flight.done.wait(deadline.remaining() if deadline is not None else None)
+        waited = time.perf_counter() - started
+        with self._lock:
+            self._waits += 1
+            self._wait_time += waited
+            self._max_wait_time = max(self._max_wait_time, waited)
+        if self.metrics is not None:
+            self.metrics.token_refresh_wait.observe(waited)
+
+        if not finished and deadline is not None:
+            raise deadline.exceeded("token refresh")
+        if in_flight.error is not None:
+            raise in_flight.error
         return self.token
 
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get token refresh statistics.
+
+        Returns:
+            dict: Token validations sent (``refreshes``), those that failed
+            (``failed_refreshes``) and the seconds they took (``refresh_time``);
+            callers that waited for another caller's validation instead of
+            sending their own (``waits``), their total and longest wait in
+            seconds (``wait_time``, ``max_wait_time``); and whether a
+            validation is running (``in_flight``)
+        """
+        with self._lock:
+            return {
+                "refreshes": self._refreshes,
+                "failed_refreshes": self._failed_refreshes,
+                "refresh_time": self._refresh_time,
+                "waits": self._waits,
+                "wait_time": self._wait_time,
+                "max_wait_time": self._max_wait_time,
+                "in_flight": self._refresh is not None,
+            }
+
+    def _set_token(self, token):
+        """Store a newly issued token and its expiry as one update."""
+        ttl = token_ttl(token, issued=True)
+        if ttl is None or ttl <= 0:
+            ttl = self.token_lifetime.total_seconds()
+        with self._lock:
+            self.token = token
+            self._expires_at = self._clock() + ttl
+            self._lifetime = ttl
+        if self.token_cache is not None and self.username:
+            self.token_cache.set(self.base_url, self.username, token, ttl)
+
+    @property
+    def token_expiry(self) -> Optional[datetime]:
+        """Get the local time at which the token expires (None without a token)."""
+        expires_in = self.expires_in()
+        return None if expires_in is None else datetime.now() + timedelta(seconds=expires_in)
+
+    @token_expiry.setter
+    def token_expiry(self, expiry: Optional[datetime]):
+        """Set the local time at which the token expires."""
+        if expiry is None:
+            self._expires_at = None
+        else:
+            self._expires_at = self._clock() + (expiry - datetime.now()).total_seconds()
+
+    def expires_in(self) -> Optional[float]:
+        """
+        Get the time until the token expires.
+
+        The expiry comes from the token's ``exp`` claim (``token_lifetime``
+        for tokens without one) and is tracked on the monotonic clock.
+
+        Returns:
+            float: Seconds until expiry (negative once expired), or None without a token
+        """
+        expires_at = self._expires_at
+        return None if expires_at is None else expires_at - self._clock()
+
+    def _window(self, seconds: float, fraction: float = 0.5) -> float:
+        """Cap a window before expiry at a fraction of the token's issued lifetime."""
+        lifetime = self._lifetime
+        return seconds if lifetime is None else min(seconds, lifetime * fraction)
+
+    def needs_refresh(self):
+        """
+        Check whether get_token would have to contact the API before returning.
+
+        Returns:
+            bool: True if the token is missing, expired or close to expiry
+                (less than 30 minutes, or half its issued lifetime if shorter,
+                remaining). While a background refresher keeps the token fresh,
+                only a missing or expired token counts.
+        """
+        expires_in = self.expires_in()
+        if self.token is None or expires_in is None or expires_in <= 0:
+            return True
+        if self.background_refresh:
+            return False
+        return expires_in < self._window(30 * 60)
+
+    def refresh_delay(self, rng: Callable[[], float] = random.random) -> float:
+        """
+        Get the time until the token should be renewed in the background.
+
+        Renewal is due ``refresh_ahead`` seconds before expiry, brought
+        forward by a random part of ``refresh_jitter`` so that processes
+        sharing credentials do not all renew at once. For short-lived tokens
+        the two are capped at a half and a quarter of the issued lifetime, so
+        a fresh token is renewed no sooner than a quarter of the way in.
+
+        Args:
+            rng: Returns a random number in [0, 1)
+
+        Returns:
+            float: Seconds until the renewal is due (0 if it already is)
+        """
+        expires_in = self.expires_in()
+        if expires_in is None:
+            return 0.0
+        ahead = self._window(self.refresh_ahead)
+        jitter = self._window(self.refresh_jitter, fraction=0.25)
+        return max(expires_in - ahead - rng() * jitter, 0.0)
+
+    def refresh(self) -> float:
+        """
+        Renew the token now, on behalf of a background refresher.
+
+        Failures are logged rather than raised: the current token stays in use
+        and the renewal is retried after ``refresh_retry_interval`` seconds.
+
+        Returns:
+            float: Seconds until the next renewal should be attempted
+        """
+        if not self.token:
+            return self.refresh_retry_interval
+
+        try:
+            self._refresh_once(None, force=True)
+        except Exception as e:
+            logger.warning(f"Background token refresh failed: {e}")
+            return self.refresh_retry_interval
+
+        # A validation that did not renew the token is retried later, not at once
+        return self.refresh_delay() or self.refresh_retry_interval
+
+    def start_refresher(
+        self, refresh_ahead: Optional[float] = None, jitter: Optional[float] = None
+    ):
+        """
+        Start renewing the token in a background thread ahead of its expiry.
+
+        While the refresher runs, get_token only returns the token it keeps
+        ready and never blocks on a renewal, unless the token has expired
+        (e.g. because the gateway was unreachable for a long time).
+
+        Args:
+            refresh_ahead: Seconds before expiry to renew the token (1 hour by default)
+            jitter: Up to this many seconds are randomly added to ``refresh_ahead``
+                (10 minutes by default)
+        """
+        if refresh_ahead is not None:
+            self.refresh_ahead = refresh_ahead
+        if jitter is not None:
+            self.refresh_jitter = jitter
+        if self._refresher is not None:
+            return
+
+        self._refresher_stop.clear()
+        self.background_refresh = True
+
+        def run():
+            delay = self.refresh_delay()
+            while not self._refresher_stop.wait(delay):
+                delay = self.refresh()
+
+        self._refresher = threading.Thread(target=run, name="projectx-token-refresh", daemon=True)
+        self._refresher.start()
+
+    def stop_refresher(self):
+        """Stop the background refresher, if running."""
+        self._refresher_stop.set()
+        if self._refresher is not None:
+            self._refresher.join()
+            self._refresher = None
+        self.background_refresh = False
+
     def get_auth_header(self):
         """
         Get the authentication header with a valid token.
@@ -228,8 +669,5 @@ class Authenticator:
         Returns:
             bool: True if authenticated with a non-expired token
         """
-        return (
-            self.token is not None
-            and self.token_expiry is not None
-            and self.token_expiry > datetime.now()
-        )
+        expires_in = self.expires_in()
+        return self.token is not None and expires_in is not None and expires_in > 0
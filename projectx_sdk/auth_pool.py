@@ -0,0 +1,429 @@
+"""Authentication of many users with a shared refresh scheduler."""
+
+import concurrent.futures
+import logging
+import math
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from projectx_sdk.auth import Authenticator
+from projectx_sdk.batch import Batch
+from projectx_sdk.client import ProjectXClient
+from projectx_sdk.exceptions import AuthenticationError
+from projectx_sdk.metrics import MetricsSetting, resolve_metrics
+from projectx_sdk.token_cache import TokenCache
+from projectx_sdk.transport import SessionPool, Transport
+
+logger = logging.getLogger(__name__)
+
+
+class TimerWheel:
+    """
+    Hashed timing wheel scheduling items to whole ticks.
+
+    Advancing only looks at the items of one slot, however many are pending
+    in total, which keeps one scheduler cheap for hundreds of tokens. With
+    ``max_per_tick``, an item landing on a full tick is moved to the nearest
+    earlier tick with room (or later, if every earlier tick is full), so that
+    items scheduled for the same moment are spread out instead of firing
+    together.
+
+    Not thread-safe; AuthPool guards it with its lock.
+    """
+
+    def __init__(self, tick: float = 1.0, slots: int = 3600, max_per_tick: Optional[int] = None):
+        """
+        Initialize a timer wheel.
+
+        Args:
+            tick: Seconds per tick
+            slots: Number of slots; items further away than this many ticks
+                wait for additional turns of the wheel
+            max_per_tick: Maximum number of items due on the same tick (unbounded if None)
+
+        Raises:
+            ValueError: If tick is not positive, or slots or max_per_tick is less than 1
+        """
+        if tick <= 0:
+            raise ValueError("tick must be positive")
+        if slots < 1:
+            raise ValueError("slots must be at least 1")
+        if max_per_tick is not None and max_per_tick < 1:
+            raise ValueError("max_per_tick must be at least 1")
+
+        self.tick = tick
+        self.max_per_tick = max_per_tick
+        # Each slot holds (absolute tick, item) pairs for every turn of the wheel
+        self._slots: List[List[Tuple[int, Any]]] = [[] for _ in range(slots)]
+        self._now = 0
+        self._size = 0
+
+    def schedule(self, delay: float, item: Any) -> float:
+        """
+        Schedule an item.
+
+        Args:
+            delay: Seconds from the current tick until the item is due
+            item: The item
+
+        Returns:
+            float: Seconds until the item is actually due, after rounding to
+            whole ticks and spreading
+        """
+        ticks = max(math.ceil(delay / self.tick), 1)
+        if self.max_per_tick is not None:
+            ticks = self._spread(ticks, self.max_per_tick)
+
+        due = self._now + ticks
+        self._slots[due % len(self._slots)].append((due, item))
+        self._size += 1
+        return ticks * self.tick
+
+    def advance(self) -> List[Any]:
+        """
+        Move to the next tick.
+
+        Returns:
+            list: The items due on the new tick, in scheduling order
+        """
+        self._now += 1
+        slot = self._slots[self._now % len(self._slots)]
+        due = [item for at, item in slot if at <= self._now]
+        if due:
+            slot[:] = [(at, item) for at, item in slot if at > self._now]
+            self._size -= len(due)
+        return due
+
+    def clear(self):
+        """Remove every pending item."""
+        for slot in self._slots:
+            slot.clear()
+        self._size = 0
+
+    def _spread(self, ticks: int, limit: int) -> int:
+        """Get the tick nearest to ``ticks`` from now with room for another item."""
+        for candidate in range(ticks, 0, -1):
+            if self._count(self._now + candidate) < limit:
+                return candidate
+        candidate = ticks + 1
+        while self._count(self._now + candidate) >= limit:
+            candidate += 1
+        return candidate
+
+    def _count(self, due: int) -> int:
+        """Count the items due on an absolute tick."""
+        return sum(1 for at, _ in self._slots[due % len(self._slots)] if at == due)
+
+    def __len__(self) -> int:
+        """Get the number of pending items."""
+        return self._size
+
+
+class AuthPool:
+    """
+    Authenticators for many users, logged in and refreshed together.
+
+    Each ProjectXClient logs in on construction and renews its own token.
+    With hundreds of users that means hundreds of sequential logins and
+    renewals that can cluster in the same second. An AuthPool instead logs
+    every user in concurrently with bounded parallelism, then renews all of
+    the tokens from a single scheduler thread driving a TimerWheel, at most
+    ``max_refreshes_per_tick`` per tick. Per-user clients share one HTTP
+    connection pool::
+
+        credentials = [
+            {"username": "trader1", "api_key": "..."},
+            {"username": "trader2", "api_key": "..."},
+        ]
+        with AuthPool(credentials, environment="topstepx", max_concurrency=16) as pool:
+            for username in pool.usernames:
+                accounts = pool.client(username).accounts.search()
+
+    Each credential set takes the keyword arguments of Authenticator:
+    ``username`` with ``api_key``, or with ``password``, ``device_id``,
+    ``app_id`` and ``verify_key``. Logins that fail are recorded in
+    ``errors`` and do not affect the other users.
+    """
+
+    def __init__(
+        self,
+        credentials: Iterable[Dict[str, Any]],
+        environment: str = "demo",
+        base_url: Optional[str] = None,
+        timeout: int = 30,
+        transport: Optional[Transport] = None,
+        max_concurrency: int = 8,
+        tick: float = 1.0,
+        max_refreshes_per_tick: int = 1,
+        metrics: MetricsSetting = None,
+        token_cache: Optional[TokenCache] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize an authentication pool.
+
+        Args:
+            credentials: A dict of Authenticator credentials per user
+            environment: Environment name (see ProjectXClient)
+            base_url: Override the base URL (if not using an environment)
+            timeout: Request timeout in seconds
+            transport: Transport shared by every authenticator and client. A
+                SessionPool is created if not provided; close() only closes a
+                transport the pool created.
+            max_concurrency: Maximum number of logins or renewals running at once
+            tick: Seconds per tick of the refresh scheduler
+            max_refreshes_per_tick: Maximum number of renewals starting on the same tick
+            metrics: Metrics registry (see ProjectXClient)
+            token_cache: On-disk token cache shared with other processes
+            clock: Monotonic clock returning seconds
+
+        Raises:
+            ValueError: If a credential set has no username, a username is
+                repeated, the environment is unknown or max_concurrency is less than 1
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        self.credentials: Dict[str, Dict[str, Any]] = {}
+        for credential in credentials:
+            username = credential.get("username")
+            if not username:
+                raise ValueError("Every credential set needs a username")
+            if username in self.credentials:
+                raise ValueError(f"Duplicate credentials for {username}")
+            self.credentials[username] = dict(credential)
+
+        if base_url:
+            self.base_url = base_url
+        elif environment in ProjectXClient.ENVIRONMENT_URLS:
+            self.base_url = ProjectXClient.ENVIRONMENT_URLS[environment]
+        else:
+            raise ValueError(f"Unknown environment: {environment}. Use base_url parameter instead.")
+
+        self.environment = environment
+        self.timeout = timeout
+        self._owns_transport = transport is None
+        self.transport = transport or SessionPool(max_connections_per_host=max_concurrency)
+        self.max_concurrency = max_concurrency
+        self.metrics = resolve_metrics(metrics)
+        self.token_cache = token_cache
+
+        self.auths: Dict[str, Authenticator] = {}
+        self.errors: Dict[str, BaseException] = {}
+        self._clients: Dict[str, ProjectXClient] = {}
+        self._lock = threading.Lock()
+        self._wheel = TimerWheel(tick=tick, max_per_tick=max_refreshes_per_tick)
+        self._clock = clock
+        self._refreshes = 0
+        self._executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._scheduler: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    @property
+    def usernames(self) -> List[str]:
+        """Get the users of the pool, in the order their credentials were given."""
+        return list(self.credentials)
+
+    def login(self) -> Dict[str, BaseException]:
+        """
+        Log in every user that is not logged in yet, concurrently.
+
+        Returns:
+            dict: The error of each login that failed, by username
+        """
+        with self._lock:
+            pending = [username for username in self.credentials if username not in self.auths]
+
+        with Batch(max_concurrency=self.max_concurrency) as batch:
+            for username in pending:
+                batch.submit(self._login, username)
+
+        for username, result in zip(pending, batch.results()):
+            if result.ok:
+                with self._lock:
+                    self.auths[username] = result.value
+                    self.errors.pop(username, None)
+                    if self._scheduler is not None:
+                        self._wheel.schedule(result.value.refresh_delay(), username)
+            elif result.error is not None:
+                logger.warning(f"Login failed for {username}: {result.error}")
+                with self._lock:
+                    self.errors[username] = result.error
+
+        with self._lock:
+            return {
+                username: self.errors[username] for username in pending if username in self.errors
+            }
+
+    def _login(self, username: str) -> Authenticator:
+        """Log one user in."""
+        auth = Authenticator(
+            base_url=self.base_url,
+            timeout=self.timeout,
+            transport=self.transport,
+            metrics=self.metrics,
+            token_cache=self.token_cache,
+            **self.credentials[username],
+        )
+        # Renewals are left to the scheduler, so requests never wait for one
+        auth.background_refresh = True
+        return auth
+
+    def start(self):
+        """
+        Log in every user and start renewing their tokens ahead of expiry.
+
+        Each token is scheduled for renewal after its ``refresh_delay()``, so
+        renewals are randomly jittered per user as well as spread over ticks.
+        """
+        if self._scheduler is not None:
+            return
+
+        self.login()
+        with self._lock:
+            self._stop.clear()
+            self._wheel.clear()
+            self._executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.max_concurrency, thread_name_prefix="projectx-auth-refresh"
+            )
+            for username, auth in self.auths.items():
+                self._wheel.schedule(auth.refresh_delay(), username)
+            self._scheduler = threading.Thread(
+                target=self._run, name="projectx-auth-pool", daemon=True
+            )
+            self._scheduler.start()
+
+    def _run(self):
+        """Advance the timer wheel every tick and start the renewals due."""
+        tick = self._wheel.tick
+        next_tick = self._clock() + tick
+        while not self._stop.wait(max(next_tick - self._clock(), 0.0)):
+            # Catch up on ticks missed while the thread was not running
+            while self._clock() >= next_tick:
+                with self._lock:
+                    due = self._wheel.advance()
+                    executor = self._executor
+                if executor is not None:
+                    for username in due:
+                        executor.submit(self._refresh, username)
+                next_tick += tick
+
+    def _refresh(self, username: str):
+        """Renew a user's token and schedule the next renewal."""
+        with self._lock:
+            auth = self.auths[username]
+        delay = auth.refresh()
+        with self._lock:
+            self._refreshes += 1
+            if not self._stop.is_set():
+                self._wheel.schedule(delay, username)
+
+    def auth(self, username: str) -> Authenticator:
+        """
+        Get a user's authenticator.
+
+        Args:
+            username: The user
+
+        Returns:
+            Authenticator: The user's authenticator
+
+        Raises:
+            KeyError: If the user is not in the pool
+            AuthenticationError: If the user's login failed or has not happened yet
+        """
+        if username not in self.credentials:
+            raise KeyError(username)
+        with self._lock:
+            auth = self.auths.get(username)
+            error = self.errors.get(username)
+        if auth is None:
+            if error is None:
+                raise AuthenticationError(f"{username} is not logged in; call login() first")
+            raise AuthenticationError(f"Login failed for {username}: {error}") from error
+        return auth
+
+    def client(self, username: str, **kwargs) -> ProjectXClient:
+        """
+        Get a client for a user, sharing the pool's transport.
+
+        The client is created on the first call for the user and returned by
+        later calls. It uses the user's pooled authenticator, so it never logs
+        in or renews the token itself.
+
+        Args:
+            username: The user
+            **kwargs: Further ProjectXClient arguments, applied when the client
+                is created (e.g. ``cache=True``)
+
+        Returns:
+            ProjectXClient: The user's client
+
+        Raises:
+            KeyError: If the user is not in the pool
+            AuthenticationError: If the user's login failed or has not happened yet
+        """
+        auth = self.auth(username)
+        with self._lock:
+            client = self._clients.get(username)
+            if client is None:
+                kwargs.setdefault("timeout", self.timeout)
+                kwargs.setdefault("metrics", self.metrics if self.metrics is not None else False)
+                client = ProjectXClient(
+                    environment=self.environment,
+                    base_url=self.base_url,
+                    transport=self.transport,
+                    auth=auth,
+                    **kwargs,
+                )
+                self._clients[username] = client
+            return client
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get pool statistics.
+
+        Returns:
+            dict: Users in the pool (``users``), those logged in
+            (``logged_in``) and whose login failed (``login_failures``);
+            renewals pending on the scheduler (``scheduled``), run by it
+            (``refreshes``) and failed across all users (``failed_refreshes``)
+        """
+        with self._lock:
+            auths = list(self.auths.values())
+            return {
+                "users": len(self.credentials),
+                "logged_in": len(auths),
+                "login_failures": len(self.errors),
+                "scheduled": len(self._wheel),
+                "refreshes": self._refreshes,
+                "failed_refreshes": sum(auth.stats()["failed_refreshes"] for auth in auths),
+            }
+
+    def close(self):
+        """Stop renewing tokens and close the clients and the transport the pool created."""
+        self._stop.set()
+        if self._scheduler is not None:
+            self._scheduler.join()
+            self._scheduler = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        for client in clients:
+            client.close()
+        if self._owns_transport:
+            self.transport.close()
+
+    def __enter__(self) -> "AuthPool":
+        """Log in every user and start renewing their tokens."""
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Stop renewing tokens and close all connections."""
+        self.close()
@@ -0,0 +1,248 @@
+"""Concurrent execution of many service calls from synchronous code."""
+
+import concurrent.futures
+import contextvars
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+
+class BatchResult:
+    """
+    Outcome of one call of a batch.
+
+    Attributes:
+        value: The call's return value (None if it raised)
+        error: The exception the call raised (None if it succeeded)
+        duration: Seconds the call took, excluding time queued for a worker
+    """
+
+    __slots__ = ("value", "error", "duration")
+
+    def __init__(
+        self, value: Any = None, error: Optional[BaseException] = None, duration: float = 0.0
+    ):
+        """Initialize a call outcome."""
+        self.value = value
+        self.error = error
+        self.duration = duration
+
+    @property
+    def ok(self) -> bool:
+        """Check whether the call succeeded."""
+        return self.error is None
+
+    def unwrap(self) -> Any:
+        """
+        Get the call's return value.
+
+        Returns:
+            The value the call returned
+
+        Raises:
+            Exception: The exception the call raised
+        """
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+    def __repr__(self) -> str:
+        """Get a debugging representation."""
+        outcome = f"error={self.error!r}" if self.error is not None else f"value={self.value!r}"
+        return f"BatchResult({outcome}, duration={self.duration:.4f})"
+
+
+class _BoundService:
+    """Service whose method calls are submitted to a batch instead of run."""
+
+    def __init__(self, batch: "Batch", service: Any):
+        """Wrap a client service."""
+        self._batch = batch
+        self._service = service
+
+    def __getattr__(self, name: str) -> Any:
+        """Get a method that submits calls of the service method to the batch."""
+        method = getattr(self._service, name)
+        if not callable(method):
+            return method
+
+        def submit(*args, **kwargs) -> concurrent.futures.Future:
+            return self._batch.submit(method, *args, **kwargs)
+
+        return submit
+
+
+class Batch:
+    """
+    Run many service calls concurrently with bounded concurrency.
+
+    Calls are submitted while the batch is open and run on up to
+    ``max_concurrency`` worker threads sharing the client; leaving the ``with``
+    block waits for all of them. A call that raises does not affect the
+    others: its exception is captured in its result. Services of the client
+    are available on the batch, so any service method call can be submitted
+    as it would be written against the client::
+
+        with client.batch(max_concurrency=32) as batch:
+            for account in accounts:
+                batch.positions.search_open(account.id)
+                batch.orders.search_open(account.id)
+
+        for result in batch.results():
+            print(result.value if result.ok else result.error)
+
+    Submitting returns a ``concurrent.futures.Future``, and ``results()`` returns
+    a BatchResult per call in submission order. Calls run in the caller's
+    context, so they join its active tracing span.
+    """
+
+    def __init__(self, client: Any = None, max_concurrency: int = 8):
+        """
+        Initialize a batch.
+
+        Args:
+            client: Client whose services are exposed on the batch (optional;
+                any callable can be submitted with ``submit``)
+            max_concurrency: Maximum number of calls running at once
+
+        Raises:
+            ValueError: If max_concurrency is less than 1
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        self.client = client
+        self.max_concurrency = max_concurrency
+
+        self._lock = threading.Lock()
+        self._executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._futures: List[concurrent.futures.Future] = []
+        self._results: List[BatchResult] = []
+        self._started: Optional[float] = None
+        self._finished: Optional[float] = None
+
+    def __getattr__(self, name: str) -> Any:
+        """Get a client service whose method calls are submitted to the batch."""
+        client = self.__dict__.get("client")
+        if client is None or name.startswith("_"):
+            raise AttributeError(name)
+        return _BoundService(self, getattr(client, name))
+
+    def submit(self, fn: Callable[..., Any], *args, **kwargs) -> concurrent.futures.Future:
+        """
+        Schedule a call.
+
+        Args:
+            fn: Function or service method to call
+            *args: Positional arguments for the call
+            **kwargs: Keyword arguments for the call
+
+        Returns:
+            Future: Resolves to the call's return value or raises its exception
+
+        Raises:
+            RuntimeError: If the batch has already finished
+        """
+        with self._lock:
+            if self._finished is not None:
+                raise RuntimeError("Cannot submit calls to a finished batch")
+            if self._executor is None:
+                self._started = time.perf_counter()
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.max_concurrency, thread_name_prefix="projectx-batch"
+                )
+
+            result = BatchResult()
+            context = contextvars.copy_context()
+
+            def call() -> Any:
+                started = time.perf_counter()
+                try:
+                    result.value = context.run(fn, *args, **kwargs)
+                    return result.value
+                except BaseException as e:
+                    result.error = e
+                    raise
+                finally:
+                    result.duration = time.perf_counter() - started
+
+            future = self._executor.submit(call)
+            self._futures.append(future)
+            self._results.append(result)
+            return future
+
+    def wait(self) -> List[BatchResult]:
+        """
+        Wait for all submitted calls and finish the batch.
+
+        Returns:
+            list: A BatchResult per call, in submission order
+        """
+        with self._lock:
+            executor = self._executor
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+        with self._lock:
+            if self._finished is None:
+                self._finished = time.perf_counter()
+            return list(self._results)
+
+    def results(self) -> List[BatchResult]:
+        """
+        Get the outcome of every call, waiting for calls still running.
+
+        Returns:
+            list: A BatchResult per call, in submission order
+        """
+        return self.wait()
+
+    def values(self) -> List[Any]:
+        """
+        Get the return value of every call, waiting for calls still running.
+
+        Returns:
+            list: Return values in submission order
+
+        Raises:
+            Exception: The exception of the first call that failed
+        """
+        return [result.unwrap() for result in self.wait()]
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get batch statistics.
+
+        Returns:
+            dict: Calls submitted, succeeded and failed so far, the batch's
+            wall time, and the total, mean and maximum call durations in
+            seconds
+        """
+        with self._lock:
+            done = [result for future, result in zip(self._futures, self._results) if future.done()]
+            started, finished = self._started, self._finished
+            calls = len(self._futures)
+
+        durations = [result.duration for result in done]
+        if started is None:
+            wall_time = 0.0
+        else:
+            wall_time = (finished if finished is not None else time.perf_counter()) - started
+
+        return {
+            "calls": calls,
+            "succeeded": sum(1 for result in done if result.ok),
+            "failed": sum(1 for result in done if not result.ok),
+            "wall_time": wall_time,
+            "call_time": sum(durations),
+            "mean_call_time": sum(durations) / len(durations) if durations else 0.0,
+            "max_call_time": max(durations, default=0.0),
+        }
+
+    def __enter__(self) -> "Batch":
+        """Open the batch."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Wait for all submitted calls."""
+        self.wait()
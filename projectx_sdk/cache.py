@@ -0,0 +1,206 @@
+"""TTL + LRU response cache for reference-data endpoints."""
+
+import fnmatch
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+# Time to live in seconds per endpoint pattern; endpoints not listed are never cached
+DEFAULT_TTLS: Dict[str, float] = {
+    "Contract/search": 300.0,
+    "Contract/searchById": 3600.0,
+    "Account/search": 60.0,
+}
+
+
+class ResponseCache:
+    """
+    Size-bounded LRU cache of parsed API responses with per-endpoint TTLs.
+
+    Only endpoints with a TTL are cached, so trading calls always reach the
+    gateway. Entries expire after their endpoint's TTL and the least recently
+    used entry is evicted once ``max_entries`` is reached. Account entries are
+    also invalidated by ``GatewayUserAccount`` events, but only once the
+    client's real-time user hub is started and subscribed to accounts;
+    otherwise they live out their TTL::
+
+        client.realtime.start()
+        client.realtime.user.subscribe_accounts()
+
+    Cached results are shared objects, so callers must not mutate them.
+
+    Example::
+
+        cache = ResponseCache(ttls={"Contract/*": 600.0}, max_entries=256)
+        client = ProjectXClient(username="...", api_key="...", cache=cache)
+        client.contracts.search("ES")  # network
+        client.contracts.search("ES")  # cache hit
+        cache.invalidate("Contract/*")
+    """
+
+    def __init__(
+        self,
+        ttls: Optional[Dict[str, float]] = None,
+        max_entries: int = 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize a response cache.
+
+        Args:
+            ttls: Time to live in seconds per endpoint glob pattern (e.g.
+                'Contract/*'). Merged over DEFAULT_TTLS; a TTL of 0 disables
+                caching for the pattern.
+            max_entries: Maximum number of cached responses
+            clock: Monotonic clock returning seconds
+
+        Raises:
+            ValueError: If max_entries is less than 1
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+
+        self.ttls: Dict[str, float] = {**DEFAULT_TTLS, **(ttls or {})}
+        self.max_entries = max_entries
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        # key -> (path, expires_at, value), least recently used first
+        self._entries: "OrderedDict[Hashable, Tuple[str, float, Any]]" = OrderedDict()
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._invalidations = 0
+
+    def ttl_for(self, path: str) -> Optional[float]:
+        """
+        Get the time to live of an endpoint's responses.
+
+        Exact paths take precedence over glob patterns.
+
+        Args:
+            path: API path relative to '/api/'
+
+        Returns:
+            float: Seconds to keep responses, or None if the endpoint is not cached
+        """
+        ttl = self.ttls.get(path)
+        if ttl is None:
+            ttl = next(
+                (ttl for pattern, ttl in self.ttls.items() if fnmatch.fnmatchcase(path, pattern)),
+                None,
+            )
+        return ttl if ttl else None
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: The request's key (see coalesce.request_key)
+
+        Returns:
+            tuple: ``(True, value)`` on a hit, ``(False, None)`` on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] <= self._clock():
+                del self._entries[key]
+                self._expirations += 1
+                entry = None
+
+            if entry is None:
+                self._misses += 1
+                return False, None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return True, entry[2]
+
+    def set(self, key: Hashable, path: str, value: Any):
+        """
+        Store a response.
+
+        Args:
+            key: The request's key (see coalesce.request_key)
+            path: API path relative to '/api/', used for TTLs and invalidation
+            value: The parsed response
+        """
+        ttl = self.ttl_for(path)
+        if ttl is None:
+            return
+
+        with self._lock:
+            self._entries[key] = (path, self._clock() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self, pattern: str = "*") -> int:
+        """
+        Drop cached responses.
+
+        Args:
+            pattern: Glob pattern of the endpoints to drop (e.g. 'Account/*');
+                drops everything by default
+
+        Returns:
+            int: Number of entries dropped
+        """
+        with self._lock:
+            keys = [
+                key
+                for key, (path, _, _) in self._entries.items()
+                if fnmatch.fnmatchcase(path, pattern)
+            ]
+            for key in keys:
+                del self._entries[key]
+            self._invalidations += len(keys)
+            return len(keys)
+
+    def clear(self):
+        """Drop every cached response."""
+        self.invalidate()
+
+    def on_account_update(self, data: Any):
+        """
+        Invalidate account responses; registered for ``GatewayUserAccount`` events.
+
+        The client registers it with its real-time user hub, which only
+        receives these events after ``subscribe_accounts()``.
+
+        Args:
+            data: The account event payload
+        """
+        self.invalidate("Account/*")
+
+    def __len__(self) -> int:
+        """Return the number of cached responses."""
+        with self._lock:
+            return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            dict: Lookups served from the cache (``hits``) or not (``misses``),
+            entries evicted for space (``evictions``), expired (``expirations``)
+            or invalidated (``invalidations``), the current ``size`` and the
+            ``hit_ratio``
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "invalidations": self._invalidations,
+                "size": len(self._entries),
+                "hit_ratio": self._hits / lookups if lookups else 0.0,
+            }
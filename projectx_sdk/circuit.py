@@ -0,0 +1,437 @@
+"""Per-endpoint-family circuit breakers for ProjectX Gateway API requests."""
+
+import fnmatch
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence, Tuple
+
+import requests
+
+from projectx_sdk.exceptions import CircuitOpenError, RequestError
+from projectx_sdk.ratelimit import endpoint_family
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Calls that reduce risk and must reach the gateway even while their family is failing
+BYPASS_ENDPOINTS = (
+    "Order/cancel",
+    "Position/closeContract",
+    "Position/partialCloseContract",
+)
+
+StateCallback = Callable[[str, str, str], None]
+
+
+class Circuit:
+    """
+    Circuit of one endpoint family.
+
+    Outcomes of the last ``window`` calls are kept. The circuit opens when, over
+    at least ``min_calls`` calls, the share of failed calls reaches
+    ``error_rate`` or the share of slow calls reaches ``slow_call_rate``. After
+    ``reset_timeout`` it half-opens and lets ``probes`` requests through; if
+    they all succeed it closes, and any failure opens it again.
+    """
+
+    def __init__(
+        self,
+        family: str,
+        window: int = 20,
+        min_calls: int = 10,
+        error_rate: float = 0.5,
+        slow_call_duration: Optional[float] = None,
+        slow_call_rate: float = 0.5,
+        reset_timeout: float = 30.0,
+        probes: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize a circuit.
+
+        Args:
+            family: The endpoint family (e.g. 'History')
+            window: Number of recent calls the rates are computed over
+            min_calls: Calls needed in the window before the circuit may open
+            error_rate: Share of failed calls that opens the circuit
+            slow_call_duration: Seconds after which a call counts as slow (None
+                to ignore latency)
+            slow_call_rate: Share of slow calls that opens the circuit
+            reset_timeout: Seconds the circuit stays open before half-opening
+            probes: Requests let through, and required to succeed, while half-open
+            clock: Monotonic clock returning seconds
+        """
+        self.family = family
+        self.min_calls = min_calls
+        self.error_rate = error_rate
+        self.slow_call_duration = slow_call_duration
+        self.slow_call_rate = slow_call_rate
+        self.reset_timeout = reset_timeout
+        self.probes = probes
+        self._clock = clock
+
+        self.state = CLOSED
+        # (failed, slow) per call, oldest first
+        self._outcomes: Deque[Tuple[bool, bool]] = deque(maxlen=window)
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+
+        self.rejected = 0
+        self.opened = 0
+
+    def _set_state(self, state: str, transitions: List[Tuple[str, str, str]]):
+        """Move to a new state, recording the transition."""
+        if state == self.state:
+            return
+        transitions.append((self.family, self.state, state))
+        self.state = state
+        self._outcomes.clear()
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+        if state == OPEN:
+            self._opened_at = self._clock()
+            self.opened += 1
+
+    def allow(self, transitions: List[Tuple[str, str, str]]) -> bool:
+        """
+        Admit a request, half-opening the circuit once the reset timeout passed.
+
+        Args:
+            transitions: Collects state transitions as ``(family, old, new)``
+
+        Returns:
+            bool: True if the request is a half-open probe
+
+        Raises:
+            CircuitOpenError: If the circuit rejects the request
+        """
+        if self.state == OPEN:
+            remaining = self._opened_at + self.reset_timeout - self._clock()
+            if remaining > 0:
+                self.rejected += 1
+                raise CircuitOpenError(
+                    f"Circuit open for {self.family}; failing fast for {remaining:.1f}s",
+                    family=self.family,
+                    retry_after=remaining,
+                )
+            self._set_state(HALF_OPEN, transitions)
+
+        if self.state == HALF_OPEN:
+            if self._probes_in_flight + self._probe_successes >= self.probes:
+                self.rejected += 1
+                raise CircuitOpenError(
+                    f"Circuit half-open for {self.family}; waiting for probe requests",
+                    family=self.family,
+                )
+            self._probes_in_flight += 1
+            return True
+
+        return False
+
+    def record(
+        self,
+        failed: bool,
+        duration: float,
+        probe: bool,
+        transitions: List[Tuple[str, str, str]],
+    ):
+        """
+        Record the outcome of an admitted request.
+
+        Args:
+            failed: Whether the call failed in a way that indicates gateway trouble
+            duration: Seconds the call took
+            probe: Whether the call was a half-open probe
+            transitions: Collects state transitions as ``(family, old, new)``
+        """
+        slow = self.slow_call_duration is not None and duration >= self.slow_call_duration
+
+        if self.state == HALF_OPEN:
+            if not probe:
+                return
+            self._probes_in_flight = max(0, self._probes_in_flight - 1)
+            if failed or slow:
+                self._set_state(OPEN, transitions)
+            else:
+                self._probe_successes += 1
+                if self._probe_successes >= self.probes:
+                    self._set_state(CLOSED, transitions)
+            return
+
+        if self.state != CLOSED:
+            return
+
+        self._outcomes.append((failed, slow))
+        calls = len(self._outcomes)
+        if calls < self.min_calls:
+            return
+
+        failures = sum(1 for f, _ in self._outcomes if f)
+        slow_calls = sum(1 for _, s in self._outcomes if s)
+        if failures / calls >= self.error_rate or (
+            self.slow_call_duration is not None and slow_calls / calls >= self.slow_call_rate
+        ):
+            self._set_state(OPEN, transitions)
+
+    def release(self, probe: bool):
+        """
+        Return the admission of a request that ended without an outcome.
+
+        Args:
+            probe: Whether the request was a half-open probe
+        """
+        if probe and self.state == HALF_OPEN:
+            self._probes_in_flight = max(0, self._probes_in_flight - 1)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the circuit's state and counters."""
+        calls = len(self._outcomes)
+        return {
+            "state": self.state,
+            "calls": calls,
+            "failures": sum(1 for f, _ in self._outcomes if f),
+            "slow_calls": sum(1 for _, s in self._outcomes if s),
+            "opened": self.opened,
+            "rejected": self.rejected,
+        }
+
+
+class CircuitBreaker:
+    """
+    Circuit breakers keyed by endpoint family.
+
+    When the gateway degrades, requests to a failing family (``History``,
+    ``Order``, ...) fail immediately with CircuitOpenError instead of each
+    waiting out the full timeout. Network failures, timeouts and 5xx responses
+    count as failures; business errors (``success: false``) and 4xx responses
+    do not. Endpoints matching ``bypass`` (order cancels and position closes by
+    default) are always sent.
+
+    Example::
+
+        def log_transition(family, old, new):
+            print(f"{family}: {old} -> {new}")
+
+        breaker = CircuitBreaker(error_rate=0.3, slow_call_duration=5.0,
+                                 on_state_change=log_transition)
+        client = ProjectXClient(username="...", api_key="...", circuit_breaker=breaker)
+    """
+
+    def __init__(
+        self,
+        window: int = 20,
+        min_calls: int = 10,
+        error_rate: float = 0.5,
+        slow_call_duration: Optional[float] = None,
+        slow_call_rate: float = 0.5,
+        reset_timeout: float = 30.0,
+        probes: int = 1,
+        bypass: Sequence[str] = BYPASS_ENDPOINTS,
+        on_state_change: Optional[StateCallback] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize a circuit breaker.
+
+        Args:
+            window: Number of recent calls per family the rates are computed over
+            min_calls: Calls needed in the window before a circuit may open
+            error_rate: Share of failed calls that opens a circuit
+            slow_call_duration: Seconds after which a call counts as slow (None
+                to ignore latency)
+            slow_call_rate: Share of slow calls that opens a circuit
+            reset_timeout: Seconds a circuit stays open before half-opening
+            probes: Requests let through, and required to succeed, while half-open
+            bypass: Glob patterns of endpoints that are never blocked
+            on_state_change: Called with ``(family, old_state, new_state)`` on
+                every transition
+            clock: Monotonic clock returning seconds
+
+        Raises:
+            ValueError: If the configuration is invalid
+        """
+        if window < 1 or not 1 <= min_calls <= window or probes < 1:
+            raise ValueError("window, min_calls and probes must be positive, min_calls <= window")
+
+        self.window = window
+        self.min_calls = min_calls
+        self.error_rate = error_rate
+        self.slow_call_duration = slow_call_duration
+        self.slow_call_rate = slow_call_rate
+        self.reset_timeout = reset_timeout
+        self.probes = probes
+        self.bypass = tuple(bypass)
+        self.on_state_change = on_state_change
+        self.clock = clock
+
+        self._lock = threading.Lock()
+        self._circuits: Dict[str, Circuit] = {}
+
+    def circuit(self, path: str) -> Circuit:
+        """
+        Get the circuit for the family of an API path.
+
+        Args:
+            path: API path relative to '/api/'
+
+        Returns:
+            Circuit: The family's circuit
+        """
+        family = endpoint_family(path)
+        with self._lock:
+            circuit = self._circuits.get(family)
+            if circuit is None:
+                circuit = Circuit(
+                    family,
+                    window=self.window,
+                    min_calls=self.min_calls,
+                    error_rate=self.error_rate,
+                    slow_call_duration=self.slow_call_duration,
+                    slow_call_rate=self.slow_call_rate,
+                    reset_timeout=self.reset_timeout,
+                    probes=self.probes,
+                    clock=self.clock,
+                )
+                self._circuits[family] = circuit
+            return circuit
+
+    def is_bypassed(self, path: str) -> bool:
+        """
+        Check whether an endpoint skips the breaker.
+
+        Args:
+            path: API path relative to '/api/'
+
+        Returns:
+            bool: True if the endpoint matches a bypass pattern
+        """
+        return any(fnmatch.fnmatchcase(path, pattern) for pattern in self.bypass)
+
+    @staticmethod
+    def is_failure(error: Optional[BaseException]) -> bool:
+        """
+        Check whether an error indicates gateway trouble.
+
+        Args:
+            error: The exception raised by a request, or None on success
+
+        Returns:
+            bool: True for network failures, timeouts and 5xx responses
+        """
+        if isinstance(error, requests.RequestException):
+            return True
+        if isinstance(error, RequestError):
+            if isinstance(error.__cause__, requests.RequestException):
+                return True
+            return isinstance(error.error_code, int) and error.error_code >= 500
+        return False
+
+    def _notify(self, transitions: List[Tuple[str, str, str]]):
+        """Report state transitions outside the lock."""
+        for family, old, new in transitions:
+            log = logger.warning if new == OPEN else logger.info
+            log(f"Circuit for {family} {old} -> {new}")
+            if self.on_state_change is not None:
+                try:
+                    self.on_state_change(family, old, new)
+                except Exception as e:
+                    logger.error(f"Error in circuit state callback: {e}")
+
+    def before(self, path: str) -> Optional[Tuple[Circuit, bool]]:
+        """
+        Admit a request.
+
+        Args:
+            path: API path relative to '/api/'
+
+        Returns:
+            tuple: ``(circuit, probe)`` to pass to after(), or None if the
+            endpoint bypasses the breaker
+
+        Raises:
+            CircuitOpenError: If the family's circuit rejects the request
+        """
+        if self.is_bypassed(path):
+            return None
+
+        circuit = self.circuit(path)
+        transitions: List[Tuple[str, str, str]] = []
+        try:
+            with self._lock:
+                probe = circuit.allow(transitions)
+        finally:
+            self._notify(transitions)
+        return circuit, probe
+
+    def after(
+        self,
+        admission: Optional[Tuple[Circuit, bool]],
+        duration: float,
+        error: Optional[BaseException] = None,
+    ):
+        """
+        Record the outcome of an admitted request.
+
+        Args:
+            admission: The value returned by before()
+            duration: Seconds the request took
+            error: The exception the request raised, if any
+        """
+        if admission is None:
+            return
+
+        circuit, probe = admission
+        transitions: List[Tuple[str, str, str]] = []
+        with self._lock:
+            circuit.record(self.is_failure(error), duration, probe, transitions)
+        self._notify(transitions)
+
+    def release(self, admission: Optional[Tuple[Circuit, bool]]):
+        """
+        Return the admission of a request that ended without an outcome.
+
+        Used for requests cancelled by their caller, whose outcome says
+        nothing about the gateway; a half-open probe slot is freed for the
+        next request without closing or opening the circuit.
+
+        Args:
+            admission: The value returned by before()
+        """
+        if admission is None:
+            return
+
+        circuit, probe = admission
+        with self._lock:
+            circuit.release(probe)
+
+    def state(self, path: str) -> str:
+        """
+        Get the state of an endpoint family's circuit.
+
+        Args:
+            path: API path or family name
+
+        Returns:
+            str: 'closed', 'open' or 'half_open'
+        """
+        circuit = self.circuit(path)
+        with self._lock:
+            return circuit.state
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get circuit breaker statistics.
+
+        Returns:
+            dict: Per-family state, calls in the window with their failures and
+            slow calls, times opened (``opened``) and requests rejected while
+            open or half-open (``rejected``)
+        """
+        with self._lock:
+            return {family: circuit.snapshot() for family, circuit in self._circuits.items()}
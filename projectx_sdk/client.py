@@ -1,11 +1,22 @@
 """Main client for ProjectX Gateway API."""
 
 import logging
-from typing import Any, Dict, Optional, cast
+import socket
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Type, Union, cast
+from urllib.parse import urlsplit
 
+import pydantic
 import requests
 
 from projectx_sdk.auth import Authenticator
+from projectx_sdk.batch import Batch
+from projectx_sdk.cache import ResponseCache
+from projectx_sdk.circuit import CircuitBreaker
+from projectx_sdk.coalesce import SingleFlight, request_key
+from projectx_sdk.codec import JSONCodec, get_codec
+from projectx_sdk.deadline import Deadline, resolve_deadline
 from projectx_sdk.endpoints import (
     AccountService,
     ContractService,
@@ -16,21 +27,394 @@ from projectx_sdk.endpoints import (
 )
 from projectx_sdk.exceptions import (
     AuthenticationError,
+    DeadlineExceededError,
     ProjectXError,
+    RateLimitError,
     RequestError,
     ResourceNotFoundError,
 )
+from projectx_sdk.hedge import HedgePolicy
+from projectx_sdk.hooks import RequestEvent, RequestHooks
+from projectx_sdk.metrics import MetricsSetting, resolve_metrics
+from projectx_sdk.ratelimit import RateLimiter, parse_retry_after
 from projectx_sdk.realtime import SyncRealTimeClient
+from projectx_sdk.retry import RetryPolicy, RetrySetting, resolve_policy
+from projectx_sdk.streaming import JSONArrayStream
+from projectx_sdk.token_cache import TokenCache
+from projectx_sdk.tracing import Tracer, trace
+from projectx_sdk.transport import SessionPool, Transport
+
+from projectx_sdk.models.base import BaseResponse
 
 logger = logging.getLogger(__name__)
 
 
+def _normalize_path(path: str) -> str:
+    """
+    Strip any leading API prefix from a request path.
+
+    Args:
+        path: API path, with or without a leading '/api/'
+
+    Returns:
+        The path relative to the '/api/' root (e.g. 'Order/place')
+    """
+    # Ensure path doesn't start with '/api/' since we'll add it
+    if path.startswith("/api/"):
+        return path[5:]  # Remove the leading '/api/'
+    if path.startswith("api/"):
+        return path[4:]  # Remove the leading 'api/'
+    return path
+
+
+_STDLIB_CODEC = JSONCodec()
+
+
+def _encode_body(
+    codec: JSONCodec,
+    data: Optional[Dict[str, Any]],
+    json: Optional[Dict[str, Any]],
+    headers: Dict[str, str],
+) -> Tuple[Any, Optional[Dict[str, Any]]]:
+    """
+    Pre-encode a JSON request body with the client's codec.
+
+    Args:
+        codec: The codec to encode with
+        data: Request body (form data)
+        json: Request body (JSON data)
+        headers: Request headers, updated with the JSON content type
+
+    Returns:
+        tuple: The ``data`` and ``json`` arguments to hand to the transport
+    """
+    if json is None or data is not None:
+        return data, json
+
+    headers.setdefault("Content-Type", "application/json")
+    return codec.dumps(json), None
+
+
+def _retry_after(response: Any) -> Optional[float]:
+    """
+    Get the parsed ``Retry-After`` header of a response.
+
+    Args:
+        response: The HTTP response
+
+    Returns:
+        float: Seconds to wait, or None if the header is missing or malformed
+    """
+    headers = getattr(response, "headers", None) or {}
+    value = headers.get("Retry-After")
+    if value is None:
+        # Plain dict headers (e.g. from the in-memory transports) are case-sensitive
+        value = next((v for k, v in headers.items() if k.lower() == "retry-after"), None)
+    return parse_retry_after(value)
+
+
+def _resolve_rate_limiter(rate_limiter: Union[RateLimiter, bool, None]) -> Optional[RateLimiter]:
+    """
+    Resolve a client's rate_limiter setting.
+
+    Args:
+        rate_limiter: A RateLimiter, None or True for the default limiter, or
+            False to disable client-side rate limiting
+
+    Returns:
+        RateLimiter: The limiter, or None if disabled
+    """
+    if rate_limiter is None or rate_limiter is True:
+        return RateLimiter()
+    if rate_limiter is False:
+        return None
+    return rate_limiter
+
+
+def _resolve_retry_policy(retry_policy: Union[RetryPolicy, bool, None]) -> Optional[RetryPolicy]:
+    """
+    Resolve a client's retry_policy setting.
+
+    Args:
+        retry_policy: A RetryPolicy, None or True for the default policy, or
+            False to disable retries
+
+    Returns:
+        RetryPolicy: The policy, or None if disabled
+    """
+    if retry_policy is None or retry_policy is True:
+        return RetryPolicy()
+    if retry_policy is False:
+        return None
+    return retry_policy
+
+
+def _resolve_coalescer(coalesce: Union[SingleFlight, bool, None]) -> Optional[SingleFlight]:
+    """
+    Resolve a client's coalesce setting.
+
+    Args:
+        coalesce: A SingleFlight, True for the default coalescer, or None or
+            False to leave coalescing off
+
+    Returns:
+        SingleFlight: The coalescer, or None if disabled
+    """
+    if coalesce is True:
+        return SingleFlight()
+    if coalesce is None or coalesce is False:
+        return None
+    return coalesce
+
+
+def _resolve_cache(cache: Union[ResponseCache, bool, None]) -> Optional[ResponseCache]:
+    """
+    Resolve a client's cache setting.
+
+    Args:
+        cache: A ResponseCache, True for a cache with the default TTLs, or None
+            or False to leave caching off
+
+    Returns:
+        ResponseCache: The cache, or None if disabled
+    """
+    if cache is True:
+        return ResponseCache()
+    if cache is None or cache is False:
+        return None
+    return cache
+
+
+def _resolve_token_cache(token_cache: Union[TokenCache, bool, None]) -> Optional[TokenCache]:
+    """
+    Resolve a client's token cache setting.
+
+    Args:
+        token_cache: A TokenCache, True for one at the default path, or None
+            or False to leave it off
+
+    Returns:
+        TokenCache: The token cache, or None if disabled
+    """
+    if token_cache is True:
+        return TokenCache()
+    if token_cache is None or token_cache is False:
+        return None
+    return token_cache
+
+
+def _resolve_circuit_breaker(
+    circuit_breaker: Union[CircuitBreaker, bool, None],
+) -> Optional[CircuitBreaker]:
+    """
+    Resolve a client's circuit_breaker setting.
+
+    Args:
+        circuit_breaker: A CircuitBreaker, True for the default thresholds, or
+            None or False to leave the breaker off
+
+    Returns:
+        CircuitBreaker: The breaker, or None if disabled
+    """
+    if circuit_breaker is True:
+        return CircuitBreaker()
+    if circuit_breaker is None or circuit_breaker is False:
+        return None
+    return circuit_breaker
+
+
+def _resolve_hedge_policy(hedge_policy: Union[HedgePolicy, bool, None]) -> Optional[HedgePolicy]:
+    """
+    Resolve a client's hedge_policy setting.
+
+    Args:
+        hedge_policy: A HedgePolicy, True for the default policy, or None or
+            False to leave hedging off
+
+    Returns:
+        HedgePolicy: The policy, or None if disabled
+    """
+    if hedge_policy is True:
+        return HedgePolicy()
+    if hedge_policy is None or hedge_policy is False:
+        return None
+    return hedge_policy
+
+
+def _warm_up_hosts(urls: List[Optional[str]]) -> List[Tuple[str, int]]:
+    """Get the distinct (host, port) pairs of the given URLs, skipping missing ones."""
+    hosts: List[Tuple[str, int]] = []
+    for url in urls:
+        if not url:
+            continue
+        parts = urlsplit(url)
+        if not parts.hostname:
+            continue
+        host = (parts.hostname, parts.port or (80 if parts.scheme in ("http", "ws") else 443))
+        if host not in hosts:
+            hosts.append(host)
+    return hosts
+
+
+def _check_status(response: Any, path: str, codec: Optional[JSONCodec] = None):
+    """
+    Raise the matching SDK exception for an HTTP error status.
+
+    Args:
+        response: The HTTP response
+        path: The API path the request was sent to
+        codec: Codec used to decode error bodies (stdlib json if not provided)
+
+    Raises:
+        AuthenticationError: If authentication fails
+        RateLimitError: If the gateway rejected the request with 429
+        RequestError: If the request fails
+        ResourceNotFoundError: If the resource is not found
+    """
+    if response.status_code == 401:
+        raise AuthenticationError("Authentication failed: Invalid or expired token")
+
+    if response.status_code == 404:
+        raise ResourceNotFoundError(f"Resource not found: {path}")
+
+    if response.status_code >= 400:
+        error_data = {}
+        try:
+            error_data = (codec or _STDLIB_CODEC).loads(response.content)
+        except Exception:
+            pass
+
+        message = f"API request failed with status {response.status_code}"
+        if error_data and "errorMessage" in error_data:
+            message = f"{message}: {error_data['errorMessage']}"
+
+        if response.status_code == 429:
+            retry_after = _retry_after(response)
+            if retry_after is not None:
+                message = f"{message} (retry after {retry_after:g}s)"
+            raise RateLimitError(
+                message, error_code=429, response=error_data, retry_after=retry_after
+            )
+
+        raise RequestError(message, error_code=response.status_code, response=error_data)
+
+
+def _parse_response(response: Any, path: str, codec: Optional[JSONCodec] = None) -> Dict[str, Any]:
+    """
+    Map an HTTP response to its JSON payload or the matching SDK exception.
+
+    Works with any response object exposing ``status_code``, ``content`` and ``text``.
+
+    Args:
+        response: The HTTP response
+        path: The API path the request was sent to
+        codec: Codec used to decode the body (stdlib json if not provided)
+
+    Returns:
+        The parsed JSON response
+
+    Raises:
+        AuthenticationError: If authentication fails
+        RequestError: If the request fails
+        ResourceNotFoundError: If the resource is not found
+        ProjectXError: For other API errors
+    """
+    _check_status(response, path, codec)
+
+    # Parse the response
+    try:
+        json_data = (codec or _STDLIB_CODEC).loads(response.content)
+    except ValueError:
+        raise RequestError(f"Invalid JSON response: {response.text}")
+
+    # Defensive check: ensure we got a dictionary (handles None case for mypy)
+    if json_data is None:
+        raise ProjectXError("Received null response from API")
+
+    # Safe to cast now that we've checked
+    response_data: Dict[str, Any] = cast(Dict[str, Any], json_data)
+
+    _check_success(response_data)
+    return response_data
+
+
+def _check_success(response_data: Dict[str, Any]):
+    """
+    Raise for API-level errors reported in a response envelope.
+
+    Args:
+        response_data: The decoded response (at least its ``success``,
+            ``errorCode`` and ``errorMessage`` fields)
+
+    Raises:
+        ProjectXError: If the response reports ``success: false``
+    """
+    success = response_data.get("success", True)  # type: ignore[union-attr]
+    if not success:
+        error_code = response_data.get("errorCode", 0)  # type: ignore[union-attr]
+        err_msg = response_data.get("errorMessage", "Unknown error")  # type: ignore[union-attr]
+
+        raise ProjectXError(
+            f"API error {error_code}: {err_msg}",
+            error_code=error_code,
+            response=response_data,
+        )
+
+
+def _parse_model_response(
+    response: Any,
+    path: str,
+    response_model: Type[BaseResponse],
+    codec: Optional[JSONCodec] = None,
+) -> BaseResponse:
+    """
+    Validate an HTTP response body directly into a response model.
+
+    The raw body bytes go straight through pydantic's JSON validator, so no
+    intermediate dict tree is built for large payloads such as bars or trades.
+    Error envelopes (``success: false``) and bodies the model rejects are
+    handed to _parse_response, which raises the same errors as the dict path.
+
+    Args:
+        response: The HTTP response (must expose ``content``)
+        path: The API path the request was sent to
+        response_model: The BaseResponse subclass to validate into
+        codec: Codec used by the fallback path (stdlib json if not provided)
+
+    Returns:
+        The validated response model
+
+    Raises:
+        AuthenticationError: If authentication fails
+        RequestError: If the request fails
+        ResourceNotFoundError: If the resource is not found
+        ProjectXError: For other API errors
+    """
+    _check_status(response, path, codec)
+
+    try:
+        model: BaseResponse = response_model.model_validate_json(response.content)
+    except pydantic.ValidationError:
+        # Slow path: map invalid JSON and error envelopes like any other response
+        parsed: BaseResponse = response_model.model_validate(_parse_response(response, path, codec))
+        return parsed
+
+    if not model.success:
+        _parse_response(response, path, codec)
+
+    return model
+
+
 class ProjectXClient:
     """
     Main client for interacting with the ProjectX Gateway API.
 
     This client provides access to all the API services and handles authentication,
     session management, and request routing.
+
+    A single client can be shared by many threads: token refreshes are
+    serialized, the session pool, rate limiter, retry budget, cache and
+    circuit breaker are all thread-safe, and ``realtime`` is created once.
     """
 
     # Map of environment names to base URLs (only new endpoints)
@@ -102,6 +486,20 @@ class ProjectXClient:
         token: Optional[str] = None,
         base_url: Optional[str] = None,
         timeout: int = 30,
+        transport: Optional[Transport] = None,
+        codec: Union[str, JSONCodec, None] = None,
+        rate_limiter: Union[RateLimiter, bool, None] = None,
+        retry_policy: Union[RetryPolicy, bool, None] = None,
+        coalesce: Union[SingleFlight, bool, None] = None,
+        cache: Union[ResponseCache, bool, None] = None,
+        circuit_breaker: Union[CircuitBreaker, bool, None] = None,
+        hedge_policy: Union[HedgePolicy, bool, None] = None,
+        hooks: Optional[RequestHooks] = None,
+        metrics: MetricsSetting = None,
+        tracer: Optional[Tracer] = None,
+        auto_refresh: bool = False,
+        token_cache: Union[TokenCache, bool, None] = None,
+        auth: Optional[Authenticator] = None,
     ):
         """
         Initialize a new ProjectX client.
@@ -122,6 +520,59 @@ class ProjectXClient:
             token: Existing auth token (if you already have one)
             base_url: Override the base URL (if not using an environment)
             timeout: Request timeout in seconds
+            transport: Transport shared by all services and the authenticator.
+                A default keep-alive SessionPool is created if not provided; pass a
+                FakeTransport or RecordReplayTransport to run without a network.
+                close() only closes a transport the client created.
+            codec: JSON codec for request and response bodies and real-time hub
+                frames: 'auto' (fastest installed), 'orjson', 'msgspec', 'json' or a
+                JSONCodec instance. Defaults to the stdlib json module.
+            rate_limiter: Client-side rate limiter shared by all services. A
+                RateLimiter with the gateway's published limits is used if not
+                provided; pass False to disable rate limiting. Throttled requests
+                wait up to 30 seconds, and order and position-closing calls up to
+                1 second, before raising RateLimitError.
+            retry_policy: Retry policy for failed requests. A default RetryPolicy
+                (read-only endpoints, 3 attempts, exponential backoff with jitter)
+                is used if not provided; pass False to disable retries.
+            coalesce: Share one network call between identical read-only requests
+                (same path, query and JSON body) that are in flight at the same
+                time. Pass True or a SingleFlight to enable; off by default.
+            cache: Response cache for reference data (contract and account
+                searches). Pass True for the default TTLs or a ResponseCache to
+                configure them; off by default. Account entries are invalidated
+                by ``GatewayUserAccount`` events once ``realtime`` is started and
+                ``realtime.user.subscribe_accounts()`` called; until then they
+                only expire with their TTL.
+            circuit_breaker: Per-endpoint-family circuit breaker that fails requests
+                with CircuitOpenError while the gateway is failing. Pass True for
+                the default thresholds or a CircuitBreaker; off by default.
+            hedge_policy: Send a second, identical request when a latency-critical
+                read (``positions.search_open``, ``orders.search_open``) is slower
+                than usual, and use whichever answers first. Pass True for the
+                default policy or a HedgePolicy; off by default.
+            hooks: Lifecycle hooks (before_request, after_response, on_error)
+                called with a RequestEvent carrying each attempt's endpoint,
+                status, payload sizes and phase timings. Hooks can also be
+                registered later on ``client.hooks``.
+            metrics: Metrics registry for request, real-time and token refresh
+                counters and latency histograms. The process-wide
+                ``default_registry()`` is used if not provided; pass a
+                MetricsRegistry to keep them separate or False to disable.
+            tracer: Tracer recording spans for request attempts, token
+                validation, hub invocations and hub events, with orders
+                correlated to their hub events through ``custom_tag``. Off if
+                not provided.
+            auto_refresh: Renew the token in a background thread ahead of its
+                expiry, so requests never wait for a renewal (see
+                Authenticator.start_refresher). Stopped by ``close()``.
+            token_cache: On-disk token cache shared by the processes of the
+                host, so that a process logging in with credentials another
+                one has already used starts without a login. Pass True for a
+                TokenCache at the default path or a TokenCache; off by default.
+            auth: Authenticator to use instead of building one from the
+                credentials above, e.g. one managed by an AuthPool. The
+                client does not stop its background refresher on ``close()``.
         """
         # Set up the base URL
         if base_url:
@@ -133,9 +584,24 @@ class ProjectXClient:
 
         self.environment = environment
         self.timeout = timeout
+        self.codec = get_codec(codec)
+        self.rate_limiter = _resolve_rate_limiter(rate_limiter)
+        self.retry_policy = _resolve_retry_policy(retry_policy)
+        self.coalescer = _resolve_coalescer(coalesce)
+        self.cache = _resolve_cache(cache)
+        self.circuit_breaker = _resolve_circuit_breaker(circuit_breaker)
+        self.hedge_policy = _resolve_hedge_policy(hedge_policy)
+        self.hooks = hooks or RequestHooks()
+        self.metrics = resolve_metrics(metrics)
+        self.tracer = tracer
+
+        # Pooled keep-alive connections shared by every service and the authenticator
+        self._owns_transport = transport is None
+        self.transport = transport or SessionPool()
 
-        # Set up the authenticator
-        self.auth = Authenticator(
+        # Set up the authenticator, unless one is managed elsewhere
+        self._owns_auth = auth is None
+        self.auth = auth or Authenticator(
             base_url=self.base_url,
             username=username,
             api_key=api_key,
@@ -145,7 +611,13 @@ class ProjectXClient:
             verify_key=verify_key,
             token=token,
             timeout=timeout,
+            transport=self.transport,
+            metrics=self.metrics,
+            tracer=tracer,
+            token_cache=_resolve_token_cache(token_cache),
         )
+        if auto_refresh:
+            self.auth.start_refresher()
 
         # Initialize service endpoints
         self.accounts = AccountService(self)
@@ -157,24 +629,41 @@ class ProjectXClient:
 
         # Real-time client (lazy-initialized)
         self._realtime: Optional[SyncRealTimeClient] = None
+        self._realtime_lock = threading.Lock()
+
+        # Background connection warming (see warm_up)
+        self._keep_warm: Optional[threading.Thread] = None
+        self._keep_warm_stop = threading.Event()
 
     @property
     def realtime(self) -> SyncRealTimeClient:
         """
         Get the real-time client for WebSocket connections.
 
-        This is lazy-initialized on first access.
+        This is lazy-initialized on first access; threads racing to access it
+        all get the same instance.
 
         Returns:
             The real-time client
         """
-        if not self._realtime:
+        if self._realtime is not None:
+            return self._realtime
+
+        with self._realtime_lock:
+            if self._realtime is not None:
+                # Created by another thread while this one waited
+                return self._realtime
+
             token = self.auth.get_token()
             self._realtime = SyncRealTimeClient(
                 auth_token=token,
                 environment=self.environment,
                 user_hub_url=self.USER_HUB_URLS.get(self.environment),
                 market_hub_url=self.MARKET_HUB_URLS.get(self.environment),
+                codec=self.codec,
+                on_account_update=self.cache.on_account_update if self.cache else None,
+                metrics=self.metrics,
+                tracer=self.tracer,
             )
         return self._realtime
 
@@ -187,7 +676,11 @@ class ProjectXClient:
         json: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
         timeout: Optional[int] = None,
-    ) -> Dict[str, Any]:
+        response_model: Optional[Type[BaseResponse]] = None,
+        retry: RetrySetting = None,
+        idempotent: bool = False,
+        deadline: Optional[Deadline] = None,
+    ) -> Any:
         """
         Make an HTTP request to the API.
 
@@ -199,110 +692,468 @@ class ProjectXClient:
             json: Request body (JSON data)
             headers: Additional headers
             timeout: Request timeout (overrides client timeout)
+            response_model: Response model to validate the raw body into. When
+                given, the validated model is returned instead of a dict.
+            retry: Retry policy for this call (overrides the client's policy), or
+                False to disable retries
+            idempotent: Whether a mutating call is safe to retry (e.g. because it
+                carries a unique custom tag)
+            deadline: Deadline for the whole call, including token refresh,
+                rate limiting and retries (the earlier of it and the active
+                deadline applies)
 
         Returns:
-            The parsed JSON response
+            The parsed JSON response, or an instance of ``response_model``
 
         Raises:
             AuthenticationError: If authentication fails
+            RateLimitError: If the request was rate limited
+            DeadlineExceededError: If the deadline passes before the call completes
             RequestError: If the request fails
             ResourceNotFoundError: If the resource is not found
             ProjectXError: For other API errors
         """
-        # Make sure we have a token
-        token = self.auth.get_token()
-
-        # Prepare the request URL and headers
-        # Ensure path doesn't start with '/api/' since we'll add it
-        if path.startswith("/api/"):
-            path = path[5:]  # Remove the leading '/api/'
-        elif path.startswith("api/"):
-            path = path[4:]  # Remove the leading 'api/'
-
-        url = f"{self.base_url}/api/{path}"
-        request_headers = {"Accept": "application/json", "Authorization": f"Bearer {token}"}
+        path = _normalize_path(path)
+        request_headers = {"Accept": "application/json"}
 
         if headers:
             request_headers.update(headers)
 
         request_timeout = timeout if timeout is not None else self.timeout
+        payload = json
+        body, json = _encode_body(self.codec, data, json, request_headers)
+        policy = resolve_policy(self.retry_policy, retry)
+        deadline = resolve_deadline(deadline)
+
+        def execute() -> Any:
+            return self._execute(
+                method,
+                path,
+                params,
+                body,
+                json,
+                request_headers,
+                request_timeout,
+                response_model,
+                policy,
+                idempotent,
+                deadline,
+            )
+
+        # Only plain read requests may be cached or share a response; custom
+        # headers or form data could change what the server returns
+        if headers or data is not None or method.upper() not in ("GET", "POST"):
+            return execute()
+
+        key = request_key(method, path, params, payload, response_model)
+        cache = self.cache if self.cache is not None and self.cache.ttl_for(path) else None
+        if cache is not None:
+            hit, value = cache.get(key)
+            if hit:
+                return value
+
+        coalescer = self.coalescer
+        if coalescer is not None and coalescer.applies_to(method, path):
+            result = coalescer.do(key, execute, deadline)
+        else:
+            result = execute()
+
+        if cache is not None:
+            cache.set(key, path, result)
+        return result
+
+    def _execute(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]],
+        body: Any,
+        json: Optional[Dict[str, Any]],
+        headers: Dict[str, str],
+        timeout: Optional[int],
+        response_model: Optional[Type[BaseResponse]],
+        policy: Optional[RetryPolicy],
+        idempotent: bool,
+        deadline: Optional[Deadline] = None,
+    ) -> Any:
+        """Send a request, retrying failed attempts as the policy allows."""
+        if policy is not None:
+            policy.start()
+
+        def send() -> Any:
+            return self._send(
+                method, path, params, body, json, headers, timeout, response_model, deadline
+            )
+
+        hedge = self.hedge_policy
+        if hedge is not None and not hedge.applies_to(method, path):
+            hedge = None
+
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                return hedge.call(path, send) if hedge is not None else send()
+            except DeadlineExceededError:
+                raise
+            except ProjectXError as e:
+                delay = policy.next_delay(path, attempt, e, idempotent) if policy else None
+                if delay is None:
+                    e.attempts = attempt
+                    raise
+                # Give up now rather than sleep past the deadline
+                if deadline is not None and delay >= deadline.remaining():
+                    raise deadline.exceeded(f"retry of {path}") from e
+                policy.sleep(delay)  # type: ignore[union-attr]
+
+    def _send(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]],
+        body: Any,
+        json: Optional[Dict[str, Any]],
+        headers: Dict[str, str],
+        timeout: Optional[float],
+        response_model: Optional[Type[BaseResponse]],
+        deadline: Optional[Deadline] = None,
+    ) -> Any:
+        """Make a single attempt of a request (see request)."""
+        event = RequestEvent(method, path, len(body) if isinstance(body, (bytes, str)) else 0)
+        self.hooks.emit_before(event)
+        span = trace(self.tracer, f"{method} {path}", {"endpoint": path})
+
+        breaker = self.circuit_breaker
+        admission = None
+        started: Optional[float] = None
+        error: Optional[BaseException] = None
 
         try:
-            response = requests.request(
+            # An attempt that cannot finish in time is not admitted by the breaker
+            if deadline is not None:
+                deadline.check(path)
+
+            # Make sure we have a token
+            token = self.auth.get_token(deadline)
+
+            url = f"{self.base_url}/api/{path}"
+            request_headers = {**headers, "Authorization": f"Bearer {token}"}
+            event.lap("token")
+
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(path, deadline)
+
+            event.lap("rate_limit")
+
+            if deadline is not None:
+                timeout = deadline.limit(timeout, path)
+
+            # Fail fast while the endpoint family's circuit is open. Admitted only
+            # now, so that client-side failures above (token, rate limiter,
+            # deadline) are never recorded as outcomes of a gateway call.
+            if breaker is not None:
+                admission = breaker.before(path)
+                started = breaker.clock()
+
+            try:
+                response = self.transport.request(
+                    method=method,
+                    url=url,
+                    params=params,
+                    data=body,
+                    json=json,
+                    headers=request_headers,
+                    timeout=timeout,
+                )
+            except requests.RequestException as e:
+                if isinstance(e, requests.Timeout) and deadline is not None and deadline.expired:
+                    raise deadline.exceeded(path) from e
+                raise RequestError(f"Request failed: {str(e)}") from e
+            event.record_response(response)
+
+            if self.rate_limiter is not None:
+                self.rate_limiter.record(path, response.status_code, _retry_after(response))
+            if response_model is not None:
+                model = _parse_model_response(response, path, response_model, self.codec)
+                event.lap("validate")
+                return model
+            data = _parse_response(response, path, self.codec)
+            event.lap("decode")
+            return data
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            if breaker is not None:
+                # Only the round trip counts towards latency, not client-side waits
+                duration = breaker.clock() - started if started is not None else 0.0
+                breaker.after(admission, duration, error)
+
+            event.finish(error)
+            if self.metrics is not None:
+                self.metrics.observe_request(event)
+            if error is None:
+                self.hooks.emit_after(event)
+            else:
+                self.hooks.emit_error(event)
+            span.record_request(event)
+            span.end(error)
+
+    def stream(
+        self,
+        method: str,
+        path: str,
+        key: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        timeout: Optional[int] = None,
+        item_model: Optional[Type[pydantic.BaseModel]] = None,
+        chunk_size: int = 65536,
+        deadline: Optional[Deadline] = None,
+    ) -> Iterator[Any]:
+        """
+        Make an HTTP request and parse one list of its response incrementally.
+
+        The elements of the ``key`` array (e.g. ``bars``) are yielded as they
+        are decoded from the body, so memory stays bounded however large the
+        response is. API-level errors (``success: false``) are only known once
+        the whole body has been read and are raised at the end of iteration.
+        Streamed requests are not retried, cached or coalesced.
+
+        Args:
+            method: HTTP method ('GET', 'POST', etc.)
+            path: API path (will be appended to base URL)
+            key: Name of the top-level array to stream
+            params: Query parameters
+            json: Request body (JSON data)
+            timeout: Request timeout (overrides client timeout)
+            item_model: Model to validate each element into (dicts if not provided)
+            chunk_size: Bytes read from the connection at a time
+            deadline: Deadline for reading the whole response (the earlier of
+                it and the deadline active when iteration starts applies)
+
+        Yields:
+            Each element of the array, as a dict or an ``item_model`` instance
+
+        Raises:
+            AuthenticationError: If authentication fails
+            RateLimitError: If the request was rate limited
+            DeadlineExceededError: If the deadline passes before the body is read
+            RequestError: If the request fails or the body is not valid JSON
+            ResourceNotFoundError: If the resource is not found
+            ProjectXError: For other API errors
+        """
+        path = _normalize_path(path)
+        request_headers = {"Accept": "application/json"}
+        request_timeout: Optional[float] = timeout if timeout is not None else self.timeout
+        body, json = _encode_body(self.codec, None, json, request_headers)
+        deadline = resolve_deadline(deadline)
+
+        token = self.auth.get_token(deadline)
+        request_headers["Authorization"] = f"Bearer {token}"
+
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(path, deadline)
+
+        if deadline is not None:
+            request_timeout = deadline.limit(request_timeout, path)
+
+        try:
+            response = self.transport.request(
                 method=method,
-                url=url,
+                url=f"{self.base_url}/api/{path}",
                 params=params,
-                data=data,
+                data=body,
                 json=json,
                 headers=request_headers,
                 timeout=request_timeout,
+                stream=True,
             )
+        except requests.RequestException as e:
+            if isinstance(e, requests.Timeout) and deadline is not None and deadline.expired:
+                raise deadline.exceeded(path) from e
+            raise RequestError(f"Request failed: {str(e)}") from e
 
-            # Handle response errors
-            if response.status_code == 401:
-                raise AuthenticationError("Authentication failed: Invalid or expired token")
-
-            if response.status_code == 404:
-                raise ResourceNotFoundError(f"Resource not found: {path}")
+        try:
+            if self.rate_limiter is not None:
+                self.rate_limiter.record(path, response.status_code, _retry_after(response))
+            _check_status(response, path, self.codec)
 
-            if response.status_code >= 400:
-                error_data = {}
+            parser = JSONArrayStream(key)
+            chunks = response.iter_content(chunk_size)
+            while not parser.done:
+                if deadline is not None:
+                    deadline.check(path)
                 try:
-                    error_data = response.json()
-                except Exception:
-                    pass
+                    chunk = next(chunks, None)
+                    items = parser.feed(chunk) if chunk is not None else parser.close()
+                except requests.RequestException as e:
+                    if (
+                        isinstance(e, requests.Timeout)
+                        and deadline is not None
+                        and deadline.expired
+                    ):
+                        raise deadline.exceeded(path) from e
+                    raise RequestError(f"Request failed: {str(e)}") from e
+                except ValueError as e:
+                    raise RequestError(f"Invalid JSON response: {str(e)}") from e
+
+                for item in items:
+                    yield item_model.model_validate(item) if item_model is not None else item
+
+            _check_success(parser.envelope)
+        finally:
+            response.close()
+
+    def warm_up(
+        self, connections: int = 2, hubs: bool = False, keep_warm: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Do the setup work of the first requests ahead of time.
 
-                message = f"API request failed with status {response.status_code}"
-                if error_data and "errorMessage" in error_data:
-                    message = f"{message}: {error_data['errorMessage']}"
+        Resolves the API and hub hosts (priming the OS resolver cache), gets
+        a valid token, opens ``connections`` pooled keep-alive connections to
+        the API, TLS handshake included, and optionally starts the real-time
+        hubs, so the first order or query only pays for its own round trip.
+        A host that fails to resolve is logged and skipped; failing to
+        authenticate or to connect raises.
 
-                raise RequestError(message, error_code=response.status_code, response=error_data)
+        Args:
+            connections: Number of pooled connections to open to the API
+            hubs: Also connect the user and market hubs
+            keep_warm: Re-open dropped or idle-evicted connections every
+                ``keep_warm`` seconds on a background thread, until ``close()``
+
+        Returns:
+            dict: Seconds spent per step (``dns`` per host, ``token``,
+            ``connect``, ``hubs``, or None if not started), the number of
+            ``connections`` opened and the total ``duration``
+
+        Raises:
+            AuthenticationError: If no valid token could be obtained
+            requests.ConnectionError: If the API could not be connected to
+        """
+        started = time.perf_counter()
+        report: Dict[str, Any] = {"dns": {}, "hubs": None}
 
-            # Parse the response
+        urls = [
+            self.base_url,
+            self.USER_HUB_URLS.get(self.environment),
+            self.MARKET_HUB_URLS.get(self.environment),
+        ]
+        for host, port in _warm_up_hosts(urls):
+            step = time.perf_counter()
             try:
-                json_data = response.json()
-            except ValueError:
-                raise RequestError(f"Invalid JSON response: {response.text}")
-
-            # Defensive check: ensure we got a dictionary (handles None case for mypy)
-            if json_data is None:
-                raise ProjectXError("Received null response from API")
-
-            # Safe to cast now that we've checked
-            response_data: Dict[str, Any] = cast(Dict[str, Any], json_data)
-
-            # Check for API-level errors
-            success = response_data.get("success", True)  # type: ignore[union-attr]
-            if not success:
-                error_code = response_data.get("errorCode", 0)  # type: ignore[union-attr]
-                err_msg = response_data.get(  # type: ignore[union-attr]
-                    "errorMessage", "Unknown error"
-                )
+                socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+            except OSError as e:
+                logger.warning(f"Could not resolve {host} during warm-up: {e}")
+                continue
+            report["dns"][host] = time.perf_counter() - step
 
-                raise ProjectXError(
-                    f"API error {error_code}: {err_msg}",
-                    error_code=error_code,
-                    response=response_data,
-                )
+        step = time.perf_counter()
+        self.auth.get_token()
+        report["token"] = time.perf_counter() - step
 
-            return response_data
+        step = time.perf_counter()
+        report["connections"] = self.transport.warm_up(self.base_url, connections, self.timeout)
+        report["connect"] = time.perf_counter() - step
 
-        except requests.RequestException as e:
-            raise RequestError(f"Request failed: {str(e)}")
+        if hubs:
+            step = time.perf_counter()
+            self.realtime.start()
+            report["hubs"] = time.perf_counter() - step
+
+        if keep_warm is not None:
+            self._start_keep_warm(connections, keep_warm)
+
+        report["duration"] = time.perf_counter() - started
+        logger.info(
+            f"Warm-up took {report['duration'] * 1000:.1f} ms "
+            f"({report['connections']} connections opened)"
+        )
+        return report
+
+    def _start_keep_warm(self, connections: int, interval: float):
+        """Start (or restart) the thread keeping pooled connections open."""
+        self._stop_keep_warm()
+        stop = self._keep_warm_stop = threading.Event()
+
+        def run():
+            while not stop.wait(interval):
+                try:
+                    self.transport.warm_up(self.base_url, connections, self.timeout)
+                except Exception as e:
+                    logger.warning(f"Keeping connections warm failed: {e}")
+
+        self._keep_warm = threading.Thread(target=run, name="projectx-keep-warm", daemon=True)
+        self._keep_warm.start()
+
+    def _stop_keep_warm(self):
+        """Stop the thread keeping pooled connections open, if running."""
+        self._keep_warm_stop.set()
+        if self._keep_warm is not None:
+            self._keep_warm.join()
+            self._keep_warm = None
+
+    def batch(self, max_concurrency: int = 8) -> Batch:
+        """
+        Start a batch running service calls concurrently.
+
+        Service method calls made on the batch (``batch.orders.search_open(7)``)
+        are run on up to ``max_concurrency`` threads sharing this client, and
+        each call's exception is captured instead of aborting the batch (see
+        Batch). Size the session pool's ``max_connections_per_host`` to at
+        least ``max_concurrency`` so every call gets a pooled connection.
+
+        Args:
+            max_concurrency: Maximum number of calls running at once
+
+        Returns:
+            Batch: The batch, to be used as a context manager
+        """
+        return Batch(self, max_concurrency)
+
+    def pool_stats(self) -> Dict[str, Any]:
+        """
+        Get statistics for the client's transport.
+
+        Returns:
+            dict: Connection pool counters (see SessionPool.stats)
+        """
+        return self.transport.stats()
+
+    def close(self):
+        """Close all pooled HTTP connections held by the client."""
+        self._stop_keep_warm()
+        if self._owns_auth:
+            self.auth.stop_refresher()
+        # A transport passed in may be shared with other clients
+        if self._owns_transport:
+            self.transport.close()
+        if self.hedge_policy is not None:
+            self.hedge_policy.close()
+
+    def __enter__(self):
+        """Enter the client context."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Exit the client context, closing pooled connections."""
+        self.close()
 
-    def get(self, path: str, **kwargs) -> Dict[str, Any]:
+    def get(self, path: str, **kwargs) -> Any:
         """Make a GET request to the API."""
         return self.request("GET", path, **kwargs)
 
-    def post(self, path: str, **kwargs) -> Dict[str, Any]:
+    def post(self, path: str, **kwargs) -> Any:
         """Make a POST request to the API."""
         return self.request("POST", path, **kwargs)
 
-    def put(self, path: str, **kwargs) -> Dict[str, Any]:
+    def put(self, path: str, **kwargs) -> Any:
         """Make a PUT request to the API."""
         return self.request("PUT", path, **kwargs)
 
-    def delete(self, path: str, **kwargs) -> Dict[str, Any]:
+    def delete(self, path: str, **kwargs) -> Any:
         """Make a DELETE request to the API."""
         # Use the generic request method with the DELETE HTTP method
         return self.request("DELETE", path, **kwargs)
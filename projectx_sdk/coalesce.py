@@ -0,0 +1,239 @@
+"""Single-flight coalescing of identical in-flight read requests."""
+
+import asyncio
+import json
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Sequence, Tuple
+
+from projectx_sdk.deadline import Deadline
+from projectx_sdk.retry import READ_ONLY_ENDPOINTS, is_read_only
+
+
+def request_key(
+    method: str,
+    path: str,
+    params: Optional[Dict[str, Any]] = None,
+    body: Any = None,
+    variant: Any = None,
+) -> Tuple[Hashable, ...]:
+    """
+    Build the coalescing key of a request.
+
+    Args:
+        method: HTTP method
+        path: API path relative to '/api/'
+        params: Query parameters
+        body: JSON request body
+        variant: Anything else that changes the result (e.g. the response model)
+
+    Returns:
+        tuple: A hashable key; equal for requests that may share a response
+    """
+    canonical = json.dumps([params, body], sort_keys=True, default=str)
+    return (method.upper(), path, canonical, variant)
+
+
+class _Call:
+    """An in-flight call whose outcome is shared by every waiter."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class _Counters:
+    """Counters shared by the sync and async coalescers."""
+
+    def __init__(self, endpoints: Sequence[str]):
+        self.endpoints = tuple(endpoints)
+        self._lock = threading.Lock()
+        self._executed = 0
+        self._coalesced = 0
+
+    def applies_to(self, method: str, path: str) -> bool:
+        """
+        Check whether requests to an endpoint may be coalesced.
+
+        Args:
+            method: HTTP method
+            path: API path relative to '/api/'
+
+        Returns:
+            bool: True for read-only endpoints
+        """
+        return method.upper() in ("GET", "POST") and is_read_only(path, self.endpoints)
+
+    def _count(self, leader: bool):
+        with self._lock:
+            if leader:
+                self._executed += 1
+            else:
+                self._coalesced += 1
+
+    def _stats(self, in_flight: int) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "calls": self._executed + self._coalesced,
+                "executed": self._executed,
+                "coalesced": self._coalesced,
+                "in_flight": in_flight,
+            }
+
+
+class SingleFlight(_Counters):
+    """
+    Coalesces identical read requests that are in flight at the same time.
+
+    The first caller for a key (the leader) performs the request; callers that
+    arrive with the same key while it is running wait for it and receive the
+    same parsed result, or the same exception. Nothing is cached: once the
+    leader's call completes, the next caller starts a new request.
+
+    Results are shared objects, so callers must not mutate them.
+
+    Example::
+
+        client = ProjectXClient(username="...", api_key="...", coalesce=True)
+        # Threads calling client.positions.search_open(account_id) at the same
+        # instant now share one HTTP round trip
+        print(client.coalescer.stats())
+    """
+
+    def __init__(self, endpoints: Sequence[str] = READ_ONLY_ENDPOINTS):
+        """
+        Initialize a coalescer.
+
+        Args:
+            endpoints: Glob patterns of endpoints whose requests may be coalesced
+        """
+        super().__init__(endpoints)
+        self._calls: Dict[Hashable, _Call] = {}
+        self._calls_lock = threading.Lock()
+
+    def do(self, key: Hashable, fn: Callable[[], Any], deadline: Optional[Deadline] = None) -> Any:
+        """
+        Run ``fn`` unless an identical call is already in flight.
+
+        Args:
+            key: The request's coalescing key (see request_key)
+            fn: Performs the request and returns its parsed result
+            deadline: Deadline of the caller, bounding how long it waits for
+                the leader's call
+
+        Returns:
+            The result of the leader's call
+
+        Raises:
+            DeadlineExceededError: If the leader's call outlasts the deadline
+            Exception: Whatever the leader's call raised
+        """
+        with self._calls_lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+
+        self._count(leader)
+
+        if not leader:
+            timeout = deadline.remaining() if deadline is not None else None
+            if not call.done.wait(timeout) and deadline is not None:
+                raise deadline.exceeded("waiting for an identical request")
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._calls_lock:
+                del self._calls[key]
+            call.done.set()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get coalescing statistics.
+
+        Returns:
+            dict: Coalescible calls (``calls``), calls that went to the network
+            (``executed``), calls that shared another call's result
+            (``coalesced``) and distinct calls currently running (``in_flight``)
+        """
+        with self._calls_lock:
+            in_flight = len(self._calls)
+        return self._stats(in_flight)
+
+
+class AsyncSingleFlight(_Counters):
+    """
+    Asyncio counterpart of SingleFlight, for AsyncProjectXClient.
+
+    Coalesces identical read requests awaited concurrently on one event loop.
+    """
+
+    def __init__(self, endpoints: Sequence[str] = READ_ONLY_ENDPOINTS):
+        """
+        Initialize a coalescer.
+
+        Args:
+            endpoints: Glob patterns of endpoints whose requests may be coalesced
+        """
+        super().__init__(endpoints)
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+
+    async def do(
+        self, key: Hashable, fn: Callable[[], Awaitable[Any]], deadline: Optional[Deadline] = None
+    ) -> Any:
+        """
+        Await ``fn()`` unless an identical call is already in flight.
+
+        Args:
+            key: The request's coalescing key (see request_key)
+            fn: Returns an awaitable performing the request
+            deadline: Deadline of the caller, bounding how long it waits for
+                the leader's call
+
+        Returns:
+            The result of the leader's call
+
+        Raises:
+            DeadlineExceededError: If the leader's call outlasts the deadline
+            Exception: Whatever the leader's call raised
+        """
+        future = self._calls.get(key)
+        if future is not None:
+            self._count(leader=False)
+            # Shield the shared call so one cancelled waiter does not cancel the rest
+            if deadline is None:
+                return await asyncio.shield(future)
+            try:
+                return await asyncio.wait_for(asyncio.shield(future), deadline.remaining())
+            except asyncio.TimeoutError as e:
+                if not deadline.expired:
+                    raise
+                raise deadline.exceeded("waiting for an identical request") from e
+
+        self._count(leader=True)
+        future = asyncio.get_running_loop().create_future()
+        self._calls[key] = future
+        try:
+            result = await fn()
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark the exception retrieved when no other caller was waiting for it
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._calls[key]
+
+    def stats(self) -> Dict[str, Any]:
+        """Get coalescing statistics (see SingleFlight.stats)."""
+        return self._stats(len(self._calls))
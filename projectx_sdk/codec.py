@@ -0,0 +1,164 @@
+"""Pluggable JSON codecs for REST bodies and real-time hub frames."""
+
+import json
+import logging
+from typing import Any, Callable, Dict, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import msgspec  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - depends on the environment
+    msgspec = None
+
+logger = logging.getLogger(__name__)
+
+DefaultHook = Optional[Callable[[Any], Any]]
+
+
+class JSONCodec:
+    """
+    Stdlib JSON encoder/decoder.
+
+    Codecs turn Python objects into UTF-8 JSON bytes and back. Subclasses swap in
+    a faster implementation; ``loads`` must raise ValueError for invalid input so
+    callers can handle every codec the same way.
+    """
+
+    name = "json"
+
+    def dumps(self, obj: Any, default: DefaultHook = None) -> bytes:
+        """
+        Encode an object as JSON.
+
+        Args:
+            obj: The object to encode
+            default: Called for objects the codec cannot serialize natively; must
+                return a serializable replacement
+
+        Returns:
+            bytes: UTF-8 encoded JSON
+        """
+        return json.dumps(obj, default=default).encode("utf-8")
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """
+        Decode a JSON document.
+
+        Args:
+            data: UTF-8 encoded JSON
+
+        Returns:
+            The decoded object
+
+        Raises:
+            ValueError: If the data is not valid JSON
+        """
+        return json.loads(data)
+
+    def __repr__(self):
+        """Return string representation of the codec."""
+        return f"<{self.__class__.__name__} {self.name}>"
+
+
+class OrjsonCodec(JSONCodec):
+    """JSON codec backed by orjson."""
+
+    name = "orjson"
+
+    def __init__(self):
+        """
+        Initialize the codec.
+
+        Raises:
+            ImportError: If orjson is not installed
+        """
+        if orjson is None:
+            raise ImportError("orjson is not installed. Install it with: pip install orjson")
+
+    def dumps(self, obj: Any, default: DefaultHook = None) -> bytes:
+        """Encode an object as JSON."""
+        return bytes(orjson.dumps(obj, default=default))
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """Decode a JSON document."""
+        return orjson.loads(data)
+
+
+class MsgspecCodec(JSONCodec):
+    """JSON codec backed by msgspec."""
+
+    name = "msgspec"
+
+    def __init__(self):
+        """
+        Initialize the codec.
+
+        Raises:
+            ImportError: If msgspec is not installed
+        """
+        if msgspec is None:
+            raise ImportError("msgspec is not installed. Install it with: pip install msgspec")
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, obj: Any, default: DefaultHook = None) -> bytes:
+        """Encode an object as JSON."""
+        return bytes(msgspec.json.encode(obj, enc_hook=default))
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """Decode a JSON document."""
+        try:
+            return self._decoder.decode(data)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+
+
+_CODECS: Dict[str, Callable[[], JSONCodec]] = {
+    "json": JSONCodec,
+    "orjson": OrjsonCodec,
+    "msgspec": MsgspecCodec,
+}
+
+# Preference order when picking the fastest installed codec
+_AUTO_ORDER = ("orjson", "msgspec", "json")
+
+
+def get_codec(codec: Union[str, JSONCodec, None] = None) -> JSONCodec:
+    """
+    Resolve a codec setting to a codec instance.
+
+    Args:
+        codec: A codec instance, a codec name ('json', 'orjson' or 'msgspec'),
+            'auto' for the fastest installed codec, or None for the stdlib codec
+
+    Returns:
+        JSONCodec: The codec. A named codec that is not installed falls back to
+        the stdlib codec with a warning.
+
+    Raises:
+        ValueError: If the codec name is unknown
+    """
+    if isinstance(codec, JSONCodec):
+        return codec
+
+    if codec is None:
+        return JSONCodec()
+
+    if codec == "auto":
+        for name in _AUTO_ORDER:
+            try:
+                return _CODECS[name]()
+            except ImportError:
+                continue
+
+    if codec not in _CODECS:
+        raise ValueError(f"Unknown codec: {codec}. Use one of auto, {', '.join(_CODECS)}.")
+
+    try:
+        return _CODECS[codec]()
+    except ImportError as e:
+        logger.warning(f"{e}; falling back to the stdlib json codec")
+        return JSONCodec()
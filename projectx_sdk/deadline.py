@@ -0,0 +1,174 @@
+"""Deadlines bounding the total time of a call across all of its steps."""
+
+import contextvars
+import time
+from typing import Callable, Optional, Tuple
+
+from projectx_sdk.exceptions import DeadlineExceededError
+
+_current: contextvars.ContextVar[Optional["Deadline"]] = contextvars.ContextVar(
+    "projectx_deadline", default=None
+)
+
+# Tokens restoring the previous deadline, per context, as one Deadline may be
+# entered by several threads or tasks at once
+_tokens: contextvars.ContextVar[Tuple[contextvars.Token, ...]] = contextvars.ContextVar(
+    "projectx_deadline_tokens", default=()
+)
+
+
+class Deadline:
+    """
+    Point in time by which a call must complete.
+
+    A plain ``timeout`` bounds each network wait separately, so a call that
+    refreshes the token, waits for the rate limiter and retries can take many
+    times as long. A deadline is a single budget that every step of the call
+    consumes from: token validation, rate limiting, retries and their backoff,
+    each attempt's network timeouts and real-time hub invocations. Whichever
+    step finds it exhausted raises DeadlineExceededError.
+
+    Pass it to a service method, or activate it for everything called within
+    a block (including hub callbacks placing orders)::
+
+        client.orders.place(..., deadline=Deadline(0.5))
+
+        with Deadline(2.0):
+            positions = client.positions.search_open(account_id)
+            client.orders.place(...)
+
+    When deadlines are nested, the earliest one applies.
+    """
+
+    __slots__ = ("timeout", "expires_at", "_clock")
+
+    def __init__(self, timeout: float, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize a deadline.
+
+        Args:
+            timeout: Seconds from now until the deadline
+            clock: Monotonic clock returning seconds
+
+        Raises:
+            ValueError: If timeout is negative
+        """
+        if timeout < 0:
+            raise ValueError("timeout must not be negative")
+
+        self.timeout = timeout
+        self.expires_at = clock() + timeout
+        self._clock = clock
+
+    def remaining(self) -> float:
+        """
+        Get the time left.
+
+        Returns:
+            float: Seconds until the deadline (0 once it has passed)
+        """
+        return max(self.expires_at - self._clock(), 0.0)
+
+    @property
+    def expired(self) -> bool:
+        """Check whether the deadline has passed."""
+        return self._clock() >= self.expires_at
+
+    def check(self, operation: str):
+        """
+        Make sure there is time left for a step.
+
+        Args:
+            operation: The step about to run, for the error message
+
+        Raises:
+            DeadlineExceededError: If the deadline has passed
+        """
+        if self.expired:
+            raise self.exceeded(operation)
+
+    def limit(self, timeout: Optional[float], operation: str) -> float:
+        """
+        Cap a step's own timeout by the time left.
+
+        Args:
+            timeout: The step's timeout in seconds (None for no timeout)
+            operation: The step about to run, for the error message
+
+        Returns:
+            float: The smaller of ``timeout`` and the time left
+
+        Raises:
+            DeadlineExceededError: If the deadline has passed
+        """
+        remaining = self.remaining()
+        if remaining <= 0:
+            raise self.exceeded(operation)
+        return remaining if timeout is None else min(timeout, remaining)
+
+    def exceeded(self, operation: str) -> DeadlineExceededError:
+        """
+        Build the error for a step that ran out of time.
+
+        Args:
+            operation: The step that ran out of time
+
+        Returns:
+            DeadlineExceededError: The error to raise
+        """
+        return DeadlineExceededError(
+            f"Deadline of {self.timeout:.3f}s exceeded during {operation}", operation=operation
+        )
+
+    def __enter__(self) -> "Deadline":
+        """Apply the deadline to all calls made within the block."""
+        token = _current.set(earliest(self, _current.get()))
+        _tokens.set(_tokens.get() + (token,))
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Restore the deadline that applied before the block."""
+        tokens = _tokens.get()
+        _tokens.set(tokens[:-1])
+        _current.reset(tokens[-1])
+
+    def __repr__(self) -> str:
+        """Get a debugging representation."""
+        return f"Deadline(timeout={self.timeout}, remaining={self.remaining():.3f})"
+
+
+def earliest(*deadlines: Optional[Deadline]) -> Optional[Deadline]:
+    """
+    Get the deadline that expires first.
+
+    Args:
+        *deadlines: Deadlines, or None for none
+
+    Returns:
+        Deadline: The earliest deadline, or None if none was given
+    """
+    given = [deadline for deadline in deadlines if deadline is not None]
+    return min(given, key=lambda deadline: deadline.expires_at) if given else None
+
+
+def current_deadline() -> Optional[Deadline]:
+    """
+    Get the deadline activated by the innermost enclosing ``with Deadline(...)``.
+
+    Returns:
+        Deadline: The active deadline, or None outside of one
+    """
+    return _current.get()
+
+
+def resolve_deadline(deadline: Optional[Deadline]) -> Optional[Deadline]:
+    """
+    Get the deadline a call must meet.
+
+    Args:
+        deadline: The deadline passed to the call, if any
+
+    Returns:
+        Deadline: The earlier of the passed and the active deadline, or None
+    """
+    return earliest(deadline, _current.get())
@@ -20,13 +20,34 @@ class BaseService(ABC):
         self._client = client
 
 
+class AsyncBaseService(ABC):
+    """
+    Base class for asyncio API service endpoints.
+
+    All specific async API service classes inherit from this base class.
+    """
+
+    def __init__(self, client):
+        """
+        Initialize a service with a reference to the client.
+
+        Args:
+            client: The AsyncProjectXClient instance
+        """
+        self._client = client
+
+
 # Import service classes after BaseService is defined to avoid circular imports
-from projectx_sdk.endpoints.account import AccountService  # noqa: E402
-from projectx_sdk.endpoints.contract import ContractService  # noqa: E402
-from projectx_sdk.endpoints.history import HistoryService, TimeUnit  # noqa: E402
-from projectx_sdk.endpoints.order import OrderService  # noqa: E402
-from projectx_sdk.endpoints.position import PositionService  # noqa: E402
-from projectx_sdk.endpoints.trade import TradeService  # noqa: E402
+from projectx_sdk.endpoints.account import AccountService, AsyncAccountService  # noqa: E402
+from projectx_sdk.endpoints.contract import AsyncContractService, ContractService  # noqa: E402
+from projectx_sdk.endpoints.history import (  # noqa: E402
+    AsyncHistoryService,
+    HistoryService,
+    TimeUnit,
+)
+from projectx_sdk.endpoints.order import AsyncOrderService, OrderService  # noqa: E402
+from projectx_sdk.endpoints.position import AsyncPositionService, PositionService  # noqa: E402
+from projectx_sdk.endpoints.trade import AsyncTradeService, TradeService  # noqa: E402
 
 __all__ = [
     "BaseService",
@@ -36,5 +57,12 @@ __all__ = [
     "OrderService",
     "PositionService",
     "TradeService",
+    "AsyncBaseService",
+    "AsyncAccountService",
+    "AsyncContractService",
+    "AsyncHistoryService",
+    "AsyncOrderService",
+    "AsyncPositionService",
+    "AsyncTradeService",
     "TimeUnit",
 ]
@@ -1,6 +1,9 @@
 """Account service for the ProjectX Gateway API."""
 
-from projectx_sdk.endpoints import BaseService
+from typing import Optional
+
+from projectx_sdk.deadline import Deadline
+from projectx_sdk.endpoints import AsyncBaseService, BaseService
 from projectx_sdk.models.account import Account
 from projectx_sdk.utils.constants import ENDPOINTS
 
@@ -8,13 +11,15 @@ from projectx_sdk.utils.constants import ENDPOINTS
 class AccountService(BaseService):
     """Service for account-related operations."""
 
-    def search(self, only_active_accounts=False):
+    def search(self, only_active_accounts=False, deadline: Optional[Deadline] = None):
         """
         Search for accounts.
 
         Args:
             only_active_accounts (bool, optional): If True, only return active accounts.
                 Defaults to False.
+            deadline (Deadline, optional): Deadline for the call, including token
+                refresh and retries
 
         Returns:
             list[Account]: List of account objects
@@ -27,6 +32,7 @@ class AccountService(BaseService):
             "POST",
             ENDPOINTS["account"]["search"],
             json={"onlyActiveAccounts": only_active_accounts},
+            deadline=deadline,
         )
 
         # Parse account data into model objects
@@ -35,3 +41,29 @@ class AccountService(BaseService):
             accounts.append(Account.from_dict(account_data))
 
         return accounts
+
+
+class AsyncAccountService(AsyncBaseService):
+    """Asyncio service for account-related operations."""
+
+    async def search(self, only_active_accounts=False, deadline: Optional[Deadline] = None):
+        """
+        Search for accounts.
+
+        Args:
+            only_active_accounts (bool, optional): If True, only return active accounts.
+                Defaults to False.
+            deadline (Deadline, optional): Deadline for the call, including token
+                refresh and retries
+
+        Returns:
+            list[Account]: List of account objects
+        """
+        response = await self._client.request(
+            "POST",
+            ENDPOINTS["account"]["search"],
+            json={"onlyActiveAccounts": only_active_accounts},
+            deadline=deadline,
+        )
+
+        return [Account.from_dict(account_data) for account_data in response.get("accounts", [])]
@@ -1,15 +1,18 @@
 """Service module for contract-related API endpoints."""
 
-from typing import Any, Dict, List, Optional
+from typing import List, Optional
 
-from projectx_sdk.endpoints import BaseService
+from projectx_sdk.deadline import Deadline
+from projectx_sdk.endpoints import AsyncBaseService, BaseService
 from projectx_sdk.models.contract import Contract, ContractSearchResponse
 
 
 class ContractService(BaseService):
     """Service for contract-related endpoints."""
 
-    def search(self, search_text: str, live: bool = False) -> List[Contract]:
+    def search(
+        self, search_text: str, live: bool = False, deadline: Optional[Deadline] = None
+    ) -> List[Contract]:
         """
         Search for contracts by text.
 
@@ -17,26 +20,82 @@ class ContractService(BaseService):
             search_text: The text to search for in contract names.
             live: Whether to search the live market contracts (True) or
                   the simulation contracts (False).
+            deadline: Deadline for the call, including token refresh and retries
 
         Returns:
             A list of matching contracts.
         """
         data = {"searchText": search_text, "live": live}
-        response: Dict[str, Any] = self._client.post("Contract/search", json=data)
-        search_response = ContractSearchResponse.model_validate(response)
+        search_response: ContractSearchResponse = self._client.post(
+            "Contract/search", json=data, response_model=ContractSearchResponse, deadline=deadline
+        )
         return search_response.contracts  # type: ignore
 
-    def search_by_id(self, contract_id: str) -> Optional[Contract]:
+    def search_by_id(
+        self, contract_id: str, deadline: Optional[Deadline] = None
+    ) -> Optional[Contract]:
         """
         Search for a contract by its exact ID.
 
         Args:
             contract_id: The unique contract ID to search for.
+            deadline: Deadline for the call, including token refresh and retries
 
         Returns:
             The matching contract if found, None otherwise.
         """
         data = {"contractId": contract_id}
-        response: Dict[str, Any] = self._client.post("Contract/searchById", json=data)
-        search_response = ContractSearchResponse.model_validate(response)
+        search_response: ContractSearchResponse = self._client.post(
+            "Contract/searchById",
+            json=data,
+            response_model=ContractSearchResponse,
+            deadline=deadline,
+        )
+        return search_response.contracts[0] if search_response.contracts else None
+
+
+class AsyncContractService(AsyncBaseService):
+    """Asyncio service for contract-related endpoints."""
+
+    async def search(
+        self, search_text: str, live: bool = False, deadline: Optional[Deadline] = None
+    ) -> List[Contract]:
+        """
+        Search for contracts by text.
+
+        Args:
+            search_text: The text to search for in contract names.
+            live: Whether to search the live market contracts (True) or
+                  the simulation contracts (False).
+            deadline: Deadline for the call, including token refresh and retries
+
+        Returns:
+            A list of matching contracts.
+        """
+        data = {"searchText": search_text, "live": live}
+        search_response: ContractSearchResponse = await self._client.post(
+            "Contract/search", json=data, response_model=ContractSearchResponse, deadline=deadline
+        )
+        return search_response.contracts  # type: ignore
+
+    async def search_by_id(
+        self, contract_id: str, deadline: Optional[Deadline] = None
+    ) -> Optional[Contract]:
+        """
+        Search for a contract by its exact ID.
+
+        Args:
+            contract_id: The unique contract ID to search for.
+            deadline: Deadline for the call, including token refresh and retries
+
+        Returns:
+            The matching contract if found, None otherwise.
+        """
+        data = {"contractId": contract_id}
+        search_response: ContractSearchResponse = await self._client.post(
+            "Contract/searchById",
+            json=data,
+            response_model=ContractSearchResponse,
+            deadline=deadline,
+        )
         return search_response.contracts[0] if search_response.contracts else None
@@ -2,9 +2,10 @@
 
 from datetime import datetime
 from enum import IntEnum
-from typing import Any, Dict, List
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
 
-from projectx_sdk.endpoints import BaseService
+from projectx_sdk.deadline import Deadline
+from projectx_sdk.endpoints import AsyncBaseService, BaseService
 from projectx_sdk.models.history import Bar, BarResponse
 
 
@@ -19,6 +20,29 @@ class TimeUnit(IntEnum):
     MONTH = 6
 
 
+def _retrieve_bars_payload(
+    contract_id: str,
+    start_time: datetime,
+    end_time: datetime,
+    unit: TimeUnit,
+    unit_number: int,
+    limit: int,
+    include_partial_bar: bool,
+    live: bool,
+) -> Dict[str, Any]:
+    """Build the request body for History/retrieveBars."""
+    return {
+        "contractId": contract_id,
+        "startTime": start_time.isoformat(),
+        "endTime": end_time.isoformat(),
+        "unit": int(unit),
+        "unitNumber": unit_number,
+        "limit": limit,
+        "includePartialBar": include_partial_bar,
+        "live": live,
+    }
+
+
 class HistoryService(BaseService):
     """Service for historical market data endpoints."""
 
@@ -32,6 +56,90 @@ class HistoryService(BaseService):
         limit: int = 1000,
         include_partial_bar: bool = False,
         live: bool = False,
+        deadline: Optional[Deadline] = None,
+    ) -> List[Bar]:
+        """
+        Retrieve historical price bars (candles) for a contract.
+
+        Args:
+            contract_id: The identifier of the contract to get data for
+            start_time: The start timestamp of the data range
+            end_time: The end timestamp of the data range
+            unit: The time unit for aggregation of bars
+            unit_number: The number of units per bar
+            limit: The maximum number of bars to retrieve
+            include_partial_bar: Whether to include the partial bar for the current period
+            live: Whether to retrieve from live data feed or simulation
+            deadline: Deadline for the call, including token refresh and retries
+
+        Returns:
+            A list of OHLCV bars for the requested time range
+        """
+        data = _retrieve_bars_payload(
+            contract_id, start_time, end_time, unit, unit_number, limit, include_partial_bar, live
+        )
+
+        bar_response: BarResponse = self._client.post(
+            "History/retrieveBars", json=data, response_model=BarResponse, deadline=deadline
+        )
+        return bar_response.bars  # type: ignore
+
+    def stream_bars(
+        self,
+        contract_id: str,
+        start_time: datetime,
+        end_time: datetime,
+        unit: TimeUnit = TimeUnit.MINUTE,
+        unit_number: int = 1,
+        limit: int = 1000,
+        include_partial_bar: bool = False,
+        live: bool = False,
+        deadline: Optional[Deadline] = None,
+    ) -> Iterator[Bar]:
+        """
+        Stream historical price bars, decoding each one as it arrives.
+
+        Unlike retrieve_bars, the response is never held in memory as a whole,
+        which keeps multi-month pulls bounded. Iterate with a ``for`` loop.
+
+        Args:
+            contract_id: The identifier of the contract to get data for
+            start_time: The start timestamp of the data range
+            end_time: The end timestamp of the data range
+            unit: The time unit for aggregation of bars
+            unit_number: The number of units per bar
+            limit: The maximum number of bars to retrieve
+            include_partial_bar: Whether to include the partial bar for the current period
+            live: Whether to retrieve from live data feed or simulation
+            deadline: Deadline for the call, including token refresh and retries
+
+        Returns:
+            An iterator over the OHLCV bars for the requested time range
+        """
+        data = _retrieve_bars_payload(
+            contract_id, start_time, end_time, unit, unit_number, limit, include_partial_bar, live
+        )
+
+        bars: Iterator[Bar] = self._client.stream(
+            "POST", "History/retrieveBars", "bars", json=data, item_model=Bar, deadline=deadline
+        )
+        return bars
+
+
+class AsyncHistoryService(AsyncBaseService):
+    """Asyncio service for historical market data endpoints."""
+
+    async def retrieve_bars(
+        self,
+        contract_id: str,
+        start_time: datetime,
+        end_time: datetime,
+        unit: TimeUnit = TimeUnit.MINUTE,
+        unit_number: int = 1,
+        limit: int = 1000,
+        include_partial_bar: bool = False,
+        live: bool = False,
+        deadline: Optional[Deadline] = None,
     ) -> List[Bar]:
         """
         Retrieve historical price bars (candles) for a contract.
@@ -45,21 +153,57 @@ class HistoryService(BaseService):
             limit: The maximum number of bars to retrieve
             include_partial_bar: Whether to include the partial bar for the current period
             live: Whether to retrieve from live data feed or simulation
+            deadline: Deadline for the call, including token refresh and retries
 
         Returns:
             A list of OHLCV bars for the requested time range
         """
-        data = {
-            "contractId": contract_id,
-            "startTime": start_time.isoformat(),
-            "endTime": end_time.isoformat(),
-            "unit": int(unit),
-            "unitNumber": unit_number,
-            "limit": limit,
-            "includePartialBar": include_partial_bar,
-            "live": live,
-        }
-
-        response: Dict[str, Any] = self._client.post("History/retrieveBars", json=data)
-        bar_response = BarResponse.model_validate(response)
+        data = _retrieve_bars_payload(
+            contract_id, start_time, end_time, unit, unit_number, limit, include_partial_bar, live
+        )
+
+        bar_response: BarResponse = await self._client.post(
+            "History/retrieveBars", json=data, response_model=BarResponse, deadline=deadline
+        )
         return bar_response.bars  # type: ignore
+
+    def stream_bars(
+        self,
+        contract_id: str,
+        start_time: datetime,
+        end_time: datetime,
+        unit: TimeUnit = TimeUnit.MINUTE,
+        unit_number: int = 1,
+        limit: int = 1000,
+        include_partial_bar: bool = False,
+        live: bool = False,
+        deadline: Optional[Deadline] = None,
+    ) -> AsyncIterator[Bar]:
+        """
+        Stream historical price bars, decoding each one as it arrives.
+
+        Unlike retrieve_bars, the response is never held in memory as a whole,
+        which keeps multi-month pulls bounded. Iterate with ``async for``.
+
+        Args:
+            contract_id: The identifier of the contract to get data for
+            start_time: The start timestamp of the data range
+            end_time: The end timestamp of the data range
+            unit: The time unit for aggregation of bars
+            unit_number: The number of units per bar
+            limit: The maximum number of bars to retrieve
+            include_partial_bar: Whether to include the partial bar for the current period
+            live: Whether to retrieve from live data feed or simulation
+            deadline: Deadline for the call, including token refresh and retries
+
+        Returns:
+            An iterator over the OHLCV bars for the requested time range
+        """
+        data = _retrieve_bars_payload(
+            contract_id, start_time, end_time, unit, unit_number, limit, include_partial_bar, live
+        )
+
+        bars: AsyncIterator[Bar] = self._client.stream(
+            "POST", "History/retrieveBars", "bars", json=data, item_model=Bar, deadline=deadline
+        )
+        return bars
@@ -1,9 +1,11 @@
 """Service module for order-related API endpoints."""
 
-from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Union
 
-from projectx_sdk.endpoints import BaseService
+from projectx_sdk.deadline import Deadline
+from projectx_sdk.endpoints import AsyncBaseService, BaseService
+from projectx_sdk.exceptions import ProjectXError
 from projectx_sdk.models.order import (
     Order,
     OrderCancellationResponse,
@@ -11,14 +13,106 @@ from projectx_sdk.models.order import (
     OrderPlacementResponse,
     OrderSearchResponse,
 )
+from projectx_sdk.tracing import trace
 from projectx_sdk.utils.constants import OrderSide, OrderType
 
 
+def _search_payload(
+    account_id: int, start_timestamp: datetime, end_timestamp: Optional[datetime]
+) -> Dict[str, Any]:
+    """Build the request body for Order/search."""
+    data = {
+        "accountId": account_id,
+        "startTimestamp": start_timestamp.isoformat(),
+    }
+
+    if end_timestamp:
+        data["endTimestamp"] = end_timestamp.isoformat()
+
+    return data
+
+
+def _place_payload(
+    account_id: int,
+    contract_id: str,
+    order_type: Union[OrderType, int],
+    side: Union[OrderSide, int],
+    size: int,
+    limit_price: Optional[float],
+    stop_price: Optional[float],
+    trail_price: Optional[float],
+    custom_tag: Optional[str],
+    linked_order_id: Optional[int],
+) -> Dict[str, Any]:
+    """Build the request body for Order/place."""
+    # Convert enum to int if needed
+    if isinstance(order_type, OrderType):
+        order_type = int(order_type)
+    if isinstance(side, OrderSide):
+        side = int(side)
+
+    return {
+        "accountId": account_id,
+        "contractId": contract_id,
+        "type": order_type,
+        "side": side,
+        "size": size,
+        "limitPrice": limit_price,
+        "stopPrice": stop_price,
+        "trailPrice": trail_price,
+        "customTag": custom_tag,
+        "linkedOrderId": linked_order_id,
+    }
+
+
+def _tagged_order_id(orders: List[Order], custom_tag: str) -> Optional[int]:
+    """Get the ID of the order carrying a custom tag, if any."""
+    for order in orders:
+        if order.custom_tag == custom_tag:
+            return order.id
+    return None
+
+
+def _may_have_placed(error: ProjectXError, custom_tag: Optional[str]) -> bool:
+    """Check whether a failed tagged placement was retried, so may have succeeded."""
+    # The first attempt of a retried placement failed on the way back, so the
+    # order may exist; a retry is then rejected as reusing the custom tag
+    return custom_tag is not None and error.attempts > 1
+
+
+def _modify_payload(
+    account_id: int,
+    order_id: int,
+    size: Optional[int],
+    limit_price: Optional[float],
+    stop_price: Optional[float],
+    trail_price: Optional[float],
+) -> Dict[str, Any]:
+    """Build the request body for Order/modify."""
+    data: Dict[str, Any] = {"accountId": account_id, "orderId": order_id}
+
+    # Only include fields that are being modified
+    if size is not None:
+        data["size"] = size
+    if limit_price is not None:
+        data["limitPrice"] = limit_price
+    if stop_price is not None:
+        data["stopPrice"] = stop_price
+    if trail_price is not None:
+        data["trailPrice"] = trail_price
+
+    return data
+
+
 class OrderService(BaseService):
     """Service for order-related endpoints."""
 
     def search(
-        self, account_id: int, start_timestamp: datetime, end_timestamp: Optional[datetime] = None
+        self,
+        account_id: int,
+        start_timestamp: datetime,
+        end_timestamp: Optional[datetime] = None,
+        deadline: Optional[Deadline] = None,
     ) -> List[Order]:
         """
         Search for orders based on criteria.
@@ -27,36 +121,63 @@ class OrderService(BaseService):
             account_id: The account ID to filter orders by
             start_timestamp: The start of the date/time range (inclusive)
             end_timestamp: The end of the date/time range (inclusive, optional)
+            deadline: Deadline for the call, including token refresh and retries
 
         Returns:
             A list of orders matching the criteria
         """
-        data = {
-            "accountId": account_id,
-            "startTimestamp": start_timestamp.isoformat(),
-        }
+        data = _search_payload(account_id, start_timestamp, end_timestamp)
 
-        if end_timestamp:
-            data["endTimestamp"] = end_timestamp.isoformat()
-
-        response: Dict[str, Any] = self._client.post("Order/search", json=data)
-        search_response = OrderSearchResponse.model_validate(response)
+        search_response: OrderSearchResponse = self._client.post(
+            "Order/search", json=data, response_model=OrderSearchResponse, deadline=deadline
+        )
         return search_response.orders  # type: ignore
 
-    def search_open(self, account_id: int) -> List[Order]:
+    def stream_search(
+        self,
+        account_id: int,
+        start_timestamp: datetime,
+        end_timestamp: Optional[datetime] = None,
+        deadline: Optional[Deadline] = None,
+    ) -> Iterator[Order]:
+        """
+        Stream orders matching the criteria, decoding each one as it arrives.
+
+        Unlike search, the response is never held in memory as a whole, which
+        keeps long ranges over active accounts bounded. Iterate with a ``for`` loop.
+
+        Args:
+            account_id: The account ID to filter orders by
+            start_timestamp: The start of the date/time range (inclusive)
+            end_timestamp: The end of the date/time range (inclusive, optional)
+            deadline: Deadline for the call, including token refresh and retries
+
+        Returns:
+            An iterator over the orders matching the criteria
+        """
+        data = _search_payload(account_id, start_timestamp, end_timestamp)
+
+        orders: Iterator[Order] = self._client.stream(
+            "POST", "Order/search", "orders", json=data, item_model=Order, deadline=deadline
+        )
+        return orders
+
+    def search_open(self, account_id: int, deadline: Optional[Deadline] = None) -> List[Order]:
         """
         Search for open (active) orders for an account.
 
         Args:
             account_id: The account ID for which to retrieve open orders
+            deadline: Deadline for the call, including token refresh and retries
 
         Returns:
             A list of currently open orders
         """
         data = {"accountId": account_id}
 
-        response: Dict[str, Any] = self._client.post("Order/searchOpen", json=data)
-        search_response = OrderSearchResponse.model_validate(response)
+        search_response: OrderSearchResponse = self._client.post(
+            "Order/searchOpen", json=data, response_model=OrderSearchResponse, deadline=deadline
+        )
         return search_response.orders  # type: ignore
 
     def place(
@@ -71,6 +192,7 @@ class OrderService(BaseService):
         trail_price: Optional[float] = None,
         custom_tag: Optional[str] = None,
         linked_order_id: Optional[int] = None,
+        deadline: Optional[Deadline] = None,
     ) -> int:
         """
         Place a new order.
@@ -84,50 +206,112 @@ class OrderService(BaseService):
             limit_price: The limit price (for limit orders)
             stop_price: The stop price (for stop orders)
             trail_price: The trailing amount (for trailing stops)
-            custom_tag: A custom tag or note for the order
+            custom_tag: A custom tag or note for the order. Must be unique per
+                account; tagged orders are retried on transient failures, and if
+                the retry fails (say, rejected as a duplicate because the first
+                attempt went through) the order placed with the tag is looked up
+                and its ID returned. With tracing enabled, untagged orders are
+                tagged with the trace.
             linked_order_id: ID of a linked order for advanced strategies
+            deadline: Deadline for the call, including token refresh and retries
 
         Returns:
             The order ID of the newly placed order
         """
-        # Convert enum to int if needed
-        if isinstance(order_type, OrderType):
-            order_type = int(order_type)
-        if isinstance(side, OrderSide):
-            side = int(side)
-
-        data = {
-            "accountId": account_id,
-            "contractId": contract_id,
-            "type": order_type,
-            "side": side,
-            "size": size,
-            "limitPrice": limit_price,
-            "stopPrice": stop_price,
-            "trailPrice": trail_price,
-            "customTag": custom_tag,
-            "linkedOrderId": linked_order_id,
-        }
-
-        response: Dict[str, Any] = self._client.post("Order/place", json=data)
-        placement_response = OrderPlacementResponse.model_validate(response)
-        return placement_response.order_id  # type: ignore
-
-    def cancel(self, account_id: int, order_id: int) -> bool:
+        tracer = self._client.tracer
+        with trace(
+            tracer, "OrderService.place", {"account_id": account_id, "contract_id": contract_id}
+        ) as span:
+            tag = custom_tag
+            if tag is None and tracer is not None and tracer.tag_orders:
+                # Carry the trace to the order's hub events
+                tag = span.correlation_tag()
+
+            data = _place_payload(
+                account_id,
+                contract_id,
+                order_type,
+                side,
+                size,
+                limit_price,
+                stop_price,
+                trail_price,
+                tag,
+                linked_order_id,
+            )
+
+            # Orders placed by an earlier attempt are created after this
+            placed_after = datetime.now(timezone.utc) - timedelta(minutes=5)
+            try:
+                placement_response: OrderPlacementResponse = self._client.post(
+                    "Order/place",
+                    json=data,
+                    response_model=OrderPlacementResponse,
+                    # The gateway rejects a reused custom tag, so tagged orders are safe to retry
+                    idempotent=custom_tag is not None,
+                    deadline=deadline,
+                )
+                order_id: int = placement_response.order_id  # type: ignore
+            except ProjectXError as e:
+                if not _may_have_placed(e, custom_tag):
+                    raise
+                found = self._find_tagged(account_id, custom_tag, placed_after, deadline)
+                if found is None:
+                    raise
+                order_id = found
+                span.set_attribute("reconciled", True)
+            span.set_attribute("order_id", order_id)
+            span.correlate(custom_tag=tag, order_id=order_id)
+        return order_id
+
+    def _find_tagged(
+        self,
+        account_id: int,
+        custom_tag: Optional[str],
+        placed_after: datetime,
+        deadline: Optional[Deadline],
+    ) -> Optional[int]:
+        """
+        Find the order a retried placement created, open or not.
+
+        Args:
+            account_id: The account the order was placed in
+            custom_tag: The order's custom tag
+            placed_after: A time before the placement started
+            deadline: Deadline of the placement
+
+        Returns:
+            The order's ID, or None if no order carries the tag or the lookup failed
+        """
+        if custom_tag is None:
+            return None
+        try:
+            order_id = _tagged_order_id(self.search_open(account_id, deadline), custom_tag)
+            if order_id is None:
+                # Already filled or cancelled
+                orders = self.search(account_id, placed_after, deadline=deadline)
+                order_id = _tagged_order_id(orders, custom_tag)
+        except ProjectXError:
+            return None
+        return order_id
+
+    def cancel(self, account_id: int, order_id: int, deadline: Optional[Deadline] = None) -> bool:
         """
         Cancel an open order.
 
         Args:
             account_id: The account ID which the order belongs to
             order_id: The unique ID of the order to cancel
+            deadline: Deadline for the call, including token refresh and retries
 
         Returns:
             True if cancellation was successful, False otherwise
         """
         data = {"accountId": account_id, "orderId": order_id}
 
-        response: Dict[str, Any] = self._client.post("Order/cancel", json=data)
-        cancellation_response = OrderCancellationResponse.model_validate(response)
+        cancellation_response: OrderCancellationResponse = self._client.post(
+            "Order/cancel", json=data, response_model=OrderCancellationResponse, deadline=deadline
+        )
         return cancellation_response.success  # type: ignore
 
     def modify(
@@ -138,6 +322,7 @@ class OrderService(BaseService):
         limit_price: Optional[float] = None,
         stop_price: Optional[float] = None,
         trail_price: Optional[float] = None,
+        deadline: Optional[Deadline] = None,
     ) -> bool:
         """
         Modify an existing open order.
@@ -149,22 +334,261 @@ class OrderService(BaseService):
             limit_price: The new limit price
             stop_price: The new stop price
             trail_price: The new trail price
+            deadline: Deadline for the call, including token refresh and retries
 
         Returns:
             True if modification was successful, False otherwise
         """
-        data: Dict[str, Any] = {"accountId": account_id, "orderId": order_id}
+        data = _modify_payload(account_id, order_id, size, limit_price, stop_price, trail_price)
+
+        modification_response: OrderModificationResponse = self._client.post(
+            "Order/modify", json=data, response_model=OrderModificationResponse, deadline=deadline
+        )
+        return modification_response.success  # type: ignore
+
+
+class AsyncOrderService(AsyncBaseService):
+    """Asyncio service for order-related endpoints."""
+
+    async def search(
+        self,
+        account_id: int,
+        start_timestamp: datetime,
+        end_timestamp: Optional[datetime] = None,
+        deadline: Optional[Deadline] = None,
+    ) -> List[Order]:
+        """
+        Search for orders based on criteria.
+
+        Args:
+            account_id: The account ID to filter orders by
+            start_timestamp: The start of the date/time range (inclusive)
+            end_timestamp: The end of the date/time range (inclusive, optional)
+            deadline: Deadline for the call, including token refresh and retries
+
+        Returns:
+            A list of orders matching the criteria
+        """
+        data = _search_payload(account_id, start_timestamp, end_timestamp)
+
+        search_response: OrderSearchResponse = await self._client.post(
+            "Order/search", json=data, response_model=OrderSearchResponse, deadline=deadline
+        )
+        return search_response.orders  # type: ignore
+
+    def stream_search(
+        self,
+        account_id: int,
+        start_timestamp: datetime,
+        end_timestamp: Optional[datetime] = None,
+        deadline: Optional[Deadline] = None,
+    ) -> AsyncIterator[Order]:
+        """
+        Stream orders matching the criteria, decoding each one as it arrives.
+
+        Unlike search, the response is never held in memory as a whole, which
+        keeps long ranges over active accounts bounded. Iterate with ``async for``.
+
+        Args:
+            account_id: The account ID to filter orders by
+            start_timestamp: The start of the date/time range (inclusive)
+            end_timestamp: The end of the date/time range (inclusive, optional)
+            deadline: Deadline for the call, including token refresh and retries
+
+        Returns:
+            An iterator over the orders matching the criteria
+        """
+        data = _search_payload(account_id, start_timestamp, end_timestamp)
+
+        orders: AsyncIterator[Order] = self._client.stream(
+            "POST", "Order/search", "orders", json=data, item_model=Order, deadline=deadline
+        )
+        return orders
+
+    async def search_open(
+        self, account_id: int, deadline: Optional[Deadline] = None
+    ) -> List[Order]:
+        """
+        Search for open (active) orders for an account.
+
+        Args:
+            account_id: The account ID for which to retrieve open orders
+            deadline: Deadline for the call, including token refresh and retries
 
-        # Only include fields that are being modified
-        if size is not None:
-            data["size"] = size
-        if limit_price is not None:
-            data["limitPrice"] = limit_price
-        if stop_price is not None:
-            data["stopPrice"] = stop_price
-        if trail_price is not None:
-            data["trailPrice"] = trail_price
+        Returns:
+            A list of currently open orders
+        """
+        data = {"accountId": account_id}
+
+        search_response: OrderSearchResponse = await self._client.post(
+            "Order/searchOpen", json=data, response_model=OrderSearchResponse, deadline=deadline
+        )
+        return search_response.orders  # type: ignore
+
+    async def place(
+        self,
+        account_id: int,
+        contract_id: str,
+        order_type: Union[OrderType, int],
+        side: Union[OrderSide, int],
+        size: int,
+        limit_price: Optional[float] = None,
+        stop_price: Optional[float] = None,
+        trail_price: Optional[float] = None,
+        custom_tag: Optional[str] = None,
+        linked_order_id: Optional[int] = None,
+        deadline: Optional[Deadline] = None,
+    ) -> int:
+        """
+        Place a new order.
+
+        Args:
+            account_id: The ID of the account to place the order in
+            contract_id: The ID of the contract/instrument to trade
+            order_type: The order type (market, limit, etc.)
+            side: The side of the order (buy or sell)
+            size: The quantity of the order
+            limit_price: The limit price (for limit orders)
+            stop_price: The stop price (for stop orders)
+            trail_price: The trailing amount (for trailing stops)
+            custom_tag: A custom tag or note for the order. Must be unique per
+                account; tagged orders are retried on transient failures, and if
+                the retry fails (say, rejected as a duplicate because the first
+                attempt went through) the order placed with the tag is looked up
+                and its ID returned. With tracing enabled, untagged orders are
+                tagged with the trace.
+            linked_order_id: ID of a linked order for advanced strategies
+            deadline: Deadline for the call, including token refresh and retries
+
+        Returns:
+            The order ID of the newly placed order
+        """
+        tracer = self._client.tracer
+        with trace(
+            tracer, "OrderService.place", {"account_id": account_id, "contract_id": contract_id}
+        ) as span:
+            tag = custom_tag
+            if tag is None and tracer is not None and tracer.tag_orders:
+                # Carry the trace to the order's hub events
+                tag = span.correlation_tag()
+
+            data = _place_payload(
+                account_id,
+                contract_id,
+                order_type,
+                side,
+                size,
+                limit_price,
+                stop_price,
+                trail_price,
+                tag,
+                linked_order_id,
+            )
+
+            # Orders placed by an earlier attempt are created after this
+            placed_after = datetime.now(timezone.utc) - timedelta(minutes=5)
+            try:
+                placement_response: OrderPlacementResponse = await self._client.post(
+                    "Order/place",
+                    json=data,
+                    response_model=OrderPlacementResponse,
+                    # The gateway rejects a reused custom tag, so tagged orders are safe to retry
+                    idempotent=custom_tag is not None,
+                    deadline=deadline,
+                )
+                order_id: int = placement_response.order_id  # type: ignore
+            except ProjectXError as e:
+                if not _may_have_placed(e, custom_tag):
+                    raise
+                found = await self._find_tagged(account_id, custom_tag, placed_after, deadline)
+                if found is None:
+                    raise
+                order_id = found
+                span.set_attribute("reconciled", True)
+            span.set_attribute("order_id", order_id)
+            span.correlate(custom_tag=tag, order_id=order_id)
+        return order_id
+
+    async def _find_tagged(
+        self,
+        account_id: int,
+        custom_tag: Optional[str],
+        placed_after: datetime,
+        deadline: Optional[Deadline],
+    ) -> Optional[int]:
+        """
+        Find the order a retried placement created, open or not.
+
+        Args:
+            account_id: The account the order was placed in
+            custom_tag: The order's custom tag
+            placed_after: A time before the placement started
+            deadline: Deadline of the placement
+
+        Returns:
+            The order's ID, or None if no order carries the tag or the lookup failed
+        """
+        if custom_tag is None:
+            return None
+        try:
+            order_id = _tagged_order_id(await self.search_open(account_id, deadline), custom_tag)
+            if order_id is None:
+                # Already filled or cancelled
+                orders = await self.search(account_id, placed_after, deadline=deadline)
+                order_id = _tagged_order_id(orders, custom_tag)
+        except ProjectXError:
+            return None
+        return order_id
+
+    async def cancel(
+        self, account_id: int, order_id: int, deadline: Optional[Deadline] = None
+    ) -> bool:
+        """
+        Cancel an open order.
+
+        Args:
+            account_id: The account ID which the order belongs to
+            order_id: The unique ID of the order to cancel
+            deadline: Deadline for the call, including token refresh and retries
+
+        Returns:
+            True if cancellation was successful, False otherwise
+        """
+        data = {"accountId": account_id, "orderId": order_id}
+
+        cancellation_response: OrderCancellationResponse = await self._client.post(
+            "Order/cancel", json=data, response_model=OrderCancellationResponse, deadline=deadline
+        )
+        return cancellation_response.success  # type: ignore
+
+    async def modify(
+        self,
+        account_id: int,
+        order_id: int,
+        size: Optional[int] = None,
+        limit_price: Optional[float] = None,
+        stop_price: Optional[float] = None,
+        trail_price: Optional[float] = None,
+        deadline: Optional[Deadline] = None,
+    ) -> bool:
+        """
+        Modify an existing open order.
+
+        Args:
+            account_id: The account ID which the order belongs to
+            order_id: The ID of the order to modify
+            size: The new size (quantity) for the order
+            limit_price: The new limit price
+            stop_price: The new stop price
+            trail_price: The new trail price
+            deadline: Deadline for the call, including token refresh and retries
+
+        Returns:
+            True if modification was successful, False otherwise
+        """
+        data = _modify_payload(account_id, order_id, size, limit_price, stop_price, trail_price)
 
-        response: Dict[str, Any] = self._client.post("Order/modify", json=data)
-        modification_response = OrderModificationResponse.model_validate(response)
+        modification_response: OrderModificationResponse = await self._client.post(
+            "Order/modify", json=data, response_model=OrderModificationResponse, deadline=deadline
+        )
         return modification_response.success  # type: ignore
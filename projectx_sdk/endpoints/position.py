@@ -1,31 +1,39 @@
 """Service module for position-related API endpoints."""
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
-from projectx_sdk.endpoints import BaseService
+from projectx_sdk.deadline import Deadline
+from projectx_sdk.endpoints import AsyncBaseService, BaseService
 from projectx_sdk.models.position import Position, PositionSearchResponse
 
 
 class PositionService(BaseService):
     """Service for position-related endpoints."""
 
-    def search_open(self, account_id: int) -> List[Position]:
+    def search_open(self, account_id: int, deadline: Optional[Deadline] = None) -> List[Position]:
         """
         Search for open positions for a given account.
 
         Args:
             account_id: The account ID for which to retrieve open positions
+            deadline: Deadline for the call, including token refresh and retries
 
         Returns:
             A list of open positions for the account
         """
         data = {"accountId": account_id}
 
-        response: Dict[str, Any] = self._client.post("Position/searchOpen", json=data)
-        search_response = PositionSearchResponse.model_validate(response)
+        search_response: PositionSearchResponse = self._client.post(
+            "Position/searchOpen",
+            json=data,
+            response_model=PositionSearchResponse,
+            deadline=deadline,
+        )
         return search_response.positions  # type: ignore
 
-    def close_contract(self, account_id: int, contract_id: str) -> bool:
+    def close_contract(
+        self, account_id: int, contract_id: str, deadline: Optional[Deadline] = None
+    ) -> bool:
         """
         Close any open position in a specific contract.
 
@@ -35,18 +43,23 @@ class PositionService(BaseService):
         Args:
             account_id: The account ID in which the position exists
             contract_id: The contract ID of the position to close
+            deadline: Deadline for the call, including token refresh and retries
 
         Returns:
             True if the close operation was successful, False otherwise
         """
         data = {"accountId": account_id, "contractId": contract_id}
 
-        response: Dict[str, Any] = self._client.post("Position/closeContract", json=data)
+        response: Dict[str, Any] = self._client.post(
+            "Position/closeContract", json=data, deadline=deadline
+        )
         return response.get("success", False)  # type: ignore
 
-    def partial_close_contract(self, account_id: int, contract_id: str, size: int) -> bool:
+    def partial_close_contract(
+        self, account_id: int, contract_id: str, size: int, deadline: Optional[Deadline] = None
+    ) -> bool:
         """
-        Partially close an open position by a given size.
+        Close part of an open position, reducing it by a given size.
 
         This will reduce an open position in the specified contract
         by placing an offsetting order of the specified size.
@@ -55,11 +68,84 @@ class PositionService(BaseService):
             account_id: The account ID of the position
             contract_id: The contract ID for which to reduce the position
             size: The quantity of the position to close
+            deadline: Deadline for the call, including token refresh and retries
 
         Returns:
             True if the partial close operation was successful, False otherwise
         """
         data = {"accountId": account_id, "contractId": contract_id, "size": size}
 
-        response: Dict[str, Any] = self._client.post("Position/partialCloseContract", json=data)
+        response: Dict[str, Any] = self._client.post(
+            "Position/partialCloseContract", json=data, deadline=deadline
+        )
+        return response.get("success", False)  # type: ignore
+
+
+class AsyncPositionService(AsyncBaseService):
+    """Asyncio service for position-related endpoints."""
+
+    async def search_open(
+        self, account_id: int, deadline: Optional[Deadline] = None
+    ) -> List[Position]:
+        """
+        Search for open positions for a given account.
+
+        Args:
+            account_id: The account ID for which to retrieve open positions
+            deadline: Deadline for the call, including token refresh and retries
+
+        Returns:
+            A list of open positions for the account
+        """
+        data = {"accountId": account_id}
+
+        search_response: PositionSearchResponse = await self._client.post(
+            "Position/searchOpen",
+            json=data,
+            response_model=PositionSearchResponse,
+            deadline=deadline,
+        )
+        return search_response.positions  # type: ignore
+
+    async def close_contract(
+        self, account_id: int, contract_id: str, deadline: Optional[Deadline] = None
+    ) -> bool:
+        """
+        Close any open position in a specific contract.
+
+        Args:
+            account_id: The account ID in which the position exists
+            contract_id: The contract ID of the position to close
+            deadline: Deadline for the call, including token refresh and retries
+
+        Returns:
+            True if the close operation was successful, False otherwise
+        """
+        data = {"accountId": account_id, "contractId": contract_id}
+
+        response: Dict[str, Any] = await self._client.post(
+            "Position/closeContract", json=data, deadline=deadline
+        )
+        return response.get("success", False)  # type: ignore
+
+    async def partial_close_contract(
+        self, account_id: int, contract_id: str, size: int, deadline: Optional[Deadline] = None
+    ) -> bool:
+        """
+        Close part of an open position, reducing it by a given size.
+
+        Args:
+            account_id: The account ID of the position
+            contract_id: The contract ID for which to reduce the position
+            size: The quantity of the position to close
+            deadline: Deadline for the call, including token refresh and retries
+
+        Returns:
+            True if the partial close operation was successful, False otherwise
+        """
+        data = {"accountId": account_id, "contractId": contract_id, "size": size}
+
+        response: Dict[str, Any] = await self._client.post(
+            "Position/partialCloseContract", json=data, deadline=deadline
+        )
         return response.get("success", False)  # type: ignore
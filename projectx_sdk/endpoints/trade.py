@@ -1,17 +1,34 @@
 """Service module for trade-related API endpoints."""
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
 
-from projectx_sdk.endpoints import BaseService
+from projectx_sdk.deadline import Deadline
+from projectx_sdk.endpoints import AsyncBaseService, BaseService
 from projectx_sdk.models.trade import Trade, TradeSearchResponse
 
 
+def _search_payload(
+    account_id: int, start_timestamp: datetime, end_timestamp: Optional[datetime]
+) -> Dict[str, Any]:
+    """Build the request body for Trade/search."""
+    data = {"accountId": account_id, "startTimestamp": start_timestamp.isoformat()}
+
+    if end_timestamp:
+        data["endTimestamp"] = end_timestamp.isoformat()
+
+    return data
+
+
 class TradeService(BaseService):
     """Service for trade-related endpoints."""
 
     def search(
-        self, account_id: int, start_timestamp: datetime, end_timestamp: Optional[datetime] = None
+        self,
+        account_id: int,
+        start_timestamp: datetime,
+        end_timestamp: Optional[datetime] = None,
+        deadline: Optional[Deadline] = None,
     ) -> List[Trade]:
         """
         Search for executed trades (fills) for an account and time range.
@@ -20,15 +37,102 @@ class TradeService(BaseService):
             account_id: The account ID to fetch trade history for
             start_timestamp: Start of the time range to retrieve trades from
             end_timestamp: End of the time range for trade retrieval (optional)
+            deadline: Deadline for the call, including token refresh and retries
 
         Returns:
             A list of trades (executions) for the account within the time range
         """
-        data = {"accountId": account_id, "startTimestamp": start_timestamp.isoformat()}
+        data = _search_payload(account_id, start_timestamp, end_timestamp)
+
+        search_response: TradeSearchResponse = self._client.post(
+            "Trade/search", json=data, response_model=TradeSearchResponse, deadline=deadline
+        )
+        return search_response.trades  # type: ignore
+
+    def stream_search(
+        self,
+        account_id: int,
+        start_timestamp: datetime,
+        end_timestamp: Optional[datetime] = None,
+        deadline: Optional[Deadline] = None,
+    ) -> Iterator[Trade]:
+        """
+        Stream the executed trades (fills) of an account, decoding each as it arrives.
+
+        Unlike search, the response is never held in memory as a whole, which
+        keeps long ranges over active accounts bounded. Iterate with a ``for`` loop.
+
+        Args:
+            account_id: The account ID to fetch trade history for
+            start_timestamp: Start of the time range to retrieve trades from
+            end_timestamp: End of the time range for trade retrieval (optional)
+            deadline: Deadline for the call, including token refresh and retries
+
+        Returns:
+            An iterator over the trades (executions) for the account within the time range
+        """
+        data = _search_payload(account_id, start_timestamp, end_timestamp)
+
+        trades: Iterator[Trade] = self._client.stream(
+            "POST", "Trade/search", "trades", json=data, item_model=Trade, deadline=deadline
+        )
+        return trades
+
+
+class AsyncTradeService(AsyncBaseService):
+    """Asyncio service for trade-related endpoints."""
+
+    async def search(
+        self,
+        account_id: int,
+        start_timestamp: datetime,
+        end_timestamp: Optional[datetime] = None,
+        deadline: Optional[Deadline] = None,
+    ) -> List[Trade]:
+        """
+        Search for executed trades (fills) for an account and time range.
 
-        if end_timestamp:
-            data["endTimestamp"] = end_timestamp.isoformat()
+        Args:
+            account_id: The account ID to fetch trade history for
+            start_timestamp: Start of the time range to retrieve trades from
+            end_timestamp: End of the time range for trade retrieval (optional)
+            deadline: Deadline for the call, including token refresh and retries
 
-        response: Dict[str, Any] = self._client.post("Trade/search", json=data)
-        search_response = TradeSearchResponse.model_validate(response)
+        Returns:
+            A list of trades (executions) for the account within the time range
+        """
+        data = _search_payload(account_id, start_timestamp, end_timestamp)
+
+        search_response: TradeSearchResponse = await self._client.post(
+            "Trade/search", json=data, response_model=TradeSearchResponse, deadline=deadline
+        )
         return search_response.trades  # type: ignore
+
+    def stream_search(
+        self,
+        account_id: int,
+        start_timestamp: datetime,
+        end_timestamp: Optional[datetime] = None,
+        deadline: Optional[Deadline] = None,
+    ) -> AsyncIterator[Trade]:
+        """
+        Stream the executed trades (fills) of an account, decoding each as it arrives.
+
+        Unlike search, the response is never held in memory as a whole, which
+        keeps long ranges over active accounts bounded. Iterate with ``async for``.
+
+        Args:
+            account_id: The account ID to fetch trade history for
+            start_timestamp: Start of the time range to retrieve trades from
+            end_timestamp: End of the time range for trade retrieval (optional)
+            deadline: Deadline for the call, including token refresh and retries
+
+        Returns:
+            An iterator over the trades (executions) for the account within the time range
+        """
+        data = _search_payload(account_id, start_timestamp, end_timestamp)
+
+        trades: AsyncIterator[Trade] = self._client.stream(
+            "POST", "Trade/search", "trades", json=data, item_model=Trade, deadline=deadline
+        )
+        return trades
@@ -17,6 +17,8 @@ class ProjectXError(Exception):
         self.message = message
         self.error_code = error_code
         self.response = response
+        # Requests sent before the error was raised, set by the client's retry loop
+        self.attempts = 1
 
     def __str__(self):
         """
@@ -51,7 +53,35 @@ class ConnectionError(ProjectXError):
 class RateLimitError(ProjectXError):
     """Rate limiting errors."""
 
-    pass
+    def __init__(self, message, error_code=None, response=None, retry_after=None):
+        """
+        Initialize a RateLimitError.
+
+        Args:
+            message: Error message
+            error_code: Optional error code
+            response: Optional response data
+            retry_after: Seconds to wait before the request may be retried, if known
+        """
+        super().__init__(message, error_code=error_code, response=response)
+        self.retry_after = retry_after
+
+
+class CircuitOpenError(ProjectXError):
+    """Request rejected without being sent because its endpoint family's circuit is open."""
+
+    def __init__(self, message, family=None, retry_after=None):
+        """
+        Initialize a CircuitOpenError.
+
+        Args:
+            message: Error message
+            family: The endpoint family whose circuit is open
+            retry_after: Seconds until the circuit lets a probe request through
+        """
+        super().__init__(message)
+        self.family = family
+        self.retry_after = retry_after
 
 
 class ValidationError(ProjectXError):
@@ -66,6 +96,22 @@ class RequestError(ProjectXError):
     pass
 
 
+class DeadlineExceededError(RequestError, TimeoutError):
+    """A call, including its token refresh, retries and waits, outlived its deadline."""
+
+    def __init__(self, message, operation=None):
+        """
+        Initialize a DeadlineExceededError.
+
+        Args:
+            message: Error message
+            operation: The step that was running or about to run when the
+                deadline expired (e.g. 'Order/place' or 'token refresh')
+        """
+        super().__init__(message)
+        self.operation = operation
+
+
 class ResourceNotFoundError(ProjectXError):
     """Resource not found errors (404)."""
 
@@ -0,0 +1,359 @@
+"""Hedged requests for latency-critical read-only endpoints."""
+
+import asyncio
+import concurrent.futures
+import contextvars
+import fnmatch
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, Sequence, Set, TypeVar
+
+from projectx_sdk.retry import is_read_only
+
+logger = logging.getLogger(__name__)
+
+# Reads that sit on the critical path of reconciling before an order is sent
+HEDGED_ENDPOINTS = (
+    "Position/searchOpen",
+    "Order/searchOpen",
+)
+
+T = TypeVar("T")
+
+
+class HedgePolicy:
+    """
+    Hedge slow read requests with a second, identical request.
+
+    When the first attempt at a hedged endpoint has not answered within the
+    endpoint's ``percentile`` latency, a second attempt is sent on another
+    pooled connection. The first successful response wins and the other
+    attempt is cancelled: async attempts are cancelled outright, while a sync
+    attempt that is already on the wire is abandoned and its result discarded.
+    Only read-only endpoints are ever hedged, since the server may see both
+    requests.
+
+    The hedge delay adapts to the latencies of the last ``window`` successful
+    attempts per endpoint; until ``min_samples`` have been seen,
+    ``default_delay`` is used.
+
+    Example::
+
+        hedge = HedgePolicy(percentile=90.0, max_delay=0.5)
+        client = ProjectXClient(username="...", api_key="...", hedge_policy=hedge)
+
+        client.positions.search_open(account_id)
+        hedge.stats()  # {'requests': 1, 'hedged': 0, 'hedge_wins': 0, ...}
+    """
+
+    def __init__(
+        self,
+        endpoints: Sequence[str] = HEDGED_ENDPOINTS,
+        percentile: float = 95.0,
+        window: int = 200,
+        min_samples: int = 20,
+        default_delay: float = 0.25,
+        min_delay: float = 0.005,
+        max_delay: Optional[float] = None,
+        max_workers: int = 8,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize a hedge policy.
+
+        Args:
+            endpoints: Glob patterns of endpoints to hedge (read-only ones only)
+            percentile: Latency percentile (0-100) after which the hedge is sent
+            window: Number of recent latencies per endpoint the percentile uses
+            min_samples: Latencies needed before the percentile is trusted
+            default_delay: Hedge delay in seconds until ``min_samples`` are known
+            min_delay: Lower bound of the hedge delay in seconds
+            max_delay: Upper bound of the hedge delay in seconds (None for none)
+            max_workers: Threads running sync attempts; requests made while all
+                of them are busy are not hedged
+            clock: Monotonic clock returning seconds
+
+        Raises:
+            ValueError: If the configuration is invalid
+        """
+        if not 0 < percentile <= 100 or window < 1 or min_samples < 1 or max_workers < 2:
+            raise ValueError(
+                "percentile must be in (0, 100], window and min_samples positive "
+                "and max_workers at least 2"
+            )
+
+        self.endpoints = tuple(endpoints)
+        self.percentile = percentile
+        self.window = window
+        self.min_samples = min_samples
+        self.default_delay = default_delay
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.max_workers = max_workers
+        self.clock = clock
+
+        self._lock = threading.Lock()
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        # Sync attempts submitted and not done, cancelled by close()
+        self._futures: Set[concurrent.futures.Future] = set()
+
+        self._requests = 0
+        self._hedged = 0
+        self._hedge_wins = 0
+        self._skipped = 0
+        # Sync attempts running or about to run on a worker
+        self._busy = 0
+
+    def applies_to(self, method: str, path: str) -> bool:
+        """
+        Check whether requests to an endpoint are hedged.
+
+        Args:
+            method: HTTP method
+            path: API path relative to '/api/'
+
+        Returns:
+            bool: True for read-only endpoints matching ``endpoints``
+        """
+        return (
+            method.upper() in ("GET", "POST")
+            and is_read_only(path)
+            and any(fnmatch.fnmatchcase(path, pattern) for pattern in self.endpoints)
+        )
+
+    def delay(self, path: str) -> float:
+        """
+        Get the current hedge delay of an endpoint.
+
+        Args:
+            path: API path relative to '/api/'
+
+        Returns:
+            float: Seconds to wait for the first attempt before hedging
+        """
+        with self._lock:
+            samples = sorted(self._latencies.get(path, ()))
+
+        if len(samples) < self.min_samples:
+            delay = self.default_delay
+        else:
+            # Nearest-rank percentile
+            rank = max(1, -(-len(samples) * self.percentile // 100))
+            delay = samples[int(rank) - 1]
+
+        delay = max(delay, self.min_delay)
+        if self.max_delay is not None:
+            delay = min(delay, self.max_delay)
+        return delay
+
+    def record(self, path: str, latency: float):
+        """
+        Record the latency of a successful attempt.
+
+        Args:
+            path: API path relative to '/api/'
+            latency: Seconds the attempt took
+        """
+        with self._lock:
+            latencies = self._latencies.get(path)
+            if latencies is None:
+                latencies = self._latencies[path] = deque(maxlen=self.window)
+            latencies.append(latency)
+
+    def _count(self, hedged: bool = False, hedge_won: bool = False, skipped: bool = False):
+        with self._lock:
+            self._requests += 1
+            if skipped:
+                self._skipped += 1
+            if hedged:
+                self._hedged += 1
+            if hedge_won:
+                self._hedge_wins += 1
+
+    def _timed(self, path: str, attempt: Callable[[], T]) -> T:
+        """Run a sync attempt, recording its latency if it succeeds."""
+        started = self.clock()
+        result = attempt()
+        self.record(path, self.clock() - started)
+        return result
+
+    def _pooled(self, path: str, attempt: Callable[[], T], running: threading.Event) -> T:
+        """Run a sync attempt on a worker, freeing the worker's slot when done."""
+        running.set()
+        try:
+            return self._timed(path, attempt)
+        finally:
+            with self._lock:
+                self._busy -= 1
+
+    async def _atimed(self, path: str, attempt: Callable[[], Awaitable[T]]) -> T:
+        """Run an async attempt, recording its latency if it succeeds."""
+        started = self.clock()
+        result = await attempt()
+        self.record(path, self.clock() - started)
+        return result
+
+    def _submit(
+        self, path: str, attempt: Callable[[], T]
+    ) -> Optional["concurrent.futures.Future[T]"]:
+        """
+        Start a sync attempt on an idle worker.
+
+        Returns:
+            Future: The attempt, once it is running, or None if every worker is busy
+        """
+        with self._lock:
+            if self._busy >= self.max_workers:
+                return None
+            self._busy += 1
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="projectx-hedge"
+                )
+            executor = self._executor
+
+        running = threading.Event()
+        # Attempts run in copies of the caller's context so they keep its tracing span
+        future = executor.submit(
+            contextvars.copy_context().run, self._pooled, path, attempt, running
+        )
+        with self._lock:
+            self._futures.add(future)
+        future.add_done_callback(lambda f: self._release_cancelled(f, running))
+        # A worker was idle, so this returns at once; the hedge delay starts from here
+        running.wait()
+        return future
+
+    def _release_cancelled(self, future: concurrent.futures.Future, running: threading.Event):
+        """Forget a finished attempt, freeing its slot if close() cancelled it before it ran."""
+        with self._lock:
+            self._futures.discard(future)
+        if future.cancelled():
+            with self._lock:
+                self._busy -= 1
+            running.set()
+
+    def call(self, path: str, attempt: Callable[[], T]) -> T:
+        """
+        Run a sync request, hedging it if the first attempt is slow.
+
+        Attempts only ever run on an idle worker, so that hedging cannot add
+        load while the client is saturated: with every worker busy the request
+        runs on the caller's thread without a hedge, and a hedge that finds
+        no idle worker is not sent (both counted as ``skipped``).
+
+        Args:
+            path: API path relative to '/api/'
+            attempt: Sends one attempt of the request and returns its result
+
+        Returns:
+            The result of the first successful attempt
+
+        Raises:
+            Exception: The first attempt's error if every attempt failed
+        """
+        primary = self._submit(path, attempt)
+        if primary is None:
+            self._count(skipped=True)
+            return self._timed(path, attempt)
+
+        done, _ = concurrent.futures.wait([primary], timeout=self.delay(path))
+        if done:
+            self._count()
+            return primary.result()
+
+        hedge = self._submit(path, attempt)
+        if hedge is None:
+            self._count(skipped=True)
+            return primary.result()
+
+        logger.debug(f"Hedging slow request to {path}")
+        pending = {primary, hedge}
+        while pending:
+            done, pending = concurrent.futures.wait(
+                pending, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                if future.exception() is None:
+                    self._count(hedged=True, hedge_won=future is hedge)
+                    return future.result()
+
+        self._count(hedged=True)
+        return primary.result()
+
+    async def acall(self, path: str, attempt: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run an async request, hedging it if the first attempt is slow.
+
+        Args:
+            path: API path relative to '/api/'
+            attempt: Coroutine function sending one attempt of the request
+
+        Returns:
+            The result of the first successful attempt
+
+        Raises:
+            Exception: The first attempt's error if every attempt failed
+        """
+        primary = asyncio.ensure_future(self._atimed(path, attempt))
+        pending = {primary}
+        try:
+            done, _ = await asyncio.wait(pending, timeout=self.delay(path))
+            if done:
+                self._count()
+                return primary.result()
+
+            logger.debug(f"Hedging slow request to {path}")
+            hedge = asyncio.ensure_future(self._atimed(path, attempt))
+            pending.add(hedge)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        self._count(hedged=True, hedge_won=task is hedge)
+                        return task.result()
+
+            self._count(hedged=True)
+            return primary.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get hedging statistics.
+
+        Returns:
+            dict: Hedged-endpoint requests (``requests``), how many were hedged
+            (``hedged``) and how many of those the hedge answered first
+            (``hedge_wins``), sync requests not hedged because every worker
+            was busy (``skipped``), the ``hedge_rate`` and ``win_rate`` derived
+            from them, and the current hedge delay per endpoint (``delays``)
+        """
+        with self._lock:
+            requests, hedged, wins = self._requests, self._hedged, self._hedge_wins
+            skipped = self._skipped
+            paths = list(self._latencies)
+        return {
+            "requests": requests,
+            "hedged": hedged,
+            "hedge_wins": wins,
+            "skipped": skipped,
+            "hedge_rate": hedged / requests if requests else 0.0,
+            "win_rate": wins / hedged if hedged else 0.0,
+            "delays": {path: self.delay(path) for path in paths},
+        }
+
+    def close(self):
+        """Stop the threads running sync attempts once they finish."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+            futures = list(self._futures)
+        # Cancelled here rather than by shutdown(cancel_futures=True), which needs Python 3.9
+        for future in futures:
+            future.cancel()
+        if executor is not None:
+            executor.shutdown(wait=False)
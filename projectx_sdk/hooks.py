@@ -0,0 +1,255 @@
+"""Request lifecycle hooks with per-phase timings."""
+
+import logging
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Phases of a request attempt, in order
+PHASES = ("token", "rate_limit", "connect", "ttfb", "body", "decode", "validate")
+
+# Transport phases a response may report through its ``timings`` attribute
+TRANSPORT_PHASES = ("connect", "ttfb", "body")
+
+
+class RequestEvent:
+    """
+    Details of one request attempt, passed to every hook.
+
+    ``timings`` maps each phase to the seconds spent in it:
+
+    - ``token``: getting (and if needed validating or renewing) the session token
+    - ``rate_limit``: waiting for the client-side rate limiter
+    - ``connect``: opening the TCP connection and TLS handshake (0 on a reused
+      keep-alive connection)
+    - ``ttfb``: sending the request until the response headers arrived
+    - ``body``: reading the response body
+    - ``decode``: decoding the JSON body into a dict
+    - ``validate``: validating the body into a response model (pydantic parses
+      and validates raw bytes in one pass, so ``decode`` stays 0 for calls with
+      a response model)
+
+    Transports that cannot tell the network phases apart (e.g. FakeTransport)
+    report the whole round trip as ``ttfb``.
+    """
+
+    def __init__(self, method: str, endpoint: str, request_size: int = 0):
+        """
+        Start timing a request attempt.
+
+        Args:
+            method: HTTP method
+            endpoint: API path relative to '/api/' (e.g. 'Order/place')
+            request_size: Size of the encoded request body in bytes
+        """
+        self.method = method.upper()
+        self.endpoint = endpoint
+        self.request_size = request_size
+        self.status_code: Optional[int] = None
+        self.response_size: Optional[int] = None
+        self.error: Optional[BaseException] = None
+        self.timings: Dict[str, float] = dict.fromkeys(PHASES, 0.0)
+        self.duration = 0.0
+        self.timestamp = time.time()
+
+        self._started = self._mark = time.perf_counter()
+
+    def lap(self, phase: str):
+        """
+        Charge the time since the previous lap to a phase.
+
+        Args:
+            phase: One of PHASES
+        """
+        now = time.perf_counter()
+        self.timings[phase] += now - self._mark
+        self._mark = now
+
+    def record_response(self, response: Any):
+        """
+        Record the response of the attempt and its network phases.
+
+        Args:
+            response: The transport's response; its optional ``timings`` dict
+                splits the round trip into ``connect``, ``ttfb`` and ``body``
+        """
+        now = time.perf_counter()
+        elapsed = now - self._mark
+        self._mark = now
+
+        self.status_code = response.status_code
+        self.response_size = len(response.content)
+
+        transport_timings = getattr(response, "timings", None)
+        if transport_timings:
+            for phase in TRANSPORT_PHASES:
+                self.timings[phase] += transport_timings.get(phase, 0.0)
+        else:
+            self.timings["ttfb"] += elapsed
+
+    def finish(self, error: Optional[BaseException] = None):
+        """
+        Mark the attempt as complete.
+
+        Args:
+            error: The exception the attempt raised, if any
+        """
+        self.duration = time.perf_counter() - self._started
+        self.error = error
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Get the event as a dict, e.g. for structured logging.
+
+        Returns:
+            dict: Every field of the event, with the error as its string form
+        """
+        return {
+            "method": self.method,
+            "endpoint": self.endpoint,
+            "status_code": self.status_code,
+            "request_size": self.request_size,
+            "response_size": self.response_size,
+            "duration": self.duration,
+            "timings": dict(self.timings),
+            "timestamp": self.timestamp,
+            "error": str(self.error) if self.error is not None else None,
+        }
+
+    def __repr__(self) -> str:
+        """Return a short description of the event."""
+        return (
+            f"RequestEvent({self.method} {self.endpoint}, status={self.status_code}, "
+            f"duration={self.duration * 1e3:.1f}ms)"
+        )
+
+
+Hook = Callable[[RequestEvent], None]
+
+
+class RequestHooks:
+    """
+    Callbacks invoked around every request attempt.
+
+    - ``before_request`` hooks run before the attempt starts
+    - ``after_response`` hooks run after a successful attempt
+    - ``on_error`` hooks run after a failed attempt (``event.error`` is set)
+
+    Each hook receives the attempt's RequestEvent. Hooks run inline on the
+    calling thread (or event loop), so they should be quick; exceptions they
+    raise are logged and never affect the request. With no hooks registered
+    the only cost is timing the phases.
+
+    Example::
+
+        client = ProjectXClient(username="...", api_key="...")
+
+        @client.hooks.after_response
+        def log_slow(event):
+            if event.duration > 0.5:
+                logger.warning("slow %s: %s", event.endpoint, event.timings)
+    """
+
+    def __init__(
+        self,
+        before_request: Optional[Hook] = None,
+        after_response: Optional[Hook] = None,
+        on_error: Optional[Hook] = None,
+    ):
+        """
+        Initialize the hooks.
+
+        Args:
+            before_request: Hook to register for the start of each attempt
+            after_response: Hook to register for successful attempts
+            on_error: Hook to register for failed attempts
+        """
+        # Tuples are replaced rather than mutated so dispatch never needs a lock
+        self._before: Tuple[Hook, ...] = ()
+        self._after: Tuple[Hook, ...] = ()
+        self._error: Tuple[Hook, ...] = ()
+
+        if before_request is not None:
+            self.before_request(before_request)
+        if after_response is not None:
+            self.after_response(after_response)
+        if on_error is not None:
+            self.on_error(on_error)
+
+    def before_request(self, hook: Hook) -> Hook:
+        """
+        Register a hook run before each attempt (usable as a decorator).
+
+        Args:
+            hook: Called with the attempt's RequestEvent
+
+        Returns:
+            The hook
+        """
+        self._before += (hook,)
+        return hook
+
+    def after_response(self, hook: Hook) -> Hook:
+        """
+        Register a hook run after each successful attempt (usable as a decorator).
+
+        Args:
+            hook: Called with the completed RequestEvent
+
+        Returns:
+            The hook
+        """
+        self._after += (hook,)
+        return hook
+
+    def on_error(self, hook: Hook) -> Hook:
+        """
+        Register a hook run after each failed attempt (usable as a decorator).
+
+        Args:
+            hook: Called with the RequestEvent, whose ``error`` is set
+
+        Returns:
+            The hook
+        """
+        self._error += (hook,)
+        return hook
+
+    def remove(self, hook: Hook):
+        """
+        Unregister a hook from every lifecycle stage.
+
+        Args:
+            hook: The hook to remove
+        """
+        self._before = tuple(h for h in self._before if h is not hook)
+        self._after = tuple(h for h in self._after if h is not hook)
+        self._error = tuple(h for h in self._error if h is not hook)
+
+    @property
+    def active(self) -> bool:
+        """Check whether any hook is registered."""
+        return bool(self._before or self._after or self._error)
+
+    def _dispatch(self, hooks: Tuple[Hook, ...], event: RequestEvent):
+        for hook in hooks:
+            try:
+                hook(event)
+            except Exception as e:
+                logger.error(f"Error in request hook {hook!r}: {e}")
+
+    def emit_before(self, event: RequestEvent):
+        """Run the before_request hooks."""
+        if self._before:
+            self._dispatch(self._before, event)
+
+    def emit_after(self, event: RequestEvent):
+        """Run the after_response hooks."""
+        if self._after:
+            self._dispatch(self._after, event)
+
+    def emit_error(self, event: RequestEvent):
+        """Run the on_error hooks."""
+        if self._error:
+            self._dispatch(self._error, event)
@@ -0,0 +1,509 @@
+"""In-process metrics for the SDK with an OpenMetrics text exporter."""
+
+import bisect
+import logging
+import math
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# Latency buckets in seconds, from sub-millisecond callbacks to slow REST calls
+DEFAULT_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+
+def _escape(value: str) -> str:
+    """Escape a label value for the text exposition format."""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    """Format a label set as ``{a="1",b="2"}``."""
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value."""
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _CounterChild:
+    """Counter for one label set."""
+
+    __slots__ = ("_lock", "value")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0):
+        """Increase the counter."""
+        with self._lock:
+            self.value += amount
+
+
+class _HistogramChild:
+    """Histogram for one label set."""
+
+    __slots__ = ("_lock", "_upper_bounds", "counts", "sum", "count")
+
+    def __init__(self, upper_bounds: Tuple[float, ...]):
+        self._lock = threading.Lock()
+        self._upper_bounds = upper_bounds
+        self.counts = [0] * (len(upper_bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        """Record an observation."""
+        index = bisect.bisect_left(self._upper_bounds, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+            self.count += 1
+
+
+class _Metric:
+    """A named metric family with a fixed set of label names."""
+
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._children: Dict[Tuple[str, ...], Any] = {}
+
+    def _new_child(self) -> Any:
+        raise NotImplementedError
+
+    def labels(self, *values: Any) -> Any:
+        """
+        Get the metric for one combination of label values.
+
+        Args:
+            *values: One value per label name, in order
+
+        Returns:
+            The child metric, with ``inc()`` (counters) or ``observe()`` (histograms)
+
+        Raises:
+            ValueError: If the number of values does not match the label names
+        """
+        key = tuple(str(value) for value in values)
+        child = self._children.get(key)
+        if child is None:
+            if len(key) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}, got {key}")
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+
+    def _items(self) -> List[Tuple[Tuple[str, ...], Any]]:
+        with self._lock:
+            return sorted(self._children.items())
+
+
+class Counter(_Metric):
+    """Monotonically increasing count, e.g. of requests."""
+
+    kind = "counter"
+
+    def _new_child(self) -> _CounterChild:
+        return _CounterChild()
+
+    def inc(self, amount: float = 1.0):
+        """Increase the counter of a metric without labels."""
+        self.labels().inc(amount)
+
+    def value(self, *values: Any) -> float:
+        """
+        Get the current count of a label set.
+
+        Args:
+            *values: One value per label name, in order
+
+        Returns:
+            float: The count (0 if never incremented)
+        """
+        child = self._children.get(tuple(str(value) for value in values))
+        return child.value if child is not None else 0.0
+
+    def render(self) -> List[str]:
+        """Render the samples in the text exposition format."""
+        return [
+            f"{self.name}_total{_format_labels(self.labelnames, key)} {_format_value(child.value)}"
+            for key, child in self._items()
+        ]
+
+
+class Histogram(_Metric):
+    """Distribution of observed values, e.g. latencies, in cumulative buckets."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        """
+        Initialize a histogram.
+
+        Args:
+            name: Metric name
+            documentation: Help text
+            labelnames: Names of the labels
+            buckets: Upper bounds of the buckets, in increasing order (a +Inf
+                bucket is always added)
+        """
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value: float):
+        """Record an observation of a metric without labels."""
+        self.labels().observe(value)
+
+    def render(self) -> List[str]:
+        """Render the samples in the text exposition format."""
+        lines = []
+        bounds = self.buckets + (math.inf,)
+        for key, child in self._items():
+            with child._lock:
+                counts, total, count = list(child.counts), child.sum, child.count
+            cumulative = 0
+            for bound, bucket_count in zip(bounds, counts):
+                cumulative += bucket_count
+                labels = _format_labels(self.labelnames, key, f'le="{_format_value(bound)}"')
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_count{labels} {count}")
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Collection of named metrics.
+
+    Metrics are created on first use and shared afterwards, so every
+    component asking for ``projectx_requests`` gets the same counter.
+
+    Example::
+
+        registry = MetricsRegistry()
+        client = ProjectXClient(username="...", api_key="...", metrics=registry)
+        ...
+        print(registry.render())
+    """
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._lock = threading.Lock()
+        self._metrics: Dict[str, _Metric] = {}
+
+    def _get_or_create(self, cls: type, name: str, *args: Any, **kwargs: Any) -> Any:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, *args, **kwargs)
+            elif not isinstance(metric, cls):
+                raise ValueError(f"Metric {name} is already registered as a {metric.kind}")
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        """
+        Get or create a counter.
+
+        Args:
+            name: Metric name (without the ``_total`` suffix)
+            documentation: Help text
+            labelnames: Names of the labels
+
+        Returns:
+            Counter: The counter
+        """
+        counter: Counter = self._get_or_create(Counter, name, documentation, labelnames)
+        return counter
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """
+        Get or create a histogram.
+
+        Args:
+            name: Metric name
+            documentation: Help text
+            labelnames: Names of the labels
+            buckets: Upper bounds of the buckets
+
+        Returns:
+            Histogram: The histogram
+        """
+        histogram: Histogram = self._get_or_create(
+            Histogram, name, documentation, labelnames, buckets=buckets
+        )
+        return histogram
+
+    def get(self, name: str) -> Optional[Any]:
+        """
+        Get a registered metric by name.
+
+        Args:
+            name: Metric name
+
+        Returns:
+            The metric, or None if it is not registered
+        """
+        with self._lock:
+            return self._metrics.get(name)
+
+    def render(self) -> str:
+        """
+        Render every metric in the OpenMetrics text format.
+
+        Returns:
+            str: The exposition, terminated by ``# EOF``
+        """
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda metric: metric.name)
+
+        lines = []
+        for metric in metrics:
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.append(f"# HELP {metric.name} {_escape(metric.documentation)}")
+            lines.extend(metric.render())  # type: ignore[attr-defined]
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def serve(self, port: int = 9464, host: str = "127.0.0.1") -> "MetricsServer":
+        """
+        Start a background HTTP server exposing the metrics.
+
+        Args:
+            port: Port to listen on (0 for any free port)
+            host: Interface to bind (local only by default)
+
+        Returns:
+            MetricsServer: The running server
+        """
+        server = MetricsServer(self, port=port, host=host)
+        server.start()
+        return server
+
+
+_DEFAULT_REGISTRY = MetricsRegistry()
+
+
+def default_registry() -> MetricsRegistry:
+    """
+    Get the process-wide registry used when a client is not given one.
+
+    Returns:
+        MetricsRegistry: The default registry
+    """
+    return _DEFAULT_REGISTRY
+
+
+class SDKMetrics:
+    """
+    The SDK's own instruments, registered in a MetricsRegistry.
+
+    - ``projectx_requests_total{endpoint,status}``: REST request attempts by
+      HTTP status (``error`` when no response was received)
+    - ``projectx_request_duration_seconds{endpoint}``: REST attempt latency
+    - ``projectx_request_errors_total{endpoint,error}``: failed attempts by
+      exception type
+    - ``projectx_realtime_messages_total{hub,event,key}``: hub messages by
+      event type and contract (market hub) or account (user hub)
+    - ``projectx_realtime_callback_duration_seconds{hub,event}``: time spent in
+      user callbacks
+    - ``projectx_realtime_callback_errors_total{hub,event}``: callbacks that raised
+    - ``projectx_realtime_reconnects_total{hub}``: SignalR reconnections
+    - ``projectx_token_refreshes_total{kind,outcome}``: logins and token
+      validations by outcome
+    - ``projectx_token_refresh_wait_seconds``: time callers waited for a token
+      validation sent by another caller
+    """
+
+    def __init__(self, registry: Optional[MetricsRegistry] = None):
+        """
+        Register the instruments.
+
+        Args:
+            registry: Registry to register in (the default registry if not provided)
+        """
+        self.registry = registry or default_registry()
+        r = self.registry
+
+        self.requests = r.counter(
+            "projectx_requests", "REST request attempts", ("endpoint", "status")
+        )
+        self.request_duration = r.histogram(
+            "projectx_request_duration_seconds", "REST request attempt latency", ("endpoint",)
+        )
+        self.request_errors = r.counter(
+            "projectx_request_errors", "Failed REST request attempts", ("endpoint", "error")
+        )
+        self.messages = r.counter(
+            "projectx_realtime_messages", "Real-time hub messages", ("hub", "event", "key")
+        )
+        self.callback_duration = r.histogram(
+            "projectx_realtime_callback_duration_seconds",
+            "Time spent in real-time callbacks",
+            ("hub", "event"),
+        )
+        self.callback_errors = r.counter(
+            "projectx_realtime_callback_errors",
+            "Real-time callbacks that raised",
+            ("hub", "event"),
+        )
+        self.reconnects = r.counter(
+            "projectx_realtime_reconnects", "Real-time hub reconnections", ("hub",)
+        )
+        self.token_refreshes = r.counter(
+            "projectx_token_refreshes", "Logins and token validations", ("kind", "outcome")
+        )
+        self.token_refresh_wait = r.histogram(
+            "projectx_token_refresh_wait_seconds",
+            "Time spent waiting for another caller's token validation",
+        )
+
+    def observe_request(self, event: Any):
+        """
+        Record a completed REST request attempt.
+
+        Args:
+            event: The attempt's RequestEvent
+        """
+        status = event.status_code if event.status_code is not None else "error"
+        self.requests.labels(event.endpoint, status).inc()
+        self.request_duration.labels(event.endpoint).observe(event.duration)
+        if event.error is not None:
+            self.request_errors.labels(event.endpoint, type(event.error).__name__).inc()
+
+
+MetricsSetting = Union[MetricsRegistry, SDKMetrics, bool, None]
+
+
+def resolve_metrics(metrics: MetricsSetting) -> Optional[SDKMetrics]:
+    """
+    Resolve a metrics setting.
+
+    Args:
+        metrics: A MetricsRegistry or SDKMetrics, None or True for the default
+            registry, or False to disable metrics
+
+    Returns:
+        SDKMetrics: The instruments, or None if disabled
+    """
+    if metrics is False:
+        return None
+    if isinstance(metrics, SDKMetrics):
+        return metrics
+    if isinstance(metrics, MetricsRegistry):
+        return SDKMetrics(metrics)
+    return SDKMetrics()
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    """Serve the registry on GET /metrics."""
+
+    def do_GET(self):
+        """Answer a scrape."""
+        if self.path.split("?", 1)[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = self.server.registry.render().encode("utf-8")  # type: ignore[attr-defined]
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        """Silence request logging."""
+        pass
+
+
+class MetricsServer:
+    """
+    Local HTTP endpoint serving a registry in the OpenMetrics text format.
+
+    Scrapers read ``http://<host>:<port>/metrics``. The server runs in a
+    daemon thread, so it never keeps a process alive.
+    """
+
+    def __init__(self, registry: MetricsRegistry, port: int = 9464, host: str = "127.0.0.1"):
+        """
+        Initialize a metrics server.
+
+        Args:
+            registry: The registry to expose
+            port: Port to listen on (0 for any free port)
+            host: Interface to bind (local only by default)
+        """
+        self.registry = registry
+        self.host = host
+        self._server = ThreadingHTTPServer((host, port), _MetricsHandler)
+        self._server.daemon_threads = True
+        self._server.registry = registry  # type: ignore[attr-defined]
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Get the URL of the metrics endpoint."""
+        return f"http://{self.host}:{self._server.server_port}/metrics"
+
+    def start(self):
+        """Start serving in a background thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._server.serve_forever, name="projectx-metrics", daemon=True
+            )
+            self._thread.start()
+            logger.info(f"Serving metrics on {self.url}")
+
+    def stop(self):
+        """Stop serving and release the port."""
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
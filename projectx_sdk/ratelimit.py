@@ -0,0 +1,391 @@
+"""Client-side rate limiting for ProjectX Gateway API requests."""
+
+import fnmatch
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple, Union
+
+from projectx_sdk.exceptions import RateLimitError
+
+if TYPE_CHECKING:
+    from projectx_sdk.deadline import Deadline
+
+logger = logging.getLogger(__name__)
+
+# Published gateway limits as (requests per second, burst size): History has
+# its own limit, every other endpoint counts against one limit per connection
+DEFAULT_RATES: Dict[str, Tuple[float, int]] = {
+    "History": (50 / 30, 50),
+}
+DEFAULT_RATE: Tuple[float, int] = (200 / 60, 200)
+
+# Bucket shared by the families without a rate of their own
+SHARED_BUCKET = "*"
+
+# Trading calls are stale after a long wait, so they fail fast instead
+TRADING_ENDPOINTS = ("Order/*", "Position/close*")
+DEFAULT_TRADING_MAX_WAIT = 1.0
+
+Rate = Union[float, Tuple[float, int]]
+
+
+def endpoint_family(path: str) -> str:
+    """
+    Get the endpoint family of an API path.
+
+    Args:
+        path: API path relative to '/api/' (e.g. 'History/retrieveBars')
+
+    Returns:
+        str: The family (e.g. 'History')
+    """
+    return path.strip("/").split("/", 1)[0]
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a ``Retry-After`` header.
+
+    Args:
+        value: The header value, either delay seconds or an HTTP date
+
+    Returns:
+        float: Seconds to wait (never negative), or None if the value is missing
+        or malformed
+    """
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class TokenBucket:
+    """
+    Token bucket pacing one endpoint family, or all those sharing the default rate.
+
+    Reservations may drive the token count negative; the caller then waits
+    until the bucket has refilled to its reservation. The refill rate adapts to
+    throttling: it is halved on every 429 and recovers additively on success.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int,
+        clock: Callable[[], float] = time.monotonic,
+        min_rate_ratio: float = 0.1,
+        recovery_ratio: float = 0.05,
+    ):
+        """
+        Initialize a token bucket.
+
+        Args:
+            rate: Configured refill rate in requests per second
+            burst: Bucket capacity (requests allowed back to back)
+            clock: Monotonic clock returning seconds
+            min_rate_ratio: Lowest fraction of the configured rate pacing may adapt to
+            recovery_ratio: Fraction of the configured rate restored per success
+        """
+        if rate <= 0 or burst < 1:
+            raise ValueError("rate must be positive and burst at least 1")
+
+        self.configured_rate = float(rate)
+        self.rate = float(rate)
+        self.burst = burst
+        self._clock = clock
+        self._min_rate = self.configured_rate * min_rate_ratio
+        self._recovery = self.configured_rate * recovery_ratio
+
+        self._tokens = float(burst)
+        self._updated = clock()
+        self._blocked_until = 0.0
+
+        self.throttled = 0
+        self.waits = 0
+        self.wait_time = 0.0
+        self.rejected = 0
+
+    def _refill(self, now: float):
+        """Add the tokens accrued since the last update."""
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self, max_wait: Optional[float] = None) -> float:
+        """
+        Reserve a token.
+
+        Args:
+            max_wait: Largest acceptable wait in seconds (None for no limit)
+
+        Returns:
+            float: Seconds the caller must wait before sending
+
+        Raises:
+            RateLimitError: If the wait would exceed ``max_wait``; no token is
+                consumed in that case
+        """
+        now = self._clock()
+        self._refill(now)
+
+        wait = 0.0 if self._tokens >= 1 else (1 - self._tokens) / self.rate
+        wait = max(wait, self._blocked_until - now)
+
+        if max_wait is not None and wait > max_wait:
+            self.rejected += 1
+            raise RateLimitError(
+                f"Rate limit would delay the request by {wait:.2f}s", retry_after=wait
+            )
+
+        self._tokens -= 1
+        if wait > 0:
+            self.waits += 1
+            self.wait_time += wait
+        return wait
+
+    def throttle(self, retry_after: Optional[float], adapt: bool = True):
+        """
+        Record a 429 response.
+
+        Args:
+            retry_after: The server's ``Retry-After`` delay in seconds, if any
+            adapt: Whether to slow down the refill rate
+        """
+        now = self._clock()
+        self._refill(now)
+        self.throttled += 1
+
+        if adapt:
+            self.rate = max(self._min_rate, self.rate / 2)
+        self._tokens = min(self._tokens, 0.0)
+
+        delay = retry_after if retry_after is not None else 1 / self.rate
+        self._blocked_until = max(self._blocked_until, now + delay)
+
+    def succeed(self):
+        """Record a successful response, recovering the refill rate."""
+        if self.rate < self.configured_rate:
+            now = self._clock()
+            self._refill(now)
+            self.rate = min(self.configured_rate, self.rate + self._recovery)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the bucket's counters."""
+        return {
+            "rate": self.rate,
+            "configured_rate": self.configured_rate,
+            "burst": self.burst,
+            "throttled": self.throttled,
+            "waits": self.waits,
+            "wait_time": self.wait_time,
+            "rejected": self.rejected,
+        }
+
+
+class RateLimiter:
+    """
+    Client-side rate limiter keyed by endpoint family.
+
+    Families with a rate of their own (``History`` by default) get their own
+    bucket; every other family (``Order``, ``Position``, ...) draws from one
+    shared bucket (``SHARED_BUCKET``) at ``default_rate``, as the gateway
+    counts them against a single limit. Each request reserves a token from its
+    bucket and is delayed until the bucket allows it. 429 responses block the
+    bucket for the server's ``Retry-After`` delay and halve its pacing, which
+    then recovers gradually on successful responses.
+
+    A request is delayed for at most ``max_wait`` seconds, and trading calls
+    (``TRADING_ENDPOINTS``) for at most ``trading_max_wait``, so that an
+    order never goes out long after it was placed; longer waits raise
+    RateLimitError.
+
+    Example::
+
+        limiter = RateLimiter(rates={"History/*": (1.0, 10), "Order": 20.0})
+        client = ProjectXClient(username="...", api_key="...", rate_limiter=limiter)
+    """
+
+    def __init__(
+        self,
+        rates: Optional[Dict[str, Rate]] = None,
+        default_rate: Rate = DEFAULT_RATE,
+        max_wait: Optional[float] = 30.0,
+        trading_max_wait: Optional[float] = DEFAULT_TRADING_MAX_WAIT,
+        adaptive: bool = True,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Initialize a rate limiter.
+
+        Args:
+            rates: Rate per endpoint family, as requests per second or a
+                ``(requests_per_second, burst)`` tuple. Families may be written
+                as 'History' or 'History/*'. Merged over the gateway's published
+                limits (DEFAULT_RATES).
+            default_rate: Rate of the bucket shared by the families without
+                an explicit rate
+            max_wait: Longest a request may be delayed before RateLimitError is
+                raised instead (None to always wait)
+            trading_max_wait: Longest a trading call (TRADING_ENDPOINTS) may be
+                delayed, if shorter than ``max_wait`` (None to apply ``max_wait``)
+            adaptive: Whether 429 responses slow down pacing for the bucket
+            clock: Monotonic clock returning seconds
+            sleep: Function used to wait
+        """
+        self.rates: Dict[str, Tuple[float, int]] = dict(DEFAULT_RATES)
+        for family, rate in (rates or {}).items():
+            self.rates[family.rstrip("/*")] = self._normalize(rate)
+
+        self.default_rate = self._normalize(default_rate)
+        self.max_wait = max_wait
+        self.trading_max_wait = trading_max_wait
+        self.adaptive = adaptive
+        self._clock = clock
+        self._sleep = sleep
+
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, TokenBucket] = {}
+
+    @staticmethod
+    def _normalize(rate: Rate) -> Tuple[float, int]:
+        """Expand a bare rate into a ``(rate, burst)`` tuple."""
+        if isinstance(rate, tuple):
+            return float(rate[0]), int(rate[1])
+        return float(rate), max(1, int(rate))
+
+    def bucket(self, path: str) -> TokenBucket:
+        """
+        Get the token bucket pacing an API path.
+
+        Args:
+            path: API path relative to '/api/'
+
+        Returns:
+            TokenBucket: The family's own bucket, or the shared bucket if the
+            family has no rate of its own
+        """
+        family = endpoint_family(path)
+        name = family if family in self.rates else SHARED_BUCKET
+        with self._lock:
+            bucket = self._buckets.get(name)
+            if bucket is None:
+                rate, burst = self.rates.get(name, self.default_rate)
+                bucket = TokenBucket(rate, burst, clock=self._clock)
+                self._buckets[name] = bucket
+            return bucket
+
+    def max_wait_for(self, path: str) -> Optional[float]:
+        """
+        Get the longest a request may be delayed.
+
+        Args:
+            path: API path relative to '/api/'
+
+        Returns:
+            float: Seconds, or None for no limit
+        """
+        max_wait, trading_max_wait = self.max_wait, self.trading_max_wait
+        if trading_max_wait is None or not any(
+            fnmatch.fnmatchcase(path.strip("/"), pattern) for pattern in TRADING_ENDPOINTS
+        ):
+            return max_wait
+        return trading_max_wait if max_wait is None else min(max_wait, trading_max_wait)
+
+    def reserve(self, path: str, deadline: Optional["Deadline"] = None) -> float:
+        """
+        Reserve capacity for a request without waiting.
+
+        Args:
+            path: API path relative to '/api/'
+            deadline: Deadline of the request; no capacity is reserved if the
+                wait would outlast it
+
+        Returns:
+            float: Seconds the caller must wait before sending
+
+        Raises:
+            RateLimitError: If the request would have to wait longer than
+                max_wait_for(path)
+            DeadlineExceededError: If the wait would outlast the deadline
+        """
+        bucket = self.bucket(path)
+        max_wait = self.max_wait_for(path)
+        if deadline is not None:
+            remaining = deadline.remaining()
+            if max_wait is None or remaining < max_wait:
+                try:
+                    with self._lock:
+                        return bucket.reserve(remaining)
+                except RateLimitError as e:
+                    raise deadline.exceeded(f"rate limiting of {path}") from e
+
+        with self._lock:
+            return bucket.reserve(max_wait)
+
+    def acquire(self, path: str, deadline: Optional["Deadline"] = None) -> float:
+        """
+        Wait until a request may be sent.
+
+        Args:
+            path: API path relative to '/api/'
+            deadline: Deadline of the request (see reserve)
+
+        Returns:
+            float: Seconds waited
+
+        Raises:
+            RateLimitError: If the request would have to wait longer than ``max_wait``
+            DeadlineExceededError: If the wait would outlast the deadline
+        """
+        wait = self.reserve(path, deadline)
+        if wait > 0:
+            logger.debug(f"Rate limiting {path}: waiting {wait:.3f}s")
+            self._sleep(wait)
+        return wait
+
+    def record(self, path: str, status_code: int, retry_after: Optional[float] = None):
+        """
+        Feed a response outcome back into the pacing of the path's bucket.
+
+        Args:
+            path: API path relative to '/api/'
+            status_code: HTTP status code of the response
+            retry_after: Parsed ``Retry-After`` delay, if the response had one
+        """
+        bucket = self.bucket(path)
+        with self._lock:
+            if status_code == 429:
+                bucket.throttle(retry_after, adapt=self.adaptive)
+                logger.warning(
+                    f"Rate limited on {endpoint_family(path)}; pacing at {bucket.rate:.2f} req/s"
+                )
+            elif status_code < 400:
+                bucket.succeed()
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get rate limiter statistics.
+
+        Returns:
+            dict: Per bucket (family name, or SHARED_BUCKET for the families
+            sharing the default rate), the current and configured rate, burst, 429 count
+            (``throttled``), delayed requests (``waits`` and total ``wait_time``)
+            and requests rejected for exceeding ``max_wait`` (``rejected``)
+        """
+        with self._lock:
+            return {family: bucket.snapshot() for family, bucket in self._buckets.items()}
@@ -1,18 +1,73 @@
 """Real-time communication modules for ProjectX Gateway API."""
 
 import asyncio
+import concurrent.futures
 import logging
 import threading
 from concurrent.futures import ThreadPoolExecutor
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Coroutine, Dict, Optional, Union
 
+from projectx_sdk.codec import JSONCodec
+from projectx_sdk.deadline import Deadline, resolve_deadline
+from projectx_sdk.metrics import SDKMetrics
 from projectx_sdk.realtime.connection import SignalRConnection
 from projectx_sdk.realtime.market_hub import MarketHub
 from projectx_sdk.realtime.user_hub import UserHub
+from projectx_sdk.tracing import Tracer
 
 # Set up normal logging (removing the debug level override)
 logger = logging.getLogger(__name__)
 
+# Seconds a synchronous hub call waits for the event loop without a deadline
+HUB_CALL_TIMEOUT = 30.0
+
+
+def _run(
+    coro: Coroutine[Any, Any, Any],
+    loop: asyncio.AbstractEventLoop,
+    deadline: Optional[Deadline],
+    operation: str,
+) -> Any:
+    """
+    Run a coroutine on the hub event loop and wait for its result.
+
+    Args:
+        coro: The coroutine to run
+        loop: The event loop of the hub thread
+        deadline: Deadline for the call (the earlier of it and the active deadline applies)
+        operation: Name of the call, for the error message
+
+    Returns:
+        The coroutine's result
+
+    Raises:
+        DeadlineExceededError: If the deadline passes before the call completes
+        TimeoutError: If the call takes longer than HUB_CALL_TIMEOUT without a deadline
+    """
+    deadline = resolve_deadline(deadline)
+    if deadline is None:
+        return asyncio.run_coroutine_threadsafe(coro, loop).result(timeout=HUB_CALL_TIMEOUT)
+
+    try:
+        timeout = deadline.limit(HUB_CALL_TIMEOUT, operation)
+    except Exception:
+        coro.close()
+        raise
+
+    async def bounded() -> Any:
+        # Activate the deadline on the loop so hub invocations see it too
+        with deadline:
+            return await coro
+
+    future = asyncio.run_coroutine_threadsafe(bounded(), loop)
+    try:
+        return future.result(timeout=timeout)
+    except concurrent.futures.TimeoutError as e:
+        future.cancel()
+        if not deadline.expired:
+            raise
+        raise deadline.exceeded(operation) from e
+
 
 class SyncMarketHub:
     """Synchronous wrapper for MarketHub that hides async complexity."""
@@ -23,54 +78,130 @@ class SyncMarketHub:
         self._loop = event_loop
 
     def subscribe_quotes(
-        self, contract_id: str, callback: Callable[[str, Dict[str, Any]], None]
+        self,
+        contract_id: str,
+        callback: Callable[[str, Dict[str, Any]], None],
+        deadline: Optional[Deadline] = None,
     ) -> None:
-        """Subscribe to quote updates for a contract."""
-        future = asyncio.run_coroutine_threadsafe(
-            self._async_hub.subscribe_quotes(contract_id, callback), self._loop
+        """
+        Subscribe to quote updates for a contract.
+
+        Args:
+            contract_id: The contract ID
+            callback: Function called with the contract ID and each update
+            deadline: Deadline for the call (waits up to HUB_CALL_TIMEOUT without one)
+        """
+        _run(
+            self._async_hub.subscribe_quotes(contract_id, callback),
+            self._loop,
+            deadline,
+            "subscribe_quotes",
         )
-        future.result(timeout=30)
 
-    def unsubscribe_quotes(self, contract_id: str, callback: Optional[Callable] = None) -> None:
-        """Unsubscribe from quote updates for a contract."""
-        future = asyncio.run_coroutine_threadsafe(
-            self._async_hub.unsubscribe_quotes(contract_id, callback), self._loop
+    def unsubscribe_quotes(
+        self,
+        contract_id: str,
+        callback: Optional[Callable] = None,
+        deadline: Optional[Deadline] = None,
+    ) -> None:
+        """
+        Unsubscribe from quote updates for a contract.
+
+        Args:
+            contract_id: The contract ID
+            callback: The callback to remove (all callbacks if not provided)
+            deadline: Deadline for the call (waits up to HUB_CALL_TIMEOUT without one)
+        """
+        _run(
+            self._async_hub.unsubscribe_quotes(contract_id, callback),
+            self._loop,
+            deadline,
+            "unsubscribe_quotes",
         )
-        future.result(timeout=30)
 
     def subscribe_trades(
-        self, contract_id: str, callback: Callable[[str, Dict[str, Any]], None]
+        self,
+        contract_id: str,
+        callback: Callable[[str, Dict[str, Any]], None],
+        deadline: Optional[Deadline] = None,
     ) -> None:
-        """Subscribe to trade updates for a contract."""
-        future = asyncio.run_coroutine_threadsafe(
-            self._async_hub.subscribe_trades(contract_id, callback), self._loop
+        """
+        Subscribe to trade updates for a contract.
+
+        Args:
+            contract_id: The contract ID
+            callback: Function called with the contract ID and each update
+            deadline: Deadline for the call (waits up to HUB_CALL_TIMEOUT without one)
+        """
+        _run(
+            self._async_hub.subscribe_trades(contract_id, callback),
+            self._loop,
+            deadline,
+            "subscribe_trades",
         )
-        future.result(timeout=30)
 
-    def unsubscribe_trades(self, contract_id: str, callback: Optional[Callable] = None) -> None:
-        """Unsubscribe from trade updates for a contract."""
-        future = asyncio.run_coroutine_threadsafe(
-            self._async_hub.unsubscribe_trades(contract_id, callback), self._loop
+    def unsubscribe_trades(
+        self,
+        contract_id: str,
+        callback: Optional[Callable] = None,
+        deadline: Optional[Deadline] = None,
+    ) -> None:
+        """
+        Unsubscribe from trade updates for a contract.
+
+        Args:
+            contract_id: The contract ID
+            callback: The callback to remove (all callbacks if not provided)
+            deadline: Deadline for the call (waits up to HUB_CALL_TIMEOUT without one)
+        """
+        _run(
+            self._async_hub.unsubscribe_trades(contract_id, callback),
+            self._loop,
+            deadline,
+            "unsubscribe_trades",
         )
-        future.result(timeout=30)
 
     def subscribe_market_depth(
-        self, contract_id: str, callback: Callable[[str, Dict[str, Any]], None]
+        self,
+        contract_id: str,
+        callback: Callable[[str, Dict[str, Any]], None],
+        deadline: Optional[Deadline] = None,
     ) -> None:
-        """Subscribe to market depth updates for a contract."""
-        future = asyncio.run_coroutine_threadsafe(
-            self._async_hub.subscribe_market_depth(contract_id, callback), self._loop
+        """
+        Subscribe to market depth updates for a contract.
+
+        Args:
+            contract_id: The contract ID
+            callback: Function called with the contract ID and each update
+            deadline: Deadline for the call (waits up to HUB_CALL_TIMEOUT without one)
+        """
+        _run(
+            self._async_hub.subscribe_market_depth(contract_id, callback),
+            self._loop,
+            deadline,
+            "subscribe_market_depth",
         )
-        future.result(timeout=30)
 
     def unsubscribe_market_depth(
-        self, contract_id: str, callback: Optional[Callable] = None
+        self,
+        contract_id: str,
+        callback: Optional[Callable] = None,
+        deadline: Optional[Deadline] = None,
     ) -> None:
-        """Unsubscribe from market depth updates for a contract."""
-        future = asyncio.run_coroutine_threadsafe(
-            self._async_hub.unsubscribe_market_depth(contract_id, callback), self._loop
+        """
+        Unsubscribe from market depth updates for a contract.
+
+        Args:
+            contract_id: The contract ID
+            callback: The callback to remove (all callbacks if not provided)
+            deadline: Deadline for the call (waits up to HUB_CALL_TIMEOUT without one)
+        """
+        _run(
+            self._async_hub.unsubscribe_market_depth(contract_id, callback),
+            self._loop,
+            deadline,
+            "unsubscribe_market_depth",
         )
-        future.result(timeout=30)
 
 
 class SyncUserHub:
@@ -99,6 +230,10 @@ class SyncRealTimeClient:
         environment: str,
         user_hub_url: Optional[str] = None,
         market_hub_url: Optional[str] = None,
+        codec: Union[str, JSONCodec, None] = None,
+        on_account_update: Optional[Callable[[Any], None]] = None,
+        metrics: Optional[SDKMetrics] = None,
+        tracer: Optional[Tracer] = None,
     ):
         """
         Initialize a synchronous real-time client.
@@ -108,11 +243,19 @@ class SyncRealTimeClient:
             environment: Environment name (e.g., 'topstepx')
             user_hub_url: URL for the user hub (optional)
             market_hub_url: URL for the market hub (optional)
+            codec: JSON codec for hub frames (stdlib json if not provided)
+            on_account_update: Listener for account events (see RealTimeClient)
+            metrics: Metrics for hub messages, callbacks and reconnects (optional)
+            tracer: Tracer for hub invocations and events (optional)
         """
         self._auth_token = auth_token
         self._environment = environment
         self._user_hub_url = user_hub_url
         self._market_hub_url = market_hub_url
+        self._codec = codec
+        self._on_account_update = on_account_update
+        self._metrics = metrics
+        self._tracer = tracer
 
         # Background thread and event loop
         self._loop: Optional[asyncio.AbstractEventLoop] = None
@@ -125,8 +268,17 @@ class SyncRealTimeClient:
         self._user: Optional[SyncUserHub] = None
         self._market: Optional[SyncMarketHub] = None
 
-    def start(self):
-        """Start the real-time connections."""
+    def start(self, deadline: Optional[Deadline] = None):
+        """
+        Start the real-time connections.
+
+        Args:
+            deadline: Deadline for connecting the hubs (waits up to
+                HUB_CALL_TIMEOUT without one)
+
+        Raises:
+            DeadlineExceededError: If the hubs do not connect before the deadline
+        """
         if self._started:
             return
 
@@ -142,6 +294,10 @@ class SyncRealTimeClient:
                     environment=self._environment,
                     user_hub_url=self._user_hub_url,
                     market_hub_url=self._market_hub_url,
+                    codec=self._codec,
+                    on_account_update=self._on_account_update,
+                    metrics=self._metrics,
+                    tracer=self._tracer,
                 )
 
                 # Run the event loop
@@ -162,8 +318,7 @@ class SyncRealTimeClient:
 
         # Start the async client (we know _async_client and _loop are not None here)
         if self._async_client and self._loop:
-            future = asyncio.run_coroutine_threadsafe(self._async_client.start(), self._loop)
-            future.result(timeout=30)  # Wait up to 30 seconds
+            _run(self._async_client.start(), self._loop, deadline, "hub start")
 
             # Create sync wrappers for hubs
             self._user = SyncUserHub(self._async_client.user, self._loop)
@@ -250,6 +405,10 @@ class RealTimeClient:
         environment: str,
         user_hub_url: Optional[str] = None,
         market_hub_url: Optional[str] = None,
+        codec: Union[str, JSONCodec, None] = None,
+        on_account_update: Optional[Callable[[Any], None]] = None,
+        metrics: Optional[SDKMetrics] = None,
+        tracer: Optional[Tracer] = None,
     ):
         """
         Initialize a real-time client.
@@ -259,21 +418,35 @@ class RealTimeClient:
             environment: Environment name (e.g., 'topstepx')
             user_hub_url: URL for the user hub (optional)
             market_hub_url: URL for the market hub (optional)
+            codec: JSON codec for hub frames (stdlib json if not provided)
+            on_account_update: Called with every ``GatewayUserAccount`` event,
+                without subscribing to accounts (the client uses it to invalidate
+                its response cache)
+            metrics: Metrics for hub messages, callbacks and reconnects (optional)
+            tracer: Tracer for hub invocations and events (optional)
         """
         # Create hub instances with their connections
         self._user_connection = SignalRConnection(
             hub_url=user_hub_url or f"wss://gateway-rtc-{environment}.s2f.projectx.com/hubs/user",
             access_token=auth_token,
             connection_callback=None,  # Will be set by UserHub
+            codec=codec,
+            metrics=metrics,
+            tracer=tracer,
         )
         self._market_connection = SignalRConnection(
             hub_url=market_hub_url
             or f"wss://gateway-rtc-{environment}.s2f.projectx.com/hubs/market",
             access_token=auth_token,
             connection_callback=None,  # Will be set by MarketHub
+            codec=codec,
+            metrics=metrics,
+            tracer=tracer,
         )
 
         self.user = UserHub(self._user_connection)
+        if on_account_update is not None:
+            self.user.add_account_listener(on_account_update)
         self.market = MarketHub(self._market_connection)
 
     async def start(self):
@@ -7,10 +7,61 @@ from abc import ABC, abstractmethod
 
 # This is a placeholder import - in real implementation, you'd use signalrcore or similar
 from signalrcore.hub_connection_builder import HubConnectionBuilder
+from signalrcore.protocol.json_hub_protocol import JsonHubProtocol
+
+from projectx_sdk.codec import get_codec
+from projectx_sdk.deadline import current_deadline
+from projectx_sdk.tracing import trace
 
 logger = logging.getLogger(__name__)
 
 
+class CodecHubProtocol(JsonHubProtocol):
+    """SignalR JSON hub protocol that encodes and decodes frames with a JSONCodec."""
+
+    def __init__(self, codec=None):
+        """
+        Initialize the protocol.
+
+        Args:
+            codec: A JSONCodec instance or codec name (see projectx_sdk.codec.get_codec)
+        """
+        super().__init__()
+        self.codec = get_codec(codec)
+
+    def parse_messages(self, raw):
+        """
+        Decode the hub messages contained in a raw WebSocket frame.
+
+        Args:
+            raw (str): One or more JSON records separated by the record separator
+
+        Returns:
+            list: The decoded hub messages
+        """
+        result = []
+        for record in raw.split(self.record_separator):
+            if not record:
+                continue
+            dict_message = self.codec.loads(record)
+            if dict_message:
+                result.append(self.get_message(dict_message))
+        return result
+
+    def encode(self, message):
+        """
+        Encode a hub message as a JSON record.
+
+        Args:
+            message: The signalrcore message object
+
+        Returns:
+            str: The JSON record terminated by the record separator
+        """
+        payload = self.codec.dumps(message, default=self.encoder.default)
+        return payload.decode("utf-8") + self.record_separator
+
+
 class HubConnection(ABC):
     """Base class for SignalR hub connections."""
 
@@ -208,7 +259,15 @@ class HubConnection(ABC):
 class SignalRConnection:
     """SignalR connection for ProjectX Gateway API real-time data."""
 
-    def __init__(self, hub_url, access_token, connection_callback=None):
+    def __init__(
+        self,
+        hub_url,
+        access_token,
+        connection_callback=None,
+        codec=None,
+        metrics=None,
+        tracer=None,
+    ):
         """
         Initialize a SignalR connection.
 
@@ -217,9 +276,20 @@ class SignalRConnection:
             access_token (str): JWT authentication token
             connection_callback (callable, optional): Callback to invoke when connection is
                 established or reconnected
+            codec (optional): JSON codec for hub frames, as a JSONCodec instance or
+                codec name ('auto', 'orjson', 'msgspec', 'json'). Defaults to stdlib json.
+            metrics (SDKMetrics, optional): Metrics recording reconnects here and
+                messages and callbacks in the hub using this connection
+            tracer (Tracer, optional): Tracer recording spans for hub invocations
+                here and hub events in the hub using this connection
         """
         self.hub_url = hub_url
         self.access_token = access_token
+        self.codec = get_codec(codec)
+        self.metrics = metrics
+        self.tracer = tracer
+        # Hub name used in metrics and spans (e.g. 'market' for '.../hubs/market')
+        self.hub_name = hub_url.rstrip("/").rsplit("/", 1)[-1]
         self._connection = self._build_connection()
         self._is_connected = False
         self._handlers = {}
@@ -245,6 +315,7 @@ class SignalRConnection:
                     "max_attempts": 10,
                 }
             )
+            .with_hub_protocol(CodecHubProtocol(self.codec))
             .build()
         )
 
@@ -369,40 +440,48 @@ class SignalRConnection:
             The result of the method invocation
 
         Raises:
+            DeadlineExceededError: If the active deadline has passed
             Exception: If not connected or method invocation fails
         """
         if not self._is_connected:
             raise Exception("Not connected to SignalR hub")
 
-        try:
-            # Log the raw args for debugging
-            logger.debug(f"Invoking hub method {method} with args: {args}")
-
-            # For signalrcore methods, we need to ensure arguments are in a list
-            # Convert single arguments to a list containing that argument
-            if len(args) == 1 and not isinstance(args[0], list):
-                # Single non-list argument, wrap it in a list
-                send_args = [args[0]]
-            elif len(args) > 1:
-                # Multiple arguments, put them all in a list
-                send_args = list(args)
-            else:
-                # Either empty args or a single list argument
-                send_args = args[0] if args and isinstance(args[0], list) else list(args)
-
-            logger.debug(f"Final args for {method}: {send_args}")
+        deadline = current_deadline()
+        if deadline is not None:
+            deadline.check(f"{self.hub_name} hub {method}")
 
-            # Check if send is a coroutine function or a regular function
-            conn_send = self._connection.send
-            if asyncio.iscoroutinefunction(conn_send):
-                sent_result = await conn_send(method, send_args)
-                return sent_result
-            else:
-                return conn_send(method, send_args)
-        except Exception as e:
-            error_msg = f"Hub error: {method}"
-            logger.error(error_msg)
-            raise e
+        with trace(
+            self.tracer, f"SignalR.invoke {method}", {"hub": self.hub_name, "method": method}
+        ):
+            try:
+                # Log the raw args for debugging
+                logger.debug(f"Invoking hub method {method} with args: {args}")
+
+                # For signalrcore methods, we need to ensure arguments are in a list
+                # Convert single arguments to a list containing that argument
+                if len(args) == 1 and not isinstance(args[0], list):
+                    # Single non-list argument, wrap it in a list
+                    send_args = [args[0]]
+                elif len(args) > 1:
+                    # Multiple arguments, put them all in a list
+                    send_args = list(args)
+                else:
+                    # Either empty args or a single list argument
+                    send_args = args[0] if args and isinstance(args[0], list) else list(args)
+
+                logger.debug(f"Final args for {method}: {send_args}")
+
+                # Check if send is a coroutine function or a regular function
+                conn_send = self._connection.send
+                if asyncio.iscoroutinefunction(conn_send):
+                    sent_result = await conn_send(method, send_args)
+                    return sent_result
+                else:
+                    return conn_send(method, send_args)
+            except Exception as e:
+                error_msg = f"Hub error: {method}"
+                logger.error(error_msg)
+                raise e
 
     def _register_handlers(self):
         """Register all existing event handlers with the connection."""
@@ -423,6 +502,8 @@ class SignalRConnection:
                 self._reconnecting = False
 
             logger.info("SignalR connection reconnected")
+            if self.metrics is not None:
+                self.metrics.reconnects.labels(self.hub_name).inc()
 
             # Re-register all handlers
             self._register_handlers()
@@ -2,9 +2,12 @@
 
 import asyncio
 import logging
-from typing import Any, Callable, Dict, Optional
+import time
+from typing import Any, Callable, Dict, List, Optional
 
+from projectx_sdk.metrics import SDKMetrics
 from projectx_sdk.realtime.connection import SignalRConnection
+from projectx_sdk.tracing import SpanContext, Tracer, trace
 
 logger = logging.getLogger(__name__)
 
@@ -64,6 +67,12 @@ class MarketHub:
             self._connection: Optional[SignalRConnection] = None  # type: ignore
             self._is_connected = False
 
+        # Metrics and tracing, shared with the connection or client
+        metrics = getattr(client_or_connection, "metrics", None)
+        self._metrics = metrics if isinstance(metrics, SDKMetrics) else None
+        tracer = getattr(client_or_connection, "tracer", None)
+        self._tracer = tracer if isinstance(tracer, Tracer) else None
+
         # Register event handlers if using direct connection
         if not self._owns_connection:
             self._register_handlers()
@@ -239,12 +248,13 @@ class MarketHub:
             logger.debug("No contract ID in quote data")
             return
 
+        if self._metrics is not None:
+            self._metrics.messages.labels("market", "GatewayQuote", contract_id).inc()
+
         if contract_id in self._quote_callbacks:
-            for callback in self._quote_callbacks[contract_id]:
-                try:
-                    callback(contract_id, quote_data)
-                except Exception as e:
-                    logger.error(f"Error in quote callback: {e}")
+            self._invoke_callbacks(
+                "GatewayQuote", "quote", self._quote_callbacks[contract_id], contract_id, quote_data
+            )
 
     def _handle_trade(self, data_or_contract_id, data=None):
         """
@@ -306,12 +316,13 @@ class MarketHub:
             logger.debug("No contract ID in trade data")
             return
 
+        if self._metrics is not None:
+            self._metrics.messages.labels("market", "GatewayTrade", contract_id).inc()
+
         if contract_id in self._trade_callbacks:
-            for callback in self._trade_callbacks[contract_id]:
-                try:
-                    callback(contract_id, trade_data)
-                except Exception as e:
-                    logger.error(f"Error in trade callback: {e}")
+            self._invoke_callbacks(
+                "GatewayTrade", "trade", self._trade_callbacks[contract_id], contract_id, trade_data
+            )
 
     def _handle_depth(self, data_or_contract_id, data=None):
         """
@@ -373,12 +384,47 @@ class MarketHub:
             logger.debug("No contract ID in depth data")
             return
 
+        if self._metrics is not None:
+            self._metrics.messages.labels("market", "GatewayDepth", contract_id).inc()
+
         if contract_id in self._depth_callbacks:
-            for callback in self._depth_callbacks[contract_id]:
+            self._invoke_callbacks(
+                "GatewayDepth", "depth", self._depth_callbacks[contract_id], contract_id, depth_data
+            )
+
+    def _invoke_callbacks(
+        self,
+        event: str,
+        kind: str,
+        callbacks: List[Any],
+        *args: Any,
+        origin: Optional[SpanContext] = None,
+    ):
+        """
+        Run the callbacks of a hub event, isolating and timing each one.
+
+        Args:
+            event: Hub event name (e.g. 'GatewayQuote')
+            kind: Short name used in log messages (e.g. 'quote')
+            callbacks: The callbacks to run
+            *args: Arguments passed to every callback
+            origin: Span that caused the event (e.g. the one that placed the
+                order), parenting the event's span
+        """
+        metrics = self._metrics
+        with trace(self._tracer, event, {"hub": "market"}, parent=origin):
+            for callback in callbacks:
+                started = time.perf_counter()
                 try:
-                    callback(contract_id, depth_data)
+                    callback(*args)
                 except Exception as e:
-                    logger.error(f"Error in depth callback: {e}")
+                    logger.error(f"Error in {kind} callback: {e}")
+                    if metrics is not None:
+                        metrics.callback_errors.labels("market", event).inc()
+                if metrics is not None:
+                    metrics.callback_duration.labels("market", event).observe(
+                        time.perf_counter() - started
+                    )
 
     async def subscribe_quotes(
         self, contract_id: str, callback: Callable[[str, Dict[str, Any]], None]
@@ -2,9 +2,12 @@
 
 import asyncio
 import logging
+import time
 from typing import Any, Callable, Dict, List, Optional, Set
 
+from projectx_sdk.metrics import SDKMetrics
 from projectx_sdk.realtime.connection import SignalRConnection
+from projectx_sdk.tracing import SpanContext, Tracer, trace
 
 logger = logging.getLogger(__name__)
 
@@ -67,6 +70,12 @@ class UserHub:
             self._connection: Optional[SignalRConnection] = None  # type: ignore
             self._is_connected = False
 
+        # Metrics and tracing, shared with the connection or client
+        metrics = getattr(client_or_connection, "metrics", None)
+        self._metrics = metrics if isinstance(metrics, SDKMetrics) else None
+        tracer = getattr(client_or_connection, "tracer", None)
+        self._tracer = tracer if isinstance(tracer, Tracer) else None
+
         # Register handlers if using direct connection
         if not self._owns_connection:
             self._register_handlers()
@@ -235,6 +244,22 @@ class UserHub:
 
         return self
 
+    def add_account_listener(self, callback):
+        """
+        Register a callback for account updates without subscribing.
+
+        The callback only receives events once accounts are subscribed to, e.g.
+        with subscribe_accounts().
+
+        Args:
+            callback (callable): Callback function for account updates
+
+        Returns:
+            self: For method chaining
+        """
+        self._account_callbacks.append(callback)
+        return self
+
     def unsubscribe_accounts(self):
         """
         Unsubscribe from account updates.
@@ -381,6 +406,40 @@ class UserHub:
 
         return await self._connection.invoke(method, *args)
 
+    def _invoke_callbacks(
+        self,
+        event: str,
+        kind: str,
+        callbacks: List[Any],
+        *args: Any,
+        origin: Optional[SpanContext] = None,
+    ):
+        """
+        Run the callbacks of a hub event, isolating and timing each one.
+
+        Args:
+            event: Hub event name (e.g. 'GatewayUserOrder')
+            kind: Short name used in log messages (e.g. 'order')
+            callbacks: The callbacks to run
+            *args: Arguments passed to every callback
+            origin: Span that caused the event (e.g. the one that placed the
+                order), parenting the event's span
+        """
+        metrics = self._metrics
+        with trace(self._tracer, event, {"hub": "user"}, parent=origin):
+            for callback in callbacks:
+                started = time.perf_counter()
+                try:
+                    callback(*args)
+                except Exception as e:
+                    logger.error(f"Error in {kind} callback: {e}")
+                    if metrics is not None:
+                        metrics.callback_errors.labels("user", event).inc()
+                if metrics is not None:
+                    metrics.callback_duration.labels("user", event).observe(
+                        time.perf_counter() - started
+                    )
+
     def _handle_account_update(self, data):
         """
         Handle account update events.
@@ -404,12 +463,14 @@ class UserHub:
             logger.error(f"Error processing account data: {e}")
             return
 
+        if self._metrics is not None:
+            account = processed_data.get("id", "") if isinstance(processed_data, dict) else ""
+            self._metrics.messages.labels("user", "GatewayUserAccount", account).inc()
+
         # Call all registered account callbacks
-        for callback in self._account_callbacks:
-            try:
-                callback(processed_data)
-            except Exception as e:
-                logger.error(f"Error in account callback: {e}")
+        self._invoke_callbacks(
+            "GatewayUserAccount", "account", self._account_callbacks, processed_data
+        )
 
     def _handle_order_update(self, data_or_account_id, data=None):
         """
@@ -472,11 +533,20 @@ class UserHub:
             callbacks = self._order_callbacks.get(str(account_id), [])
         else:
             callbacks = []
-        for callback in callbacks:
-            try:
-                callback(account_id, order_data)
-            except Exception as e:
-                logger.error(f"Error in order callback: {e}")
+        if self._metrics is not None:
+            self._metrics.messages.labels("user", "GatewayUserOrder", account_id).inc()
+
+        # Join the trace of the span that placed the order, if known
+        origin = None
+        if self._tracer is not None and isinstance(order_data, dict):
+            order_id = order_data.get("id")
+            origin = self._tracer.origin(order_data.get("customTag"), order_id)
+            if origin is not None:
+                self._tracer.correlate(origin, order_id=order_id)
+
+        self._invoke_callbacks(
+            "GatewayUserOrder", "order", callbacks, account_id, order_data, origin=origin
+        )
 
     def _handle_position_update(self, data_or_account_id, data=None):
         """
@@ -539,11 +609,11 @@ class UserHub:
             callbacks = self._position_callbacks.get(str(account_id), [])
         else:
             callbacks = []
-        for callback in callbacks:
-            try:
-                callback(account_id, position_data)
-            except Exception as e:
-                logger.error(f"Error in position callback: {e}")
+        if self._metrics is not None:
+            self._metrics.messages.labels("user", "GatewayUserPosition", account_id).inc()
+        self._invoke_callbacks(
+            "GatewayUserPosition", "position", callbacks, account_id, position_data
+        )
 
     def _handle_trade_update(self, data_or_account_id, data=None):
         """
@@ -606,8 +676,14 @@ class UserHub:
             callbacks = self._trade_callbacks.get(str(account_id), [])
         else:
             callbacks = []
-        for callback in callbacks:
-            try:
-                callback(account_id, trade_data)
-            except Exception as e:
-                logger.error(f"Error in trade callback: {e}")
+        if self._metrics is not None:
+            self._metrics.messages.labels("user", "GatewayUserTrade", account_id).inc()
+
+        # Join the trace of the span that placed the filled order, if known
+        origin = None
+        if self._tracer is not None and isinstance(trade_data, dict):
+            origin = self._tracer.origin(order_id=trade_data.get("orderId"))
+
+        self._invoke_callbacks(
+            "GatewayUserTrade", "trade", callbacks, account_id, trade_data, origin=origin
+        )
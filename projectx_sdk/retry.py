@@ -0,0 +1,332 @@
+"""Retry policies for ProjectX Gateway API requests."""
+
+import contextlib
+import contextvars
+import fnmatch
+import logging
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, Optional, Sequence, Union
+
+import requests
+
+from projectx_sdk.exceptions import RateLimitError, RequestError
+
+logger = logging.getLogger(__name__)
+
+# Endpoints that only read data and are therefore always safe to repeat
+READ_ONLY_ENDPOINTS = (
+    "*/search",
+    "*/searchOpen",
+    "History/retrieveBars",
+    "Contract/searchById",
+)
+
+# HTTP statuses worth retrying: throttling and transient gateway failures
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+JITTER_MODES = ("full", "equal", "none")
+
+
+def is_read_only(path: str, patterns: Sequence[str] = READ_ONLY_ENDPOINTS) -> bool:
+    """
+    Check whether an endpoint only reads data.
+
+    Args:
+        path: API path relative to '/api/'
+        patterns: Glob patterns of read-only endpoints
+
+    Returns:
+        bool: True if the path matches one of the patterns
+    """
+    return any(fnmatch.fnmatchcase(path, pattern) for pattern in patterns)
+
+
+class RetryBudget:
+    """
+    Global retry budget shared by every endpoint of a client.
+
+    Each first attempt deposits ``ratio`` tokens and each retry withdraws one,
+    so over time retries stay below ``ratio`` of the request volume. The
+    ``capacity`` reserve lets a quiet client ride out a short burst of failures.
+    When the budget is empty, failures are raised instead of retried, which
+    keeps a struggling gateway from being hit by a retry storm.
+    """
+
+    def __init__(self, ratio: float = 0.2, capacity: float = 10.0):
+        """
+        Initialize a retry budget.
+
+        Args:
+            ratio: Retries allowed per request, on average
+            capacity: Maximum (and initial) number of banked retries
+        """
+        self.ratio = ratio
+        self.capacity = capacity
+        self._tokens = capacity
+        self._lock = threading.Lock()
+
+    def deposit(self):
+        """Credit the budget for a new request."""
+        with self._lock:
+            self._tokens = min(self.capacity, self._tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        """
+        Take one retry from the budget.
+
+        Returns:
+            bool: True if a retry is allowed
+        """
+        with self._lock:
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            return False
+
+    @property
+    def available(self) -> float:
+        """Get the number of retries currently banked."""
+        with self._lock:
+            return self._tokens
+
+
+class RetryPolicy:
+    """
+    Decides whether and when a failed request is retried.
+
+    Read-only endpoints (see READ_ONLY_ENDPOINTS) are retried on network
+    failures, timeouts, 429 and transient 5xx responses, with exponential
+    backoff and jitter. Mutating endpoints such as ``Order/place`` are only
+    retried when the call is marked idempotent, e.g. because it carries a
+    ``custom_tag`` the gateway uses to reject duplicates.
+
+    Example::
+
+        policy = RetryPolicy(max_attempts=5, backoff_base=0.5)
+        client = ProjectXClient(username="...", api_key="...", retry_policy=policy)
+
+        # Per call
+        client.request("POST", "History/retrieveBars", json=..., retry=RetryPolicy(max_attempts=10))
+        with retry_override(False):
+            client.orders.search_open(account_id)  # fail fast
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff_base: float = 0.2,
+        backoff_max: float = 5.0,
+        jitter: str = "full",
+        retry_statuses: Sequence[int] = RETRY_STATUSES,
+        read_only_endpoints: Sequence[str] = READ_ONLY_ENDPOINTS,
+        budget: Optional[RetryBudget] = None,
+        sleep: Callable[[float], None] = time.sleep,
+        rng: Callable[[], float] = random.random,
+    ):
+        """
+        Initialize a retry policy.
+
+        Args:
+            max_attempts: Total attempts per call, including the first
+            backoff_base: Delay before the first retry, in seconds
+            backoff_max: Cap on any single delay, in seconds
+            jitter: 'full' (uniform in [0, delay]), 'equal' (uniform in
+                [delay / 2, delay]) or 'none'
+            retry_statuses: HTTP statuses that are retried
+            read_only_endpoints: Glob patterns of endpoints that are always safe
+                to retry
+            budget: Retry budget shared by all calls (a new one if not provided)
+            sleep: Function used to wait between attempts
+            rng: Source of uniform random numbers in [0, 1)
+
+        Raises:
+            ValueError: If the configuration is invalid
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        if jitter not in JITTER_MODES:
+            raise ValueError(
+                f"Unknown jitter mode: {jitter}. Use one of {', '.join(JITTER_MODES)}."
+            )
+
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.jitter = jitter
+        self.retry_statuses = tuple(retry_statuses)
+        self.read_only_endpoints = tuple(read_only_endpoints)
+        self.budget = budget if budget is not None else RetryBudget()
+        self.sleep = sleep
+        self._rng = rng
+
+        self._lock = threading.Lock()
+        self._retries = 0
+        self._budget_exhausted = 0
+        self._gave_up = 0
+
+    def is_read_only(self, path: str) -> bool:
+        """
+        Check whether an endpoint only reads data.
+
+        Args:
+            path: API path relative to '/api/'
+
+        Returns:
+            bool: True if the endpoint matches a read-only pattern
+        """
+        return is_read_only(path, self.read_only_endpoints)
+
+    def is_retryable_error(self, error: Exception) -> bool:
+        """
+        Check whether an error is transient.
+
+        Args:
+            error: The exception raised by an attempt
+
+        Returns:
+            bool: True for network failures, timeouts and retryable HTTP
+            statuses. Rejections by the client's own rate limiter are not
+            retryable, as they already waited as long as ``max_wait`` allows.
+        """
+        if isinstance(error, RateLimitError):
+            # Only a 429 from the gateway; local rejections carry no status
+            return error.error_code == 429 and 429 in self.retry_statuses
+        if isinstance(error, requests.RequestException):
+            return True
+        if isinstance(error, RequestError):
+            if isinstance(error.__cause__, requests.RequestException):
+                return True
+            return error.error_code in self.retry_statuses
+        return False
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Get the delay before the next attempt.
+
+        Args:
+            attempt: The number of the attempt that just failed (1-based)
+
+        Returns:
+            float: Seconds to wait
+        """
+        delay = min(self.backoff_max, self.backoff_base * 2.0 ** (attempt - 1))
+        if self.jitter == "full":
+            return delay * self._rng()
+        if self.jitter == "equal":
+            return delay / 2 + delay / 2 * self._rng()
+        return delay
+
+    def start(self):
+        """Record the first attempt of a call, crediting the retry budget."""
+        self.budget.deposit()
+
+    def next_delay(
+        self, path: str, attempt: int, error: Exception, idempotent: bool = False
+    ) -> Optional[float]:
+        """
+        Decide whether a failed attempt is retried.
+
+        Args:
+            path: API path relative to '/api/'
+            attempt: The number of the attempt that just failed (1-based)
+            error: The exception raised by the attempt
+            idempotent: Whether the caller marked a mutating call safe to repeat
+
+        Returns:
+            float: Seconds to wait before retrying, or None to raise the error
+        """
+        if attempt >= self.max_attempts:
+            if self.is_retryable_error(error):
+                with self._lock:
+                    self._gave_up += 1
+            return None
+
+        if not (idempotent or self.is_read_only(path)) or not self.is_retryable_error(error):
+            return None
+
+        if not self.budget.withdraw():
+            with self._lock:
+                self._budget_exhausted += 1
+            logger.warning(f"Retry budget exhausted; not retrying {path}")
+            return None
+
+        delay = self.backoff(attempt)
+        retry_after = getattr(error, "retry_after", None)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+
+        with self._lock:
+            self._retries += 1
+
+        logger.info(f"Retrying {path} in {delay:.2f}s after attempt {attempt} failed: {error}")
+        return delay
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get retry statistics.
+
+        Returns:
+            dict: Retries performed (``retries``), retries denied by the budget
+            (``budget_exhausted``), calls that failed after ``max_attempts``
+            (``gave_up``) and the retries currently banked (``budget_available``)
+        """
+        with self._lock:
+            return {
+                "retries": self._retries,
+                "budget_exhausted": self._budget_exhausted,
+                "gave_up": self._gave_up,
+                "budget_available": self.budget.available,
+            }
+
+
+RetrySetting = Union[RetryPolicy, bool, None]
+
+_override: contextvars.ContextVar[RetrySetting] = contextvars.ContextVar(
+    "projectx_retry_override", default=None
+)
+
+
+@contextlib.contextmanager
+def retry_override(policy: Union[RetryPolicy, bool]) -> Iterator[None]:
+    """
+    Override the retry policy of every request made in this context.
+
+    Works for service calls that do not expose a ``retry`` argument, and
+    applies to the current thread or asyncio task only.
+
+    Args:
+        policy: The RetryPolicy to use, or False to disable retries
+
+    Yields:
+        None
+    """
+    token = _override.set(policy)
+    try:
+        yield
+    finally:
+        _override.reset(token)
+
+
+def resolve_policy(
+    default: Optional[RetryPolicy], retry: RetrySetting = None
+) -> Optional[RetryPolicy]:
+    """
+    Pick the retry policy for a single call.
+
+    Args:
+        default: The client's policy
+        retry: The per-call setting: a RetryPolicy, False to disable retries,
+            or None to fall back to any retry_override and then the default
+
+    Returns:
+        RetryPolicy: The policy, or None if retries are disabled
+    """
+    if retry is None:
+        retry = _override.get()
+    if retry is None or retry is True:
+        return default
+    if retry is False:
+        return None
+    return retry
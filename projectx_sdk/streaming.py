@@ -0,0 +1,241 @@
+"""Incremental parsing of large JSON list responses."""
+
+import codecs
+import json
+import re
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+# Default cap on a single buffered array element or envelope field
+DEFAULT_MAX_ITEM_SIZE = 16 * 1024 * 1024
+
+
+class JSONArrayStream:
+    """
+    Push parser that yields the elements of one array in a JSON object.
+
+    Gateway list responses look like ``{"bars": [...], "success": true, ...}``.
+    Fed the body chunk by chunk, the parser decodes each element of the
+    ``key`` array as soon as it is complete and keeps every other top-level
+    field (the response envelope) in ``envelope``. Only the undecoded tail of
+    the body is buffered, so memory stays bounded by the largest element rather
+    than the size of the response.
+
+    Example::
+
+        stream = JSONArrayStream("bars")
+        for chunk in response.iter_content(65536):
+            for bar in stream.feed(chunk):
+                ...
+        stream.close()
+        stream.envelope  # {'success': True, 'errorCode': 0, 'errorMessage': None}
+    """
+
+    def __init__(self, key: str, max_item_size: int = DEFAULT_MAX_ITEM_SIZE):
+        """
+        Initialize a parser.
+
+        Args:
+            key: Name of the top-level array to stream
+            max_item_size: Largest number of characters one element (or envelope
+                field) may occupy before the body is rejected
+        """
+        self.key = key
+        self.max_item_size = max_item_size
+        self.envelope: Dict[str, Any] = {}
+        self.items = 0
+
+        self._decoder = json.JSONDecoder()
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._state = "start"
+        self._first_item = True
+
+    @property
+    def done(self) -> bool:
+        """Check whether the whole document has been parsed."""
+        return self._state == "done"
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """
+        Parse the next chunk of the body.
+
+        Args:
+            chunk: The next bytes of the body
+
+        Returns:
+            list: Array elements completed by this chunk
+
+        Raises:
+            ValueError: If the body is not a JSON object or an element is too large
+        """
+        self._buffer = self._buffer[self._pos :] + self._utf8.decode(chunk)
+        self._pos = 0
+        items: List[Any] = []
+        self._parse(items, final=False)
+
+        if len(self._buffer) - self._pos > self.max_item_size:
+            raise ValueError(f"JSON value larger than {self.max_item_size} characters")
+        return items
+
+    def close(self) -> List[Any]:
+        """
+        Finish parsing once the body is exhausted.
+
+        Returns:
+            list: Array elements completed by the end of the body
+
+        Raises:
+            ValueError: If the body was truncated or is not valid JSON
+        """
+        self._buffer = self._buffer[self._pos :] + self._utf8.decode(b"", final=True)
+        self._pos = 0
+        items: List[Any] = []
+        self._parse(items, final=True)
+
+        if self._state != "done":
+            raise ValueError("Truncated or invalid JSON response")
+        return items
+
+    def _skip(self) -> Optional[str]:
+        """Skip whitespace and return the next character, if buffered."""
+        self._pos = _WHITESPACE.match(self._buffer, self._pos).end()  # type: ignore[union-attr]
+        return self._buffer[self._pos] if self._pos < len(self._buffer) else None
+
+    def _value(self, final: bool) -> Any:
+        """
+        Decode the value at the current position.
+
+        Returns:
+            The value, or the parser itself if more data is needed
+        """
+        try:
+            value, end = self._decoder.raw_decode(self._buffer, self._pos)
+        except json.JSONDecodeError:
+            if final:
+                raise ValueError("Truncated or invalid JSON response")
+            return self
+
+        # A number cut off by the end of the chunk (e.g. '1.' of '1.25') decodes as a
+        # shorter one; only trust a value once the delimiter after it has arrived
+        following = _WHITESPACE.match(self._buffer, end).end()  # type: ignore[union-attr]
+        if not final and (following >= len(self._buffer) or self._buffer[following] not in ",:]}"):
+            return self
+
+        self._pos = end
+        return value
+
+    def _expect(self, char: Optional[str], expected: str):
+        """Raise for an unexpected structural character."""
+        if char != expected:
+            raise ValueError(f"Invalid JSON response: expected {expected!r}, got {char!r}")
+
+    def _parse(self, items: List[Any], final: bool):
+        """Advance through the buffer, appending completed elements to ``items``."""
+        while self._state != "done":
+            char = self._skip()
+            if char is None:
+                return
+
+            if self._state == "start":
+                self._expect(char, "{")
+                self._pos += 1
+                self._state = "open"
+
+            elif self._state == "open":
+                if char == "}":
+                    self._pos += 1
+                    self._state = "done"
+                else:
+                    self._state = "key"
+
+            elif self._state == "key":
+                self._expect(char, '"')
+                # Keys are only consumed with their colon and the opening of their value
+                start = self._pos
+                name = self._value(final)
+                if name is self:
+                    return
+                if self._skip() is None:
+                    self._pos = start
+                    return
+                self._expect(self._buffer[self._pos], ":")
+                self._pos += 1
+                if self._skip() is None:
+                    self._pos = start
+                    return
+
+                if name == self.key and self._buffer[self._pos] == "[":
+                    self._pos += 1
+                    self._state = "items"
+                    continue
+
+                value = self._value(final)
+                if value is self:
+                    self._pos = start
+                    return
+                self.envelope[name] = value
+                self._state = "next"
+
+            elif self._state == "items":
+                if char == "]":
+                    self._pos += 1
+                    self._state = "next"
+                    continue
+                start = self._pos
+                if not self._first_item:
+                    self._expect(char, ",")
+                    self._pos += 1
+                    if self._skip() is None:
+                        self._pos = start
+                        return
+                item = self._value(final)
+                if item is self:
+                    self._pos = start
+                    return
+                self._first_item = False
+                self.items += 1
+                items.append(item)
+
+            elif self._state == "next":
+                if char == ",":
+                    self._pos += 1
+                    self._state = "key"
+                else:
+                    self._expect(char, "}")
+                    self._pos += 1
+                    self._state = "done"
+
+
+def columnar(
+    items: Iterable[Dict[str, Any]], size: int = 10000, fields: Optional[Sequence[str]] = None
+) -> Iterator[Dict[str, List[Any]]]:
+    """
+    Group streamed records into column-oriented chunks.
+
+    Args:
+        items: Records as dicts (e.g. raw bars from ``client.stream``)
+        size: Maximum number of rows per chunk
+        fields: Columns to keep (every key of the first record if not provided)
+
+    Yields:
+        dict: Column name to list of values, at most ``size`` rows long
+    """
+    columns: Optional[Dict[str, List[Any]]] = None
+    rows = 0
+
+    for item in items:
+        if columns is None:
+            columns = {name: [] for name in (fields or list(item))}
+        for name, values in columns.items():
+            values.append(item.get(name))
+        rows += 1
+        if rows == size:
+            yield columns
+            columns = {name: [] for name in columns}
+            rows = 0
+
+    if columns is not None and rows:
+        yield columns
@@ -0,0 +1,322 @@
+"""On-disk token cache shared by the processes of a host."""
+
+import hashlib
+import json
+import logging
+import os
+import stat
+import sys
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+if sys.platform == "win32":
+    import msvcrt
+else:
+    import fcntl
+
+logger = logging.getLogger(__name__)
+
+
+def default_cache_path() -> str:
+    """
+    Get the default location of the token cache.
+
+    Returns:
+        str: ``$XDG_CACHE_HOME/projectx/tokens.json``, or
+        ``~/.cache/projectx/tokens.json`` if XDG_CACHE_HOME is not set
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "projectx", "tokens.json")
+
+
+def _lock_file(fd: int):
+    """Block until this process holds the exclusive lock on an open file."""
+    if sys.platform == "win32":
+        msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+    else:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+
+
+def _unlock_file(fd: int):
+    """Release the lock taken by _lock_file."""
+    if sys.platform == "win32":
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+    else:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+class _LockFile:
+    """Reentrant hold on a lock file, by one thread of this process at a time."""
+
+    def __init__(self, path: str):
+        """Track a lock file that is not held yet."""
+        self.path = path
+        self.thread_lock = threading.RLock()
+        self.fd: Optional[int] = None
+        self.depth = 0
+
+
+class TokenCache:
+    """
+    Session tokens persisted to disk, keyed by base URL and username.
+
+    Every process that logs in with the same credentials can reuse a token
+    another process obtained, so workers started together log in once instead
+    of once each. The cache is a JSON file readable only by its owner (mode
+    0600, in a 0700 directory), rewritten atomically and guarded by an
+    exclusive lock on a sibling ``.lock`` file. Expiries are stored as wall
+    clock times, as they must be meaningful to other processes.
+
+    Logins hold a lock of their own per base URL and username (a ``.lock``
+    file next to the cache, named after a digest of the two), so that users
+    logging in at the same time never wait for each other.
+
+    The default directory is the SDK's own and is tightened to 0700 if it
+    already exists with a wider mode. The directory of a path you pass is
+    created 0700 if missing but otherwise left as it is.
+
+    Pass it to a client; the authenticator uses a cached token instead of
+    logging in and stores every token it obtains::
+
+        cache = TokenCache()  # ~/.cache/projectx/tokens.json
+        client = ProjectXClient(username="...", api_key="...", token_cache=cache)
+
+    The cache is an optimization: if the file cannot be read or written, a
+    warning is logged and the authenticator logs in as it would without it.
+    """
+
+    def __init__(self, path: Optional[str] = None, min_ttl: float = 300.0):
+        """
+        Initialize a token cache.
+
+        Args:
+            path: Cache file (default_cache_path() if not provided)
+            min_ttl: Cached tokens expiring within this many seconds are not used
+
+        Raises:
+            ValueError: If min_ttl is negative
+        """
+        if min_ttl < 0:
+            raise ValueError("min_ttl must not be negative")
+
+        self.path = path or default_cache_path()
+        self._owns_directory = path is None
+        self.lock_path = self.path + ".lock"
+        self.min_ttl = min_ttl
+
+        # Guards the cache file; each lock serializes threads, its file processes
+        self._file_lock = _LockFile(self.lock_path)
+        self._thread_lock = self._file_lock.thread_lock
+        self._user_locks: Dict[Tuple[str, str], _LockFile] = {}
+        self._user_locks_lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._writes = 0
+        self._errors = 0
+
+    @contextmanager
+    def lock(
+        self, base_url: Optional[str] = None, username: Optional[str] = None
+    ) -> Iterator[None]:
+        """
+        Hold the cache, or one user's entry, exclusively across threads and processes.
+
+        Reentrant within a thread. Without arguments the whole file is held,
+        and get and set may be called while it is. With a base URL and
+        username only that user is held: the authenticator holds it around its
+        login, so that processes starting together wait for the first login of
+        a user and reuse its token, while other users log in meanwhile.
+
+        Args:
+            base_url: The API base URL of the user to hold
+            username: The user to hold
+        """
+        if base_url is None or username is None:
+            lock = self._file_lock
+        else:
+            key = (base_url, username)
+            with self._user_locks_lock:
+                if key not in self._user_locks:
+                    digest = hashlib.sha256(f"{base_url}\n{username}".encode("utf-8")).hexdigest()
+                    self._user_locks[key] = _LockFile(f"{self.path}.{digest[:16]}.lock")
+                lock = self._user_locks[key]
+
+        with lock.thread_lock:
+            if lock.depth == 0:
+                try:
+                    self._make_directory()
+                    fd = os.open(lock.path, os.O_RDWR | os.O_CREAT, 0o600)
+                except OSError as e:
+                    self._record_error("lock", e)
+                else:
+                    try:
+                        _lock_file(fd)
+                        lock.fd = fd
+                    except OSError as e:
+                        os.close(fd)
+                        self._record_error("lock", e)
+            lock.depth += 1
+            try:
+                yield
+            finally:
+                lock.depth -= 1
+                if lock.depth == 0 and lock.fd is not None:
+                    fd, lock.fd = lock.fd, None
+                    try:
+                        _unlock_file(fd)
+                    finally:
+                        os.close(fd)
+
+    def get(self, base_url: str, username: str) -> Optional[Tuple[str, float]]:
+        """
+        Get a cached token.
+
+        Args:
+            base_url: The API base URL the token was issued by
+            username: The user the token was issued to
+
+        Returns:
+            tuple: The token and the seconds until it expires, or None if no
+            token is cached or it expires within ``min_ttl`` seconds
+        """
+        with self.lock():
+            entry = self._users(self._read(), base_url).get(username)
+            token, expires_in = None, 0.0
+            if isinstance(entry, dict) and isinstance(entry.get("token"), str):
+                token = entry["token"]
+                try:
+                    expires_in = float(entry["expires"]) - time.time()
+                except (KeyError, TypeError, ValueError):
+                    token = None
+
+            if token is None or expires_in <= self.min_ttl:
+                self._misses += 1
+                return None
+            self._hits += 1
+            return token, expires_in
+
+    def set(self, base_url: str, username: str, token: str, expires_in: float):
+        """
+        Store a token, replacing any cached for the same user.
+
+        Args:
+            base_url: The API base URL the token was issued by
+            username: The user the token was issued to
+            token: The token
+            expires_in: Seconds until the token expires
+        """
+        with self.lock():
+            entries = self._read()
+            users = entries[base_url] = self._users(entries, base_url)
+            users[username] = {
+                "token": token,
+                "expires": time.time() + expires_in,
+            }
+            self._write(entries)
+
+    def delete(self, base_url: str, username: str, token: Optional[str] = None):
+        """
+        Remove a cached token.
+
+        Args:
+            base_url: The API base URL the token was issued by
+            username: The user the token was issued to
+            token: Only remove the entry if it holds this token, so that a
+                token another process has cached since is kept
+        """
+        with self.lock():
+            entries = self._read()
+            users = self._users(entries, base_url)
+            entry = users.get(username)
+            if entry is None or (
+                token is not None and (not isinstance(entry, dict) or entry.get("token") != token)
+            ):
+                return
+            del users[username]
+            if not users:
+                del entries[base_url]
+            self._write(entries)
+
+    def clear(self):
+        """Remove every cached token."""
+        with self.lock():
+            self._write({})
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get token cache statistics.
+
+        Returns:
+            dict: Lookups that found a usable token (``hits``) and that did not
+            (``misses``), rewrites of the cache file (``writes``) and failed
+            file operations (``errors``) by this process
+        """
+        with self._thread_lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "writes": self._writes,
+                "errors": self._errors,
+            }
+
+    def _read(self) -> Dict[str, Any]:
+        """Read all entries, treating a missing or corrupt file as empty."""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            self._record_error("read", e)
+            return {}
+        if not isinstance(entries, dict):
+            self._record_error("read", ValueError("malformed cache file"))
+            return {}
+        return entries
+
+    def _users(self, entries: Dict[str, Any], base_url: str) -> Dict[str, Any]:
+        """Get the entries of a base URL, treating a malformed value as empty."""
+        users = entries.get(base_url)
+        if users is None:
+            return {}
+        if not isinstance(users, dict):
+            self._record_error("read", ValueError(f"malformed entry for {base_url}"))
+            return {}
+        return users
+
+    def _make_directory(self) -> str:
+        """Create the cache directory if missing, tightening the SDK's own to owner-only."""
+        directory = os.path.dirname(self.path) or "."
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        if self._owns_directory and stat.S_IMODE(os.stat(directory).st_mode) != 0o700:
+            os.chmod(directory, 0o700)
+        return directory
+
+    def _write(self, entries: Dict[str, Any]):
+        """Replace the file with the given entries, atomically and owner-only."""
+        try:
+            directory = self._make_directory()
+            # mkstemp creates the file with mode 0600
+            fd, tmp_path = tempfile.mkstemp(prefix=".tokens-", dir=directory)
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(entries, f)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            self._record_error("write", e)
+            return
+        self._writes += 1
+
+    def _record_error(self, operation: str, error: Exception):
+        """Count and log a failed file operation."""
+        with self._thread_lock:
+            self._errors += 1
+        logger.warning(f"Token cache {operation} failed for {self.path}: {error}")
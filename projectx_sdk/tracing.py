@@ -0,0 +1,534 @@
+"""Tracing spans for REST calls, authentication and real-time hub traffic."""
+
+import contextvars
+import fnmatch
+import json
+import logging
+import random
+import re
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Any, Deque, Dict, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Root spans fired for every market tick are sampled sparingly by default
+DEFAULT_SAMPLE_RATES = {
+    "GatewayQuote": 0.01,
+    "GatewayTrade": 0.01,
+    "GatewayDepth": 0.01,
+}
+
+# Spans kept by the exporter a tracer gets when none is given
+DEFAULT_MAX_SPANS = 1000
+
+# W3C traceparent, used as the order's custom_tag to carry the trace
+_TRACEPARENT = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-0[01]$")
+
+# (trace_id, span_id) of a span, enough to parent another span on it
+SpanContext = Tuple[str, str]
+
+_current_span: contextvars.ContextVar[Optional["Span"]] = contextvars.ContextVar(
+    "projectx_current_span", default=None
+)
+
+
+def current_span() -> Optional["Span"]:
+    """
+    Get the span active in the current thread or task.
+
+    Returns:
+        Span: The innermost active span, or None
+    """
+    return _current_span.get()
+
+
+def parse_traceparent(value: Any) -> Optional[SpanContext]:
+    """
+    Parse a W3C traceparent string, such as an order's custom tag.
+
+    Args:
+        value: The string to parse
+
+    Returns:
+        tuple: ``(trace_id, span_id)``, or None if the value is not a traceparent
+    """
+    if not isinstance(value, str):
+        return None
+    match = _TRACEPARENT.match(value)
+    return (match.group(1), match.group(2)) if match else None
+
+
+class Span:
+    """
+    A timed operation within a trace.
+
+    Spans are created with Tracer.start_span and become the current span of
+    the thread or task until they end, so spans started meanwhile (e.g. the
+    HTTP call made by ``orders.place`` inside a quote callback) are recorded
+    as their children. Use them as context managers::
+
+        with tracer.start_span("strategy.rebalance", {"account": 7}) as span:
+            client.orders.place(...)
+            span.set_attribute("orders", 1)
+
+    Spans that were not sampled still propagate the sampling decision to
+    their children but record nothing.
+    """
+
+    __slots__ = (
+        "_tracer",
+        "_token",
+        "_started",
+        "name",
+        "trace_id",
+        "span_id",
+        "parent_id",
+        "sampled",
+        "attributes",
+        "start_time",
+        "duration",
+        "error",
+        "ended",
+    )
+
+    def __init__(
+        self,
+        tracer: Optional["Tracer"],
+        name: str,
+        trace_id: str,
+        span_id: str,
+        parent_id: Optional[str],
+        sampled: bool,
+        attributes: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        Start a span and make it the current span.
+
+        Args:
+            tracer: Tracer exporting the span when it ends (None for a no-op span)
+            name: Operation name
+            trace_id: 32 hex digit trace ID
+            span_id: 16 hex digit span ID
+            parent_id: Span ID of the parent span, if any
+            sampled: Whether the span is recorded and exported
+            attributes: Initial attributes
+        """
+        self._tracer = tracer
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = span_id
+        self.parent_id = parent_id
+        self.sampled = sampled
+        self.attributes: Dict[str, Any] = dict(attributes) if sampled and attributes else {}
+        self.start_time = time.time() if sampled else 0.0
+        self.duration = 0.0
+        self.error: Optional[BaseException] = None
+        self.ended = False
+        self._started = time.perf_counter() if sampled else 0.0
+        self._token: Optional[contextvars.Token] = (
+            _current_span.set(self) if tracer is not None else None
+        )
+
+    @property
+    def context(self) -> SpanContext:
+        """Get the ``(trace_id, span_id)`` pair identifying the span."""
+        return self.trace_id, self.span_id
+
+    @property
+    def traceparent(self) -> str:
+        """Get the span as a W3C traceparent string."""
+        return f"00-{self.trace_id}-{self.span_id}-{'01' if self.sampled else '00'}"
+
+    def set_attribute(self, key: str, value: Any):
+        """
+        Set an attribute of the span.
+
+        Args:
+            key: Attribute name
+            value: JSON-serializable value
+        """
+        if self.sampled:
+            self.attributes[key] = value
+
+    def correlation_tag(self) -> Optional[str]:
+        """
+        Get a custom tag correlating an order with this span.
+
+        Order events whose ``customTag`` is such a tag are traced as children
+        of the span. Tags are unique per span, as the gateway requires per account.
+
+        Returns:
+            str: The span's traceparent, or None if the span is not sampled
+        """
+        return self.traceparent if self.sampled else None
+
+    def correlate(self, custom_tag: Optional[str] = None, order_id: Optional[Any] = None):
+        """
+        Remember the span as the origin of an order.
+
+        Hub events carrying the order's tag or ID are then traced as children
+        of the span, even when the tag is not a traceparent.
+
+        Args:
+            custom_tag: The order's custom tag
+            order_id: The order's ID
+        """
+        if self.sampled and self._tracer is not None:
+            self._tracer.correlate(self.context, custom_tag=custom_tag, order_id=order_id)
+
+    def record_request(self, event: Any):
+        """
+        Copy the details of a REST request attempt into the span.
+
+        Args:
+            event: The attempt's RequestEvent
+        """
+        if self.sampled:
+            self.attributes.update(
+                {
+                    "http.method": event.method,
+                    "http.status_code": event.status_code,
+                    "http.request_size": event.request_size,
+                    "http.response_size": event.response_size,
+                }
+            )
+
+    def end(self, error: Optional[BaseException] = None):
+        """
+        End the span and export it if it was sampled.
+
+        Args:
+            error: The exception the operation failed with, if any
+        """
+        if self.ended:
+            return
+        self.ended = True
+
+        if self._token is not None:
+            try:
+                _current_span.reset(self._token)
+            except ValueError:
+                # Ended in another context than it was started in
+                pass
+            self._token = None
+
+        if self.sampled and self._tracer is not None:
+            self.duration = time.perf_counter() - self._started
+            self.error = error
+            self._tracer._export(self)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Get the span as a dict, e.g. for exporting as JSON.
+
+        Returns:
+            dict: Every field of the span, with the error as its string form
+        """
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start_time": self.start_time,
+            "duration": self.duration,
+            "status": "error" if self.error is not None else "ok",
+            "error": repr(self.error) if self.error is not None else None,
+            "attributes": self.attributes,
+        }
+
+    def __enter__(self) -> "Span":
+        """Return the span."""
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        """End the span, recording the exception that left the block, if any."""
+        self.end(exc)
+
+    def __repr__(self) -> str:
+        """Return a short description of the span."""
+        return f"Span({self.name}, trace={self.trace_id}, span={self.span_id})"
+
+
+_UNSAMPLED_TRACE = "0" * 32
+_UNSAMPLED_SPAN = "0" * 16
+
+# Span handed out when tracing is disabled; never current, never exported
+NOOP_SPAN = Span(None, "", _UNSAMPLED_TRACE, _UNSAMPLED_SPAN, None, sampled=False)
+
+
+class SpanExporter:
+    """
+    Destination of ended spans.
+
+    Subclass it to send spans elsewhere, e.g. to an OpenTelemetry collector.
+    ``export`` runs on the thread that ended the span, so it should be quick.
+    """
+
+    def export(self, spans: Sequence[Span]):
+        """
+        Export ended, sampled spans.
+
+        Args:
+            spans: The spans to export
+        """
+        raise NotImplementedError
+
+    def flush(self):
+        """Write out any buffered spans."""
+
+    def shutdown(self):
+        """Flush and release the exporter's resources."""
+        self.flush()
+
+
+class InMemorySpanExporter(SpanExporter):
+    """Exporter keeping spans in memory, e.g. for tests."""
+
+    def __init__(self, max_spans: Optional[int] = None):
+        """
+        Start with no spans.
+
+        Args:
+            max_spans: Number of most recent spans kept (all of them if not
+                provided, which only suits short-lived processes such as tests)
+        """
+        self._lock = threading.Lock()
+        self.spans: Deque[Span] = deque(maxlen=max_spans)
+
+    def export(self, spans: Sequence[Span]):
+        """Append the spans to ``spans``."""
+        with self._lock:
+            self.spans.extend(spans)
+
+    def clear(self):
+        """Forget the exported spans."""
+        with self._lock:
+            self.spans.clear()
+
+
+class FileSpanExporter(SpanExporter):
+    """
+    Exporter appending spans to a local file, one JSON object per line.
+
+    Works offline; the file can later be loaded into any trace viewer or
+    simply searched for a trace ID.
+    """
+
+    def __init__(self, path: str):
+        """
+        Open the file for appending.
+
+        Args:
+            path: Path of the JSON lines file
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = open(path, "a", encoding="utf-8")
+
+    def export(self, spans: Sequence[Span]):
+        """Append the spans to the file."""
+        lines = "".join(json.dumps(span.as_dict(), default=str) + "\n" for span in spans)
+        with self._lock:
+            if not self._file.closed:
+                self._file.write(lines)
+
+    def flush(self):
+        """Flush written spans to disk."""
+        with self._lock:
+            if not self._file.closed:
+                self._file.flush()
+
+    def shutdown(self):
+        """Flush and close the file."""
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+
+class Tracer:
+    """
+    Creates, samples and exports spans.
+
+    The SDK traces REST request attempts, token validation, hub method
+    invocations and hub events (with the callbacks they run). Orders placed
+    while a sampled span is active get the span's traceparent as their
+    ``custom_tag`` (unless given one), so the ``GatewayUserOrder`` events of
+    the order and the ``GatewayUserTrade`` events of its fills join the trace
+    that placed it.
+
+    Sampling is decided once per trace, at its root span: ``sample_rates``
+    maps root span names (glob patterns) to the fraction of traces recorded,
+    and ``sample_rate`` applies to every other root. Unsampled spans cost a
+    context variable update and record nothing.
+
+    Example::
+
+        tracer = Tracer(FileSpanExporter("traces.jsonl"))
+        client = ProjectXClient(username="...", api_key="...", tracer=tracer)
+    """
+
+    def __init__(
+        self,
+        exporter: Optional[SpanExporter] = None,
+        sample_rate: float = 1.0,
+        sample_rates: Optional[Dict[str, float]] = None,
+        tag_orders: bool = True,
+        max_correlations: int = 10000,
+    ):
+        """
+        Initialize a tracer.
+
+        Args:
+            exporter: Where ended spans go (the last DEFAULT_MAX_SPANS are kept
+                in memory if not provided)
+            sample_rate: Fraction (0-1) of traces recorded
+            sample_rates: Per-root-span-name overrides of ``sample_rate``.
+                DEFAULT_SAMPLE_RATES (1% of market ticks) if not provided.
+            tag_orders: Set the ``custom_tag`` of untagged orders placed within
+                a sampled span to the span's traceparent
+            max_correlations: Number of orders whose origin span is remembered
+                for correlating hub events
+        """
+        if exporter is None:
+            exporter = InMemorySpanExporter(max_spans=DEFAULT_MAX_SPANS)
+        self.exporter = exporter
+        self.sample_rate = sample_rate
+        self.sample_rates = dict(DEFAULT_SAMPLE_RATES if sample_rates is None else sample_rates)
+        self.tag_orders = tag_orders
+        self.max_correlations = max_correlations
+
+        self._lock = threading.Lock()
+        self._correlations: "OrderedDict[str, SpanContext]" = OrderedDict()
+        self._random = random.Random()
+
+    def _rate(self, name: str) -> float:
+        rate = self.sample_rates.get(name)
+        if rate is not None:
+            return rate
+        for pattern, pattern_rate in self.sample_rates.items():
+            if fnmatch.fnmatchcase(name, pattern):
+                return pattern_rate
+        return self.sample_rate
+
+    def start_span(
+        self,
+        name: str,
+        attributes: Optional[Dict[str, Any]] = None,
+        parent: Optional[SpanContext] = None,
+    ) -> Span:
+        """
+        Start a span and make it the current span.
+
+        Args:
+            name: Operation name
+            attributes: Initial attributes
+            parent: Context of the parent span; the current span if not provided
+
+        Returns:
+            Span: The started span (end it, or use it as a context manager)
+        """
+        current = _current_span.get()
+
+        if parent is not None:
+            trace_id, parent_id = parent
+            sampled = True
+        elif current is not None:
+            trace_id, parent_id, sampled = current.trace_id, current.span_id, current.sampled
+        else:
+            rate = self._rate(name)
+            sampled = rate >= 1.0 or (rate > 0.0 and self._random.random() < rate)
+            trace_id = f"{self._random.getrandbits(128):032x}" if sampled else _UNSAMPLED_TRACE
+            parent_id = None
+
+        # Unsampled spans are never seen, so they skip generating IDs
+        span_id = f"{self._random.getrandbits(64):016x}" if sampled else _UNSAMPLED_SPAN
+        return Span(self, name, trace_id, span_id, parent_id, sampled, attributes)
+
+    def correlate(
+        self,
+        context: SpanContext,
+        custom_tag: Optional[str] = None,
+        order_id: Optional[Any] = None,
+    ):
+        """
+        Remember the span an order originated from.
+
+        Args:
+            context: The span's ``(trace_id, span_id)``
+            custom_tag: The order's custom tag
+            order_id: The order's ID
+        """
+        keys = []
+        if custom_tag is not None:
+            keys.append(f"tag:{custom_tag}")
+        if order_id is not None:
+            keys.append(f"order:{order_id}")
+
+        with self._lock:
+            for key in keys:
+                self._correlations[key] = context
+                self._correlations.move_to_end(key)
+            while len(self._correlations) > self.max_correlations:
+                self._correlations.popitem(last=False)
+
+    def origin(
+        self, custom_tag: Optional[Any] = None, order_id: Optional[Any] = None
+    ) -> Optional[SpanContext]:
+        """
+        Find the span an order originated from.
+
+        Args:
+            custom_tag: The order's custom tag (a traceparent is used directly)
+            order_id: The order's ID
+
+        Returns:
+            tuple: The span's ``(trace_id, span_id)``, or None if unknown
+        """
+        context = parse_traceparent(custom_tag)
+        if context is not None:
+            return context
+        with self._lock:
+            if custom_tag is not None:
+                context = self._correlations.get(f"tag:{custom_tag}")
+            if context is None and order_id is not None:
+                context = self._correlations.get(f"order:{order_id}")
+        return context
+
+    def _export(self, span: Span):
+        try:
+            self.exporter.export((span,))
+        except Exception as e:
+            logger.error(f"Error exporting span {span.name}: {e}")
+
+    def flush(self):
+        """Flush the exporter."""
+        self.exporter.flush()
+
+    def shutdown(self):
+        """Flush and shut down the exporter."""
+        self.exporter.shutdown()
+
+
+def trace(
+    tracer: Optional[Tracer],
+    name: str,
+    attributes: Optional[Dict[str, Any]] = None,
+    parent: Optional[SpanContext] = None,
+) -> Span:
+    """
+    Start a span if tracing is enabled.
+
+    Args:
+        tracer: The tracer, or None if tracing is disabled
+        name: Operation name
+        attributes: Initial attributes
+        parent: Context of the parent span; the current span if not provided
+
+    Returns:
+        Span: The started span, or NOOP_SPAN when ``tracer`` is None
+    """
+    if tracer is None:
+        return NOOP_SPAN
+    return tracer.start_span(name, attributes, parent)
@@ -0,0 +1,21 @@
+"""HTTP transport and connection pooling for the ProjectX SDK."""
+
+from projectx_sdk.transport.async_pool import AsyncSessionPool
+from projectx_sdk.transport.base import AsyncTransport, Transport, TransportResponse
+from projectx_sdk.transport.fake import AsyncFakeTransport, FakeRequest, FakeTransport
+from projectx_sdk.transport.http2 import HTTP2Pool
+from projectx_sdk.transport.pool import SessionPool
+from projectx_sdk.transport.replay import RecordReplayTransport
+
+__all__ = [
+    "Transport",
+    "AsyncTransport",
+    "TransportResponse",
+    "SessionPool",
+    "AsyncSessionPool",
+    "HTTP2Pool",
+    "FakeTransport",
+    "AsyncFakeTransport",
+    "FakeRequest",
+    "RecordReplayTransport",
+]
@@ -0,0 +1,251 @@
+"""Pooled, keep-alive async HTTP sessions for the ProjectX Gateway API."""
+
+import asyncio
+import threading
+import time
+from typing import Any, AsyncIterator, Dict, Optional
+
+import requests
+
+from projectx_sdk.transport.base import AsyncTransport
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - exercised only without the async extra
+    httpx = None  # type: ignore[assignment]
+
+
+class _StreamedResponse:
+    """Streamed httpx response that raises network failures as requests exceptions."""
+
+    def __init__(self, response: Any):
+        """Wrap an unread httpx response."""
+        self._response = response
+        self.status_code = response.status_code
+        self.headers = response.headers
+        self.url = str(response.url)
+
+    @property
+    def content(self) -> bytes:
+        """Get the body; only available after aread()."""
+        content: bytes = self._response.content
+        return content
+
+    @property
+    def text(self) -> str:
+        """Get the body as text; only available after aread()."""
+        text: str = self._response.text
+        return text
+
+    async def aread(self) -> bytes:
+        """Read the whole body."""
+        try:
+            content: bytes = await self._response.aread()
+        except httpx.HTTPError as e:
+            raise requests.ConnectionError(str(e)) from e
+        return content
+
+    async def aiter_bytes(self, chunk_size: Optional[int] = None) -> AsyncIterator[bytes]:
+        """Iterate over the body as it arrives."""
+        try:
+            async for chunk in self._response.aiter_bytes(chunk_size):
+                yield chunk
+        except httpx.TimeoutException as e:
+            raise requests.Timeout(str(e)) from e
+        except httpx.HTTPError as e:
+            raise requests.ConnectionError(str(e)) from e
+
+    async def aclose(self):
+        """Release the connection."""
+        await self._response.aclose()
+
+
+class _PhaseTrace:
+    """httpcore trace callback recording when a request connected and got its headers."""
+
+    def __init__(self):
+        """Start timing a request."""
+        self.start = time.perf_counter()
+        self.connect = 0.0
+        self.headers_at: Optional[float] = None
+        self._started: Dict[str, float] = {}
+
+    async def __call__(self, name: str, info: Dict[str, Any]):
+        """Record a trace event such as 'connection.connect_tcp.started'."""
+        self.record(name, info)
+
+    def record(self, name: str, info: Dict[str, Any]):
+        """Record a trace event; the callback for synchronous httpx clients."""
+        now = time.perf_counter()
+        step, _, stage = name.rpartition(".")
+        if stage == "started":
+            self._started[step] = now
+        elif stage == "complete":
+            if step.startswith("connection.") and step in self._started:
+                # connect_tcp and start_tls
+                self.connect += now - self._started[step]
+            elif step.endswith(".receive_response_headers"):
+                self.headers_at = now
+
+    def timings(self, end: float) -> Dict[str, float]:
+        """Split the round trip ending at ``end`` into connect, ttfb and body."""
+        headers_at = self.headers_at if self.headers_at is not None else end
+        return {
+            "connect": self.connect,
+            "ttfb": max(headers_at - self.start - self.connect, 0.0),
+            "body": end - headers_at,
+        }
+
+
+class AsyncSessionPool(AsyncTransport):
+    """
+    Shared pool of keep-alive HTTP connections for asyncio code.
+
+    This is the asyncio counterpart of SessionPool and the default transport of
+    AsyncProjectXClient. It is backed by
+    ``httpx.AsyncClient``, which must be installed separately
+    (``pip install projectx-sdk[async]``).
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        idle_timeout: Optional[float] = 60.0,
+        http2: bool = False,
+    ):
+        """
+        Initialize an async session pool.
+
+        Args:
+            max_connections: Maximum number of concurrent connections
+            max_keepalive_connections: Maximum number of idle connections kept open
+            idle_timeout: Seconds after which an idle connection is closed
+                (None to never evict)
+            http2: Whether to negotiate HTTP/2 (requires the ``h2`` package)
+
+        Raises:
+            ImportError: If httpx is not installed
+        """
+        if httpx is None:
+            raise ImportError(
+                "AsyncSessionPool requires httpx. Install it with: pip install projectx-sdk[async]"
+            )
+
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.idle_timeout = idle_timeout
+        self.http2 = http2
+
+        self._lock = threading.Lock()
+        self._requests = 0
+
+        self.session = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=idle_timeout,
+            ),
+            http2=http2,
+        )
+
+    async def request(self, method: str, url: str, **kwargs) -> Any:
+        """
+        Send a request over a pooled connection.
+
+        Args:
+            method: HTTP method ('GET', 'POST', etc.)
+            url: Absolute URL
+            **kwargs: Arguments accepted by httpx.AsyncClient.request, plus
+                ``stream=True`` to return before the body is read
+
+        Returns:
+            httpx.Response: The HTTP response, with a ``timings`` dict like
+            SessionPool responses. Streamed responses expose ``aiter_bytes()``
+            and must be closed with ``aclose()``.
+
+        Raises:
+            requests.RequestException: If the request could not be completed
+        """
+        with self._lock:
+            self._requests += 1
+
+        # httpx takes pre-encoded bodies as ``content``; ``data`` is for form fields
+        if isinstance(kwargs.get("data"), (bytes, str)):
+            kwargs["content"] = kwargs.pop("data")
+
+        stream = kwargs.pop("stream", False)
+
+        # Surface network failures the same way as the synchronous transports
+        trace = _PhaseTrace()
+        kwargs["extensions"] = {**kwargs.get("extensions", {}), "trace": trace}
+
+        try:
+            if stream:
+                request = self.session.build_request(method, url, **kwargs)
+                return _StreamedResponse(await self.session.send(request, stream=True))
+            response = await self.session.request(method, url, **kwargs)
+            response.timings = trace.timings(time.perf_counter())  # type: ignore[attr-defined]
+            return response
+        except httpx.TimeoutException as e:
+            raise requests.Timeout(str(e)) from e
+        except httpx.HTTPError as e:
+            raise requests.ConnectionError(str(e)) from e
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get connection pool statistics.
+
+        Returns:
+            dict: The number of requests sent (``requests``) and the number of
+            currently open connections (``open_connections``)
+        """
+        # httpx does not expose pool statistics publicly; read them defensively
+        transport_pool = getattr(getattr(self.session, "_transport", None), "_pool", None)
+        connections = getattr(transport_pool, "connections", None)
+
+        with self._lock:
+            return {
+                "requests": self._requests,
+                "open_connections": len(connections) if connections is not None else None,
+            }
+
+    async def warm_up(self, url: str, connections: int = 1, timeout: Optional[float] = None) -> int:
+        """
+        Open keep-alive connections to a host before the first request needs them.
+
+        httpx cannot open a connection without a request, so this sends
+        ``connections`` concurrent HEAD requests to the host's root; each makes
+        the pool open (or reuse) one connection and keep it afterwards.
+
+        Args:
+            url: Any URL on the host
+            connections: Number of connections to have open (one when
+                negotiating HTTP/2, which multiplexes requests)
+            timeout: Connect timeout in seconds
+
+        Returns:
+            int: The number of connections opened
+
+        Raises:
+            requests.ConnectionError: If no connection could be opened
+        """
+        root = httpx.URL(url).copy_with(path="/", query=None, fragment=None)
+        before: Optional[int] = self.stats()["open_connections"]
+
+        results = await asyncio.gather(
+            *(self.session.head(root, timeout=timeout) for _ in range(max(connections, 1))),
+            return_exceptions=True,
+        )
+        errors = [result for result in results if isinstance(result, BaseException)]
+        if len(errors) == len(results):
+            raise requests.ConnectionError(f"Could not connect to {root}: {errors[0]}")
+
+        after: Optional[int] = self.stats()["open_connections"]
+        if before is None or after is None:
+            return len(results) - len(errors)
+        return max(after - before, 0)
+
+    async def close(self):
+        """Close all pooled connections."""
+        await self.session.aclose()
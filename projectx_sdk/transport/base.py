@@ -0,0 +1,239 @@
+"""Transport interfaces used by the ProjectX clients to send HTTP requests."""
+
+import json
+from abc import ABC, abstractmethod
+from typing import Any, AsyncIterator, Dict, Iterator, Mapping, Optional
+
+import requests
+
+
+class Transport(ABC):
+    """
+    Interface for sending HTTP requests on behalf of a ProjectXClient.
+
+    A transport receives fully built requests (absolute URL, headers, body) and
+    returns a response object exposing ``status_code``, ``headers``, ``content``,
+    ``text``, ``json()`` and ``raise_for_status()`` like ``requests.Response``.
+    Network-level failures must be raised as ``requests.RequestException``.
+    Responses may carry a ``timings`` dict with the ``connect``, ``ttfb`` and
+    ``body`` seconds of the round trip, which request hooks report.
+    """
+
+    @abstractmethod
+    def request(self, method: str, url: str, **kwargs) -> Any:
+        """
+        Send an HTTP request.
+
+        Args:
+            method: HTTP method ('GET', 'POST', etc.)
+            url: Absolute URL
+            **kwargs: Request options (``params``, ``data``, ``json``, ``headers``,
+                ``timeout`` and ``stream``)
+
+        Returns:
+            The HTTP response. With ``stream=True`` the body is read through
+            ``iter_content()`` and the response must be closed with ``close()``.
+        """
+        pass
+
+    def post(self, url: str, **kwargs) -> Any:
+        """Send a POST request."""
+        return self.request("POST", url, **kwargs)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get transport statistics.
+
+        Returns:
+            dict: Implementation-specific counters (empty by default)
+        """
+        return {}
+
+    def warm_up(self, url: str, connections: int = 1, timeout: Optional[float] = None) -> int:
+        """
+        Open connections to a host before the first request needs them.
+
+        Args:
+            url: Any URL on the host
+            connections: Number of connections to have open
+            timeout: Connect timeout in seconds
+
+        Returns:
+            int: The number of connections opened (0 for transports without
+            connections)
+        """
+        return 0
+
+    def close(self):
+        """Release any resources held by the transport."""
+        pass
+
+
+class AsyncTransport(ABC):
+    """
+    Interface for sending HTTP requests on behalf of an AsyncProjectXClient.
+
+    The asyncio counterpart of Transport; ``request`` is a coroutine and
+    network-level failures must be raised as ``requests.RequestException``.
+    """
+
+    @abstractmethod
+    async def request(self, method: str, url: str, **kwargs) -> Any:
+        """
+        Send an HTTP request.
+
+        Args:
+            method: HTTP method ('GET', 'POST', etc.)
+            url: Absolute URL
+            **kwargs: Request options (``params``, ``data``, ``json``, ``headers``,
+                ``timeout`` and ``stream``)
+
+        Returns:
+            The HTTP response. With ``stream=True`` the body is read through
+            ``aiter_bytes()`` and the response must be closed with ``aclose()``.
+        """
+        pass
+
+    async def post(self, url: str, **kwargs) -> Any:
+        """Send a POST request."""
+        return await self.request("POST", url, **kwargs)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get transport statistics.
+
+        Returns:
+            dict: Implementation-specific counters (empty by default)
+        """
+        return {}
+
+    async def warm_up(self, url: str, connections: int = 1, timeout: Optional[float] = None) -> int:
+        """
+        Open connections to a host before the first request needs them.
+
+        Args:
+            url: Any URL on the host
+            connections: Number of connections to have open
+            timeout: Connect timeout in seconds
+
+        Returns:
+            int: The number of connections opened (0 for transports without
+            connections)
+        """
+        return 0
+
+    async def close(self):
+        """Release any resources held by the transport."""
+        pass
+
+
+class TransportResponse:
+    """In-memory HTTP response, as returned by the non-network transports and HTTP2Pool."""
+
+    def __init__(
+        self,
+        status_code: int = 200,
+        content: bytes = b"",
+        headers: Optional[Mapping[str, str]] = None,
+        url: str = "",
+    ):
+        """
+        Initialize a response.
+
+        Args:
+            status_code: HTTP status code
+            content: Raw response body
+            headers: Response headers
+            url: The URL the response was produced for
+        """
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+        self.url = url
+
+    @classmethod
+    def from_json(cls, payload: Any, status_code: int = 200, url: str = "") -> "TransportResponse":
+        """
+        Build a JSON response from a Python object.
+
+        Args:
+            payload: JSON-serializable response body
+            status_code: HTTP status code
+            url: The URL the response was produced for
+
+        Returns:
+            TransportResponse: The response
+        """
+        return cls(
+            status_code=status_code,
+            content=json.dumps(payload).encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+            url=url,
+        )
+
+    @property
+    def text(self) -> str:
+        """Get the response body decoded as UTF-8."""
+        return self.content.decode("utf-8", errors="replace")
+
+    @property
+    def ok(self) -> bool:
+        """Check whether the status code is below 400."""
+        return self.status_code < 400
+
+    def json(self) -> Any:
+        """
+        Parse the response body as JSON.
+
+        Raises:
+            ValueError: If the body is not valid JSON
+        """
+        return json.loads(self.content)
+
+    def iter_content(self, chunk_size: int = 1) -> Iterator[bytes]:
+        """
+        Iterate over the body in chunks, like a streamed ``requests.Response``.
+
+        Args:
+            chunk_size: Bytes per chunk
+
+        Yields:
+            bytes: The next chunk of the body
+        """
+        for start in range(0, len(self.content), chunk_size):
+            yield self.content[start : start + chunk_size]
+
+    async def aiter_bytes(self, chunk_size: Optional[int] = None) -> AsyncIterator[bytes]:
+        """
+        Iterate over the body in chunks, like a streamed ``httpx.Response``.
+
+        Args:
+            chunk_size: Bytes per chunk (the whole body if not provided)
+
+        Yields:
+            bytes: The next chunk of the body
+        """
+        for chunk in self.iter_content(chunk_size or max(1, len(self.content))):
+            yield chunk
+
+    def close(self):
+        """Release the response; a no-op for in-memory responses."""
+        pass
+
+    async def aclose(self):
+        """Release the response; a no-op for in-memory responses."""
+        pass
+
+    def raise_for_status(self):
+        """
+        Raise an error for 4xx and 5xx responses.
+
+        Raises:
+            requests.HTTPError: If the status code indicates an error
+        """
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} Error for url: {self.url}", response=self)
+
+    def __repr__(self):
+        """Return string representation of the response."""
+        return f"<TransportResponse [{self.status_code}]>"
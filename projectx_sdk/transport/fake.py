@@ -0,0 +1,227 @@
+"""In-process fake transport that routes API calls to Python handlers."""
+
+import json
+import threading
+from typing import Any, Callable, Dict, List, Optional, Union
+from urllib.parse import urlsplit
+
+from projectx_sdk.transport.base import AsyncTransport, Transport, TransportResponse
+
+FakeHandler = Callable[["FakeRequest"], Any]
+
+
+class FakeRequest:
+    """A request received by a FakeTransport handler."""
+
+    def __init__(
+        self,
+        method: str,
+        url: str,
+        path: str,
+        json_body: Any = None,
+        data: Any = None,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ):
+        """
+        Initialize a fake request.
+
+        Args:
+            method: HTTP method
+            url: Absolute request URL
+            path: API path relative to '/api/' (e.g. 'Order/place')
+            json_body: Decoded JSON request body
+            data: Raw request body (if sent as form data or pre-encoded bytes)
+            params: Query parameters
+            headers: Request headers
+        """
+        self.method = method
+        self.url = url
+        self.path = path
+        self.json = json_body
+        self.data = data
+        self.params = params or {}
+        self.headers = headers or {}
+
+    def __repr__(self):
+        """Return string representation of the request."""
+        return f"<FakeRequest {self.method} {self.path}>"
+
+
+def _default_login(request: FakeRequest) -> Dict[str, Any]:
+    return {"token": "fake-token", "success": True, "errorCode": 0, "errorMessage": None}
+
+
+def _default_validate(request: FakeRequest) -> Dict[str, Any]:
+    return {"success": True, "errorCode": 0, "errorMessage": None, "newToken": "fake-token"}
+
+
+class FakeTransport(Transport):
+    """
+    Transport that answers requests from in-process Python handlers.
+
+    Handlers are registered per API path (e.g. ``"Order/place"``) and receive a
+    FakeRequest. They may return a JSON-serializable object (sent with status
+    200), a ``(status_code, payload)`` tuple or a TransportResponse, and may raise
+    ``requests.RequestException`` to simulate network failures. Login and token
+    validation are answered by default so a client can authenticate against the
+    fake. Unrouted paths answer 404.
+
+    Example::
+
+        fake = FakeTransport()
+
+        @fake.route("Order/place")
+        def place(request):
+            return {"orderId": 42, "success": True, "errorCode": 0, "errorMessage": None}
+
+        client = ProjectXClient(username="u", api_key="k", transport=fake)
+        client.orders.place(...)  # -> 42, no network involved
+    """
+
+    def __init__(self, routes: Optional[Dict[str, Union[FakeHandler, Any]]] = None):
+        """
+        Initialize a fake transport.
+
+        Args:
+            routes: Mapping of API paths to handlers or static JSON payloads
+        """
+        self._lock = threading.Lock()
+        self._routes: Dict[str, FakeHandler] = {
+            "Auth/loginKey": _default_login,
+            "Auth/loginApp": _default_login,
+            "Auth/validate": _default_validate,
+        }
+        self.requests: List[FakeRequest] = []
+
+        for path, handler in (routes or {}).items():
+            self.add_route(path, handler)
+
+    def add_route(self, path: str, handler: Union[FakeHandler, Any]):
+        """
+        Register a handler for an API path.
+
+        Args:
+            path: API path relative to '/api/' (e.g. 'History/retrieveBars')
+            handler: Callable receiving a FakeRequest, or a static JSON payload
+        """
+        if not callable(handler):
+            payload = handler
+            handler = lambda request: payload  # noqa: E731
+
+        with self._lock:
+            self._routes[path.strip("/")] = handler
+
+    def route(self, path: str) -> Callable[[FakeHandler], FakeHandler]:
+        """
+        Register the decorated function as the handler for an API path.
+
+        Args:
+            path: API path relative to '/api/'
+
+        Returns:
+            The decorator
+        """
+
+        def decorator(handler: FakeHandler) -> FakeHandler:
+            self.add_route(path, handler)
+            return handler
+
+        return decorator
+
+    def request(self, method: str, url: str, **kwargs) -> TransportResponse:
+        """
+        Dispatch a request to its registered handler.
+
+        Args:
+            method: HTTP method
+            url: Absolute URL
+            **kwargs: Request options (``params``, ``data``, ``json``, ``headers``,
+                ``timeout``)
+
+        Returns:
+            TransportResponse: The handler's response
+        """
+        path = urlsplit(url).path
+        if path.startswith("/api/"):
+            path = path[5:]
+        path = path.strip("/")
+
+        json_body = kwargs.get("json")
+        data = kwargs.get("data")
+        if json_body is None and isinstance(data, (bytes, str)) and data:
+            try:
+                json_body = json.loads(data)
+            except ValueError:
+                pass
+
+        request = FakeRequest(
+            method=method,
+            url=url,
+            path=path,
+            json_body=json_body,
+            data=data,
+            params=kwargs.get("params"),
+            headers=kwargs.get("headers"),
+        )
+
+        with self._lock:
+            self.requests.append(request)
+            handler = self._routes.get(path)
+
+        if handler is None:
+            return TransportResponse.from_json(
+                {"success": False, "errorMessage": f"No fake route for {path}"},
+                status_code=404,
+                url=url,
+            )
+
+        result = handler(request)
+
+        if isinstance(result, TransportResponse):
+            return result
+        if isinstance(result, tuple):
+            status_code, payload = result
+            return TransportResponse.from_json(payload, status_code=status_code, url=url)
+        return TransportResponse.from_json(result, url=url)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get transport statistics.
+
+        Returns:
+            dict: The number of requests handled (``requests``)
+        """
+        with self._lock:
+            return {"requests": len(self.requests)}
+
+    def reset(self):
+        """Forget all recorded requests."""
+        with self._lock:
+            self.requests.clear()
+
+
+class AsyncFakeTransport(AsyncTransport):
+    """
+    Asyncio view of a FakeTransport, for use with AsyncProjectXClient.
+
+    Routes, handlers and recorded requests are shared with the wrapped
+    FakeTransport; handlers stay plain (synchronous) functions.
+    """
+
+    def __init__(self, fake: Optional[FakeTransport] = None):
+        """
+        Initialize an async fake transport.
+
+        Args:
+            fake: The FakeTransport to dispatch to (a new one if not provided)
+        """
+        self.fake = fake or FakeTransport()
+
+    async def request(self, method: str, url: str, **kwargs) -> TransportResponse:
+        """Dispatch a request to the wrapped FakeTransport."""
+        return self.fake.request(method, url, **kwargs)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get the statistics of the wrapped FakeTransport."""
+        return self.fake.stats()
@@ -0,0 +1,304 @@
+"""Multiplexed HTTP/2 transport for the ProjectX Gateway API."""
+
+import threading
+import time
+from typing import Any, Dict, Iterator, Optional
+from urllib.parse import urlsplit
+
+import requests
+
+from projectx_sdk.transport.async_pool import _PhaseTrace
+from projectx_sdk.transport.base import Transport, TransportResponse
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - exercised only without the http2 extra
+    httpx = None  # type: ignore[assignment]
+
+# RFC 9218 urgency per endpoint prefix (0 is most urgent, 3 the default, 7 the least)
+DEFAULT_URGENCIES = {
+    "Order/": 0,
+    "Position/": 0,
+    "History/": 6,
+    "Trade/search": 6,
+}
+
+# Requests at or above this urgency are bulk requests
+BULK_URGENCY = 5
+
+
+class _StreamedResponse:
+    """Streamed httpx response that raises network failures as requests exceptions."""
+
+    def __init__(self, response: Any, on_close=None):
+        """Wrap an unread httpx response."""
+        self._response = response
+        self._on_close = on_close
+        self.status_code = response.status_code
+        self.headers = response.headers
+        self.url = str(response.url)
+
+    @property
+    def content(self) -> bytes:
+        """Get the whole body."""
+        try:
+            content: bytes = self._response.read()
+        except httpx.HTTPError as e:
+            raise requests.ConnectionError(str(e)) from e
+        return content
+
+    @property
+    def text(self) -> str:
+        """Get the whole body as text."""
+        return self.content.decode(self._response.encoding or "utf-8", errors="replace")
+
+    def iter_content(self, chunk_size: Optional[int] = None) -> Iterator[bytes]:
+        """Iterate over the body as it arrives."""
+        try:
+            yield from self._response.iter_bytes(chunk_size)
+        except httpx.TimeoutException as e:
+            raise requests.Timeout(str(e)) from e
+        except httpx.HTTPError as e:
+            raise requests.ConnectionError(str(e)) from e
+
+    def raise_for_status(self):
+        """
+        Raise an error for 4xx and 5xx responses.
+
+        Raises:
+            requests.HTTPError: If the status code indicates an error
+        """
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} Error for url: {self.url}", response=self)
+
+    def close(self):
+        """Release the stream."""
+        self._response.close()
+        if self._on_close is not None:
+            self._on_close()
+            self._on_close = None
+
+
+class HTTP2Pool(Transport):
+    """
+    HTTP/2 transport multiplexing concurrent requests over one connection per host.
+
+    Where SessionPool opens one connection (and TLS handshake) per concurrent
+    request, HTTP2Pool sends them as streams of a single connection, so bulk
+    history and trade backfills from many threads cost one socket. It is
+    backed by ``httpx.Client`` with HTTP/2 support, which must be installed
+    separately (``pip install projectx-sdk[http2]``).
+
+    Trading calls get priority over bulk ones: each request carries an RFC
+    9218 ``Priority`` header with the urgency of its endpoint, and bulk
+    requests are limited to ``max_bulk_streams`` concurrent streams, so they
+    never use up the server's stream limit (usually 100) while orders wait.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 10,
+        idle_timeout: Optional[float] = 60.0,
+        max_bulk_streams: int = 64,
+        urgencies: Optional[Dict[str, int]] = None,
+        prior_knowledge: bool = False,
+    ):
+        """
+        Initialize an HTTP/2 pool.
+
+        Args:
+            max_connections: Maximum number of connections, across hosts
+            idle_timeout: Seconds after which an idle connection is closed
+                (None to never evict)
+            max_bulk_streams: Maximum number of concurrent bulk requests
+                (urgency 5 or above)
+            urgencies: RFC 9218 urgency (0-7) per endpoint path prefix, matched
+                against the path after ``/api/``. Defaults to DEFAULT_URGENCIES;
+                unmatched endpoints get 3.
+            prior_knowledge: Speak HTTP/2 without negotiating it, as needed for
+                cleartext ``http://`` servers. Otherwise HTTP/2 is negotiated
+                during the TLS handshake and cleartext hosts get HTTP/1.1.
+
+        Raises:
+            ImportError: If httpx or h2 is not installed
+        """
+        if httpx is None:
+            raise ImportError(
+                "HTTP2Pool requires httpx and h2. Install them with: "
+                "pip install projectx-sdk[http2]"
+            )
+
+        self.max_connections = max_connections
+        self.idle_timeout = idle_timeout
+        self.max_bulk_streams = max_bulk_streams
+        self.urgencies = dict(DEFAULT_URGENCIES if urgencies is None else urgencies)
+        self.prior_knowledge = prior_knowledge
+
+        self._lock = threading.Lock()
+        self._bulk_streams = threading.BoundedSemaphore(max_bulk_streams)
+        self._requests = 0
+        self._bulk_waits = 0
+        self._bulk_wait_time = 0.0
+
+        self.session = httpx.Client(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+                keepalive_expiry=idle_timeout,
+            ),
+            http1=not prior_knowledge,
+            http2=True,
+        )
+
+    def urgency(self, url: str) -> int:
+        """
+        Get the RFC 9218 urgency of a request.
+
+        Args:
+            url: Absolute URL of the request
+
+        Returns:
+            int: The urgency, from 0 (most urgent) to 7
+        """
+        path = urlsplit(url).path
+        _, _, endpoint = path.partition("/api/")
+        for prefix, urgency in self.urgencies.items():
+            if endpoint.startswith(prefix):
+                return urgency
+        return 3
+
+    def _acquire_bulk_stream(self):
+        """Wait for one of the bulk streams to be free."""
+        if self._bulk_streams.acquire(blocking=False):
+            return
+        started = time.perf_counter()
+        self._bulk_streams.acquire()
+        with self._lock:
+            self._bulk_waits += 1
+            self._bulk_wait_time += time.perf_counter() - started
+
+    def request(self, method: str, url: str, **kwargs) -> Any:
+        """
+        Send a request as a stream of a pooled HTTP/2 connection.
+
+        Args:
+            method: HTTP method ('GET', 'POST', etc.)
+            url: Absolute URL
+            **kwargs: Arguments accepted by httpx.Client.request, plus
+                ``data`` as pre-encoded bytes and ``stream=True`` to return
+                before the body is read
+
+        Returns:
+            TransportResponse: The HTTP response, with a ``timings`` dict like
+            SessionPool responses and the negotiated ``http_version``;
+            ``raise_for_status()`` raises ``requests.HTTPError``. Streamed
+            responses expose ``iter_content()`` and must be closed with ``close()``.
+
+        Raises:
+            requests.RequestException: If the request could not be completed
+        """
+        with self._lock:
+            self._requests += 1
+
+        # httpx takes pre-encoded bodies as ``content``; ``data`` is for form fields
+        if isinstance(kwargs.get("data"), (bytes, str)):
+            kwargs["content"] = kwargs.pop("data")
+
+        stream = kwargs.pop("stream", False)
+
+        urgency = self.urgency(url)
+        headers = dict(kwargs.get("headers") or {})
+        headers.setdefault("Priority", f"u={urgency}")
+        kwargs["headers"] = headers
+
+        trace = _PhaseTrace()
+        kwargs["extensions"] = {**kwargs.get("extensions", {}), "trace": trace.record}
+
+        bulk = urgency >= BULK_URGENCY
+        if bulk:
+            self._acquire_bulk_stream()
+        release = self._bulk_streams.release if bulk else None
+
+        # Surface network failures the same way as SessionPool
+        try:
+            if stream:
+                request = self.session.build_request(method, url, **kwargs)
+                streamed = _StreamedResponse(self.session.send(request, stream=True), release)
+                release = None
+                return streamed
+            response = self.session.request(method, url, **kwargs)
+            # Hand back the Transport contract rather than httpx's own response
+            wrapped = TransportResponse(
+                status_code=response.status_code,
+                content=response.content,
+                headers=response.headers,
+                url=str(response.url),
+            )
+            wrapped.timings = trace.timings(time.perf_counter())  # type: ignore[attr-defined]
+            wrapped.http_version = response.http_version  # type: ignore[attr-defined]
+            return wrapped
+        except httpx.TimeoutException as e:
+            raise requests.Timeout(str(e)) from e
+        except httpx.HTTPError as e:
+            raise requests.ConnectionError(str(e)) from e
+        finally:
+            if release is not None:
+                release()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get connection pool statistics.
+
+        Returns:
+            dict: The number of requests sent (``requests``), currently open
+            connections (``open_connections``), and how often and how long
+            bulk requests waited for a free stream (``bulk_waits`` and
+            ``bulk_wait_time``)
+        """
+        # httpx does not expose pool statistics publicly; read them defensively
+        transport_pool = getattr(getattr(self.session, "_transport", None), "_pool", None)
+        connections = getattr(transport_pool, "connections", None)
+
+        with self._lock:
+            return {
+                "requests": self._requests,
+                "open_connections": len(connections) if connections is not None else None,
+                "bulk_waits": self._bulk_waits,
+                "bulk_wait_time": self._bulk_wait_time,
+            }
+
+    def warm_up(self, url: str, connections: int = 1, timeout: Optional[float] = None) -> int:
+        """
+        Open the connection to a host before the first request needs it.
+
+        httpx cannot open a connection without a request, so this sends a HEAD
+        request to the host's root. One connection carries all requests, so
+        ``connections`` is ignored.
+
+        Args:
+            url: Any URL on the host
+            connections: Ignored; kept for compatibility with SessionPool
+            timeout: Connect timeout in seconds
+
+        Returns:
+            int: The number of connections opened
+
+        Raises:
+            requests.ConnectionError: If the host could not be connected to
+        """
+        root = httpx.URL(url).copy_with(path="/", query=None, fragment=None)
+        before: Optional[int] = self.stats()["open_connections"]
+
+        try:
+            self.session.head(root, timeout=timeout)
+        except httpx.HTTPError as e:
+            raise requests.ConnectionError(f"Could not connect to {root}: {e}") from e
+
+        after: Optional[int] = self.stats()["open_connections"]
+        if before is None or after is None:
+            return 1
+        return max(after - before, 0)
+
+    def close(self):
+        """Close all pooled connections."""
+        self.session.close()
@@ -0,0 +1,330 @@
+"""Pooled, keep-alive HTTP sessions for the ProjectX Gateway API."""
+
+import threading
+import time
+from typing import Any, Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import EmptyPoolError
+from urllib3.poolmanager import PoolManager
+
+from projectx_sdk.transport.base import Transport
+
+
+class _PoolCounters:
+    """Thread-safe counters shared by every host pool of a SessionPool."""
+
+    def __init__(self):
+        """Initialize all counters to zero."""
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.hits = 0
+        self.new_connections = 0
+        self.waits = 0
+        self.wait_time = 0.0
+        self.evictions = 0
+
+    def record_checkout(self, reused: bool, waited: bool, wait_time: float, evicted: bool):
+        """Record a single connection checkout from a host pool."""
+        with self._lock:
+            self.requests += 1
+            if reused:
+                self.hits += 1
+            else:
+                self.new_connections += 1
+            if waited:
+                self.waits += 1
+                self.wait_time += wait_time
+            if evicted:
+                self.evictions += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return a consistent copy of the counters."""
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "hits": self.hits,
+                "new_connections": self.new_connections,
+                "waits": self.waits,
+                "wait_time": self.wait_time,
+                "evictions": self.evictions,
+            }
+
+
+# Seconds spent opening connections by the request in progress on each thread
+_connect_time = threading.local()
+
+
+class _TimedConnectionMixin:
+    """Connection mixin that adds its TCP connect and TLS handshake time to the thread's total."""
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            super().connect()  # type: ignore[misc]
+        finally:
+            _connect_time.seconds = getattr(_connect_time, "seconds", 0.0) + (
+                time.perf_counter() - start
+            )
+
+
+class _TimedHTTPConnection(_TimedConnectionMixin, HTTPConnection):
+    """HTTP connection with connect timing."""
+
+    pass
+
+
+class _TimedHTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+    """HTTPS connection with connect and TLS handshake timing."""
+
+    pass
+
+
+class _CountingPoolMixin:
+    """Connection pool mixin that records checkout statistics and evicts idle sockets."""
+
+    _px_counters: Optional[_PoolCounters] = None
+    _px_idle_timeout: Optional[float] = None
+
+    def _get_conn(self, timeout=None):
+        pool = getattr(self, "pool", None)
+        waited = bool(getattr(self, "block", False) and pool is not None and pool.empty())
+        start = time.monotonic()
+
+        conn = super()._get_conn(timeout)  # type: ignore[misc]
+
+        now = time.monotonic()
+        reused = getattr(conn, "sock", None) is not None
+        evicted = False
+
+        last_used = getattr(conn, "_px_last_used", None)
+        if reused and self._px_idle_timeout is not None and last_used is not None:
+            if now - last_used > self._px_idle_timeout:
+                # The server has likely dropped this socket already; reconnect eagerly
+                # instead of paying for a failed request on a half-closed connection.
+                conn.close()
+                reused = False
+                evicted = True
+
+        if self._px_counters is not None:
+            self._px_counters.record_checkout(reused, waited, now - start, evicted)
+
+        return conn
+
+    def _put_conn(self, conn):
+        if conn is not None:
+            conn._px_last_used = time.monotonic()
+        super()._put_conn(conn)  # type: ignore[misc]
+
+
+class _CountingHTTPConnectionPool(_CountingPoolMixin, HTTPConnectionPool):
+    """HTTP connection pool with checkout statistics."""
+
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _CountingHTTPSConnectionPool(_CountingPoolMixin, HTTPSConnectionPool):
+    """HTTPS connection pool with checkout statistics."""
+
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class _CountingPoolManager(PoolManager):
+    """Pool manager that builds counting host pools."""
+
+    def __init__(self, counters: _PoolCounters, idle_timeout: Optional[float], **kwargs):
+        super().__init__(**kwargs)
+        self.pool_classes_by_scheme = {
+            "http": _CountingHTTPConnectionPool,
+            "https": _CountingHTTPSConnectionPool,
+        }
+        self._px_counters = counters
+        self._px_idle_timeout = idle_timeout
+
+    def _new_pool(self, scheme, host, port, request_context=None):
+        pool = super()._new_pool(scheme, host, port, request_context=request_context)
+        pool._px_counters = self._px_counters  # type: ignore[attr-defined]
+        pool._px_idle_timeout = self._px_idle_timeout  # type: ignore[attr-defined]
+        return pool
+
+
+class _PooledAdapter(HTTPAdapter):
+    """Transport adapter backed by a counting pool manager."""
+
+    def __init__(self, counters: _PoolCounters, idle_timeout: Optional[float], **kwargs):
+        self._px_counters = counters
+        self._px_idle_timeout = idle_timeout
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        """Create the pool manager used for all plain HTTP(S) requests."""
+        self._pool_connections = connections
+        self._pool_maxsize = maxsize
+        self._pool_block = block
+        self.poolmanager = _CountingPoolManager(
+            self._px_counters,
+            self._px_idle_timeout,
+            num_pools=connections,
+            maxsize=maxsize,
+            block=block,
+            **pool_kwargs,
+        )
+
+
+class SessionPool(Transport):
+    """
+    Shared pool of keep-alive HTTP connections.
+
+    This is the default (real network) transport. A single SessionPool is owned
+    by a ProjectXClient and shared by all of its services and its Authenticator,
+    so consecutive API calls reuse an already established TCP/TLS connection
+    instead of paying a new handshake each time.
+
+    The pool is safe to share between threads: each request checks out its
+    own connection, so concurrent calls run in parallel on up to
+    ``max_connections_per_host`` connections per host.
+    """
+
+    def __init__(
+        self,
+        num_pools: int = 10,
+        max_connections_per_host: int = 10,
+        block: bool = False,
+        keep_alive: bool = True,
+        idle_timeout: Optional[float] = None,
+    ):
+        """
+        Initialize a session pool.
+
+        Args:
+            num_pools: Number of per-host connection pools to keep
+            max_connections_per_host: Maximum number of connections kept per host
+            block: If True, wait for a free connection when a host pool is exhausted
+                instead of opening a throwaway connection
+            keep_alive: Whether connections are kept open between requests
+            idle_timeout: Seconds after which an idle connection is closed and
+                re-established on next use (None to never evict)
+        """
+        self.num_pools = num_pools
+        self.max_connections_per_host = max_connections_per_host
+        self.block = block
+        self.keep_alive = keep_alive
+        self.idle_timeout = idle_timeout
+
+        self._counters = _PoolCounters()
+        self.session = requests.Session()
+
+        adapter = _PooledAdapter(
+            self._counters,
+            idle_timeout,
+            pool_connections=num_pools,
+            pool_maxsize=max_connections_per_host,
+            pool_block=block,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        if not keep_alive:
+            self.session.headers["Connection"] = "close"
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Send a request over a pooled connection.
+
+        Args:
+            method: HTTP method ('GET', 'POST', etc.)
+            url: Absolute URL
+            **kwargs: Arguments accepted by requests.Session.request
+
+        Returns:
+            The HTTP response, with a ``timings`` dict splitting the round trip
+            into ``connect`` (TCP and TLS), ``ttfb`` (until the response headers
+            arrived) and ``body`` (reading the body) seconds
+        """
+        _connect_time.seconds = 0.0
+        start = time.perf_counter()
+        response = self.session.request(method, url, **kwargs)
+        total = time.perf_counter() - start
+
+        # requests measures ``elapsed`` up to the parsed headers, before the body is read
+        connect = _connect_time.seconds
+        headers = min(response.elapsed.total_seconds(), total)
+        response.timings = {  # type: ignore[attr-defined]
+            "connect": connect,
+            "ttfb": max(headers - connect, 0.0),
+            "body": total - headers,
+        }
+        return response
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get connection pool statistics.
+
+        Returns:
+            dict: Counters for checked-out connections (``requests``), reused
+            keep-alive connections (``hits``), freshly opened connections
+            (``new_connections``), checkouts that had to wait for a free
+            connection (``waits`` and total ``wait_time`` in seconds) and idle
+            connections that were evicted (``evictions``)
+        """
+        return self._counters.snapshot()
+
+    def _connection_pool(self, url: str) -> Any:
+        """Get the host pool requests would use for a URL."""
+        adapter: Any = self.session.get_adapter(url)
+        get_connection = getattr(adapter, "get_connection_with_tls_context", None)
+        # Pools are keyed by proxy and TLS settings, resolved as requests does
+        settings = self.session.merge_environment_settings(url, {}, None, None, None)
+        if get_connection is not None:
+            # requests >= 2.32
+            request = requests.Request("GET", url).prepare()
+            return get_connection(
+                request, settings["verify"], proxies=settings["proxies"], cert=settings["cert"]
+            )
+        return adapter.get_connection(url, settings["proxies"])
+
+    def warm_up(self, url: str, connections: int = 1, timeout: Optional[float] = None) -> int:
+        """
+        Open keep-alive connections to a host before the first request needs them.
+
+        Connections still open are kept; missing, dropped or idle-evicted ones
+        are established, TLS handshake included. Running it again later keeps
+        the connections warm. The checkouts show up in ``stats()``. Connections
+        busy with other requests are left alone: warm-up never waits for one
+        to be returned, even when the pool blocks.
+
+        Args:
+            url: Any URL on the host
+            connections: Number of connections to have open (at most
+                ``max_connections_per_host``)
+            timeout: Connect timeout in seconds
+
+        Returns:
+            int: The number of connections that had to be opened
+        """
+        pool = self._connection_pool(url)
+        checked_out = []
+        opened = 0
+        try:
+            for _ in range(min(connections, self.max_connections_per_host)):
+                try:
+                    conn = pool._get_conn(timeout=0)
+                except EmptyPoolError:
+                    break
+                checked_out.append(conn)
+                if conn.sock is None:
+                    if timeout is not None:
+                        conn.timeout = timeout
+                    conn.connect()
+                    opened += 1
+        finally:
+            for conn in checked_out:
+                pool._put_conn(conn)
+        return opened
+
+    def close(self):
+        """Close all pooled connections."""
+        self.session.close()
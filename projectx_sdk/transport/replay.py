@@ -0,0 +1,226 @@
+"""Record/replay transport that stores real API responses on disk."""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlsplit
+
+import requests
+
+from projectx_sdk.transport.base import Transport, TransportResponse
+from projectx_sdk.transport.pool import SessionPool
+
+# Response fields holding credentials; never written to a cassette
+_SECRET_RESPONSE_FIELDS = ("token", "newToken")
+_REDACTED_TOKEN = "replayed-token"
+
+
+def _request_key(method: str, path: str, body: Any) -> str:
+    """
+    Build the cassette key for a request.
+
+    The body is hashed rather than stored so that credentials sent to the login
+    endpoints never end up on disk.
+    """
+    canonical = json.dumps(body, sort_keys=True, default=str) if body is not None else ""
+    digest = hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
+    return f"{method.upper()} {path} {digest}"
+
+
+class RecordReplayTransport(Transport):
+    """
+    Transport that records real responses to a cassette file and replays them.
+
+    Modes:
+        - ``"record"``: send every request through the inner transport and store
+          the response (replacing earlier recordings of the same request)
+        - ``"replay"``: answer only from the cassette; unrecorded requests raise
+          ``requests.ConnectionError``
+        - ``"auto"``: replay recorded requests and record the rest
+
+    Requests are matched on method, API path and JSON body. When the same request
+    was recorded several times, the recordings are replayed in order and the last
+    one repeats. Auth tokens in responses are redacted before they are written.
+    """
+
+    MODES = ("record", "replay", "auto")
+
+    def __init__(self, path: str, mode: str = "auto", inner: Optional[Transport] = None):
+        """
+        Initialize a record/replay transport.
+
+        Args:
+            path: Path of the JSON cassette file
+            mode: One of 'record', 'replay' or 'auto'
+            inner: Transport used for recording (a default SessionPool if not provided)
+
+        Raises:
+            ValueError: If the mode is unknown
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown mode: {mode}. Use one of {', '.join(self.MODES)}.")
+
+        self.path = path
+        self.mode = mode
+        self._inner = inner
+
+        self._lock = threading.Lock()
+        self._cassette: Dict[str, List[Dict[str, Any]]] = {}
+        self._replay_positions: Dict[str, int] = {}
+        self._recorded_keys: set = set()
+        self._hits = 0
+        self._misses = 0
+
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as fh:
+                self._cassette = json.load(fh).get("interactions", {})
+
+    @property
+    def inner(self) -> Transport:
+        """Get the transport used for recording."""
+        if self._inner is None:
+            self._inner = SessionPool()
+        return self._inner
+
+    def request(self, method: str, url: str, **kwargs) -> Any:
+        """
+        Replay a recorded response or record a new one.
+
+        Args:
+            method: HTTP method
+            url: Absolute URL
+            **kwargs: Request options (``params``, ``data``, ``json``, ``headers``,
+                ``timeout``)
+
+        Returns:
+            The recorded or live response
+
+        Raises:
+            requests.ConnectionError: If replaying and no recording matches
+        """
+        path = urlsplit(url).path
+        body = kwargs.get("json")
+        if body is None:
+            body = kwargs.get("data")
+            if isinstance(body, bytes):
+                body = body.decode("utf-8", errors="replace")
+            if isinstance(body, str):
+                # Match pre-encoded JSON bodies against recordings of the decoded form
+                try:
+                    body = json.loads(body)
+                except ValueError:
+                    pass
+        key = _request_key(method, path, body)
+
+        if self.mode != "record":
+            recorded = self._next_recording(key)
+            if recorded is not None:
+                return TransportResponse(
+                    status_code=recorded["status"],
+                    content=recorded["body"].encode("utf-8"),
+                    headers=recorded.get("headers", {}),
+                    url=url,
+                )
+
+            if self.mode == "replay":
+                with self._lock:
+                    self._misses += 1
+                raise requests.ConnectionError(f"No recorded response for {method} {path}")
+
+        response = self.inner.request(method, url, **kwargs)
+        self._record(key, response)
+        return response
+
+    def _next_recording(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get the next recording for a key, or None if there is none."""
+        with self._lock:
+            recordings = self._cassette.get(key)
+            if not recordings:
+                return None
+
+            position = self._replay_positions.get(key, 0)
+            self._replay_positions[key] = position + 1
+            self._hits += 1
+            return recordings[min(position, len(recordings) - 1)]
+
+    def _record(self, key: str, response: Any):
+        """Store a live response in the cassette and persist it."""
+        body = response.text
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            payload = None
+
+        if isinstance(payload, dict) and any(payload.get(f) for f in _SECRET_RESPONSE_FIELDS):
+            for field in _SECRET_RESPONSE_FIELDS:
+                if payload.get(field):
+                    payload[field] = _REDACTED_TOKEN
+            body = json.dumps(payload)
+
+        entry = {
+            "status": response.status_code,
+            "headers": {"Content-Type": response.headers.get("Content-Type", "application/json")},
+            "body": body,
+        }
+
+        with self._lock:
+            # The first recording of a key in this session replaces older ones
+            if key not in self._recorded_keys:
+                self._cassette[key] = []
+                self._recorded_keys.add(key)
+            self._cassette[key].append(entry)
+            self._save()
+
+    def _save(self):
+        """Atomically write the cassette to disk with owner-only permissions."""
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".cassette-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                json.dump({"version": 1, "interactions": self._cassette}, fh, indent=2)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    def warm_up(self, url: str, connections: int = 1, timeout: Optional[float] = None) -> int:
+        """
+        Open connections through the inner transport, unless only replaying.
+
+        Args:
+            url: Any URL on the host
+            connections: Number of connections to have open
+            timeout: Connect timeout in seconds
+
+        Returns:
+            int: The number of connections opened
+        """
+        if self.mode == "replay":
+            return 0
+        return self.inner.warm_up(url, connections, timeout)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get transport statistics.
+
+        Returns:
+            dict: Replayed responses (``hits``), unmatched replays (``misses``) and
+            the number of distinct recorded requests (``recorded``)
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "recorded": len(self._cassette),
+            }
+
+    def close(self):
+        """Close the inner transport if one was created."""
+        if self._inner is not None:
+            self._inner.close()
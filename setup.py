@@ -14,13 +14,28 @@ install_requires = [
     "pydantic>=2.0.0",
 ]
 
+# Optional asyncio client dependencies
+async_requires = [
+    "httpx>=0.23.0",
+]
+
+# Optional HTTP/2 transport dependencies
+http2_requires = [
+    "httpx[http2]>=0.23.0",
+]
+
+# Optional fast JSON codecs (codec="auto")
+speedups_requires = [
+    "orjson>=3.6.0",
+]
+
 # Test dependencies
 test_requires = [
     "pytest>=7.0.0",
     "pytest-cov>=4.0.0",
     "responses>=0.22.0",
     "pytest-mock>=3.10.0",
-]
+] + async_requires
 
 # Development dependencies
 dev_requires = [
@@ -66,6 +81,9 @@ setup(
     python_requires=">=3.8",
     install_requires=install_requires,
     extras_require={
+        "async": async_requires,
+        "http2": http2_requires,
+        "speedups": speedups_requires,
         "test": test_requires,
         "dev": dev_requires,
     },
@@ -1,5 +1,9 @@
 """Pytest configuration for ProjectX SDK tests."""
 
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import MagicMock
 
 import pytest
@@ -383,3 +387,205 @@ def mock_hub_connection():
     connection.trigger_event = trigger_event
 
     return connection
+
+
+class _GatewayStandInHandler(BaseHTTPRequestHandler):
+    """Minimal keep-alive HTTP handler standing in for the gateway."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        """Answer a POST request with the configured route or a success envelope."""
+        length = int(self.headers.get("Content-Length", 0))
+        request_body = self.rfile.read(length) if length else b""
+        self.server.requests.append((self.path, request_body))
+
+        payload = self.server.routes.get(
+            self.path,
+            {"success": True, "errorCode": 0, "errorMessage": None, "token": "local-token"},
+        )
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_HEAD(self):
+        """Answer a HEAD request with an empty 404, keeping the connection open."""
+        self.send_response(404)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        """Silence request logging."""
+        pass
+
+
+class _GatewayStandInServer(ThreadingHTTPServer):
+    """Threaded HTTP server with room for many concurrent connection attempts."""
+
+    daemon_threads = True
+    request_queue_size = 128
+
+
+@pytest.fixture
+def local_gateway():
+    """
+    Fixture for a local keep-alive HTTP server standing in for the gateway.
+
+    Responses can be configured per path through ``server.routes`` and received
+    requests are recorded in ``server.requests`` as ``(path, body)`` tuples.
+
+    Returns:
+        ThreadingHTTPServer: The running server, with its base URL in ``server.url``.
+    """
+    server = _GatewayStandInServer(("127.0.0.1", 0), _GatewayStandInHandler)
+    server.routes = {}
+    server.requests = []
+    server.url = f"http://127.0.0.1:{server.server_address[1]}"
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield server
+
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def local_http_server(local_gateway):
+    """
+    Fixture for the base URL of the local gateway stand-in server.
+
+    Returns:
+        str: The base URL of the running server.
+    """
+    return local_gateway.url
+
+
+class _H2GatewayStandIn:
+    """Cleartext HTTP/2 (prior knowledge) server standing in for the gateway."""
+
+    def __init__(self, h2):
+        """Start the server on its own event loop thread."""
+        self.h2 = h2
+        self.routes = {}
+        self.requests = []
+        self.latency = 0.0
+        self.connections = 0
+        self.streams = 0
+        self.peak_streams = 0
+
+        self.loop = asyncio.new_event_loop()
+        started = threading.Event()
+
+        def run():
+            asyncio.set_event_loop(self.loop)
+            self.server = self.loop.run_until_complete(
+                self.loop.create_server(lambda: _H2GatewayProtocol(self), "127.0.0.1", 0)
+            )
+            started.set()
+            self.loop.run_forever()
+
+        self.thread = threading.Thread(target=run, daemon=True)
+        self.thread.start()
+        started.wait()
+        self.url = f"http://127.0.0.1:{self.server.sockets[0].getsockname()[1]}"
+
+    def close(self):
+        """Stop the server."""
+        self.loop.call_soon_threadsafe(self.server.close)
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+
+
+class _H2GatewayProtocol(asyncio.Protocol):
+    """One HTTP/2 connection to the stand-in server."""
+
+    def __init__(self, server):
+        """Set up the connection state machine."""
+        self.server = server
+        config = server.h2.config.H2Configuration(client_side=False, header_encoding="utf-8")
+        self.conn = server.h2.connection.H2Connection(config=config)
+        self.pending = {}
+
+    def connection_made(self, transport):
+        """Send the server preface."""
+        self.server.connections += 1
+        self.transport = transport
+        self.conn.initiate_connection()
+        transport.write(self.conn.data_to_send())
+
+    def data_received(self, data):
+        """Collect request headers and bodies, answering complete requests."""
+        events = self.server.h2.events
+        for event in self.conn.receive_data(data):
+            if isinstance(event, events.RequestReceived):
+                self.pending[event.stream_id] = (dict(event.headers), bytearray())
+            elif isinstance(event, events.DataReceived):
+                self.pending[event.stream_id][1].extend(event.data)
+                self.conn.acknowledge_received_data(event.flow_controlled_length, event.stream_id)
+            elif isinstance(event, events.StreamEnded):
+                headers, body = self.pending.pop(event.stream_id)
+                asyncio.ensure_future(self.respond(event.stream_id, headers, bytes(body)))
+        self.transport.write(self.conn.data_to_send())
+
+    async def respond(self, stream_id, headers, body):
+        """Answer a request with the configured route or a success envelope."""
+        server = self.server
+        server.requests.append((headers[":path"], headers, body))
+        server.streams += 1
+        server.peak_streams = max(server.peak_streams, server.streams)
+        await asyncio.sleep(server.latency)
+        server.streams -= 1
+
+        status = 200
+        if headers[":method"] == "HEAD":
+            payload = b""
+        else:
+            route = server.routes.get(
+                headers[":path"],
+                {"success": True, "errorCode": 0, "errorMessage": None, "token": "local-token"},
+            )
+            if isinstance(route, tuple):
+                status, route = route
+            payload = json.dumps(route).encode("utf-8")
+        self.conn.send_headers(
+            stream_id,
+            [
+                (":status", str(status)),
+                ("content-type", "application/json"),
+                ("content-length", str(len(payload))),
+            ],
+            end_stream=not payload,
+        )
+        if payload:
+            # Stand-in responses fit the default flow-control window
+            self.conn.send_data(stream_id, payload, end_stream=True)
+        self.transport.write(self.conn.data_to_send())
+
+
+@pytest.fixture
+def local_h2_gateway():
+    """
+    Fixture for a local cleartext HTTP/2 server standing in for the gateway.
+
+    Like ``local_gateway``, responses can be configured per path through
+    ``server.routes``, as a payload or a ``(status, payload)`` tuple; received
+    requests are recorded in ``server.requests`` as ``(path, headers, body)``
+    tuples. ``server.latency`` delays every response,
+    ``server.connections`` counts accepted connections and
+    ``server.peak_streams`` is the most requests handled at once.
+
+    Returns:
+        The running server, with its base URL in ``server.url``.
+    """
+    pytest.importorskip("h2")
+    import h2.config
+    import h2.connection
+    import h2.events
+
+    server = _H2GatewayStandIn(h2)
+    yield server
+    server.close()
@@ -0,0 +1,156 @@
+"""Tests for the AsyncProjectXClient class."""
+
+import asyncio
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from projectx_sdk import AsyncProjectXClient
+from projectx_sdk.exceptions import ProjectXError
+from projectx_sdk.models.history import Bar
+from projectx_sdk.models.order import Order
+from projectx_sdk.utils.constants import OrderSide, OrderType
+
+pytest.importorskip("httpx")
+
+
+def _client(local_gateway):
+    return AsyncProjectXClient(
+        username="test_user", api_key="test_api_key", base_url=local_gateway.url
+    )
+
+
+class TestAsyncProjectXClient:
+    """Tests for the AsyncProjectXClient class."""
+
+    def test_init_with_invalid_environment(self):
+        """Test client initialization with an invalid environment."""
+        with pytest.raises(ValueError) as excinfo:
+            AsyncProjectXClient(environment="invalid_env")
+        assert "Unknown environment" in str(excinfo.value)
+
+    def test_services_available(self):
+        """Test that all async services are initialized."""
+        client = AsyncProjectXClient(environment="demo")
+
+        assert client.base_url == "https://gateway-api-demo.s2f.projectx.com"
+        for service in ("accounts", "contracts", "history", "orders", "positions", "trades"):
+            assert getattr(client, service) is not None
+
+    def test_orders_search_open(self, local_gateway, mock_order_list_response):
+        """Test an awaitable order search."""
+        local_gateway.routes["/api/Order/searchOpen"] = mock_order_list_response
+
+        async def run():
+            async with _client(local_gateway) as client:
+                return await client.orders.search_open(1)
+
+        orders = asyncio.run(run())
+
+        assert len(orders) == 2
+        assert isinstance(orders[0], Order)
+        assert orders[0].id == 1001
+
+    def test_orders_place(self, local_gateway, mock_order_response):
+        """Test awaitable order placement."""
+        local_gateway.routes["/api/Order/place"] = mock_order_response
+
+        async def run():
+            async with _client(local_gateway) as client:
+                return await client.orders.place(
+                    account_id=1,
+                    contract_id="CON.F.US.ENQ.H25",
+                    order_type=OrderType.MARKET,
+                    side=OrderSide.BUY,
+                    size=1,
+                )
+
+        assert asyncio.run(run()) == 1234
+
+        path, body = local_gateway.requests[-1]
+        assert path == "/api/Order/place"
+        assert json.loads(body)["type"] == 2
+
+    def test_concurrent_requests(self, local_gateway, mock_history_response):
+        """Test many concurrent requests sharing one event loop and pool."""
+        local_gateway.routes["/api/History/retrieveBars"] = mock_history_response
+        start = datetime(2023, 1, 1, tzinfo=timezone.utc)
+        end = datetime(2023, 1, 2, tzinfo=timezone.utc)
+
+        async def run():
+            async with _client(local_gateway) as client:
+                results = await asyncio.gather(
+                    *(
+                        client.history.retrieve_bars("CON.F.US.ENQ.H25", start, end)
+                        for _ in range(20)
+                    )
+                )
+                return results, client.pool_stats()
+
+        results, stats = asyncio.run(run())
+
+        assert len(results) == 20
+        assert all(len(bars) == 3 and isinstance(bars[0], Bar) for bars in results)
+        assert stats["requests"] == 20
+
+    def test_warm_up(self, local_gateway):
+        """Test that warmed-up connections are kept for the next requests."""
+
+        async def run():
+            async with _client(local_gateway) as client:
+                report = await client.warm_up(connections=2)
+                await client.orders.search_open(1)
+                return report, client.pool_stats()
+
+        report, stats = asyncio.run(run())
+
+        assert report["connections"] == 2
+        assert stats["open_connections"] == 2
+
+    def test_api_error(self, local_gateway):
+        """Test that API error envelopes raise ProjectXError."""
+        local_gateway.routes["/api/Account/search"] = {
+            "success": False,
+            "errorCode": 1001,
+            "errorMessage": "Test error",
+        }
+
+        async def run():
+            async with _client(local_gateway) as client:
+                await client.accounts.search()
+
+        with pytest.raises(ProjectXError) as excinfo:
+            asyncio.run(run())
+
+        assert excinfo.value.error_code == 1001
+
+    def test_auto_refresh(self, local_gateway):
+        """Test that the token is renewed by a background task started with the first request."""
+        local_gateway.routes["/api/Auth/validate"] = {
+            "success": True,
+            "errorCode": 0,
+            "errorMessage": None,
+            "newToken": "renewed-token",
+        }
+
+        async def run():
+            client = AsyncProjectXClient(
+                token="test-token", base_url=local_gateway.url, auto_refresh=True
+            )
+            client.auth.refresh_jitter = 0
+            client.auth.token_expiry = datetime.now() + timedelta(seconds=3600.05)
+            async with client:
+                await client.orders.search_open(1)
+                assert client.auth.background_refresh is True
+                for _ in range(200):
+                    if client.auth.token == "renewed-token":
+                        break
+                    await asyncio.sleep(0.01)
+            return client
+
+        client = asyncio.run(run())
+
+        assert client.auth.token == "renewed-token"
+        assert client.auth.background_refresh is False
+        assert [path for path, _ in local_gateway.requests].count("/api/Auth/validate") == 1
@@ -1,11 +1,17 @@
 """Tests for the authentication module."""
 
+import base64
+import json
+import threading
+import time
 from datetime import datetime, timedelta
 
 import pytest
 
-from projectx_sdk.auth import Authenticator
-from projectx_sdk.exceptions import AuthenticationError
+from projectx_sdk.auth import Authenticator, decode_jwt_claims, issued_lifetime, token_ttl
+from projectx_sdk.deadline import Deadline
+from projectx_sdk.exceptions import AuthenticationError, DeadlineExceededError
+from projectx_sdk.transport import FakeTransport
 from projectx_sdk.utils.constants import ENDPOINTS
 
 
@@ -255,3 +261,248 @@ class TestAuthenticator:
 
         # Should no longer be authenticated
         assert auth.is_authenticated() is False
+
+
+def _renewing_transport(token="renewed-token"):
+    """Build a fake transport whose token validation renews the token."""
+    fake = FakeTransport()
+    fake.add_route(
+        "Auth/validate",
+        {"success": True, "errorCode": 0, "errorMessage": None, "newToken": token},
+    )
+    return fake
+
+
+class TestBackgroundRefresh:
+    """Tests for renewing the token in the background."""
+
+    def test_refresh_delay(self, auth_token):
+        """Test that renewal is due ahead of expiry, brought forward by the jitter."""
+        auth = Authenticator("https://test-api.example.com", token=auth_token)
+        auth.token_expiry = datetime.now() + timedelta(hours=2)
+
+        assert auth.refresh_delay(rng=lambda: 0.0) == pytest.approx(3600, abs=1)
+        assert auth.refresh_delay(rng=lambda: 0.5) == pytest.approx(3300, abs=1)
+
+        auth.token_expiry = datetime.now() + timedelta(minutes=30)
+        assert auth.refresh_delay() == 0.0
+
+    def test_request_path_never_blocks(self, auth_token):
+        """Test that get_token does not renew a near-expiry token while a refresher runs."""
+        fake = _renewing_transport()
+        auth = Authenticator("https://test-api.example.com", token=auth_token, transport=fake)
+        auth.token_expiry = datetime.now() + timedelta(minutes=15)
+        auth.background_refresh = True
+
+        assert auth.needs_refresh() is False
+        assert auth.get_token() == auth_token
+        assert fake.requests == []
+
+        # An expired token is still renewed on the request path
+        auth.token_expiry = datetime.now() - timedelta(minutes=1)
+        assert auth.get_token() == "renewed-token"
+
+    def test_refresher_renews_ahead_of_expiry(self, auth_token):
+        """Test that the refresher thread renews the token once renewal is due."""
+        fake = _renewing_transport()
+        auth = Authenticator("https://test-api.example.com", token=auth_token, transport=fake)
+        auth.token_expiry = datetime.now() + timedelta(seconds=3600.05)
+
+        auth.start_refresher(refresh_ahead=3600, jitter=0)
+        try:
+            for _ in range(200):
+                if auth.token == "renewed-token":
+                    break
+                time.sleep(0.01)
+        finally:
+            auth.stop_refresher()
+
+        assert auth.token == "renewed-token"
+        assert [request.path for request in fake.requests] == ["Auth/validate"]
+        assert auth.refresh_delay(rng=lambda: 0.0) > 3600 * 20
+        assert auth.background_refresh is False
+
+    def test_failed_refresh_is_retried(self, auth_token):
+        """Test that a failed renewal keeps the token and is retried later."""
+        fake = FakeTransport()
+        fake.add_route("Auth/validate", {"success": False, "errorCode": 1, "errorMessage": "no"})
+        auth = Authenticator("https://test-api.example.com", token=auth_token, transport=fake)
+        auth.token_expiry = datetime.now() + timedelta(minutes=10)
+
+        assert auth.refresh() == auth.refresh_retry_interval
+        assert auth.token == auth_token
+
+
+def _run_threads(count, target):
+    """Run ``target`` on ``count`` threads started together; return results or exceptions."""
+    barrier = threading.Barrier(count)
+    results = [None] * count
+
+    def worker(index):
+        barrier.wait()
+        try:
+            results[index] = target()
+        except Exception as e:
+            results[index] = e
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+class TestSingleFlightRefresh:
+    """Tests for sharing one token validation between concurrent callers."""
+
+    def make_auth(self, handler):
+        """Build an authenticator with an expiring token and a slow validation."""
+        fake = FakeTransport()
+        fake.add_route("Auth/validate", handler)
+        auth = Authenticator("https://test-api.example.com", token="stale", transport=fake)
+        auth.token_expiry = datetime.now() + timedelta(minutes=5)
+        return auth, fake
+
+    def test_one_validation_without_renewal(self):
+        """Test that callers share a validation even when it does not renew the token."""
+
+        def validate(request):
+            time.sleep(0.05)
+            return {"success": True, "errorCode": 0, "errorMessage": None}
+
+        auth, fake = self.make_auth(validate)
+
+        tokens = _run_threads(16, auth.get_token)
+
+        assert tokens == ["stale"] * 16
+        assert len(fake.requests) == 1
+        stats = auth.stats()
+        assert stats["refreshes"] == 1
+        assert stats["waits"] == 15
+        assert 0 < stats["max_wait_time"] <= stats["wait_time"]
+        assert stats["in_flight"] is False
+
+    def test_failure_is_shared(self):
+        """Test that callers waiting for a failed validation get its error."""
+
+        def validate(request):
+            time.sleep(0.05)
+            return {"success": False, "errorCode": 3, "errorMessage": "Invalid token"}
+
+        auth, fake = self.make_auth(validate)
+
+        errors = _run_threads(8, auth.get_token)
+
+        assert all(isinstance(error, AuthenticationError) for error in errors)
+        assert len(fake.requests) == 1
+        assert auth.stats()["failed_refreshes"] == 1
+
+    def test_wait_is_bounded_by_deadline(self):
+        """Test that a caller stops waiting for another's validation at its deadline."""
+        release = threading.Event()
+
+        def validate(request):
+            release.wait(5)
+            return {"success": True, "errorCode": 0, "errorMessage": None, "newToken": "fresh"}
+
+        auth, _ = self.make_auth(validate)
+        leader = threading.Thread(target=auth.get_token)
+        leader.start()
+        while not auth.stats()["in_flight"]:
+            time.sleep(0.001)
+
+        with pytest.raises(DeadlineExceededError):
+            auth.get_token(deadline=Deadline(0.05))
+
+        release.set()
+        leader.join()
+        assert auth.get_token() == "fresh"
+
+
+def _jwt(**claims):
+    """Build an unsigned JWT carrying the given claims."""
+
+    def encode(data):
+        return base64.urlsafe_b64encode(json.dumps(data).encode()).rstrip(b"=").decode()
+
+    return f"{encode({'alg': 'HS256', 'typ': 'JWT'})}.{encode(claims)}.signature"
+
+
+class TestTokenExpiry:
+    """Tests for taking the token's lifetime from its expiry claim."""
+
+    def test_decode_claims(self, auth_token):
+        """Test decoding the claims of a token."""
+        assert decode_jwt_claims(auth_token)["name"] == "Test User"
+        assert decode_jwt_claims("not-a-jwt") == {}
+        assert decode_jwt_claims("a.!!!.c") == {}
+        assert token_ttl(auth_token) is None
+
+    def test_issued_token_lifetime(self):
+        """Test that a newly issued token lives for exp - iat, whatever the local clock says."""
+        # Issued two hours apart, long ago: only the difference matters
+        token = _jwt(iat=1_000_000_000, exp=1_000_007_200)
+        fake = FakeTransport()
+        fake.add_route(
+            "Auth/loginKey",
+            {"token": token, "success": True, "errorCode": 0, "errorMessage": None},
+        )
+
+        auth = Authenticator("https://test-api.example.com", "user", "key", transport=fake)
+
+        assert auth.expires_in() == pytest.approx(7200, abs=1)
+        assert auth.is_authenticated()
+        assert not auth.needs_refresh()
+
+    def test_short_lived_token_is_not_renewed_on_every_call(self):
+        """Test that a 30 minute token is only renewed in the second half of its life."""
+        now = int(time.time())
+        fake = _renewing_transport(_jwt(iat=now, exp=now + 1800))
+        fake.add_route(
+            "Auth/loginKey",
+            {"token": _jwt(iat=now, exp=now + 1800), "success": True, "errorCode": 0},
+        )
+        auth = Authenticator("https://test-api.example.com", "user", "key", transport=fake)
+
+        for _ in range(5):
+            auth.get_token()
+        assert [r.path for r in fake.requests] == ["Auth/loginKey"]
+
+        auth.token_expiry = datetime.now() + timedelta(minutes=14)
+        auth.get_token()
+        assert [r.path for r in fake.requests][-1] == "Auth/validate"
+
+    def test_short_lived_token_refresh_delay(self):
+        """Test that background renewal of a one hour token is not due at once."""
+        now = int(time.time())
+        auth = Authenticator("https://test-api.example.com", token=_jwt(iat=now, exp=now + 3600))
+
+        assert issued_lifetime(auth.token) == 3600
+        assert auth.refresh_delay(rng=lambda: 0.0) == pytest.approx(1800, abs=2)
+        assert auth.refresh_delay(rng=lambda: 0.999) == pytest.approx(1200, abs=2)
+
+        # Without an issue time the lifetime is unknown and the windows apply as configured
+        assert issued_lifetime(_jwt(exp=now + 3600)) is None
+
+    def test_existing_token_expiry(self):
+        """Test that a token passed in expires at its exp claim."""
+        token = _jwt(exp=time.time() + 600)
+        auth = Authenticator("https://test-api.example.com", token=token)
+
+        assert auth.expires_in() == pytest.approx(600, abs=1)
+        assert auth.needs_refresh()
+
+        expired = Authenticator("https://test-api.example.com", token=_jwt(exp=time.time() - 60))
+        assert not expired.is_authenticated()
+
+    def test_wall_clock_jumps_are_ignored(self, monkeypatch):
+        """Test that the expiry is tracked on the monotonic clock."""
+        token = _jwt(exp=time.time() + 7200)
+        auth = Authenticator("https://test-api.example.com", token=token)
+
+        wall_clock = time.time()
+        monkeypatch.setattr(time, "time", lambda: wall_clock + 86400)
+
+        assert auth.is_authenticated()
+        assert auth.expires_in() == pytest.approx(7200, abs=1)
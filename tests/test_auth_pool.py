@@ -0,0 +1,206 @@
+"""Tests for authenticating many users with a shared refresh scheduler."""
+
+import threading
+import time
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+
+from projectx_sdk.auth_pool import AuthPool, TimerWheel
+from projectx_sdk.exceptions import AuthenticationError
+from projectx_sdk.token_cache import TokenCache
+from projectx_sdk.transport import FakeTransport
+
+BASE_URL = "https://api.example.com"
+SUCCESS = {"success": True, "errorCode": 0, "errorMessage": None}
+
+
+def make_fake(delay=0.0):
+    """Build a transport issuing a token per user and renewing it on validation."""
+    fake = FakeTransport()
+    lock = threading.Lock()
+    fake.running = []
+    fake.peak = 0
+    fake.renewed = []
+
+    @fake.route("Auth/loginKey")
+    def login(request):
+        username = request.json["userName"]
+        with lock:
+            fake.running.append(username)
+            fake.peak = max(fake.peak, len(fake.running))
+        time.sleep(delay)
+        with lock:
+            fake.running.remove(username)
+        if username == "locked":
+            return {"success": False, "errorCode": 3, "errorMessage": "Account locked"}
+        return {"token": f"token-{username}", **SUCCESS}
+
+    @fake.route("Auth/validate")
+    def validate(request):
+        token = request.headers["Authorization"].split()[-1]
+        fake.renewed.append(time.perf_counter())
+        return {"newToken": f"{token}-renewed", **SUCCESS}
+
+    fake.add_route("Order/searchOpen", {"orders": [], **SUCCESS})
+    return fake
+
+
+def credentials(*usernames):
+    """Build API key credentials for the given users."""
+    return [{"username": username, "api_key": "key"} for username in usernames]
+
+
+class TestTimerWheel:
+    """Tests for the TimerWheel class."""
+
+    def test_items_fire_on_their_tick(self):
+        """Test that items come due after their delay, including past a full turn."""
+        wheel = TimerWheel(tick=1.0, slots=4)
+        wheel.schedule(2.0, "a")
+        wheel.schedule(1.5, "b")
+        wheel.schedule(10.0, "c")
+
+        fired = [wheel.advance() for _ in range(10)]
+
+        assert fired[1] == ["a", "b"]
+        assert fired[9] == ["c"]
+        assert sum(len(items) for items in fired) == 3
+        assert len(wheel) == 0
+
+    def test_spreading(self):
+        """Test that items due on a full tick move to the nearest earlier tick with room."""
+        wheel = TimerWheel(tick=1.0, slots=16, max_per_tick=1)
+
+        delays = [wheel.schedule(5.0, item) for item in "abcdef"]
+
+        assert delays == [5.0, 4.0, 3.0, 2.0, 1.0, 6.0]
+        assert [wheel.advance() for _ in range(6)] == [["e"], ["d"], ["c"], ["b"], ["a"], ["f"]]
+
+    def test_invalid_settings(self):
+        """Test that invalid settings are rejected."""
+        with pytest.raises(ValueError):
+            TimerWheel(tick=0)
+        with pytest.raises(ValueError):
+            TimerWheel(max_per_tick=0)
+
+
+class TestAuthPool:
+    """Tests for the AuthPool class."""
+
+    def test_concurrent_login(self):
+        """Test that users log in concurrently, at most max_concurrency at once."""
+        fake = make_fake(delay=0.05)
+        users = [f"user{i}" for i in range(12)]
+        pool = AuthPool(
+            credentials(*users, "locked"), base_url=BASE_URL, transport=fake, max_concurrency=4
+        )
+
+        started = time.perf_counter()
+        errors = pool.login()
+
+        assert time.perf_counter() - started < 12 * 0.05
+        assert fake.peak == 4
+        assert list(errors) == ["locked"]
+        assert pool.auth("user3").token == "token-user3"
+        with pytest.raises(AuthenticationError):
+            pool.auth("locked")
+        with pytest.raises(KeyError):
+            pool.auth("unknown")
+        assert pool.stats()["logged_in"] == 12
+        assert pool.stats()["login_failures"] == 1
+
+    def test_concurrent_login_through_token_cache(self, tmp_path):
+        """Test that logins sharing a token cache still run concurrently."""
+        fake = make_fake(delay=0.1)
+        users = [f"user{i}" for i in range(8)]
+        cache = TokenCache(str(tmp_path / "tokens.json"))
+        pool = AuthPool(
+            credentials(*users),
+            base_url=BASE_URL,
+            transport=fake,
+            max_concurrency=8,
+            token_cache=cache,
+        )
+
+        started = time.perf_counter()
+        pool.login()
+
+        assert time.perf_counter() - started < 4 * 0.1
+        assert fake.peak > 1
+        assert cache.get(BASE_URL, "user5")[0] == "token-user5"
+
+    def test_clients_share_the_transport(self):
+        """Test that per-user clients send their own token over the shared transport."""
+        fake = make_fake()
+        pool = AuthPool(credentials("alice", "bob"), base_url=BASE_URL, transport=fake)
+        pool.login()
+
+        alice, bob = pool.client("alice"), pool.client("bob")
+        alice.orders.search_open(1)
+        bob.orders.search_open(2)
+
+        assert pool.client("alice") is alice
+        assert alice.transport is bob.transport is fake
+        searches = [r for r in fake.requests if r.path == "Order/searchOpen"]
+        assert [r.headers["Authorization"] for r in searches] == [
+            "Bearer token-alice",
+            "Bearer token-bob",
+        ]
+        # Only logins were needed; clients do not authenticate themselves
+        assert [r.path for r in fake.requests].count("Auth/loginKey") == 2
+
+        # Closing a client leaves renewals to the pool
+        alice.close()
+        assert pool.auth("alice").background_refresh
+
+        # The transport was passed in, so the pool leaves it open
+        fake.close = MagicMock()
+        pool.close()
+        fake.close.assert_not_called()
+
+    def test_closing_a_client_keeps_the_pool_open(self, local_http_server):
+        """Test that closing one user's client leaves the shared connections to the others."""
+        pool = AuthPool(credentials("alice", "bob"), base_url=local_http_server)
+        pool.login()
+        alice, bob = pool.client("alice"), pool.client("bob")
+        bob.orders.search_open(2)
+        before = pool.transport.stats()
+
+        alice.close()
+        bob.orders.search_open(2)
+
+        after = pool.transport.stats()
+        assert after["new_connections"] == before["new_connections"]
+        assert after["hits"] == before["hits"] + 1
+        pool.close()
+
+    def test_scheduler_spreads_renewals(self):
+        """Test that tokens due together are renewed on separate ticks by one thread."""
+        fake = make_fake()
+        pool = AuthPool(
+            credentials("a", "b", "c", "d"),
+            base_url=BASE_URL,
+            transport=fake,
+            tick=0.02,
+            max_refreshes_per_tick=1,
+        )
+        pool.login()
+        for auth in pool.auths.values():
+            auth.refresh_jitter = 0.0
+            auth.token_expiry = datetime.now() + timedelta(seconds=auth.refresh_ahead + 0.1)
+
+        with pool:
+            deadline = time.monotonic() + 5
+            while len(fake.renewed) < 4 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            time.sleep(0.05)
+            stats = pool.stats()
+
+        assert pool.auth("c").token == "token-c-renewed"
+        assert stats["refreshes"] == 4
+        # Each renewed token was scheduled again, about a day out
+        assert stats["scheduled"] == 4
+        # One renewal per tick rather than all four at once
+        assert fake.renewed[-1] - fake.renewed[0] >= 0.04
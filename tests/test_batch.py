@@ -0,0 +1,137 @@
+"""Tests for batches of concurrent service calls."""
+
+import threading
+import time
+
+import pytest
+
+from projectx_sdk import ProjectXClient
+from projectx_sdk.batch import Batch
+from projectx_sdk.exceptions import ProjectXError
+from projectx_sdk.tracing import InMemorySpanExporter, Tracer
+from projectx_sdk.transport import FakeTransport
+
+SUCCESS = {"success": True, "errorCode": 0, "errorMessage": None}
+
+
+def make_client(**kwargs):
+    """Build a client answering position and order searches per account."""
+    fake = FakeTransport()
+
+    @fake.route("Position/searchOpen")
+    def positions(request):
+        account_id = request.json["accountId"]
+        if account_id == 13:
+            return {"success": False, "errorCode": 1, "errorMessage": "Unknown account"}
+        return {
+            "positions": [
+                {
+                    "id": account_id,
+                    "accountId": account_id,
+                    "contractId": "CON.F.US.ENQ.H25",
+                    "creationTimestamp": "2025-01-01T00:00:00+00:00",
+                    "type": 1,
+                    "size": 1,
+                    "averagePrice": 21000.0,
+                }
+            ],
+            **SUCCESS,
+        }
+
+    fake.add_route("Order/searchOpen", {"orders": [], **SUCCESS})
+    return ProjectXClient(token="test-token", transport=fake, **kwargs)
+
+
+class TestBatch:
+    """Tests for the Batch class."""
+
+    def test_service_calls_in_order(self):
+        """Test that results come back in submission order."""
+        client = make_client()
+
+        with client.batch(max_concurrency=4) as batch:
+            for account_id in range(1, 13):
+                batch.positions.search_open(account_id)
+                batch.orders.search_open(account_id)
+
+        results = batch.results()
+        assert len(results) == 24
+        assert [r.value[0].account_id for r in results[::2]] == list(range(1, 13))
+        assert all(r.value == [] for r in results[1::2])
+
+    def test_errors_are_captured(self):
+        """Test that a failing call does not abort the others."""
+        client = make_client()
+
+        with client.batch() as batch:
+            for account_id in (12, 13, 14):
+                batch.positions.search_open(account_id)
+
+        results = batch.results()
+        assert [r.ok for r in results] == [True, False, True]
+        assert isinstance(results[1].error, ProjectXError)
+        with pytest.raises(ProjectXError):
+            batch.values()
+
+        stats = batch.stats()
+        assert stats["calls"] == 3
+        assert stats["succeeded"] == 2
+        assert stats["failed"] == 1
+
+    def test_futures(self):
+        """Test that submitting returns a future of the call."""
+        with Batch() as batch:
+            future = batch.submit(lambda a, b=0: a + b, 2, b=3)
+            failed = batch.submit(lambda: 1 / 0)
+
+            assert future.result(timeout=5) == 5
+            with pytest.raises(ZeroDivisionError):
+                failed.result(timeout=5)
+
+    def test_concurrency_is_bounded(self):
+        """Test that at most max_concurrency calls run at once."""
+        lock = threading.Lock()
+        running = []
+        peak = []
+
+        def call():
+            with lock:
+                running.append(1)
+                peak.append(len(running))
+            time.sleep(0.01)
+            with lock:
+                running.pop()
+
+        with Batch(max_concurrency=3) as batch:
+            for _ in range(12):
+                batch.submit(call)
+
+        assert max(peak) == 3
+        stats = batch.stats()
+        assert stats["wall_time"] < stats["call_time"]
+        assert stats["max_call_time"] >= 0.01
+
+    def test_finished_batch(self):
+        """Test that a finished batch accepts no more calls."""
+        batch = Batch()
+        batch.submit(lambda: None)
+        batch.wait()
+
+        with pytest.raises(RuntimeError):
+            batch.submit(lambda: None)
+        with pytest.raises(ValueError):
+            Batch(max_concurrency=0)
+
+    def test_calls_join_the_callers_trace(self):
+        """Test that calls run in the caller's tracing context."""
+        exporter = InMemorySpanExporter()
+        tracer = Tracer(exporter, sample_rates={})
+        client = make_client(tracer=tracer)
+
+        with tracer.start_span("reconcile") as root:
+            with client.batch() as batch:
+                batch.orders.search_open(1)
+                batch.orders.search_open(2)
+
+        requests = [span for span in exporter.spans if span.name == "POST Order/searchOpen"]
+        assert [span.parent_id for span in requests] == [root.span_id, root.span_id]
@@ -0,0 +1,202 @@
+"""Tests for the TTL + LRU response cache."""
+
+import asyncio
+
+import pytest
+
+from projectx_sdk import AsyncProjectXClient, ProjectXClient
+from projectx_sdk.cache import ResponseCache
+from projectx_sdk.realtime import RealTimeClient
+from projectx_sdk.transport import AsyncFakeTransport, FakeTransport
+
+SUCCESS = {"success": True, "errorCode": 0, "errorMessage": None}
+CONTRACTS = {
+    "contracts": [
+        {
+            "id": "CON.F.US.ENQ.H25",
+            "name": "ENQH25",
+            "description": "E-mini NASDAQ-100: March 2025",
+            "tickSize": 0.25,
+            "tickValue": 5,
+            "activeContract": True,
+        }
+    ],
+    **SUCCESS,
+}
+ACCOUNTS = {"accounts": [{"id": 1, "name": "Main", "canTrade": True}], **SUCCESS}
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        """Start the clock at zero."""
+        self.now = 0.0
+
+    def __call__(self):
+        """Return the current time."""
+        return self.now
+
+
+def api_calls(fake, path):
+    """Count the requests the fake received for a path."""
+    return sum(1 for request in fake.requests if request.path == path)
+
+
+@pytest.fixture
+def clock():
+    """Provide a fake clock."""
+    return FakeClock()
+
+
+@pytest.fixture
+def fake():
+    """Provide a fake transport serving reference data."""
+    return FakeTransport(
+        routes={
+            "Contract/search": CONTRACTS,
+            "Contract/searchById": {"contract": CONTRACTS["contracts"][0], **SUCCESS},
+            "Account/search": ACCOUNTS,
+            "Position/searchOpen": {"positions": [], **SUCCESS},
+        }
+    )
+
+
+class TestResponseCache:
+    """Tests for the ResponseCache class."""
+
+    def test_ttl_lookup(self):
+        """Test exact, pattern and uncached endpoints."""
+        cache = ResponseCache(ttls={"History/*": 5.0, "Account/search": 0})
+        assert cache.ttl_for("Contract/searchById") == 3600.0
+        assert cache.ttl_for("History/retrieveBars") == 5.0
+        assert cache.ttl_for("Account/search") is None
+        assert cache.ttl_for("Order/place") is None
+
+    def test_expiry(self, clock):
+        """Test that entries expire after their TTL."""
+        cache = ResponseCache(ttls={"Contract/search": 10.0}, clock=clock)
+        cache.set("k", "Contract/search", "value")
+
+        clock.now = 9.9
+        assert cache.get("k") == (True, "value")
+        clock.now = 10.0
+        assert cache.get("k") == (False, None)
+        assert cache.stats()["expirations"] == 1
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted."""
+        cache = ResponseCache(max_entries=2)
+        cache.set("a", "Contract/search", 1)
+        cache.set("b", "Contract/search", 2)
+        cache.get("a")
+        cache.set("c", "Contract/search", 3)
+
+        assert cache.get("b") == (False, None)
+        assert cache.get("a") == (True, 1)
+        assert len(cache) == 2
+        assert cache.stats()["evictions"] == 1
+
+    def test_invalidate(self):
+        """Test pattern invalidation."""
+        cache = ResponseCache()
+        cache.set("a", "Contract/search", 1)
+        cache.set("b", "Account/search", 2)
+
+        assert cache.invalidate("Account/*") == 1
+        assert cache.get("a") == (True, 1)
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.stats()["invalidations"] == 2
+
+    def test_invalid_size(self):
+        """Test that the cache needs room for one entry."""
+        with pytest.raises(ValueError):
+            ResponseCache(max_entries=0)
+
+
+class TestClientCaching:
+    """Tests for caching in ProjectXClient.request."""
+
+    def test_reference_data_is_cached(self, fake):
+        """Test that repeated contract searches hit the cache."""
+        client = ProjectXClient(token="test-token", transport=fake, cache=True)
+
+        first = client.contracts.search("NQ")
+        second = client.contracts.search("NQ")
+        client.contracts.search("ES")
+
+        assert first == second
+        assert api_calls(fake, "Contract/search") == 2
+        stats = client.cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 2
+
+    def test_expired_entries_are_refetched(self, fake, clock):
+        """Test that an expired response goes back to the network."""
+        cache = ResponseCache(clock=clock)
+        client = ProjectXClient(token="test-token", transport=fake, cache=cache)
+
+        client.contracts.search_by_id("CON.F.US.ENQ.H25")
+        clock.now = 3600.0
+        client.contracts.search_by_id("CON.F.US.ENQ.H25")
+
+        assert api_calls(fake, "Contract/searchById") == 2
+
+    def test_trading_data_is_not_cached(self, fake):
+        """Test that endpoints without a TTL always reach the network."""
+        client = ProjectXClient(token="test-token", transport=fake, cache=True)
+
+        client.positions.search_open(1)
+        client.positions.search_open(1)
+
+        assert api_calls(fake, "Position/searchOpen") == 2
+        assert len(client.cache) == 0
+
+    def test_disabled_by_default(self, fake):
+        """Test that caching is opt-in."""
+        client = ProjectXClient(token="test-token", transport=fake)
+
+        client.accounts.search()
+        client.accounts.search()
+
+        assert client.cache is None
+        assert api_calls(fake, "Account/search") == 2
+
+    def test_async_client(self, fake):
+        """Test that the async client shares the same cache behaviour."""
+        client = AsyncProjectXClient(
+            token="test-token", transport=AsyncFakeTransport(fake), cache=True
+        )
+
+        async def run():
+            await client.accounts.search()
+            return await client.accounts.search()
+
+        accounts = asyncio.run(run())
+
+        assert accounts[0].name == "Main"
+        assert api_calls(fake, "Account/search") == 1
+
+
+class TestEventInvalidation:
+    """Tests for invalidation by user hub events."""
+
+    def test_account_event_invalidates_accounts(self, fake):
+        """Test that a GatewayUserAccount event drops cached account searches."""
+        client = ProjectXClient(token="test-token", transport=fake, cache=True)
+        client.accounts.search()
+        client.contracts.search("NQ")
+
+        realtime = RealTimeClient(
+            auth_token="test-token",
+            environment="demo",
+            on_account_update=client.cache.on_account_update,
+        )
+        realtime.user._handle_account_update([{"id": 1, "name": "Main", "balance": 1000}])
+
+        client.accounts.search()
+        client.contracts.search("NQ")
+
+        assert api_calls(fake, "Account/search") == 2
+        assert api_calls(fake, "Contract/search") == 1
@@ -0,0 +1,302 @@
+"""Tests for the per-endpoint-family circuit breaker."""
+
+import asyncio
+
+import pytest
+import requests
+
+from projectx_sdk import AsyncProjectXClient, CircuitOpenError, ProjectXClient
+from projectx_sdk.circuit import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+from projectx_sdk.exceptions import AuthenticationError, ProjectXError, RateLimitError, RequestError
+from projectx_sdk.ratelimit import RateLimiter
+from projectx_sdk.transport import AsyncFakeTransport, FakeTransport
+
+SUCCESS = {"success": True, "errorCode": 0, "errorMessage": None}
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        """Start the clock at zero."""
+        self.now = 0.0
+
+    def __call__(self):
+        """Return the current time."""
+        return self.now
+
+
+class Gateway:
+    """Fake gateway handler that can be switched between healthy and failing."""
+
+    def __init__(self, payload, clock=None):
+        """Start healthy."""
+        self.payload = payload
+        self.clock = clock
+        self.failing = False
+        self.latency = 0.0
+        self.calls = 0
+
+    def __call__(self, request):
+        """Answer a request."""
+        self.calls += 1
+        if self.clock is not None:
+            self.clock.now += self.latency
+        if self.failing:
+            return 503, {"errorMessage": "unavailable"}
+        return self.payload
+
+
+@pytest.fixture
+def clock():
+    """Provide a fake clock."""
+    return FakeClock()
+
+
+@pytest.fixture
+def transitions():
+    """Collect reported state transitions."""
+    return []
+
+
+@pytest.fixture
+def breaker(clock, transitions):
+    """Provide a small, fast-tripping breaker."""
+    return CircuitBreaker(
+        window=4,
+        min_calls=4,
+        error_rate=0.5,
+        reset_timeout=10.0,
+        on_state_change=lambda *t: transitions.append(t),
+        clock=clock,
+    )
+
+
+def make_client(breaker, **routes):
+    """Build a client whose failures are not retried."""
+    fake = FakeTransport(routes=routes)
+    client = ProjectXClient(
+        token="test-token", transport=fake, retry_policy=False, circuit_breaker=breaker
+    )
+    return client, fake
+
+
+def fail(client, path, times):
+    """Make failing calls, swallowing the errors."""
+    for _ in range(times):
+        with pytest.raises(RequestError):
+            client.post(path, json={})
+
+
+class TestCircuitBreaker:
+    """Tests for the CircuitBreaker class."""
+
+    def test_failure_classification(self):
+        """Test which errors count against the circuit."""
+        network = RequestError("Request failed")
+        network.__cause__ = requests.ConnectionError("reset")
+
+        assert CircuitBreaker.is_failure(network)
+        assert CircuitBreaker.is_failure(RequestError("bad gateway", error_code=502))
+        assert not CircuitBreaker.is_failure(RequestError("bad request", error_code=400))
+        assert not CircuitBreaker.is_failure(ProjectXError("API error", error_code=2))
+        assert not CircuitBreaker.is_failure(None)
+
+    def test_bypass(self):
+        """Test the default bypass endpoints."""
+        breaker = CircuitBreaker()
+        assert breaker.is_bypassed("Order/cancel")
+        assert breaker.is_bypassed("Position/closeContract")
+        assert breaker.is_bypassed("Position/partialCloseContract")
+        assert not breaker.is_bypassed("Order/place")
+
+    def test_invalid_configuration(self):
+        """Test that min_calls must fit in the window."""
+        with pytest.raises(ValueError):
+            CircuitBreaker(window=5, min_calls=10)
+
+
+class TestClientCircuit:
+    """Tests for the breaker in ProjectXClient requests."""
+
+    def test_opens_on_error_rate(self, breaker, transitions):
+        """Test that the circuit opens and then fails fast."""
+        gateway = Gateway({"bars": [], **SUCCESS})
+        gateway.failing = True
+        client, fake = make_client(breaker)
+        fake.add_route("History/retrieveBars", gateway)
+
+        fail(client, "History/retrieveBars", 4)
+        with pytest.raises(CircuitOpenError) as exc_info:
+            client.post("History/retrieveBars", json={})
+
+        assert gateway.calls == 4
+        assert exc_info.value.family == "History"
+        assert exc_info.value.retry_after == pytest.approx(10.0)
+        assert transitions == [("History", CLOSED, OPEN)]
+        assert breaker.stats()["History"]["rejected"] == 1
+
+    def test_families_are_independent(self, breaker):
+        """Test that an open History circuit does not block orders."""
+        gateway = Gateway({"bars": [], **SUCCESS})
+        gateway.failing = True
+        client, fake = make_client(breaker, **{"Order/searchOpen": {"orders": [], **SUCCESS}})
+        fake.add_route("History/retrieveBars", gateway)
+
+        fail(client, "History/retrieveBars", 4)
+
+        assert breaker.state("History") == OPEN
+        assert client.orders.search_open(1) == []
+
+    def test_half_open_probe_closes(self, breaker, clock, transitions):
+        """Test recovery through a successful probe."""
+        gateway = Gateway({"bars": [], **SUCCESS})
+        gateway.failing = True
+        client, fake = make_client(breaker)
+        fake.add_route("History/retrieveBars", gateway)
+
+        fail(client, "History/retrieveBars", 4)
+        clock.now = 10.0
+        gateway.failing = False
+        client.post("History/retrieveBars", json={})
+
+        assert breaker.state("History") == CLOSED
+        assert transitions == [
+            ("History", CLOSED, OPEN),
+            ("History", OPEN, HALF_OPEN),
+            ("History", HALF_OPEN, CLOSED),
+        ]
+
+    def test_half_open_probe_failure_reopens(self, breaker, clock):
+        """Test that a failed probe opens the circuit again."""
+        gateway = Gateway({"bars": [], **SUCCESS})
+        gateway.failing = True
+        client, fake = make_client(breaker)
+        fake.add_route("History/retrieveBars", gateway)
+
+        fail(client, "History/retrieveBars", 4)
+        clock.now = 10.0
+        fail(client, "History/retrieveBars", 1)
+
+        assert breaker.state("History") == OPEN
+        with pytest.raises(CircuitOpenError):
+            client.post("History/retrieveBars", json={})
+
+    def test_probe_failing_in_token_refresh(self, breaker, clock, transitions):
+        """Test that a probe failing before reaching the gateway does not close the circuit."""
+        gateway = Gateway({"bars": [], **SUCCESS})
+        gateway.failing = True
+        client, fake = make_client(breaker)
+        fake.add_route("History/retrieveBars", gateway)
+        fail(client, "History/retrieveBars", 4)
+
+        fake.add_route("Auth/validate", {"success": False, "errorCode": 1, "errorMessage": "no"})
+        client.auth.token_expiry = None
+        clock.now = 10.0
+        with pytest.raises(AuthenticationError):
+            client.post("History/retrieveBars", json={})
+
+        assert breaker.state("History") == OPEN
+        assert gateway.calls == 4
+        assert transitions == [("History", CLOSED, OPEN)]
+
+    def test_probe_failing_in_rate_limiter(self, breaker, clock, transitions):
+        """Test that a probe rejected by the client's rate limiter is not a success."""
+        gateway = Gateway({"bars": [], **SUCCESS})
+        gateway.failing = True
+        limiter = RateLimiter(rates={"History": (0.01, 5)}, max_wait=0.0, clock=clock)
+        fake = FakeTransport(routes={"History/retrieveBars": gateway})
+        client = ProjectXClient(
+            token="test-token",
+            transport=fake,
+            retry_policy=False,
+            circuit_breaker=breaker,
+            rate_limiter=limiter,
+        )
+        fail(client, "History/retrieveBars", 4)
+        limiter.reserve("History/retrieveBars")
+
+        clock.now = 10.0
+        with pytest.raises(RateLimitError):
+            client.post("History/retrieveBars", json={})
+
+        assert breaker.state("History") == OPEN
+        assert gateway.calls == 4
+
+        # The next admitted probe reaches the gateway and decides the outcome
+        clock.now = 500.0
+        gateway.failing = False
+        client.post("History/retrieveBars", json={})
+        assert breaker.state("History") == CLOSED
+
+    def test_opens_on_latency(self, clock):
+        """Test that slow calls open the circuit."""
+        breaker = CircuitBreaker(
+            window=4, min_calls=4, slow_call_duration=2.0, slow_call_rate=0.5, clock=clock
+        )
+        gateway = Gateway({"orders": [], **SUCCESS}, clock=clock)
+        gateway.latency = 3.0
+        client, fake = make_client(breaker)
+        fake.add_route("Order/searchOpen", gateway)
+
+        for _ in range(4):
+            client.orders.search_open(1)
+
+        assert breaker.state("Order") == OPEN
+        assert breaker.stats()["Order"]["slow_calls"] == 0  # window reset on opening
+
+    def test_business_errors_do_not_trip(self, breaker):
+        """Test that success=false responses leave the circuit closed."""
+        client, fake = make_client(
+            breaker,
+            **{"Order/searchOpen": {"success": False, "errorCode": 1, "errorMessage": "bad"}},
+        )
+
+        for _ in range(6):
+            with pytest.raises(ProjectXError):
+                client.orders.search_open(1)
+
+        assert breaker.state("Order") == CLOSED
+
+    def test_cancel_bypasses_open_circuit(self, breaker):
+        """Test that order cancels are sent while the Order circuit is open."""
+        gateway = Gateway({"orders": [], **SUCCESS})
+        gateway.failing = True
+        client, fake = make_client(breaker, **{"Order/cancel": SUCCESS})
+        fake.add_route("Order/searchOpen", gateway)
+
+        fail(client, "Order/searchOpen", 4)
+
+        assert breaker.state("Order") == OPEN
+        assert client.orders.cancel(1, 42) is True
+
+    def test_async_client(self, breaker):
+        """Test that the async client fails fast too."""
+        gateway = Gateway({"bars": [], **SUCCESS})
+        gateway.failing = True
+        fake = FakeTransport(routes={"History/retrieveBars": gateway})
+        client = AsyncProjectXClient(
+            token="test-token",
+            transport=AsyncFakeTransport(fake),
+            retry_policy=False,
+            circuit_breaker=breaker,
+        )
+
+        async def run():
+            errors = []
+            for _ in range(5):
+                try:
+                    await client.post("History/retrieveBars", json={})
+                except ProjectXError as e:
+                    errors.append(type(e))
+            return errors
+
+        errors = asyncio.run(run())
+
+        assert errors == [RequestError] * 4 + [CircuitOpenError]
+        assert gateway.calls == 4
+
+    def test_disabled_by_default(self):
+        """Test that the breaker is opt-in."""
+        client = ProjectXClient(token="test-token", transport=FakeTransport())
+        assert client.circuit_breaker is None
@@ -1,11 +1,21 @@
 """Tests for the ProjectXClient class."""
 
+import threading
+import time
+from datetime import datetime, timedelta
 from unittest.mock import patch
 
 import pytest
 
 from projectx_sdk import ProjectXClient
-from projectx_sdk.exceptions import AuthenticationError, ProjectXError, ResourceNotFoundError
+from projectx_sdk.exceptions import (
+    AuthenticationError,
+    ProjectXError,
+    RequestError,
+    ResourceNotFoundError,
+)
+from projectx_sdk.models import BarResponse, OrderPlacementResponse, TradeSearchResponse
+from projectx_sdk.transport import FakeTransport, TransportResponse
 
 
 class TestProjectXClient:
@@ -136,3 +146,172 @@ class TestProjectXClient:
         realtime = authenticated_client.realtime
         assert realtime is not None
         assert authenticated_client._realtime is realtime
+
+
+class TestResponseModelDecoding:
+    """Tests for validating response bodies directly into response models."""
+
+    @pytest.fixture
+    def fake_client(self):
+        """Client answering from an in-process fake transport."""
+        fake = FakeTransport()
+        return ProjectXClient(username="test_user", api_key="test_api_key", transport=fake), fake
+
+    def test_returns_model(self, fake_client):
+        """Test that a response model is returned instead of a dict."""
+        client, fake = fake_client
+        fake.add_route(
+            "History/retrieveBars",
+            {
+                "success": True,
+                "errorCode": 0,
+                "errorMessage": None,
+                "bars": [
+                    {"t": "2025-01-02T14:30:00+00:00", "o": 1, "h": 2, "l": 0.5, "c": 1.5, "v": 10}
+                ],
+            },
+        )
+
+        result = client.post("History/retrieveBars", json={}, response_model=BarResponse)
+
+        assert isinstance(result, BarResponse)
+        assert result.bars[0].close == 1.5
+        assert result.bars[0].volume == 10
+
+    def test_error_envelope(self, fake_client):
+        """Test that success=false envelopes still raise ProjectXError."""
+        client, fake = fake_client
+        fake.add_route(
+            "Trade/search",
+            {"success": False, "errorCode": 2, "errorMessage": "Account not found", "trades": []},
+        )
+
+        with pytest.raises(ProjectXError) as excinfo:
+            client.post("Trade/search", json={}, response_model=TradeSearchResponse)
+
+        assert excinfo.value.error_code == 2
+        assert "Account not found" in str(excinfo.value)
+
+    def test_error_envelope_rejected_by_model(self, fake_client):
+        """Test that error envelopes the model cannot validate map to ProjectXError."""
+        client, fake = fake_client
+        fake.add_route(
+            "Order/place",
+            {"success": False, "errorCode": 5, "errorMessage": "Rejected", "orderId": None},
+        )
+
+        with pytest.raises(ProjectXError) as excinfo:
+            client.post("Order/place", json={}, response_model=OrderPlacementResponse)
+
+        assert excinfo.value.error_code == 5
+
+    def test_invalid_json(self, fake_client):
+        """Test that a non-JSON body raises RequestError."""
+        client, fake = fake_client
+        fake.add_route("Trade/search", lambda request: TransportResponse(content=b"<html>"))
+
+        with pytest.raises(RequestError):
+            client.post("Trade/search", json={}, response_model=TradeSearchResponse)
+
+    def test_http_error(self, fake_client):
+        """Test that HTTP errors are raised before validation."""
+        client, fake = fake_client
+        fake.add_route("Trade/search", (500, {"errorMessage": "boom"}))
+
+        with pytest.raises(RequestError) as excinfo:
+            client.post("Trade/search", json={}, response_model=TradeSearchResponse)
+
+        assert excinfo.value.error_code == 500
+
+
+class TestThreadSafety:
+    """Stress tests for a client shared by many threads."""
+
+    THREADS = 16
+
+    def run_threads(self, target):
+        """Start THREADS threads running ``target`` together and collect their results."""
+        barrier = threading.Barrier(self.THREADS)
+        results = [None] * self.THREADS
+        errors = []
+
+        def worker(index):
+            barrier.wait()
+            try:
+                results[index] = target(index)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(self.THREADS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        return results
+
+    def test_token_is_refreshed_once(self):
+        """Test that threads finding an expiring token validate it only once."""
+        validations = []
+
+        def validate(request):
+            validations.append(request)
+            time.sleep(0.05)
+            return {"success": True, "errorCode": 0, "errorMessage": None, "newToken": "fresh"}
+
+        fake = FakeTransport(routes={"Auth/validate": validate})
+        client = ProjectXClient(token="stale", transport=fake)
+        client.auth.token_expiry = datetime.now() + timedelta(minutes=1)
+
+        tokens = self.run_threads(lambda index: client.auth.get_token())
+
+        assert len(validations) == 1
+        assert set(tokens) == {"fresh"}
+
+    def test_concurrent_requests(self):
+        """Test that concurrent calls each get their own response."""
+
+        def echo(request):
+            return {"success": True, "errorCode": 0, "errorMessage": None, **request.json}
+
+        fake = FakeTransport(routes={"Order/searchOpen": echo})
+        client = ProjectXClient(token="test-token", transport=fake, rate_limiter=False)
+
+        def call(index):
+            return [
+                client.post("Order/searchOpen", json={"accountId": index * 100 + i})
+                for i in range(50)
+            ]
+
+        results = self.run_threads(call)
+
+        for index, responses in enumerate(results):
+            assert [r["accountId"] for r in responses] == [index * 100 + i for i in range(50)]
+
+    def test_session_pool_under_load(self, local_gateway):
+        """Test that threads share the session pool's keep-alive connections."""
+        with ProjectXClient(
+            token="test-token", base_url=local_gateway.url, rate_limiter=False
+        ) as client:
+            self.run_threads(
+                lambda index: [client.post("Order/searchOpen", json={}) for _ in range(10)]
+            )
+            stats = client.transport.stats()
+
+        assert len(local_gateway.requests) == self.THREADS * 10
+        assert stats["hits"] > 0
+
+    def test_realtime_is_created_once(self):
+        """Test that threads racing on ``realtime`` share one instance."""
+        client = ProjectXClient(token="test-token", transport=FakeTransport())
+
+        def slow_client(**kwargs):
+            time.sleep(0.01)
+            return object()
+
+        with patch("projectx_sdk.client.SyncRealTimeClient", side_effect=slow_client) as factory:
+            instances = self.run_threads(lambda index: client.realtime)
+
+        assert factory.call_count == 1
+        assert len({id(instance) for instance in instances}) == 1
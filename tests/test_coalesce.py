@@ -0,0 +1,232 @@
+"""Tests for single-flight request coalescing."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from projectx_sdk import AsyncProjectXClient, ProjectXClient
+from projectx_sdk.coalesce import AsyncSingleFlight, SingleFlight, request_key
+from projectx_sdk.exceptions import RequestError
+from projectx_sdk.transport import AsyncFakeTransport, FakeTransport
+
+SUCCESS = {"success": True, "errorCode": 0, "errorMessage": None}
+POSITIONS = {"positions": [], **SUCCESS}
+
+
+def wait_for(condition, timeout=5.0):
+    """Poll until a condition holds."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not reached"
+        time.sleep(0.001)
+
+
+def gated(payload):
+    """Build a fake handler that blocks until its gate is opened."""
+    entered = threading.Event()
+    gate = threading.Event()
+
+    def handler(request):
+        entered.set()
+        assert gate.wait(5)
+        if isinstance(payload, Exception):
+            raise payload
+        return payload
+
+    handler.entered = entered
+    handler.gate = gate
+    return handler
+
+
+def api_calls(fake, path):
+    """Count the requests the fake received for a path."""
+    return sum(1 for request in fake.requests if request.path == path)
+
+
+class TestRequestKey:
+    """Tests for the request_key function."""
+
+    def test_body_order_does_not_matter(self):
+        """Test that equal JSON bodies give equal keys."""
+        a = request_key("post", "Order/searchOpen", body={"accountId": 1, "x": [1, 2]})
+        b = request_key("POST", "Order/searchOpen", body={"x": [1, 2], "accountId": 1})
+        assert a == b
+
+    def test_different_requests(self):
+        """Test that differing paths, bodies and variants give different keys."""
+        key = request_key("POST", "Order/searchOpen", body={"accountId": 1})
+        assert key != request_key("POST", "Order/searchOpen", body={"accountId": 2})
+        assert key != request_key("POST", "Position/searchOpen", body={"accountId": 1})
+        assert key != request_key("POST", "Order/searchOpen", body={"accountId": 1}, variant=dict)
+
+
+class TestSingleFlight:
+    """Tests for the SingleFlight class."""
+
+    def test_applies_to_read_only_endpoints(self):
+        """Test that only read-only endpoints are coalesced."""
+        flight = SingleFlight()
+        assert flight.applies_to("POST", "Position/searchOpen")
+        assert flight.applies_to("POST", "History/retrieveBars")
+        assert not flight.applies_to("POST", "Order/place")
+        assert not flight.applies_to("DELETE", "Order/search")
+
+    def test_sequential_calls_are_not_coalesced(self):
+        """Test that nothing is cached once a call completes."""
+        flight = SingleFlight()
+        assert flight.do("key", lambda: 1) == 1
+        assert flight.do("key", lambda: 2) == 2
+        assert flight.stats() == {"calls": 2, "executed": 2, "coalesced": 0, "in_flight": 0}
+
+
+class TestClientCoalescing:
+    """Tests for coalescing in ProjectXClient.request."""
+
+    def run_concurrently(self, client, fake, handler, callers, call):
+        """Start a leader and followers, then release the leader's request."""
+        results, errors = [], []
+
+        def worker():
+            try:
+                results.append(call())
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker) for _ in range(callers)]
+        threads[0].start()
+        assert handler.entered.wait(5)
+        for thread in threads[1:]:
+            thread.start()
+        wait_for(lambda: client.coalescer.stats()["calls"] == callers)
+
+        handler.gate.set()
+        for thread in threads:
+            thread.join(5)
+        return results, errors
+
+    def test_identical_reads_share_one_call(self):
+        """Test that concurrent identical reads make a single network call."""
+        handler = gated(POSITIONS)
+        fake = FakeTransport(routes={"Position/searchOpen": handler})
+        client = ProjectXClient(token="test-token", transport=fake, coalesce=True)
+
+        results, errors = self.run_concurrently(
+            client, fake, handler, 5, lambda: client.positions.search_open(1)
+        )
+
+        assert errors == []
+        assert len(results) == 5
+        assert api_calls(fake, "Position/searchOpen") == 1
+        assert all(result is results[0] for result in results)
+        assert client.coalescer.stats() == {
+            "calls": 5,
+            "executed": 1,
+            "coalesced": 4,
+            "in_flight": 0,
+        }
+
+    def test_followers_share_the_error(self):
+        """Test that a failing call fails every caller waiting on it."""
+        handler = gated((500, {"errorMessage": "boom"}))
+        fake = FakeTransport(routes={"Order/searchOpen": handler})
+        client = ProjectXClient(
+            token="test-token", transport=fake, coalesce=True, retry_policy=False
+        )
+
+        results, errors = self.run_concurrently(
+            client, fake, handler, 3, lambda: client.orders.search_open(1)
+        )
+
+        assert results == []
+        assert len(errors) == 3
+        assert all(isinstance(e, RequestError) for e in errors)
+        assert api_calls(fake, "Order/searchOpen") == 1
+
+    def test_mutations_are_not_coalesced(self):
+        """Test that write endpoints always reach the network."""
+        handler = gated({"orderId": 7, **SUCCESS})
+        handler.gate.set()
+        fake = FakeTransport(routes={"Order/place": handler})
+        client = ProjectXClient(token="test-token", transport=fake, coalesce=True)
+
+        threads = [
+            threading.Thread(target=lambda: client.post("Order/place", json={"accountId": 1}))
+            for _ in range(3)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+
+        assert api_calls(fake, "Order/place") == 3
+        assert client.coalescer.stats()["calls"] == 0
+
+    def test_disabled_by_default(self):
+        """Test that coalescing is opt-in."""
+        client = ProjectXClient(token="test-token", transport=FakeTransport())
+        assert client.coalescer is None
+
+    def test_custom_coalescer(self):
+        """Test passing a configured SingleFlight."""
+        flight = SingleFlight(endpoints=("History/*",))
+        client = ProjectXClient(token="test-token", transport=FakeTransport(), coalesce=flight)
+        assert client.coalescer is flight
+
+
+class SlowAsyncFakeTransport(AsyncFakeTransport):
+    """Async fake transport that yields to the event loop like a real socket."""
+
+    async def request(self, method, url, **kwargs):
+        """Answer the request after a short delay."""
+        await asyncio.sleep(0.01)
+        return await super().request(method, url, **kwargs)
+
+
+class TestAsyncCoalescing:
+    """Tests for coalescing in AsyncProjectXClient.request."""
+
+    def test_identical_reads_share_one_call(self):
+        """Test that concurrently awaited identical reads make a single call."""
+        fake = FakeTransport(routes={"Position/searchOpen": POSITIONS})
+        client = AsyncProjectXClient(
+            token="test-token", transport=SlowAsyncFakeTransport(fake), coalesce=True
+        )
+
+        async def run():
+            return await asyncio.gather(*(client.positions.search_open(1) for _ in range(4)))
+
+        results = asyncio.run(run())
+
+        assert len(results) == 4
+        assert api_calls(fake, "Position/searchOpen") == 1
+        assert client.coalescer.stats()["coalesced"] == 3
+
+    def test_followers_share_the_error(self):
+        """Test that an error reaches every awaiting caller."""
+        flight = AsyncSingleFlight()
+        calls = []
+
+        async def fail():
+            calls.append(1)
+            await asyncio.sleep(0)
+            raise RequestError("boom")
+
+        async def run():
+            return await asyncio.gather(
+                flight.do("key", fail), flight.do("key", fail), return_exceptions=True
+            )
+
+        results = asyncio.run(run())
+
+        assert len(calls) == 1
+        assert all(isinstance(result, RequestError) for result in results)
+        assert flight.stats()["in_flight"] == 0
+
+
+@pytest.mark.parametrize("coalesce", [False, None])
+def test_coalesce_off_values(coalesce):
+    """Test that False and None leave coalescing off."""
+    client = ProjectXClient(token="test-token", transport=FakeTransport(), coalesce=coalesce)
+    assert client.coalescer is None
@@ -0,0 +1,120 @@
+"""Tests for the pluggable JSON codecs."""
+
+import pytest
+from signalrcore.messages.invocation_message import InvocationMessage
+from signalrcore.messages.message_type import MessageType
+
+from projectx_sdk import ProjectXClient, codec
+from projectx_sdk.codec import JSONCodec, OrjsonCodec, get_codec
+from projectx_sdk.realtime.connection import CodecHubProtocol, SignalRConnection
+from projectx_sdk.transport import FakeTransport
+
+RS = chr(0x1E)
+
+CODEC_NAMES = ["json"] + [name for name in ("orjson", "msgspec") if getattr(codec, name)]
+
+
+class TestGetCodec:
+    """Tests for resolving codec settings."""
+
+    def test_default_is_stdlib(self):
+        """Test that no setting selects the stdlib codec."""
+        assert type(get_codec()) is JSONCodec
+
+    def test_instance_passthrough(self):
+        """Test that codec instances are used as-is."""
+        instance = JSONCodec()
+        assert get_codec(instance) is instance
+
+    def test_auto_picks_installed_codec(self):
+        """Test that 'auto' picks the fastest installed codec."""
+        expected = CODEC_NAMES[1] if len(CODEC_NAMES) > 1 else "json"
+        assert get_codec("auto").name == expected
+
+    def test_unknown_codec(self):
+        """Test that unknown codec names are rejected."""
+        with pytest.raises(ValueError):
+            get_codec("yaml")
+
+    def test_missing_codec_falls_back(self, monkeypatch, caplog):
+        """Test that a named codec that is not installed falls back to stdlib json."""
+        monkeypatch.setattr(codec, "orjson", None)
+        monkeypatch.setattr(codec, "msgspec", None)
+
+        assert type(get_codec("orjson")) is JSONCodec
+        assert type(get_codec("msgspec")) is JSONCodec
+        assert type(get_codec("auto")) is JSONCodec
+        assert "falling back" in caplog.text
+
+        with pytest.raises(ImportError):
+            OrjsonCodec()
+
+
+@pytest.mark.parametrize("name", CODEC_NAMES)
+class TestCodecs:
+    """Tests shared by every installed codec."""
+
+    def test_round_trip(self, name):
+        """Test encoding and decoding a payload."""
+        instance = get_codec(name)
+        payload = {"orderId": 1, "price": 21500.25, "tag": "é", "items": [None, True]}
+
+        encoded = instance.dumps(payload)
+
+        assert isinstance(encoded, bytes)
+        assert instance.loads(encoded) == payload
+        assert instance.loads(encoded.decode("utf-8")) == payload
+
+    def test_invalid_json_raises_value_error(self, name):
+        """Test that invalid documents raise ValueError."""
+        with pytest.raises(ValueError):
+            get_codec(name).loads(b"{not json")
+
+    def test_hub_protocol_round_trip(self, name):
+        """Test that hub frames are encoded and decoded with the codec."""
+        protocol = CodecHubProtocol(name)
+        message = InvocationMessage("1", "SubscribeContractQuotes", ["CON.F.US.ENQ.H25"])
+
+        encoded = protocol.encode(message)
+
+        assert encoded.endswith(RS)
+        assert '"invocationId"' in encoded
+        frame = (
+            '{"type":1,"target":"GatewayQuote","arguments":["CON.F.US.ENQ.H25",'
+            '{"lastPrice":21500.25}]}' + RS + '{"type":6}' + RS
+        )
+        messages = protocol.parse_messages(frame)
+
+        assert messages[0].type == MessageType.invocation
+        assert messages[0].target == "GatewayQuote"
+        assert messages[0].arguments[1]["lastPrice"] == 21500.25
+        assert messages[1].type == MessageType.ping
+
+    def test_client_uses_codec(self, name):
+        """Test that the client encodes bodies and decodes responses with its codec."""
+        fake = FakeTransport()
+        fake.add_route(
+            "Order/place", {"orderId": 7, "success": True, "errorCode": 0, "errorMessage": None}
+        )
+        client = ProjectXClient(username="u", api_key="k", transport=fake, codec=name)
+
+        response = client.post("Order/place", json={"accountId": 1, "size": 2})
+
+        assert client.codec.name == name
+        assert response["orderId"] == 7
+        request = fake.requests[-1]
+        assert isinstance(request.data, bytes)
+        assert request.json == {"accountId": 1, "size": 2}
+        assert request.headers["Content-Type"] == "application/json"
+
+
+class TestSignalRConnectionCodec:
+    """Tests for the codec setting on SignalRConnection."""
+
+    def test_connection_uses_codec_protocol(self):
+        """Test that the hub connection is built with the codec protocol."""
+        connection = SignalRConnection("wss://example.com/hubs/market", "token", codec="auto")
+
+        protocol = connection._connection.transport.protocol
+        assert isinstance(protocol, CodecHubProtocol)
+        assert protocol.codec is connection.codec
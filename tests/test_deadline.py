@@ -0,0 +1,238 @@
+"""Tests for deadlines bounding calls across all of their steps."""
+
+import asyncio
+import threading
+import time
+from datetime import datetime, timedelta
+
+import pytest
+import requests
+
+from projectx_sdk import AsyncProjectXClient, DeadlineExceededError, ProjectXClient
+from projectx_sdk.coalesce import SingleFlight
+from projectx_sdk.deadline import Deadline, current_deadline
+from projectx_sdk.ratelimit import RateLimiter
+from projectx_sdk.realtime import _run
+from projectx_sdk.retry import RetryPolicy
+from projectx_sdk.transport import AsyncFakeTransport, FakeTransport
+
+SUCCESS = {"success": True, "errorCode": 0, "errorMessage": None}
+
+
+class RecordingTransport(FakeTransport):
+    """FakeTransport recording the timeout of every request."""
+
+    def __init__(self):
+        """Initialize the transport."""
+        super().__init__()
+        self.timeouts = []
+
+    def request(self, method, url, **kwargs):
+        """Record the request's timeout and dispatch it."""
+        self.timeouts.append(kwargs.get("timeout"))
+        return super().request(method, url, **kwargs)
+
+
+def make_client(fake, **kwargs):
+    """Build a client over a fake transport, without rate limiting by default."""
+    kwargs.setdefault("rate_limiter", False)
+    return ProjectXClient(token="test-token", transport=fake, **kwargs)
+
+
+class TestDeadline:
+    """Tests for the Deadline class."""
+
+    def test_remaining_and_expiry(self):
+        """Test that a deadline counts down on its clock."""
+        now = [100.0]
+        deadline = Deadline(2.0, clock=lambda: now[0])
+
+        assert deadline.remaining() == 2.0
+        assert deadline.limit(5.0, "step") == 2.0
+        assert deadline.limit(None, "step") == 2.0
+        assert deadline.limit(1.0, "step") == 1.0
+
+        now[0] = 102.5
+        assert deadline.expired
+        assert deadline.remaining() == 0.0
+        with pytest.raises(DeadlineExceededError) as exc_info:
+            deadline.check("Order/place")
+        assert exc_info.value.operation == "Order/place"
+        assert isinstance(exc_info.value, TimeoutError)
+
+        with pytest.raises(ValueError):
+            Deadline(-1)
+
+    def test_nested_deadlines_use_the_earliest(self):
+        """Test that the earliest of nested active deadlines applies."""
+        outer = Deadline(1.0)
+        inner = Deadline(10.0)
+
+        assert current_deadline() is None
+        with outer:
+            with inner:
+                assert current_deadline() is outer
+            assert current_deadline() is outer
+        assert current_deadline() is None
+
+
+class TestClientDeadline:
+    """Tests for deadlines on client calls."""
+
+    def test_timeout_is_capped_by_deadline(self):
+        """Test that each attempt's network timeout is at most the time left."""
+        fake = RecordingTransport()
+        fake.add_route("Order/searchOpen", {"orders": [], **SUCCESS})
+        client = make_client(fake)
+
+        client.orders.search_open(1, deadline=Deadline(0.5))
+        client.orders.search_open(1)
+
+        assert 0 < fake.timeouts[0] <= 0.5
+        assert fake.timeouts[1] == client.timeout
+
+    def test_retries_stop_at_deadline(self):
+        """Test that a retried call gives up instead of backing off past its deadline."""
+        fake = FakeTransport()
+        fake.add_route("Order/searchOpen", (503, {"success": False}))
+        policy = RetryPolicy(max_attempts=10, backoff_base=0.2, jitter="none")
+        client = make_client(fake, retry_policy=policy)
+
+        started = time.perf_counter()
+        with pytest.raises(DeadlineExceededError) as exc_info:
+            client.orders.search_open(1, deadline=Deadline(0.5))
+
+        assert time.perf_counter() - started < 0.5
+        assert exc_info.value.operation == "retry of Order/searchOpen"
+        # Attempts after 0s and 0.2s; the next backoff (0.4s) would overrun
+        assert len(fake.requests) == 2
+
+    def test_token_refresh_consumes_deadline(self):
+        """Test that time spent renewing the token counts towards the deadline."""
+        fake = RecordingTransport()
+
+        @fake.route("Auth/validate")
+        def validate(request):
+            time.sleep(0.2)
+            return {"newToken": "renewed-token", **SUCCESS}
+
+        fake.add_route("Position/searchOpen", {"positions": [], **SUCCESS})
+        client = make_client(fake)
+        client.auth.token_expiry = datetime.now() + timedelta(minutes=5)
+
+        with pytest.raises(DeadlineExceededError) as exc_info:
+            client.positions.search_open(1, deadline=Deadline(0.1))
+
+        assert exc_info.value.operation == "Position/searchOpen"
+        assert fake.timeouts[0] <= 0.1
+        assert [r.path for r in fake.requests] == ["Auth/validate"]
+
+    def test_transport_timeout(self):
+        """Test that a network timeout past the deadline raises the deadline error."""
+        fake = FakeTransport()
+
+        @fake.route("Order/place")
+        def place(request):
+            time.sleep(0.1)
+            raise requests.Timeout("read timed out")
+
+        client = make_client(fake, retry_policy=False)
+
+        with pytest.raises(DeadlineExceededError) as exc_info:
+            client.orders.place(1, "CON.F.US.ENQ.H25", 2, 0, 1, deadline=Deadline(0.05))
+
+        assert isinstance(exc_info.value.__cause__, requests.Timeout)
+
+    def test_rate_limit_wait_is_bounded(self):
+        """Test that a call fails rather than waits for the rate limiter past its deadline."""
+        fake = FakeTransport()
+        fake.add_route("Order/searchOpen", {"orders": [], **SUCCESS})
+        limiter = RateLimiter(rates={"Order": (1.0, 1)})
+        client = make_client(fake, rate_limiter=limiter)
+
+        client.orders.search_open(1)
+        with pytest.raises(DeadlineExceededError):
+            client.orders.search_open(1, deadline=Deadline(0.2))
+
+        assert len(fake.requests) == 1
+        # The failed call did not take the next slot
+        assert limiter.reserve("Order/searchOpen") <= 1.0
+
+    def test_active_deadline(self):
+        """Test that a deadline activated with ``with`` applies to every call in the block."""
+        fake = FakeTransport()
+        fake.add_route("Order/searchOpen", {"orders": [], **SUCCESS})
+        client = make_client(fake)
+
+        with Deadline(0.05):
+            client.orders.search_open(1)
+            time.sleep(0.06)
+            with pytest.raises(DeadlineExceededError):
+                client.orders.search_open(1)
+
+        assert client.orders.search_open(1) == []
+
+    def test_coalesced_waiter(self):
+        """Test that a caller sharing an in-flight call stops waiting at its deadline."""
+        flight = SingleFlight()
+        release = threading.Event()
+        leader = threading.Thread(target=flight.do, args=("key", release.wait))
+        leader.start()
+        time.sleep(0.02)
+
+        with pytest.raises(DeadlineExceededError):
+            flight.do("key", lambda: None, Deadline(0.05))
+
+        release.set()
+        leader.join()
+
+    def test_async_client(self):
+        """Test that the asyncio client bounds calls by their deadline."""
+
+        class SlowTransport(AsyncFakeTransport):
+            async def request(self, method, url, **kwargs):
+                await asyncio.sleep(1)
+                return await super().request(method, url, **kwargs)
+
+        async def run():
+            client = AsyncProjectXClient(
+                token="test-token", transport=SlowTransport(), rate_limiter=False
+            )
+            started = time.perf_counter()
+            with pytest.raises(DeadlineExceededError):
+                await client.orders.search_open(1, deadline=Deadline(0.1))
+            return time.perf_counter() - started
+
+        assert asyncio.run(run()) < 0.5
+
+
+class TestHubDeadline:
+    """Tests for deadlines on synchronous hub calls."""
+
+    def test_hub_call_is_bounded(self):
+        """Test that a synchronous hub call stops waiting for the loop at its deadline."""
+        loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=loop.run_forever, daemon=True)
+        thread.start()
+        seen = []
+
+        async def invoke():
+            seen.append(current_deadline())
+            await asyncio.sleep(1)
+
+        try:
+            started = time.perf_counter()
+            deadline = Deadline(0.1)
+            with pytest.raises(DeadlineExceededError) as exc_info:
+                _run(invoke(), loop, deadline, "subscribe_quotes")
+
+            assert time.perf_counter() - started < 0.5
+            assert exc_info.value.operation == "subscribe_quotes"
+            # The deadline is active on the loop for the hub invocation
+            assert seen == [deadline]
+        finally:
+            # Let the cancelled invocation unwind before stopping the loop
+            asyncio.run_coroutine_threadsafe(asyncio.sleep(0.01), loop).result()
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
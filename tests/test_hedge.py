@@ -0,0 +1,256 @@
+"""Tests for hedged requests."""
+
+import asyncio
+import threading
+import time
+from datetime import datetime, timezone
+
+import pytest
+
+from projectx_sdk import AsyncProjectXClient, ProjectXClient
+from projectx_sdk.exceptions import RequestError
+from projectx_sdk.hedge import HedgePolicy
+from projectx_sdk.transport import AsyncFakeTransport, FakeTransport
+
+SUCCESS = {"success": True, "errorCode": 0, "errorMessage": None}
+POSITION = {
+    "id": 1,
+    "accountId": 7,
+    "contractId": "CON.F.US.ENQ.H25",
+    "creationTimestamp": "2025-01-02T14:30:00+00:00",
+    "type": 1,
+    "size": 2,
+    "averagePrice": 21000.25,
+}
+
+
+class Latencies:
+    """Fake handler answering each call after its own delay."""
+
+    def __init__(self, *delays, payload=None):
+        """Queue the delays of successive calls (the last one repeats)."""
+        self.delays = list(delays)
+        self.payload = payload if payload is not None else {"positions": [POSITION], **SUCCESS}
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def next_delay(self):
+        """Return the delay of the next call."""
+        with self._lock:
+            self.calls += 1
+            return self.delays[min(self.calls, len(self.delays)) - 1]
+
+    def __call__(self, request):
+        """Answer a request after its delay, failing if the delay is negative."""
+        delay = self.next_delay()
+        time.sleep(abs(delay))
+        if delay < 0:
+            return 503, {"errorMessage": "unavailable"}
+        return self.payload
+
+
+class SlowAsyncTransport(AsyncFakeTransport):
+    """Async fake transport that awaits each call's delay before answering."""
+
+    def __init__(self, latencies):
+        """Dispatch to a Latencies handler."""
+        super().__init__(FakeTransport(routes={"Position/searchOpen": self._answer}))
+        self.latencies = latencies
+        self.cancelled = 0
+
+    def _answer(self, request):
+        return self.latencies.payload
+
+    async def request(self, method, url, **kwargs):
+        """Sleep for the call's delay, counting cancellations."""
+        try:
+            await asyncio.sleep(self.latencies.next_delay())
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return await super().request(method, url, **kwargs)
+
+
+def make_client(handler, hedge):
+    """Build a client with hedging and no retries."""
+    fake = FakeTransport(routes={"Position/searchOpen": handler})
+    client = ProjectXClient(
+        token="test-token", transport=fake, retry_policy=False, hedge_policy=hedge
+    )
+    return client, fake
+
+
+@pytest.fixture
+def hedge():
+    """Provide a policy that hedges after 50ms."""
+    policy = HedgePolicy(default_delay=0.05)
+    yield policy
+    policy.close()
+
+
+class TestHedgePolicy:
+    """Tests for the HedgePolicy class."""
+
+    def test_applies_to(self):
+        """Test that only matching read-only endpoints are hedged."""
+        policy = HedgePolicy()
+        assert policy.applies_to("POST", "Position/searchOpen")
+        assert policy.applies_to("POST", "Order/searchOpen")
+        assert not policy.applies_to("POST", "Order/search")
+        assert not HedgePolicy(endpoints=["*"]).applies_to("POST", "Order/place")
+
+    def test_delay_follows_percentile(self):
+        """Test the default delay, the percentile and the bounds."""
+        policy = HedgePolicy(percentile=90.0, min_samples=10, default_delay=0.2, max_delay=0.5)
+        assert policy.delay("Order/searchOpen") == 0.2
+
+        for i in range(1, 11):
+            policy.record("Order/searchOpen", i / 100)
+        assert policy.delay("Order/searchOpen") == pytest.approx(0.09)
+
+        policy.record("Order/searchOpen", 9.0)
+        policy.record("Order/searchOpen", 9.0)
+        assert policy.delay("Order/searchOpen") == 0.5
+
+    def test_invalid_configuration(self):
+        """Test that a hedge needs a second worker thread."""
+        with pytest.raises(ValueError):
+            HedgePolicy(max_workers=1)
+
+
+class TestClientHedging:
+    """Tests for hedging in ProjectXClient requests."""
+
+    def test_fast_requests_are_not_hedged(self, hedge):
+        """Test that an answer within the delay sends a single request."""
+        client, fake = make_client(Latencies(0.0), hedge)
+
+        client.positions.search_open(7)
+
+        assert len(fake.requests) == 1
+        assert hedge.stats()["hedged"] == 0
+
+    def test_hedge_wins(self, hedge):
+        """Test that a slow first attempt is overtaken by the hedge."""
+        handler = Latencies(1.0, 0.0)
+        client, fake = make_client(handler, hedge)
+
+        started = time.monotonic()
+        positions = client.positions.search_open(7)
+
+        assert time.monotonic() - started < 0.5
+        assert positions[0].size == 2
+        assert handler.calls == 2
+        stats = hedge.stats()
+        assert stats["hedged"] == 1
+        assert stats["hedge_wins"] == 1
+        assert stats["win_rate"] == 1.0
+
+    def test_primary_wins(self, hedge):
+        """Test that the first attempt can still answer first once hedged."""
+        client, _ = make_client(Latencies(0.1, 1.0), hedge)
+
+        client.positions.search_open(7)
+
+        stats = hedge.stats()
+        assert stats["hedged"] == 1
+        assert stats["hedge_wins"] == 0
+
+    def test_hedge_covers_failed_attempt(self, hedge):
+        """Test that a failure of one attempt is masked by the other."""
+        client, _ = make_client(Latencies(-0.1, 0.1), hedge)
+
+        assert client.positions.search_open(7)[0].id == 1
+        assert hedge.stats()["hedge_wins"] == 1
+
+    def test_all_attempts_fail(self, hedge):
+        """Test that the first attempt's error is raised when both fail."""
+        client, _ = make_client(Latencies(-0.1), hedge)
+
+        with pytest.raises(RequestError) as exc_info:
+            client.positions.search_open(7)
+
+        assert exc_info.value.error_code == 503
+
+    def test_early_failure_is_not_hedged(self, hedge):
+        """Test that an error within the delay is raised without a hedge."""
+        client, fake = make_client(Latencies(-0.001), hedge)
+
+        with pytest.raises(RequestError):
+            client.positions.search_open(7)
+
+        assert len(fake.requests) == 1
+
+    def test_saturated_policy_does_not_hedge(self):
+        """Test that callers beyond max_workers neither queue nor trigger hedges."""
+        policy = HedgePolicy(default_delay=0.1, max_workers=2)
+        handler = Latencies(0.03)
+        client, fake = make_client(handler, policy)
+        barrier = threading.Barrier(8)
+
+        def call():
+            barrier.wait()
+            client.positions.search_open(7)
+
+        threads = [threading.Thread(target=call) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        policy.close()
+
+        stats = policy.stats()
+        assert stats["requests"] == 8
+        assert stats["hedged"] == 0
+        assert stats["skipped"] >= 6
+        assert handler.calls == 8
+
+    def test_close_without_cancel_futures(self, hedge):
+        """Test that closing works with Python 3.8's Executor.shutdown, lacking cancel_futures."""
+        client, _ = make_client(Latencies(0.0), hedge)
+        client.positions.search_open(7)
+        executor = hedge._executor
+        shutdown = executor.shutdown
+
+        def shutdown_38(wait=True):
+            shutdown(wait=wait)
+
+        executor.shutdown = shutdown_38
+        client.close()
+
+        assert hedge._executor is None
+        assert hedge._futures == set()
+
+    def test_other_endpoints_are_not_hedged(self, hedge):
+        """Test that non-designated endpoints never send a second request."""
+        client, fake = make_client(Latencies(0.0), hedge)
+        fake.add_route("Order/search", Latencies(0.2, payload={"orders": [], **SUCCESS}))
+
+        client.orders.search(7, datetime(2025, 1, 1, tzinfo=timezone.utc))
+
+        assert hedge.stats()["requests"] == 0
+        assert len(fake.requests) == 1
+
+    def test_disabled_by_default(self):
+        """Test that hedging is opt-in."""
+        client = ProjectXClient(token="test-token", transport=FakeTransport())
+        assert client.hedge_policy is None
+
+    def test_async_loser_is_cancelled(self):
+        """Test that the async client cancels the slower attempt."""
+        transport = SlowAsyncTransport(Latencies(1.0, 0.0))
+        hedge = HedgePolicy(default_delay=0.05)
+        client = AsyncProjectXClient(
+            token="test-token", transport=transport, retry_policy=False, hedge_policy=hedge
+        )
+
+        async def run():
+            positions = await client.positions.search_open(7)
+            await asyncio.sleep(0)
+            return positions
+
+        positions = asyncio.run(run())
+
+        assert positions[0].id == 1
+        assert transport.cancelled == 1
+        assert hedge.stats()["hedge_wins"] == 1
@@ -0,0 +1,186 @@
+"""Tests for request lifecycle hooks."""
+
+import asyncio
+import time
+
+import pytest
+
+from projectx_sdk import AsyncProjectXClient, ProjectXClient
+from projectx_sdk.exceptions import RequestError
+from projectx_sdk.hooks import PHASES, RequestEvent, RequestHooks
+from projectx_sdk.transport import AsyncFakeTransport, AsyncSessionPool, FakeTransport
+
+SUCCESS = {"success": True, "errorCode": 0, "errorMessage": None}
+
+
+class Recorder:
+    """Collect the events passed to each hook."""
+
+    def __init__(self):
+        """Start with no events."""
+        self.events = []
+
+    def hooks(self):
+        """Build hooks recording every stage."""
+        return RequestHooks(
+            before_request=lambda event: self.events.append(("before", event)),
+            after_response=lambda event: self.events.append(("after", event)),
+            on_error=lambda event: self.events.append(("error", event)),
+        )
+
+    @property
+    def stages(self):
+        """Get the recorded stages in order."""
+        return [stage for stage, _ in self.events]
+
+
+@pytest.fixture
+def recorder():
+    """Provide a hook recorder."""
+    return Recorder()
+
+
+class TestRequestHooks:
+    """Tests for the RequestHooks class."""
+
+    def test_decorator_registration_and_removal(self):
+        """Test registering hooks as decorators and removing them."""
+        hooks = RequestHooks()
+        assert not hooks.active
+
+        @hooks.after_response
+        def hook(event):
+            pass
+
+        assert hooks.active
+        hooks.remove(hook)
+        assert not hooks.active
+
+    def test_hook_errors_are_swallowed(self):
+        """Test that a failing hook does not stop the others."""
+        calls = []
+        hooks = RequestHooks()
+        hooks.before_request(lambda event: 1 / 0)
+        hooks.before_request(lambda event: calls.append(event))
+
+        hooks.emit_before(RequestEvent("post", "Order/place"))
+
+        assert calls[0].method == "POST"
+
+    def test_laps(self):
+        """Test that laps accumulate into their phases."""
+        event = RequestEvent("POST", "Order/place")
+        time.sleep(0.01)
+        event.lap("token")
+        event.finish()
+
+        assert set(event.timings) == set(PHASES)
+        assert event.timings["token"] >= 0.01
+        assert event.duration >= event.timings["token"]
+        assert event.as_dict()["endpoint"] == "Order/place"
+
+
+class TestClientHooks:
+    """Tests for hooks in ProjectXClient requests."""
+
+    def test_successful_request(self, recorder):
+        """Test the events of a successful call."""
+        fake = FakeTransport(routes={"Order/place": {"orderId": 9, **SUCCESS}})
+        client = ProjectXClient(token="test-token", transport=fake, hooks=recorder.hooks())
+
+        client.orders.place(7, "CON.F.US.ENQ.H25", 2, 0, 1)
+
+        assert recorder.stages == ["before", "after"]
+        event = recorder.events[1][1]
+        assert event.endpoint == "Order/place"
+        assert event.status_code == 200
+        assert event.request_size == len(fake.requests[0].data)
+        assert event.response_size > 0
+        assert event.error is None
+        assert event.timings["ttfb"] > 0
+        assert event.timings["validate"] > 0
+        assert event.duration >= sum(event.timings.values())
+
+    def test_dict_responses_time_decoding(self, recorder):
+        """Test that plain dict responses report decode time."""
+        fake = FakeTransport(routes={"Position/searchOpen": {"positions": [], **SUCCESS}})
+        client = ProjectXClient(token="test-token", transport=fake, hooks=recorder.hooks())
+
+        client.post("Position/searchOpen", json={"accountId": 7})
+
+        event = recorder.events[-1][1]
+        assert event.timings["decode"] > 0
+        assert event.timings["validate"] == 0
+
+    def test_failed_request(self, recorder):
+        """Test that a failed attempt reaches on_error."""
+        fake = FakeTransport(routes={"Order/searchOpen": (503, {"errorMessage": "down"})})
+        client = ProjectXClient(
+            token="test-token", transport=fake, hooks=recorder.hooks(), retry_policy=False
+        )
+
+        with pytest.raises(RequestError):
+            client.orders.search_open(7)
+
+        assert recorder.stages == ["before", "error"]
+        event = recorder.events[1][1]
+        assert event.status_code == 503
+        assert isinstance(event.error, RequestError)
+
+    def test_hooks_added_later(self):
+        """Test registering hooks on an existing client."""
+        fake = FakeTransport(routes={"Order/searchOpen": {"orders": [], **SUCCESS}})
+        client = ProjectXClient(token="test-token", transport=fake)
+        endpoints = []
+        client.hooks.after_response(lambda event: endpoints.append(event.endpoint))
+
+        client.orders.search_open(7)
+
+        assert endpoints == ["Order/searchOpen"]
+
+    def test_network_phases(self, local_gateway, recorder):
+        """Test that the session pool reports connect, ttfb and body time."""
+        with ProjectXClient(
+            token="test-token", base_url=local_gateway.url, hooks=recorder.hooks()
+        ) as client:
+            client.post("Order/searchOpen", json={"accountId": 1})
+            client.post("Order/searchOpen", json={"accountId": 1})
+
+        first, second = recorder.events[1][1], recorder.events[3][1]
+        assert first.timings["connect"] > 0
+        assert second.timings["connect"] == 0  # reused keep-alive connection
+        assert first.timings["ttfb"] > 0
+        assert first.timings["body"] >= 0
+
+    def test_async_client(self, recorder):
+        """Test that the async client fires the same hooks."""
+        fake = FakeTransport(routes={"Order/searchOpen": {"orders": [], **SUCCESS}})
+        client = AsyncProjectXClient(
+            token="test-token", transport=AsyncFakeTransport(fake), hooks=recorder.hooks()
+        )
+
+        asyncio.run(client.orders.search_open(7))
+
+        assert recorder.stages == ["before", "after"]
+        assert recorder.events[1][1].timings["validate"] > 0
+
+    def test_async_network_phases(self, local_gateway, recorder):
+        """Test that the async session pool reports network phases."""
+
+        async def run():
+            client = AsyncProjectXClient(
+                token="test-token",
+                base_url=local_gateway.url,
+                transport=AsyncSessionPool(),
+                hooks=recorder.hooks(),
+            )
+            try:
+                await client.post("Order/searchOpen", json={"accountId": 1})
+            finally:
+                await client.close()
+
+        asyncio.run(run())
+
+        event = recorder.events[1][1]
+        assert event.timings["connect"] > 0
+        assert event.timings["ttfb"] > 0
@@ -0,0 +1,145 @@
+"""Tests for the multiplexed HTTP/2 transport."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+import pytest
+import requests
+
+from projectx_sdk import ProjectXClient
+from projectx_sdk.exceptions import AuthenticationError, RequestError
+from projectx_sdk.transport import HTTP2Pool
+
+pytest.importorskip("h2")
+
+START = datetime(2023, 1, 1, tzinfo=timezone.utc)
+END = datetime(2023, 1, 2, tzinfo=timezone.utc)
+CONTRACT = "CON.F.US.ENQ.H25"
+
+
+def make_client(server, **pool_options):
+    """Build a client talking HTTP/2 to the stand-in server."""
+    pool = HTTP2Pool(prior_knowledge=True, **pool_options)
+    client = ProjectXClient(
+        username="test_user",
+        api_key="test_api_key",
+        base_url=server.url,
+        transport=pool,
+        retry_policy=False,
+        rate_limiter=False,
+    )
+    return client, pool
+
+
+class TestHTTP2Pool:
+    """Tests for the HTTP2Pool class."""
+
+    def test_requests_are_multiplexed(self, local_h2_gateway, mock_history_response):
+        """Test that concurrent requests share one connection."""
+        local_h2_gateway.routes["/api/History/retrieveBars"] = mock_history_response
+        local_h2_gateway.latency = 0.05
+        client, pool = make_client(local_h2_gateway)
+
+        with client, ThreadPoolExecutor(max_workers=20) as executor:
+            results = list(
+                executor.map(
+                    lambda _: client.history.retrieve_bars(CONTRACT, START, END), range(20)
+                )
+            )
+
+            assert all(len(bars) == 3 for bars in results)
+            assert local_h2_gateway.connections == 1
+            assert local_h2_gateway.peak_streams > 1
+            assert pool.stats()["open_connections"] == 1
+
+    def test_priority_header(self, local_h2_gateway):
+        """Test that each request carries the urgency of its endpoint."""
+        client, _ = make_client(local_h2_gateway)
+
+        with client:
+            client.orders.search_open(7)
+            client.accounts.search()
+
+        priorities = {path: headers["priority"] for path, headers, _ in local_h2_gateway.requests}
+        assert priorities["/api/Order/searchOpen"] == "u=0"
+        assert priorities["/api/Account/search"] == "u=3"
+        assert HTTP2Pool().urgency(f"{local_h2_gateway.url}/api/History/retrieveBars") == 6
+
+    def test_bulk_streams_are_capped(self, local_h2_gateway, mock_history_response):
+        """Test that bulk requests queue while orders go straight through."""
+        local_h2_gateway.routes["/api/History/retrieveBars"] = mock_history_response
+        local_h2_gateway.latency = 0.1
+        client, pool = make_client(local_h2_gateway, max_bulk_streams=2)
+
+        with client:
+            client.auth.get_token()
+            backfill = [
+                threading.Thread(target=client.history.retrieve_bars, args=(CONTRACT, START, END))
+                for _ in range(6)
+            ]
+            for thread in backfill:
+                thread.start()
+            time.sleep(0.02)
+
+            started = time.perf_counter()
+            client.orders.search_open(7)
+            order_time = time.perf_counter() - started
+
+            for thread in backfill:
+                thread.join()
+
+        # Six bulk requests take three rounds; the order only its own round trip
+        assert order_time < 0.25
+        assert local_h2_gateway.peak_streams == 3
+        assert pool.stats()["bulk_waits"] == 4
+
+    def test_streamed_response(self, local_h2_gateway, mock_history_response):
+        """Test streaming a response body over HTTP/2."""
+        local_h2_gateway.routes["/api/History/retrieveBars"] = mock_history_response
+        client, _ = make_client(local_h2_gateway, max_bulk_streams=1)
+
+        with client:
+            bars = list(client.history.stream_bars(CONTRACT, START, END))
+            # The stream's bulk slot was released when it was closed
+            bars += client.history.retrieve_bars(CONTRACT, START, END)
+
+        assert len(bars) == 6
+
+    def test_error_statuses(self, local_h2_gateway):
+        """Test that error responses raise the same SDK errors as over HTTP/1.1."""
+        local_h2_gateway.routes["/api/Auth/loginKey"] = (500, {"errorMessage": "unavailable"})
+
+        with pytest.raises(AuthenticationError):
+            make_client(local_h2_gateway)
+
+        local_h2_gateway.routes["/api/Auth/loginKey"] = {"success": True, "token": "t"}
+        local_h2_gateway.routes["/api/Order/searchOpen"] = (503, {"errorMessage": "down"})
+        client, pool = make_client(local_h2_gateway)
+        with client, pytest.raises(RequestError) as excinfo:
+            client.orders.search_open(1)
+
+        assert excinfo.value.error_code == 503
+        with pytest.raises(requests.HTTPError):
+            pool.request("POST", f"{local_h2_gateway.url}/api/Order/searchOpen").raise_for_status()
+
+    def test_warm_up(self, local_h2_gateway):
+        """Test that warm-up opens the one connection later requests use."""
+        pool = HTTP2Pool(prior_knowledge=True)
+
+        assert pool.warm_up(local_h2_gateway.url, connections=4) == 1
+        pool.post(f"{local_h2_gateway.url}/api/Order/searchOpen", json={})
+        assert pool.warm_up(local_h2_gateway.url) == 0
+        pool.close()
+
+        assert local_h2_gateway.connections == 1
+
+    def test_cleartext_falls_back_to_http1(self, local_gateway):
+        """Test that plain http:// hosts get HTTP/1.1 without prior knowledge."""
+        pool = HTTP2Pool()
+        response = pool.post(f"{local_gateway.url}/api/Order/searchOpen", json={})
+        pool.close()
+
+        assert response.status_code == 200
+        assert response.http_version == "HTTP/1.1"
@@ -0,0 +1,217 @@
+"""Tests for SDK metrics and the OpenMetrics exporter."""
+
+import asyncio
+
+import pytest
+import requests
+
+from projectx_sdk import AsyncProjectXClient, ProjectXClient
+from projectx_sdk.auth import Authenticator
+from projectx_sdk.exceptions import AuthenticationError, RequestError
+from projectx_sdk.metrics import (
+    CONTENT_TYPE,
+    MetricsRegistry,
+    SDKMetrics,
+    default_registry,
+    resolve_metrics,
+)
+from projectx_sdk.realtime.connection import SignalRConnection
+from projectx_sdk.realtime.market_hub import MarketHub
+from projectx_sdk.realtime.user_hub import UserHub
+from projectx_sdk.transport import AsyncFakeTransport, FakeTransport
+
+SUCCESS = {"success": True, "errorCode": 0, "errorMessage": None}
+CONTRACT = "CON.F.US.ENQ.H25"
+
+
+@pytest.fixture
+def metrics():
+    """Provide SDK instruments in a private registry."""
+    return SDKMetrics(MetricsRegistry())
+
+
+def make_connection(hub, metrics):
+    """Build an unstarted SignalR connection recording into the given metrics."""
+    return SignalRConnection(
+        hub_url=f"wss://gateway-rtc-demo.s2f.projectx.com/hubs/{hub}",
+        access_token="test-token",
+        metrics=metrics,
+    )
+
+
+class TestMetricsRegistry:
+    """Tests for the MetricsRegistry class."""
+
+    def test_counter(self):
+        """Test counting per label set."""
+        registry = MetricsRegistry()
+        counter = registry.counter("jobs", "Jobs run", ("queue",))
+        counter.labels("a").inc()
+        counter.labels("a").inc(2)
+        counter.labels("b").inc()
+
+        assert counter.value("a") == 3
+        assert counter.value("c") == 0
+        assert registry.counter("jobs", "Jobs run", ("queue",)) is counter
+
+    def test_histogram_render(self):
+        """Test the cumulative buckets, count and sum of a histogram."""
+        registry = MetricsRegistry()
+        histogram = registry.histogram("latency_seconds", "Latency", buckets=(0.1, 1.0))
+        histogram.observe(0.05)
+        histogram.observe(0.5)
+        histogram.observe(5)
+
+        text = registry.render()
+
+        assert "# TYPE latency_seconds histogram" in text
+        assert 'latency_seconds_bucket{le="0.1"} 1' in text
+        assert 'latency_seconds_bucket{le="1"} 2' in text
+        assert 'latency_seconds_bucket{le="+Inf"} 3' in text
+        assert "latency_seconds_count 3" in text
+        assert "latency_seconds_sum 5.55" in text
+        assert text.endswith("# EOF\n")
+
+    def test_label_values_are_escaped(self):
+        """Test escaping quotes in label values."""
+        registry = MetricsRegistry()
+        registry.counter("events", "Events", ("name",)).labels('say "hi"').inc()
+
+        assert 'events_total{name="say \\"hi\\""} 1' in registry.render()
+
+    def test_invalid_labels(self):
+        """Test that a wrong number of label values is rejected."""
+        registry = MetricsRegistry()
+        counter = registry.counter("jobs", "Jobs run", ("queue",))
+
+        with pytest.raises(ValueError):
+            counter.labels("a", "b")
+        with pytest.raises(ValueError):
+            registry.histogram("jobs", "Jobs run")
+
+    def test_serve(self):
+        """Test scraping the local OpenMetrics endpoint."""
+        registry = MetricsRegistry()
+        registry.counter("jobs", "Jobs run").inc()
+        server = registry.serve(port=0)
+        try:
+            response = requests.get(server.url, timeout=5)
+            missing = requests.get(server.url.replace("/metrics", "/other"), timeout=5)
+        finally:
+            server.stop()
+
+        assert response.status_code == 200
+        assert response.headers["Content-Type"] == CONTENT_TYPE
+        assert "jobs_total 1" in response.text
+        assert missing.status_code == 404
+
+    def test_resolve_metrics(self):
+        """Test resolving the client's metrics setting."""
+        registry = MetricsRegistry()
+        assert resolve_metrics(False) is None
+        assert resolve_metrics(None).registry is default_registry()
+        assert resolve_metrics(registry).registry is registry
+
+
+class TestClientMetrics:
+    """Tests for REST request metrics."""
+
+    def test_successful_requests(self, metrics):
+        """Test counting requests and latencies per endpoint and status."""
+        fake = FakeTransport(routes={"Order/searchOpen": {"orders": [], **SUCCESS}})
+        client = ProjectXClient(token="test-token", transport=fake, metrics=metrics)
+
+        client.orders.search_open(7)
+        client.orders.search_open(7)
+
+        assert metrics.requests.value("Order/searchOpen", "200") == 2
+        assert metrics.request_duration.labels("Order/searchOpen").count == 2
+
+    def test_failed_requests(self, metrics):
+        """Test counting failed attempts by error type."""
+        fake = FakeTransport(routes={"Order/searchOpen": (503, {"errorMessage": "down"})})
+        client = ProjectXClient(
+            token="test-token", transport=fake, metrics=metrics, retry_policy=False
+        )
+
+        with pytest.raises(RequestError):
+            client.orders.search_open(7)
+
+        assert metrics.requests.value("Order/searchOpen", "503") == 1
+        assert metrics.request_errors.value("Order/searchOpen", "RequestError") == 1
+
+    def test_disabled(self):
+        """Test that metrics can be turned off."""
+        client = ProjectXClient(token="test-token", transport=FakeTransport(), metrics=False)
+        assert client.metrics is None
+        assert client.auth.metrics is None
+
+    def test_async_client(self, metrics):
+        """Test that the async client records the same metrics."""
+        fake = FakeTransport(routes={"Order/searchOpen": {"orders": [], **SUCCESS}})
+        client = AsyncProjectXClient(
+            token="test-token", transport=AsyncFakeTransport(fake), metrics=metrics
+        )
+
+        asyncio.run(client.orders.search_open(7))
+
+        assert metrics.requests.value("Order/searchOpen", "200") == 1
+
+
+class TestTokenRefreshMetrics:
+    """Tests for login and token validation metrics."""
+
+    def test_login_and_renewal(self, metrics):
+        """Test counting a login and a validation that renewed the token."""
+        fake = FakeTransport()
+        auth = Authenticator(
+            "https://api.example.com", "user", "key", transport=fake, metrics=metrics
+        )
+        auth.validate_token()
+
+        assert metrics.token_refreshes.value("login", "success") == 1
+        assert metrics.token_refreshes.value("validate", "renewed") == 1
+
+    def test_failed_login(self, metrics):
+        """Test counting a rejected login."""
+        fake = FakeTransport(routes={"Auth/loginKey": {"success": False, "errorCode": 3}})
+
+        with pytest.raises(AuthenticationError):
+            Authenticator("https://api.example.com", "user", "key", transport=fake, metrics=metrics)
+
+        assert metrics.token_refreshes.value("login", "failure") == 1
+
+
+class TestRealtimeMetrics:
+    """Tests for hub message, callback and reconnect metrics."""
+
+    def test_market_messages_and_callbacks(self, metrics):
+        """Test counting quotes per contract and timing their callbacks."""
+        hub = MarketHub(make_connection("market", metrics))
+        hub._quote_callbacks[CONTRACT] = [lambda contract_id, data: None]
+
+        hub._handle_quote(CONTRACT, {"lastPrice": 21000.25})
+        hub._handle_quote(CONTRACT, {"lastPrice": 21000.5})
+
+        assert metrics.messages.value("market", "GatewayQuote", CONTRACT) == 2
+        assert metrics.callback_duration.labels("market", "GatewayQuote").count == 2
+
+    def test_callback_errors(self, metrics, caplog):
+        """Test counting callbacks that raised."""
+        hub = UserHub(make_connection("user", metrics))
+        hub._order_callbacks["7"] = [lambda account_id, data: 1 / 0]
+
+        hub._handle_order_update(7, {"id": 1})
+
+        assert metrics.messages.value("user", "GatewayUserOrder", "7") == 1
+        assert metrics.callback_errors.value("user", "GatewayUserOrder") == 1
+        assert "Error in order callback" in caplog.text
+
+    def test_reconnects(self, metrics):
+        """Test counting reconnections per hub."""
+        connection = make_connection("market", metrics)
+        connection._on_connection_open()
+        connection._on_connection_close()
+        connection._on_connection_open()
+
+        assert metrics.reconnects.value("market") == 1
@@ -0,0 +1,158 @@
+"""Tests for the pooled HTTP session."""
+
+import time
+
+from projectx_sdk import ProjectXClient
+from projectx_sdk.transport import FakeTransport, SessionPool
+
+
+class TestSessionPool:
+    """Tests for the SessionPool class."""
+
+    def test_initial_stats(self):
+        """Test that a fresh pool reports zeroed statistics."""
+        pool = SessionPool()
+
+        stats = pool.stats()
+        assert stats["requests"] == 0
+        assert stats["hits"] == 0
+        assert stats["new_connections"] == 0
+        assert stats["waits"] == 0
+        assert stats["evictions"] == 0
+
+    def test_connections_are_reused(self, local_http_server):
+        """Test that consecutive requests reuse one keep-alive connection."""
+        pool = SessionPool()
+
+        for _ in range(5):
+            response = pool.post(f"{local_http_server}/api/Order/searchOpen", json={})
+            assert response.status_code == 200
+
+        stats = pool.stats()
+        assert stats["requests"] == 5
+        assert stats["new_connections"] == 1
+        assert stats["hits"] == 4
+        pool.close()
+
+    def test_keep_alive_disabled(self, local_http_server):
+        """Test that disabling keep-alive opens a new connection per request."""
+        pool = SessionPool(keep_alive=False)
+
+        for _ in range(3):
+            pool.post(f"{local_http_server}/api/Order/searchOpen", json={})
+
+        stats = pool.stats()
+        assert stats["new_connections"] == 3
+        assert stats["hits"] == 0
+        pool.close()
+
+    def test_idle_connections_are_evicted(self, local_http_server):
+        """Test that connections idle longer than idle_timeout are re-established."""
+        pool = SessionPool(idle_timeout=0.01)
+
+        pool.post(f"{local_http_server}/api/Order/searchOpen", json={})
+        time.sleep(0.05)
+        pool.post(f"{local_http_server}/api/Order/searchOpen", json={})
+
+        stats = pool.stats()
+        assert stats["evictions"] == 1
+        assert stats["new_connections"] == 2
+        pool.close()
+
+    def test_warm_up(self, local_http_server):
+        """Test that warmed-up connections are used by the next requests."""
+        pool = SessionPool()
+
+        assert pool.warm_up(local_http_server, connections=2) == 2
+        pool.post(f"{local_http_server}/api/Order/searchOpen", json={})
+        assert pool.warm_up(local_http_server, connections=2) == 0
+
+        stats = pool.stats()
+        assert stats["new_connections"] == 2
+        assert stats["hits"] == 3
+        pool.close()
+
+    def test_warm_up_is_capped(self, local_http_server):
+        """Test that warm-up opens at most max_connections_per_host connections."""
+        pool = SessionPool(max_connections_per_host=1)
+
+        assert pool.warm_up(local_http_server, connections=5) == 1
+        pool.close()
+
+    def test_warm_up_skips_busy_connections(self, local_http_server):
+        """Test that warm-up does not wait on a blocking pool with no free connection."""
+        pool = SessionPool(max_connections_per_host=1, block=True)
+        host_pool = pool._connection_pool(local_http_server)
+        busy = host_pool._get_conn()
+
+        start = time.monotonic()
+        assert pool.warm_up(local_http_server, connections=1) == 0
+        assert time.monotonic() - start < 1
+
+        host_pool._put_conn(busy)
+        assert pool.warm_up(local_http_server, connections=1) == 1
+        pool.close()
+
+
+class TestClientSessionPool:
+    """Tests for session pool sharing in ProjectXClient."""
+
+    def test_client_shares_pool_with_authenticator(self):
+        """Test that the client and its authenticator use the same pool."""
+        pool = SessionPool(max_connections_per_host=4)
+        client = ProjectXClient(environment="demo", transport=pool)
+
+        assert client.transport is pool
+        assert client.auth.transport is pool
+
+    def test_client_requests_use_pool(self, local_http_server):
+        """Test that login and API calls share pooled connections."""
+        with ProjectXClient(
+            username="test_user", api_key="test_api_key", base_url=local_http_server
+        ) as client:
+            client.post("Position/searchOpen", json={"accountId": 1})
+            client.post("Order/searchOpen", json={"accountId": 1})
+
+            stats = client.pool_stats()
+            assert stats["requests"] == 3
+            assert stats["new_connections"] == 1
+            assert stats["hits"] == 2
+
+    def test_client_warm_up(self, local_http_server):
+        """Test that warm-up logs in and opens the remaining connections."""
+        with ProjectXClient(
+            username="test_user",
+            api_key="test_api_key",
+            environment="local",
+            base_url=local_http_server,
+        ) as client:
+            report = client.warm_up(connections=2)
+            client.post("Position/searchOpen", json={"accountId": 1})
+
+            assert report["connections"] == 1
+            assert set(report["dns"]) == {"127.0.0.1"}
+            assert report["hubs"] is None
+            assert report["duration"] >= report["token"] + report["connect"]
+            assert client.pool_stats()["new_connections"] == 2
+
+    def test_keep_warm(self, local_http_server):
+        """Test that keep_warm re-runs warm-up until the client is closed."""
+        client = ProjectXClient(token="test-token", environment="local", base_url=local_http_server)
+
+        client.warm_up(connections=1, keep_warm=0.01)
+        time.sleep(0.1)
+        client.close()
+
+        assert client._keep_warm is None
+        assert client.pool_stats()["requests"] > 2
+
+    def test_warm_up_without_connections(self):
+        """Test warming up a client whose transport has no connections."""
+        client = ProjectXClient(
+            token="test-token",
+            transport=FakeTransport(),
+            environment="local",
+            base_url="http://127.0.0.1",
+        )
+
+        assert client.warm_up()["connections"] == 0
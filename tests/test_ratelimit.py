@@ -0,0 +1,274 @@
+"""Tests for the client-side rate limiter."""
+
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+
+from projectx_sdk import ProjectXClient
+from projectx_sdk.exceptions import RateLimitError
+from projectx_sdk.ratelimit import (
+    SHARED_BUCKET,
+    RateLimiter,
+    TokenBucket,
+    endpoint_family,
+    parse_retry_after,
+)
+from projectx_sdk.transport import FakeTransport, TransportResponse
+
+SUCCESS = {"success": True, "errorCode": 0, "errorMessage": None}
+
+
+class FakeClock:
+    """Manually advanced monotonic clock whose sleeps advance time."""
+
+    def __init__(self):
+        """Start the clock at zero."""
+        self.now = 0.0
+        self.slept = []
+
+    def __call__(self):
+        """Return the current time."""
+        return self.now
+
+    def sleep(self, seconds):
+        """Record a sleep and advance the clock."""
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    """Provide a fake clock."""
+    return FakeClock()
+
+
+class TestHelpers:
+    """Tests for the rate limiting helpers."""
+
+    def test_endpoint_family(self):
+        """Test that paths map to their endpoint family."""
+        assert endpoint_family("History/retrieveBars") == "History"
+        assert endpoint_family("/Order/place") == "Order"
+        assert endpoint_family("Status") == "Status"
+
+    def test_parse_retry_after_seconds(self):
+        """Test parsing delay-seconds values."""
+        assert parse_retry_after("3") == 3.0
+        assert parse_retry_after("0.5") == 0.5
+        assert parse_retry_after("-1") == 0.0
+
+    def test_parse_retry_after_date(self):
+        """Test parsing HTTP-date values."""
+        when = datetime.now(timezone.utc) + timedelta(seconds=30)
+        assert 28 <= parse_retry_after(format_datetime(when, usegmt=True)) <= 30
+
+    def test_parse_retry_after_invalid(self):
+        """Test that missing or malformed values are ignored."""
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("") is None
+        assert parse_retry_after("soon") is None
+
+
+class TestTokenBucket:
+    """Tests for the TokenBucket class."""
+
+    def test_burst_then_paced(self, clock):
+        """Test that the burst passes immediately and later requests are paced."""
+        bucket = TokenBucket(rate=2.0, burst=3, clock=clock)
+
+        assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+        assert bucket.reserve() == pytest.approx(0.5)
+        assert bucket.reserve() == pytest.approx(1.0)
+
+        clock.now += 1.0
+        assert bucket.reserve() == pytest.approx(0.5)
+        assert bucket.waits == 3
+
+    def test_max_wait_rejects_without_consuming(self, clock):
+        """Test that waits beyond max_wait raise without using a token."""
+        bucket = TokenBucket(rate=1.0, burst=1, clock=clock)
+        bucket.reserve()
+
+        with pytest.raises(RateLimitError) as excinfo:
+            bucket.reserve(max_wait=0.5)
+
+        assert excinfo.value.retry_after == pytest.approx(1.0)
+        assert bucket.rejected == 1
+        assert bucket.reserve(max_wait=1.0) == pytest.approx(1.0)
+
+    def test_throttle_blocks_and_adapts(self, clock):
+        """Test that a 429 blocks for Retry-After and halves the rate."""
+        bucket = TokenBucket(rate=4.0, burst=10, clock=clock)
+
+        bucket.throttle(retry_after=5.0)
+
+        assert bucket.rate == 2.0
+        assert bucket.reserve() == pytest.approx(5.0)
+
+    def test_rate_recovers_on_success(self, clock):
+        """Test that pacing recovers additively to the configured rate."""
+        bucket = TokenBucket(rate=10.0, burst=10, clock=clock, recovery_ratio=0.25)
+        bucket.throttle(retry_after=0)
+        bucket.throttle(retry_after=0)
+        assert bucket.rate == 2.5
+
+        for _ in range(10):
+            bucket.succeed()
+
+        assert bucket.rate == 10.0
+
+    def test_rate_floor(self, clock):
+        """Test that repeated 429s never drop below the minimum rate."""
+        bucket = TokenBucket(rate=10.0, burst=10, clock=clock, min_rate_ratio=0.1)
+        for _ in range(20):
+            bucket.throttle(retry_after=0)
+
+        assert bucket.rate == pytest.approx(1.0)
+
+    def test_invalid_configuration(self):
+        """Test that non-positive rates are rejected."""
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0, burst=1)
+
+
+class TestRateLimiter:
+    """Tests for the RateLimiter class."""
+
+    def test_families_are_independent(self, clock):
+        """Test that each endpoint family has its own bucket."""
+        limiter = RateLimiter(
+            rates={"History/*": (1.0, 1), "Order": (1.0, 1)}, clock=clock, sleep=clock.sleep
+        )
+
+        limiter.acquire("History/retrieveBars")
+        limiter.acquire("Order/place")
+        assert clock.slept == []
+
+        limiter.acquire("History/retrieveBars")
+        assert clock.slept == [pytest.approx(1.0)]
+
+    def test_default_rates(self, clock):
+        """Test that the gateway's published limits apply by default."""
+        limiter = RateLimiter(clock=clock)
+
+        assert limiter.bucket("History/retrieveBars").configured_rate == pytest.approx(50 / 30)
+        assert limiter.bucket("Order/place").burst == 200
+
+    def test_families_share_the_default_bucket(self, clock):
+        """Test that families without a rate of their own count against one shared limit."""
+        limiter = RateLimiter(default_rate=(1.0, 2), clock=clock, sleep=clock.sleep)
+
+        limiter.acquire("Order/place")
+        limiter.acquire("Position/searchOpen")
+        limiter.acquire("History/retrieveBars")
+        assert clock.slept == []
+
+        limiter.acquire("Account/search")
+        assert clock.slept == [pytest.approx(1.0)]
+        assert limiter.bucket("Trade/search") is limiter.bucket("Order/place")
+        assert sorted(limiter.stats()) == [SHARED_BUCKET, "History"]
+
+    def test_bare_rate(self, clock):
+        """Test that a bare rate uses itself as the burst size."""
+        limiter = RateLimiter(rates={"Position": 5}, clock=clock)
+
+        assert limiter.bucket("Position/searchOpen").burst == 5
+
+    def test_record_429(self, clock):
+        """Test that a 429 only slows down its own family."""
+        limiter = RateLimiter(clock=clock, sleep=clock.sleep)
+
+        limiter.record("History/retrieveBars", 429, retry_after=2.0)
+
+        stats = limiter.stats()
+        assert stats["History"]["throttled"] == 1
+        assert stats["History"]["rate"] == pytest.approx(25 / 30)
+        assert limiter.acquire("Order/place") == 0.0
+        assert limiter.acquire("History/retrieveBars") == pytest.approx(2.0)
+
+    def test_non_adaptive_still_honours_retry_after(self, clock):
+        """Test that a non-adaptive limiter keeps its rate but waits out Retry-After."""
+        limiter = RateLimiter(adaptive=False, clock=clock, sleep=clock.sleep)
+
+        limiter.record("Account/search", 429, retry_after=3.0)
+
+        assert limiter.bucket("Account/search").rate == pytest.approx(200 / 60)
+        assert limiter.acquire("Account/search") == pytest.approx(3.0)
+
+    def test_max_wait(self, clock):
+        """Test that long waits raise RateLimitError instead of sleeping."""
+        limiter = RateLimiter(max_wait=1.0, clock=clock, sleep=clock.sleep)
+        limiter.record("Order/place", 429, retry_after=60.0)
+
+        with pytest.raises(RateLimitError) as excinfo:
+            limiter.acquire("Order/place")
+
+        assert excinfo.value.retry_after == pytest.approx(60.0)
+        assert clock.slept == []
+
+    def test_trading_calls_fail_fast(self, clock):
+        """Test that order and position-closing calls are not held up for max_wait."""
+        limiter = RateLimiter(clock=clock, sleep=clock.sleep)
+        limiter.record("Account/search", 429, retry_after=5.0)
+
+        for path in ["Order/place", "Order/cancel", "Position/closeContract"]:
+            with pytest.raises(RateLimitError):
+                limiter.acquire(path)
+        assert limiter.acquire("Position/searchOpen") == pytest.approx(5.0)
+
+        patient = RateLimiter(trading_max_wait=None, clock=clock, sleep=clock.sleep)
+        patient.record("Order/place", 429, retry_after=5.0)
+        assert patient.acquire("Order/place") == pytest.approx(5.0)
+        assert RateLimiter(max_wait=0.5).max_wait_for("Order/place") == 0.5
+
+
+class TestClientRateLimiting:
+    """Tests for rate limiting in ProjectXClient."""
+
+    def test_429_raises_rate_limit_error(self, clock):
+        """Test that a 429 raises RateLimitError with the server's wait time."""
+        fake = FakeTransport()
+        fake.add_route(
+            "History/retrieveBars",
+            lambda request: TransportResponse(
+                status_code=429,
+                content=b'{"errorMessage": "slow down"}',
+                headers={"retry-after": "7"},
+            ),
+        )
+        limiter = RateLimiter(clock=clock, sleep=clock.sleep)
+        client = ProjectXClient(
+            username="u", api_key="k", transport=fake, rate_limiter=limiter, retry_policy=False
+        )
+
+        with pytest.raises(RateLimitError) as excinfo:
+            client.post("History/retrieveBars", json={})
+
+        assert excinfo.value.retry_after == 7.0
+        assert excinfo.value.error_code == 429
+        assert "slow down" in str(excinfo.value)
+        assert limiter.stats()["History"]["throttled"] == 1
+
+        # The next call waits out the Retry-After delay before it is sent
+        fake.add_route("History/retrieveBars", {**SUCCESS, "bars": []})
+        client.post("History/retrieveBars", json={})
+        assert clock.slept == [pytest.approx(7.0)]
+
+    def test_requests_are_paced(self, clock):
+        """Test that the client waits for its family's bucket."""
+        fake = FakeTransport(routes={"Order/place": {**SUCCESS, "orderId": 1}})
+        limiter = RateLimiter(rates={"Order": (10.0, 2)}, clock=clock, sleep=clock.sleep)
+        client = ProjectXClient(username="u", api_key="k", transport=fake, rate_limiter=limiter)
+
+        for _ in range(4):
+            client.post("Order/place", json={})
+
+        assert clock.slept == [pytest.approx(0.1), pytest.approx(0.1)]
+
+    def test_default_and_disabled(self):
+        """Test that a default limiter is installed and can be disabled."""
+        fake = FakeTransport()
+
+        assert isinstance(ProjectXClient(transport=fake).rate_limiter, RateLimiter)
+        assert ProjectXClient(transport=fake, rate_limiter=False).rate_limiter is None
@@ -0,0 +1,339 @@
+"""Tests for the retry policy engine."""
+
+import asyncio
+
+import pytest
+import requests
+
+from projectx_sdk import AsyncProjectXClient, OrderSide, OrderType, ProjectXClient
+from projectx_sdk.exceptions import (
+    AuthenticationError,
+    ProjectXError,
+    RateLimitError,
+    RequestError,
+)
+from projectx_sdk.ratelimit import RateLimiter
+from projectx_sdk.retry import RetryBudget, RetryPolicy, resolve_policy, retry_override
+from projectx_sdk.transport import AsyncFakeTransport, FakeTransport
+
+SUCCESS = {"success": True, "errorCode": 0, "errorMessage": None}
+NOW = "2025-01-01T00:00:00Z"
+
+
+def network_error():
+    """Build the RequestError the client raises for a dropped connection."""
+    try:
+        raise RequestError("Request failed") from requests.ConnectionError("reset")
+    except RequestError as e:
+        return e
+
+
+def flaky(failures, payload, status=None):
+    """Build a fake handler that fails ``failures`` times before answering."""
+    calls = {"count": 0}
+
+    def handler(request):
+        calls["count"] += 1
+        if calls["count"] <= failures:
+            if status is not None:
+                return status, {"errorMessage": "unavailable"}
+            raise requests.ConnectionError("connection reset by peer")
+        return payload
+
+    handler.calls = calls
+    return handler
+
+
+@pytest.fixture
+def sleeps():
+    """Collect the delays a policy sleeps for."""
+    return []
+
+
+@pytest.fixture
+def policy(sleeps):
+    """Provide a policy with deterministic, recorded backoff."""
+    return RetryPolicy(max_attempts=3, backoff_base=0.1, jitter="none", sleep=sleeps.append)
+
+
+class TestRetryPolicy:
+    """Tests for the RetryPolicy class."""
+
+    def test_read_only_endpoints(self, policy):
+        """Test the default read-only endpoint patterns."""
+        assert policy.is_read_only("Order/search")
+        assert policy.is_read_only("Position/searchOpen")
+        assert policy.is_read_only("History/retrieveBars")
+        assert policy.is_read_only("Contract/searchById")
+        assert not policy.is_read_only("Order/place")
+        assert not policy.is_read_only("Position/closeContract")
+
+    def test_retryable_errors(self, policy):
+        """Test which errors are considered transient."""
+        assert policy.is_retryable_error(network_error())
+        assert policy.is_retryable_error(RequestError("bad gateway", error_code=502))
+        assert policy.is_retryable_error(RateLimitError("slow down", error_code=429))
+        assert not policy.is_retryable_error(RateLimitError("local limit", retry_after=5.0))
+        assert not policy.is_retryable_error(RequestError("bad request", error_code=400))
+        assert not policy.is_retryable_error(AuthenticationError("expired"))
+        assert not policy.is_retryable_error(ProjectXError("API error 2", error_code=2))
+
+    def test_exponential_backoff(self, policy):
+        """Test that delays double and are capped."""
+        policy.backoff_max = 0.3
+        assert [policy.backoff(n) for n in (1, 2, 3)] == pytest.approx([0.1, 0.2, 0.3])
+
+    def test_jitter(self):
+        """Test the full and equal jitter modes."""
+        full = RetryPolicy(backoff_base=1.0, jitter="full", rng=lambda: 0.25)
+        equal = RetryPolicy(backoff_base=1.0, jitter="equal", rng=lambda: 0.25)
+
+        assert full.backoff(2) == pytest.approx(0.5)
+        assert equal.backoff(2) == pytest.approx(1.25)
+
+    def test_next_delay(self, policy):
+        """Test retry decisions for read-only and mutating endpoints."""
+        error = network_error()
+
+        assert policy.next_delay("Trade/search", 1, error) == pytest.approx(0.1)
+        assert policy.next_delay("Trade/search", 3, error) is None
+        assert policy.next_delay("Order/place", 1, error) is None
+        assert policy.next_delay("Order/place", 1, error, idempotent=True) == pytest.approx(0.1)
+
+    def test_retry_after_extends_delay(self, policy):
+        """Test that a 429's Retry-After is waited out."""
+        error = RateLimitError("slow down", error_code=429, retry_after=2.0)
+
+        assert policy.next_delay("History/retrieveBars", 1, error) == 2.0
+
+    def test_budget(self):
+        """Test that the global budget caps retries."""
+        policy = RetryPolicy(budget=RetryBudget(ratio=0.5, capacity=1))
+        error = network_error()
+
+        assert policy.next_delay("Trade/search", 1, error) is not None
+        assert policy.next_delay("Trade/search", 1, error) is None
+        policy.start()
+        policy.start()
+        assert policy.next_delay("Trade/search", 1, error) is not None
+
+        stats = policy.stats()
+        assert stats["retries"] == 2
+        assert stats["budget_exhausted"] == 1
+
+    def test_invalid_configuration(self):
+        """Test that invalid settings are rejected."""
+        with pytest.raises(ValueError):
+            RetryPolicy(max_attempts=0)
+        with pytest.raises(ValueError):
+            RetryPolicy(jitter="random")
+
+    def test_resolve_policy(self, policy):
+        """Test per-call and context overrides."""
+        other = RetryPolicy()
+
+        assert resolve_policy(policy) is policy
+        assert resolve_policy(policy, other) is other
+        assert resolve_policy(policy, False) is None
+        with retry_override(False):
+            assert resolve_policy(policy) is None
+            assert resolve_policy(policy, other) is other
+        with retry_override(other):
+            assert resolve_policy(policy) is other
+        assert resolve_policy(policy) is policy
+
+
+class TestClientRetries:
+    """Tests for retries in ProjectXClient."""
+
+    def make_client(self, policy, **routes):
+        """Build a client on a fake transport."""
+        fake = FakeTransport(routes={path.replace("_", "/"): h for path, h in routes.items()})
+        return ProjectXClient(username="u", api_key="k", transport=fake, retry_policy=policy)
+
+    def test_read_only_call_recovers(self, policy, sleeps):
+        """Test that a dropped connection during retrieveBars is retried."""
+        handler = flaky(2, {**SUCCESS, "bars": []})
+        client = self.make_client(policy, History_retrieveBars=handler)
+
+        client.post("History/retrieveBars", json={})
+
+        assert handler.calls["count"] == 3
+        assert sleeps == pytest.approx([0.1, 0.2])
+
+    def test_gives_up_after_max_attempts(self, policy, sleeps):
+        """Test that the last error is raised once attempts are exhausted."""
+        handler = flaky(5, {**SUCCESS, "trades": []}, status=503)
+        client = self.make_client(policy, Trade_search=handler)
+
+        with pytest.raises(RequestError) as excinfo:
+            client.post("Trade/search", json={})
+
+        assert excinfo.value.error_code == 503
+        assert handler.calls["count"] == 3
+        assert policy.stats()["gave_up"] == 1
+
+    def test_client_errors_not_retried(self, policy, sleeps):
+        """Test that non-transient errors fail immediately."""
+        handler = flaky(5, {}, status=400)
+        client = self.make_client(policy, Trade_search=handler)
+
+        with pytest.raises(RequestError):
+            client.post("Trade/search", json={})
+
+        assert handler.calls["count"] == 1
+
+    def test_local_rate_limit_not_retried(self, policy, sleeps):
+        """Test that a rejection by the client's rate limiter is raised at once."""
+        handler = flaky(0, {**SUCCESS, "bars": []})
+        fake = FakeTransport(routes={"History/retrieveBars": handler})
+        limiter = RateLimiter(rates={"History": (0.01, 1)}, max_wait=1.0)
+        client = ProjectXClient(
+            token="test-token", transport=fake, retry_policy=policy, rate_limiter=limiter
+        )
+
+        client.post("History/retrieveBars", json={})
+        with pytest.raises(RateLimitError):
+            client.post("History/retrieveBars", json={})
+
+        assert handler.calls["count"] == 1
+        assert sleeps == []
+
+    def test_untagged_order_not_retried(self, policy, sleeps):
+        """Test that orders without a custom tag are never retried."""
+        handler = flaky(1, {**SUCCESS, "orderId": 9})
+        client = self.make_client(policy, Order_place=handler)
+
+        with pytest.raises(RequestError):
+            client.orders.place(1, "CON.F.US.ENQ.H25", OrderType.MARKET, OrderSide.BUY, 1)
+
+        assert handler.calls["count"] == 1
+
+    def test_tagged_order_retried(self, policy, sleeps):
+        """Test that orders with a custom tag are retried."""
+        handler = flaky(1, {**SUCCESS, "orderId": 9})
+        client = self.make_client(policy, Order_place=handler)
+
+        order_id = client.orders.place(
+            1, "CON.F.US.ENQ.H25", OrderType.MARKET, OrderSide.BUY, 1, custom_tag="entry-1"
+        )
+
+        assert order_id == 9
+        assert handler.calls["count"] == 2
+
+    def test_tagged_order_reconciled(self, policy, sleeps):
+        """Test that a retry rejected as a duplicate returns the order the first attempt placed."""
+        orders = []
+
+        def place(request):
+            if orders:
+                return {"success": False, "errorCode": 2, "errorMessage": "Duplicate tag"}
+            orders.append({**request.json, "id": 9, "status": 1, "creationTimestamp": NOW})
+            raise requests.ConnectionError("connection reset by peer")
+
+        client = self.make_client(
+            policy,
+            Order_place=place,
+            Order_searchOpen=lambda request: {**SUCCESS, "orders": orders},
+        )
+
+        order_id = client.orders.place(
+            1, "CON.F.US.ENQ.H25", OrderType.MARKET, OrderSide.BUY, 1, custom_tag="entry-1"
+        )
+
+        assert order_id == 9
+        assert len(orders) == 1
+
+    def test_filled_tagged_order_reconciled(self, policy, sleeps):
+        """Test that an order no longer open is found among the recent orders."""
+        handler = flaky(1, {"success": False, "errorCode": 2, "errorMessage": "Duplicate tag"})
+        filled = {
+            "id": 9,
+            "accountId": 1,
+            "contractId": "CON.F.US.ENQ.H25",
+            "creationTimestamp": NOW,
+            "status": 2,
+            "type": 2,
+            "side": 0,
+            "size": 1,
+            "customTag": "entry-1",
+        }
+        client = self.make_client(
+            policy,
+            Order_place=handler,
+            Order_searchOpen={**SUCCESS, "orders": []},
+            Order_search={**SUCCESS, "orders": [filled]},
+        )
+
+        order_id = client.orders.place(
+            1, "CON.F.US.ENQ.H25", OrderType.MARKET, OrderSide.BUY, 1, custom_tag="entry-1"
+        )
+
+        assert order_id == 9
+
+    def test_rejected_tagged_order_not_reconciled(self, policy, sleeps):
+        """Test that an order rejected on its first attempt raises without a lookup."""
+        handler = flaky(0, {"success": False, "errorCode": 2, "errorMessage": "Duplicate tag"})
+        client = self.make_client(policy, Order_place=handler)
+
+        with pytest.raises(ProjectXError) as excinfo:
+            client.orders.place(
+                1, "CON.F.US.ENQ.H25", OrderType.MARKET, OrderSide.BUY, 1, custom_tag="entry-1"
+            )
+
+        assert excinfo.value.attempts == 1
+        assert [r.path for r in client.transport.requests][-1] == "Order/place"
+
+    def test_unreconciled_tagged_order_raises(self, policy, sleeps):
+        """Test that the retry's error is raised if no order carries the tag."""
+        handler = flaky(5, {**SUCCESS, "orderId": 9})
+        client = self.make_client(
+            policy,
+            Order_place=handler,
+            Order_searchOpen={**SUCCESS, "orders": []},
+            Order_search={**SUCCESS, "orders": []},
+        )
+
+        with pytest.raises(RequestError) as excinfo:
+            client.orders.place(
+                1, "CON.F.US.ENQ.H25", OrderType.MARKET, OrderSide.BUY, 1, custom_tag="entry-1"
+            )
+
+        assert excinfo.value.attempts == 3
+
+    def test_per_call_override(self, policy, sleeps):
+        """Test disabling or replacing the policy for a single call."""
+        handler = flaky(1, {**SUCCESS, "trades": []})
+        client = self.make_client(policy, Trade_search=handler)
+
+        with pytest.raises(RequestError):
+            client.post("Trade/search", json={}, retry=False)
+
+        handler.calls["count"] = 0
+        patient = RetryPolicy(max_attempts=2, jitter="none", backoff_base=0.5, sleep=sleeps.append)
+        client.post("Trade/search", json={}, retry=patient)
+        assert sleeps == [0.5]
+
+    def test_disabled(self):
+        """Test that retries can be disabled for the whole client."""
+        handler = flaky(1, {**SUCCESS, "trades": []})
+        client = self.make_client(False, Trade_search=handler)
+
+        assert client.retry_policy is None
+        with pytest.raises(RequestError):
+            client.post("Trade/search", json={})
+
+    def test_async_client_retries(self, policy):
+        """Test that the async client retries with awaited backoff."""
+        pytest.importorskip("httpx")
+        handler = flaky(1, {**SUCCESS, "positions": []})
+        fake = FakeTransport(routes={"Position/searchOpen": handler})
+        client = AsyncProjectXClient(
+            token="test-token", transport=AsyncFakeTransport(fake), retry_policy=policy
+        )
+
+        async def main():
+            return await client.positions.search_open(1)
+
+        assert asyncio.run(main()) == []
+        assert handler.calls["count"] == 2
@@ -0,0 +1,266 @@
+"""Tests for incremental parsing of large list responses."""
+
+import asyncio
+import json
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import requests
+
+from projectx_sdk import AsyncProjectXClient, ProjectXClient
+from projectx_sdk.exceptions import ProjectXError, RequestError
+from projectx_sdk.models import Bar, Order, Trade
+from projectx_sdk.streaming import JSONArrayStream, columnar
+from projectx_sdk.transport import AsyncFakeTransport, FakeTransport, TransportResponse
+
+SUCCESS = {"success": True, "errorCode": 0, "errorMessage": None}
+START = datetime(2025, 1, 2, 14, 30, tzinfo=timezone.utc)
+
+
+def make_bar(i):
+    """Build one raw bar."""
+    return {
+        "t": (START + timedelta(minutes=i)).isoformat(),
+        "o": 21000.25 + i,
+        "h": 21001.5 + i,
+        "l": 20999.75 + i,
+        "c": 21000.5 + i,
+        "v": 100 + i,
+    }
+
+
+def feed_in_chunks(stream, body, size):
+    """Feed a body to a parser ``size`` bytes at a time."""
+    items = []
+    for start in range(0, len(body), size):
+        items.extend(stream.feed(body[start : start + size]))
+    items.extend(stream.close())
+    return items
+
+
+class GeneratedResponse(TransportResponse):
+    """Response whose bar list is generated lazily, chunk by chunk."""
+
+    def __init__(self, count):
+        """Prepare a body of ``count`` bars."""
+        super().__init__(headers={"Content-Type": "application/json"})
+        self.count = count
+
+    def iter_content(self, chunk_size=1):
+        """Yield the body without ever materializing it."""
+        yield b'{"bars":['
+        for i in range(self.count):
+            yield (b"," if i else b"") + json.dumps(make_bar(i)).encode()
+        yield b'],"success":true,"errorCode":0,"errorMessage":null}'
+
+
+class DroppedResponse(TransportResponse):
+    """Response whose connection drops halfway through the body."""
+
+    def iter_content(self, chunk_size=1):
+        """Yield part of the body, then fail."""
+        yield b'{"bars":[' + json.dumps(make_bar(0)).encode() + b","
+        raise requests.ConnectionError("connection reset by peer")
+
+
+class TestJSONArrayStream:
+    """Tests for the JSONArrayStream parser."""
+
+    @pytest.mark.parametrize("size", [1, 3, 7, 64, 100000])
+    def test_chunk_boundaries(self, size):
+        """Test that any chunking yields the same items and envelope."""
+        payload = {
+            "success": True,
+            "bars": [make_bar(i) for i in range(20)] + [1.25, -4e-3, None, 'é"]'],
+            "errorCode": 0,
+            "errorMessage": None,
+        }
+        body = json.dumps(payload, ensure_ascii=False, indent=1).encode("utf-8")
+
+        stream = JSONArrayStream("bars")
+        items = feed_in_chunks(stream, body, size)
+
+        assert items == payload["bars"]
+        assert stream.envelope == SUCCESS
+        assert stream.items == len(payload["bars"])
+        assert stream.done
+
+    def test_missing_key(self):
+        """Test that a response without the array only fills the envelope."""
+        stream = JSONArrayStream("bars")
+        assert feed_in_chunks(stream, json.dumps(SUCCESS).encode(), 5) == []
+        assert stream.envelope == SUCCESS
+
+    def test_nested_key_is_not_streamed(self):
+        """Test that only a top-level array is streamed."""
+        body = json.dumps({"meta": {"bars": [1, 2]}, "bars": [3]}).encode()
+        stream = JSONArrayStream("bars")
+
+        assert feed_in_chunks(stream, body, 4) == [3]
+        assert stream.envelope == {"meta": {"bars": [1, 2]}}
+
+    @pytest.mark.parametrize(
+        "body", [b'{"bars":[1,2', b"[1,2]", b'{"bars":[1 2]}', b'{"bars":[{"a":1}'], ids=str
+    )
+    def test_invalid_documents(self, body):
+        """Test that truncated and malformed bodies are rejected."""
+        with pytest.raises(ValueError):
+            feed_in_chunks(JSONArrayStream("bars"), body, 3)
+
+    def test_item_size_limit(self):
+        """Test that one oversized element cannot exhaust memory."""
+        stream = JSONArrayStream("bars", max_item_size=100)
+        with pytest.raises(ValueError):
+            stream.feed(b'{"bars":["' + b"x" * 200)
+
+
+class TestColumnar:
+    """Tests for the columnar function."""
+
+    def test_chunks(self):
+        """Test grouping records into column chunks."""
+        chunks = list(columnar((make_bar(i) for i in range(5)), size=2, fields=["c", "v"]))
+
+        assert [len(chunk["v"]) for chunk in chunks] == [2, 2, 1]
+        assert chunks[2] == {"c": [21004.5], "v": [104]}
+
+    def test_empty(self):
+        """Test that no records produce no chunks."""
+        assert list(columnar([])) == []
+
+
+class TestClientStream:
+    """Tests for ProjectXClient.stream and the streaming service methods."""
+
+    def make_client(self, **routes):
+        """Build a client over a fake transport."""
+        fake = FakeTransport(routes=routes)
+        return ProjectXClient(token="test-token", transport=fake), fake
+
+    def test_stream_bars(self):
+        """Test streaming bars as models."""
+        payload = {"bars": [make_bar(i) for i in range(3)], **SUCCESS}
+        client, fake = self.make_client(**{"History/retrieveBars": payload})
+
+        bars = list(
+            client.history.stream_bars("CON.F.US.ENQ.H25", START, START + timedelta(hours=1))
+        )
+
+        assert [bar.volume for bar in bars] == [100, 101, 102]
+        assert all(isinstance(bar, Bar) for bar in bars)
+        assert fake.requests[-1].json["contractId"] == "CON.F.US.ENQ.H25"
+
+    def test_stream_trades_and_orders(self):
+        """Test streaming trade and order searches."""
+        trade = {
+            "id": 1,
+            "accountId": 7,
+            "contractId": "CON.F.US.ENQ.H25",
+            "creationTimestamp": START.isoformat(),
+            "price": 21000.25,
+            "profitAndLoss": None,
+            "fees": 1.4,
+            "side": 0,
+            "size": 1,
+            "voided": False,
+            "orderId": 9,
+        }
+        order = {
+            "id": 9,
+            "accountId": 7,
+            "contractId": "CON.F.US.ENQ.H25",
+            "creationTimestamp": START.isoformat(),
+            "updateTimestamp": None,
+            "status": 2,
+            "type": 2,
+            "side": 0,
+            "size": 1,
+        }
+        client, _ = self.make_client(
+            **{
+                "Trade/search": {"trades": [trade], **SUCCESS},
+                "Order/search": {"orders": [order], **SUCCESS},
+            }
+        )
+
+        trades = list(client.trades.stream_search(7, START))
+        orders = list(client.orders.stream_search(7, START))
+
+        assert isinstance(trades[0], Trade) and trades[0].order_id == 9
+        assert isinstance(orders[0], Order) and orders[0].id == 9
+
+    def test_raw_items(self):
+        """Test that items are dicts without an item model."""
+        client, _ = self.make_client(**{"History/retrieveBars": {"bars": [make_bar(0)], **SUCCESS}})
+        assert list(client.stream("POST", "History/retrieveBars", "bars", json={})) == [make_bar(0)]
+
+    def test_error_envelope_raises_at_end(self):
+        """Test that success=false is raised once the body has been read."""
+        client, _ = self.make_client(
+            **{
+                "Trade/search": {
+                    "trades": [],
+                    "success": False,
+                    "errorCode": 2,
+                    "errorMessage": "x",
+                }
+            }
+        )
+
+        with pytest.raises(ProjectXError) as exc_info:
+            list(client.trades.stream_search(7, START))
+
+        assert exc_info.value.error_code == 2
+
+    def test_http_error(self):
+        """Test that HTTP errors map to the usual exceptions."""
+        client, _ = self.make_client(
+            **{"History/retrieveBars": lambda request: (503, {"errorMessage": "down"})}
+        )
+
+        with pytest.raises(RequestError) as exc_info:
+            list(client.stream("POST", "History/retrieveBars", "bars", json={}))
+
+        assert exc_info.value.error_code == 503
+
+    def test_dropped_connection(self):
+        """Test that a connection lost mid-body raises RequestError."""
+        client, _ = self.make_client(**{"History/retrieveBars": DroppedResponse()})
+        stream = client.stream("POST", "History/retrieveBars", "bars", json={})
+
+        assert next(stream)["v"] == 100
+        with pytest.raises(RequestError):
+            next(stream)
+
+    def test_memory_stays_bounded(self):
+        """Test that peak memory does not grow with the response size."""
+
+        def peak(count):
+            client, _ = self.make_client(**{"History/retrieveBars": GeneratedResponse(count)})
+            tracemalloc.start()
+            try:
+                for _ in client.stream("POST", "History/retrieveBars", "bars", json={}):
+                    pass
+                return tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+
+        small, large = peak(1000), peak(20000)
+
+        # A buffered parse of the large body would need several MiB
+        assert large < small * 2
+        assert large < 1024 * 1024
+
+    def test_async_stream(self):
+        """Test streaming with the async client."""
+        fake = FakeTransport(
+            routes={"History/retrieveBars": {"bars": [make_bar(i) for i in range(4)], **SUCCESS}}
+        )
+        client = AsyncProjectXClient(token="test-token", transport=AsyncFakeTransport(fake))
+
+        async def run():
+            stream = client.history.stream_bars("CON.F.US.ENQ.H25", START, START)
+            return [bar.close async for bar in stream]
+
+        assert asyncio.run(run()) == [21000.5, 21001.5, 21002.5, 21003.5]
@@ -0,0 +1,239 @@
+"""Tests for the on-disk token cache."""
+
+import multiprocessing
+import os
+import stat
+import threading
+import time
+
+import pytest
+
+from projectx_sdk import ProjectXClient
+from projectx_sdk.auth import Authenticator
+from projectx_sdk.token_cache import TokenCache
+from projectx_sdk.transport import FakeTransport
+
+BASE_URL = "https://api.example.com"
+SUCCESS = {"success": True, "errorCode": 0, "errorMessage": None}
+
+
+def _login_in_process(path, log_path):
+    """Log in through a shared cache, appending to a file for every real login."""
+
+    def login():
+        with open(log_path, "a") as f:
+            f.write("login\n")
+        time.sleep(0.1)
+        auth._set_token(f"token-{os.getpid()}")
+        return True
+
+    auth = Authenticator(BASE_URL, username="user", token_cache=TokenCache(path))
+    auth._login(login)
+    return auth.token
+
+
+def make_auth(fake, cache, **kwargs):
+    """Build an authenticator logging in with an API key over a fake transport."""
+    return Authenticator(
+        BASE_URL, username="user", api_key="key", transport=fake, token_cache=cache, **kwargs
+    )
+
+
+class TestTokenCache:
+    """Tests for the TokenCache class."""
+
+    def test_set_and_get(self, tmp_path):
+        """Test that a token is stored per base URL and user."""
+        cache = TokenCache(str(tmp_path / "tokens.json"))
+        cache.set(BASE_URL, "user", "abc", 3600)
+
+        token, expires_in = cache.get(BASE_URL, "user")
+        assert token == "abc"
+        assert 3590 < expires_in <= 3600
+        assert cache.get(BASE_URL, "other") is None
+        assert cache.get("https://other.example.com", "user") is None
+
+        # Another instance, as in another process, sees the token
+        assert TokenCache(cache.path).get(BASE_URL, "user")[0] == "abc"
+        assert cache.stats() == {"hits": 1, "misses": 2, "writes": 1, "errors": 0}
+
+    def test_file_is_private(self, tmp_path):
+        """Test that the cache file and its directory are accessible to the owner only."""
+        cache = TokenCache(str(tmp_path / "projectx" / "tokens.json"))
+        cache.set(BASE_URL, "user", "abc", 3600)
+
+        assert stat.S_IMODE(os.stat(cache.path).st_mode) == 0o600
+        assert stat.S_IMODE(os.stat(tmp_path / "projectx").st_mode) == 0o700
+        assert os.listdir(tmp_path / "projectx") == sorted(["tokens.json", "tokens.json.lock"])
+
+    def test_expiring_tokens_are_not_used(self, tmp_path):
+        """Test that tokens expiring within min_ttl count as missing."""
+        cache = TokenCache(str(tmp_path / "tokens.json"), min_ttl=60)
+        cache.set(BASE_URL, "user", "abc", 30)
+
+        assert cache.get(BASE_URL, "user") is None
+        with pytest.raises(ValueError):
+            TokenCache(min_ttl=-1)
+
+    def test_delete(self, tmp_path):
+        """Test that deleting a specific token keeps a newer one."""
+        cache = TokenCache(str(tmp_path / "tokens.json"))
+        cache.set(BASE_URL, "user", "new", 3600)
+
+        cache.delete(BASE_URL, "user", token="old")
+        assert cache.get(BASE_URL, "user")[0] == "new"
+        cache.delete(BASE_URL, "user", token="new")
+        assert cache.get(BASE_URL, "user") is None
+
+    def test_corrupt_file(self, tmp_path):
+        """Test that an unreadable cache file is treated as empty and replaced."""
+        path = tmp_path / "tokens.json"
+        path.write_text("{not json")
+        cache = TokenCache(str(path))
+
+        assert cache.get(BASE_URL, "user") is None
+        cache.set(BASE_URL, "user", "abc", 3600)
+        assert cache.get(BASE_URL, "user")[0] == "abc"
+        assert cache.stats()["errors"] == 2
+
+    def test_malformed_entries(self, tmp_path):
+        """Test that entries of the wrong shape count as errors and misses."""
+        path = tmp_path / "tokens.json"
+        path.write_text(
+            '{"%s": ["abc"], "https://other.example.com": {"user": "abc", "bob": 1}}' % BASE_URL
+        )
+        cache = TokenCache(str(path))
+
+        assert cache.get(BASE_URL, "user") is None
+        assert cache.get("https://other.example.com", "user") is None
+        cache.delete(BASE_URL, "user")
+        cache.delete("https://other.example.com", "bob", token="abc")
+        cache.delete("https://other.example.com", "user")
+        cache.set(BASE_URL, "user", "abc", 3600)
+
+        assert cache.get(BASE_URL, "user")[0] == "abc"
+        assert cache.stats()["misses"] == 2
+        assert cache.stats()["errors"] == 3
+
+        path.write_text("[]")
+        assert cache.get(BASE_URL, "user") is None
+        assert cache.stats()["errors"] == 4
+
+    def test_default_directory_is_tightened(self, tmp_path, monkeypatch):
+        """Test that an existing default directory is made owner-only, unlike a given one."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        (tmp_path / "projectx").mkdir(mode=0o755)
+        (tmp_path / "mine").mkdir(mode=0o755)
+        os.chmod(tmp_path / "projectx", 0o755)
+        os.chmod(tmp_path / "mine", 0o755)
+
+        TokenCache().set(BASE_URL, "user", "abc", 3600)
+        TokenCache(str(tmp_path / "mine" / "tokens.json")).set(BASE_URL, "user", "abc", 3600)
+
+        assert stat.S_IMODE(os.stat(tmp_path / "projectx").st_mode) == 0o700
+        assert stat.S_IMODE(os.stat(tmp_path / "mine").st_mode) == 0o755
+
+
+class TestAuthenticatorTokenCache:
+    """Tests for authenticators sharing a token cache."""
+
+    def test_second_login_uses_cached_token(self, tmp_path):
+        """Test that a process starting after another one does not log in."""
+        cache = TokenCache(str(tmp_path / "tokens.json"))
+        first, second = FakeTransport(), FakeTransport()
+
+        make_auth(first, cache)
+        auth = make_auth(second, TokenCache(cache.path))
+
+        assert [r.path for r in first.requests] == ["Auth/loginKey"]
+        assert second.requests == []
+        assert auth.token == "fake-token"
+        assert auth.expires_in() > 23 * 3600
+
+    def test_client_token_cache(self, tmp_path):
+        """Test that clients accept a token cache."""
+        cache = TokenCache(str(tmp_path / "tokens.json"))
+        cache.set(BASE_URL, "user", "cached", 3600)
+        fake = FakeTransport()
+
+        client = ProjectXClient(
+            username="user", api_key="key", base_url=BASE_URL, transport=fake, token_cache=cache
+        )
+
+        assert client.auth.token == "cached"
+        assert fake.requests == []
+
+    def test_refresh_adopts_token_renewed_elsewhere(self, tmp_path):
+        """Test that a token renewed by another process is used instead of validating."""
+        cache = TokenCache(str(tmp_path / "tokens.json"))
+        fake = FakeTransport()
+        auth = make_auth(fake, cache)
+        auth.token_expiry = None
+        cache.set(BASE_URL, "user", "renewed-elsewhere", 20 * 3600)
+
+        assert auth.get_token() == "renewed-elsewhere"
+        assert [r.path for r in fake.requests] == ["Auth/loginKey"]
+
+    def test_renewed_token_is_stored(self, tmp_path):
+        """Test that a token renewed by validation replaces the cached one."""
+        cache = TokenCache(str(tmp_path / "tokens.json"))
+        fake = FakeTransport()
+        fake.add_route("Auth/validate", {"newToken": "renewed-token", **SUCCESS})
+        auth = make_auth(fake, cache)
+
+        auth.refresh()
+
+        assert cache.get(BASE_URL, "user")[0] == "renewed-token"
+
+    def test_rejected_token_is_removed(self, tmp_path):
+        """Test that a token failing validation is removed from the cache."""
+        cache = TokenCache(str(tmp_path / "tokens.json"))
+        cache.set(BASE_URL, "user", "revoked", 3600)
+        fake = FakeTransport()
+        fake.add_route("Auth/validate", {"success": False, "errorCode": 1, "errorMessage": "no"})
+        auth = make_auth(fake, cache)
+
+        assert auth.token == "revoked"
+        auth.refresh()
+        assert cache.get(BASE_URL, "user") is None
+
+    def test_users_log_in_concurrently(self, tmp_path):
+        """Test that different users log in concurrently, while a user waits on its own login."""
+        cache = TokenCache(str(tmp_path / "tokens.json"))
+        logins = []
+
+        def log_in(username):
+            auth = Authenticator(BASE_URL, username=username, token_cache=cache)
+
+            def login():
+                logins.append(username)
+                time.sleep(0.2)
+                auth._set_token(f"token-{username}")
+                return True
+
+            auth._login(login)
+
+        users = ["alice", "bob", "carol", "dave", "alice", "bob"]
+        threads = [threading.Thread(target=log_in, args=(user,)) for user in users]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert time.perf_counter() - started < 0.35
+        assert sorted(logins) == ["alice", "bob", "carol", "dave"]
+        assert cache.get(BASE_URL, "carol")[0] == "token-carol"
+
+    def test_concurrent_processes_log_in_once(self, tmp_path):
+        """Test that processes starting together wait for one login and share its token."""
+        path = str(tmp_path / "tokens.json")
+        log_path = str(tmp_path / "logins.txt")
+        context = multiprocessing.get_context("spawn")
+
+        with context.Pool(4) as pool:
+            tokens = pool.starmap(_login_in_process, [(path, log_path)] * 4)
+
+        with open(log_path) as f:
+            assert f.read().count("login") == 1
+        assert len(set(tokens)) == 1
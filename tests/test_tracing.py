@@ -0,0 +1,297 @@
+"""Tests for tracing spans."""
+
+import asyncio
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from projectx_sdk import AsyncProjectXClient, ProjectXClient
+from projectx_sdk.auth import Authenticator
+from projectx_sdk.hedge import HedgePolicy
+from projectx_sdk.realtime.connection import SignalRConnection
+from projectx_sdk.realtime.market_hub import MarketHub
+from projectx_sdk.realtime.user_hub import UserHub
+from projectx_sdk.tracing import (
+    DEFAULT_MAX_SPANS,
+    NOOP_SPAN,
+    FileSpanExporter,
+    InMemorySpanExporter,
+    Tracer,
+    current_span,
+    parse_traceparent,
+    trace,
+)
+from projectx_sdk.transport import AsyncFakeTransport, FakeTransport
+
+SUCCESS = {"success": True, "errorCode": 0, "errorMessage": None}
+CONTRACT = "CON.F.US.ENQ.H25"
+
+
+@pytest.fixture
+def exporter():
+    """Provide an in-memory exporter."""
+    return InMemorySpanExporter()
+
+
+@pytest.fixture
+def tracer(exporter):
+    """Provide a tracer sampling every trace."""
+    return Tracer(exporter, sample_rates={})
+
+
+def by_name(exporter):
+    """Index exported spans by name."""
+    return {span.name: span for span in exporter.spans}
+
+
+def place_order(client):
+    """Place a market order on account 7."""
+    return client.orders.place(7, CONTRACT, 2, 0, 1)
+
+
+def make_client(tracer, **kwargs):
+    """Build a client answering Order/place with order 9."""
+    fake = FakeTransport(routes={"Order/place": {"orderId": 9, **SUCCESS}})
+    client = ProjectXClient(token="test-token", transport=fake, tracer=tracer, **kwargs)
+    return client, fake
+
+
+class TestTracer:
+    """Tests for the Tracer and Span classes."""
+
+    def test_parenting(self, tracer, exporter):
+        """Test that spans started within a span are its children."""
+        with tracer.start_span("outer", {"a": 1}) as outer:
+            with tracer.start_span("inner") as inner:
+                assert current_span() is inner
+            assert current_span() is outer
+        assert current_span() is None
+
+        spans = by_name(exporter)
+        assert spans["inner"].parent_id == outer.span_id
+        assert spans["inner"].trace_id == outer.trace_id
+        assert spans["outer"].parent_id is None
+        assert spans["outer"].attributes == {"a": 1}
+        assert [span.name for span in exporter.spans] == ["inner", "outer"]
+
+    def test_error_is_recorded(self, tracer, exporter):
+        """Test that an exception leaving the block marks the span."""
+        with pytest.raises(ZeroDivisionError):
+            with tracer.start_span("failing"):
+                1 / 0
+
+        assert exporter.spans[0].as_dict()["status"] == "error"
+
+    def test_sampling(self, exporter):
+        """Test that the root's sampling decision applies to the whole trace."""
+        tracer = Tracer(exporter, sample_rate=0.0, sample_rates={"important": 1.0})
+
+        with tracer.start_span("tick") as tick:
+            with tracer.start_span("important") as child:
+                assert not child.sampled
+                assert child.trace_id == tick.trace_id
+        with tracer.start_span("important"):
+            pass
+
+        assert [span.name for span in exporter.spans] == ["important"]
+
+    def test_default_rates_sample_market_ticks(self, exporter):
+        """Test that market tick roots are sampled sparingly by default."""
+        tracer = Tracer(exporter)
+        for _ in range(1000):
+            tracer.start_span("GatewayQuote").end()
+
+        assert len(exporter.spans) < 100
+
+    def test_disabled(self):
+        """Test that no tracer hands out the shared no-op span."""
+        with trace(None, "anything") as span:
+            assert span is NOOP_SPAN
+            assert current_span() is None
+            assert span.correlation_tag() is None
+
+    def test_traceparent(self, tracer):
+        """Test formatting and parsing traceparent strings."""
+        span = tracer.start_span("root")
+        span.end()
+
+        assert parse_traceparent(span.traceparent) == span.context
+        assert parse_traceparent("my order") is None
+        assert parse_traceparent(None) is None
+
+    def test_file_exporter(self, tmp_path):
+        """Test that the file exporter writes one JSON object per span."""
+        path = tmp_path / "traces.jsonl"
+        tracer = Tracer(FileSpanExporter(str(path)))
+
+        with tracer.start_span("outer"):
+            with tracer.start_span("inner", {"contract": CONTRACT}):
+                pass
+        tracer.shutdown()
+
+        records = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [record["name"] for record in records] == ["inner", "outer"]
+        assert records[0]["parent_id"] == records[1]["span_id"]
+        assert records[0]["attributes"] == {"contract": CONTRACT}
+
+    def test_default_exporter_is_bounded(self):
+        """Test that a tracer without an exporter keeps only the most recent spans."""
+        tracer = Tracer()
+        for i in range(DEFAULT_MAX_SPANS + 10):
+            tracer.start_span(f"span-{i}").end()
+
+        spans = tracer.exporter.spans
+        assert len(spans) == DEFAULT_MAX_SPANS
+        assert spans[-1].name == f"span-{DEFAULT_MAX_SPANS + 9}"
+
+    def test_exporter_errors_are_swallowed(self):
+        """Test that a failing exporter never affects the traced code."""
+        exporter = MagicMock()
+        exporter.export.side_effect = RuntimeError("disk full")
+
+        with Tracer(exporter).start_span("root"):
+            pass
+
+        exporter.export.assert_called_once()
+
+
+class TestClientTracing:
+    """Tests for spans of REST calls."""
+
+    def test_order_placement(self, tracer, exporter):
+        """Test the place span, its HTTP child and the correlation tag."""
+        client, fake = make_client(tracer)
+
+        assert place_order(client) == 9
+
+        spans = by_name(exporter)
+        place, http = spans["OrderService.place"], spans["POST Order/place"]
+        assert http.parent_id == place.span_id
+        assert http.attributes["http.status_code"] == 200
+        assert place.attributes["order_id"] == 9
+        assert fake.requests[0].json["customTag"] == place.traceparent
+
+    def test_user_tag_is_kept(self, tracer):
+        """Test that a caller's custom tag is never replaced."""
+        client, fake = make_client(tracer)
+
+        client.orders.place(7, CONTRACT, 2, 0, 1, custom_tag="mine")
+
+        assert fake.requests[0].json["customTag"] == "mine"
+
+    def test_untraced_orders_are_untagged(self):
+        """Test that orders are not tagged without a tracer."""
+        client, fake = make_client(None)
+
+        place_order(client)
+
+        assert fake.requests[0].json["customTag"] is None
+
+    def test_failed_request(self, tracer, exporter):
+        """Test that a failed attempt ends its span with the error."""
+        fake = FakeTransport(routes={"Order/searchOpen": (503, {"errorMessage": "down"})})
+        client = ProjectXClient(
+            token="test-token", transport=fake, tracer=tracer, retry_policy=False
+        )
+
+        with pytest.raises(Exception):
+            client.orders.search_open(7)
+
+        span = exporter.spans[0]
+        assert span.attributes["http.status_code"] == 503
+        assert span.error is not None
+
+    def test_hedged_attempts_keep_the_parent(self, tracer, exporter):
+        """Test that attempts run by the hedge pool stay in the caller's trace."""
+        fake = FakeTransport(routes={"Position/searchOpen": {"positions": [], **SUCCESS}})
+        hedge = HedgePolicy()
+        client = ProjectXClient(
+            token="test-token", transport=fake, tracer=tracer, hedge_policy=hedge
+        )
+
+        try:
+            with tracer.start_span("strategy") as strategy:
+                client.positions.search_open(7)
+        finally:
+            hedge.close()
+
+        assert by_name(exporter)["POST Position/searchOpen"].parent_id == strategy.span_id
+
+    def test_token_validation(self, tracer, exporter):
+        """Test the span around token validation."""
+        auth = Authenticator("https://api.example.com", token="t", transport=FakeTransport())
+        auth.tracer = tracer
+
+        auth.validate_token()
+
+        span = by_name(exporter)["Authenticator.validate_token"]
+        assert span.attributes["renewed"] is True
+
+    def test_async_client(self, tracer, exporter):
+        """Test that spans follow the task in the async client."""
+        fake = FakeTransport(routes={"Order/place": {"orderId": 9, **SUCCESS}})
+        client = AsyncProjectXClient(
+            token="test-token", transport=AsyncFakeTransport(fake), tracer=tracer
+        )
+
+        asyncio.run(client.orders.place(7, CONTRACT, 2, 0, 1))
+
+        spans = by_name(exporter)
+        assert spans["POST Order/place"].parent_id == spans["OrderService.place"].span_id
+
+
+class TestRealtimeTracing:
+    """Tests for spans of hub traffic and order correlation."""
+
+    def make_connection(self, hub, tracer):
+        """Build an unstarted connection tracing into the given tracer."""
+        return SignalRConnection(
+            hub_url=f"wss://gateway-rtc-demo.s2f.projectx.com/hubs/{hub}",
+            access_token="test-token",
+            tracer=tracer,
+        )
+
+    def test_order_lifecycle(self, tracer, exporter):
+        """Test tracing a quote callback through the order to its fill."""
+        client, fake = make_client(tracer)
+        market = MarketHub(self.make_connection("market", tracer))
+        user = UserHub(self.make_connection("user", tracer))
+        market._quote_callbacks[CONTRACT] = [lambda contract_id, data: place_order(client)]
+        user._order_callbacks["7"] = [lambda account_id, data: None]
+        user._trade_callbacks["7"] = [lambda account_id, data: None]
+
+        market._handle_quote(CONTRACT, {"lastPrice": 21000.25})
+        tag = fake.requests[0].json["customTag"]
+        user._handle_order_update(7, {"id": 9, "accountId": 7, "customTag": tag})
+        user._handle_trade_update(7, {"id": 1, "accountId": 7, "orderId": 9})
+
+        spans = by_name(exporter)
+        quote, place = spans["GatewayQuote"], spans["OrderService.place"]
+        assert len({span.trace_id for span in exporter.spans}) == 1
+        assert place.parent_id == quote.span_id
+        assert spans["GatewayUserOrder"].parent_id == place.span_id
+        assert spans["GatewayUserTrade"].parent_id == place.span_id
+
+    def test_user_tagged_orders_are_correlated(self, tracer, exporter):
+        """Test correlating events of an order the caller tagged."""
+        client, _ = make_client(tracer)
+        user = UserHub(self.make_connection("user", tracer))
+
+        client.orders.place(7, CONTRACT, 2, 0, 1, custom_tag="mine")
+        user._handle_order_update(7, {"id": 9, "customTag": "mine"})
+
+        spans = by_name(exporter)
+        assert spans["GatewayUserOrder"].parent_id == spans["OrderService.place"].span_id
+
+    def test_hub_invocation(self, tracer, exporter):
+        """Test the span around a hub method invocation."""
+        connection = self.make_connection("market", tracer)
+        connection._is_connected = True
+        connection._connection = MagicMock()
+
+        asyncio.run(connection.invoke("SubscribeContractQuotes", CONTRACT))
+
+        span = exporter.spans[0]
+        assert span.name == "SignalR.invoke SubscribeContractQuotes"
+        assert span.attributes == {"hub": "market", "method": "SubscribeContractQuotes"}
@@ -0,0 +1,170 @@
+"""Tests for the pluggable transports."""
+
+import asyncio
+import json
+import os
+import stat
+
+import pytest
+import requests
+
+from projectx_sdk import AsyncProjectXClient, ProjectXClient
+from projectx_sdk.exceptions import ProjectXError, RequestError
+from projectx_sdk.transport import (
+    AsyncFakeTransport,
+    FakeTransport,
+    RecordReplayTransport,
+    TransportResponse,
+)
+from projectx_sdk.utils.constants import OrderSide, OrderType
+
+
+class TestTransportResponse:
+    """Tests for the TransportResponse class."""
+
+    def test_from_json(self):
+        """Test building a JSON response."""
+        response = TransportResponse.from_json({"success": True}, status_code=201)
+
+        assert response.status_code == 201
+        assert response.ok is True
+        assert response.json() == {"success": True}
+        assert response.headers["Content-Type"] == "application/json"
+
+    def test_raise_for_status(self):
+        """Test that error statuses raise requests.HTTPError."""
+        response = TransportResponse.from_json({}, status_code=502)
+
+        with pytest.raises(requests.HTTPError):
+            response.raise_for_status()
+
+
+class TestFakeTransport:
+    """Tests for the FakeTransport class."""
+
+    def test_client_login_and_route(self, mock_order_response):
+        """Test a full client round trip against the fake."""
+        fake = FakeTransport()
+
+        @fake.route("Order/place")
+        def place(request):
+            assert request.json["type"] == int(OrderType.LIMIT)
+            return mock_order_response
+
+        client = ProjectXClient(username="test_user", api_key="test_api_key", transport=fake)
+        order_id = client.orders.place(
+            account_id=1,
+            contract_id="CON.F.US.ENQ.H25",
+            order_type=OrderType.LIMIT,
+            side=OrderSide.BUY,
+            size=1,
+            limit_price=15000.0,
+        )
+
+        assert order_id == 1234
+        assert client.auth.token == "fake-token"
+        assert [r.path for r in fake.requests] == ["Auth/loginKey", "Order/place"]
+        assert fake.stats()["requests"] == 2
+
+    def test_static_routes(self, mock_position_response):
+        """Test routes registered as static payloads."""
+        fake = FakeTransport(routes={"Position/searchOpen": mock_position_response})
+        client = ProjectXClient(token="test-token", transport=fake)
+
+        positions = client.positions.search_open(1)
+
+        assert len(positions) == 2
+        assert positions[0].average_price == 15000.0
+
+    def test_status_tuple_and_unknown_route(self):
+        """Test error statuses and unrouted paths."""
+        fake = FakeTransport(routes={"Order/cancel": lambda request: (500, {"success": False})})
+        client = ProjectXClient(token="test-token", transport=fake)
+
+        with pytest.raises(RequestError) as excinfo:
+            client.orders.cancel(1, 2)
+        assert excinfo.value.error_code == 500
+
+        with pytest.raises(ProjectXError) as excinfo:
+            client.post("Unknown/endpoint", json={})
+        assert "Resource not found" in str(excinfo.value)
+
+    def test_network_failure(self):
+        """Test that handler exceptions surface as request errors."""
+
+        def fail(request):
+            raise requests.ConnectionError("connection reset")
+
+        fake = FakeTransport(routes={"Trade/search": fail})
+        client = ProjectXClient(token="test-token", transport=fake)
+
+        with pytest.raises(RequestError) as excinfo:
+            client.post("Trade/search", json={})
+        assert "connection reset" in str(excinfo.value)
+
+    def test_async_fake(self, mock_order_list_response):
+        """Test the async view of a fake transport."""
+        pytest.importorskip("httpx")
+        fake = FakeTransport(routes={"Order/searchOpen": mock_order_list_response})
+
+        async def run():
+            client = AsyncProjectXClient(token="test-token", transport=AsyncFakeTransport(fake))
+            return await client.orders.search_open(1)
+
+        orders = asyncio.run(run())
+
+        assert len(orders) == 2
+        assert fake.requests[-1].path == "Order/searchOpen"
+
+
+class TestRecordReplayTransport:
+    """Tests for the RecordReplayTransport class."""
+
+    def test_invalid_mode(self, tmp_path):
+        """Test that unknown modes are rejected."""
+        with pytest.raises(ValueError):
+            RecordReplayTransport(str(tmp_path / "cassette.json"), mode="bogus")
+
+    def test_record_then_replay(self, tmp_path, mock_contract_response):
+        """Test recording live responses and replaying them offline."""
+        cassette = str(tmp_path / "cassette.json")
+        live = FakeTransport(routes={"Contract/search": mock_contract_response})
+
+        recorder = RecordReplayTransport(cassette, mode="record", inner=live)
+        client = ProjectXClient(username="test_user", api_key="secret-key", transport=recorder)
+        recorded = client.contracts.search("NQ")
+
+        # Credentials and tokens never reach the disk, and the file is private
+        with open(cassette, "r", encoding="utf-8") as fh:
+            contents = fh.read()
+        assert "secret-key" not in contents
+        assert "fake-token" not in contents
+        assert stat.S_IMODE(os.stat(cassette).st_mode) == 0o600
+
+        replayer = RecordReplayTransport(cassette, mode="replay")
+        client = ProjectXClient(
+            username="test_user", api_key="secret-key", transport=replayer, retry_policy=False
+        )
+        replayed = client.contracts.search("NQ")
+
+        assert [c.id for c in replayed] == [c.id for c in recorded]
+        assert replayer.stats()["hits"] == 2
+
+        # A request that was never recorded fails instead of reaching the network
+        with pytest.raises(RequestError):
+            client.contracts.search("ES")
+        assert replayer.stats()["misses"] == 1
+
+    def test_auto_mode_records_missing(self, tmp_path):
+        """Test that auto mode only forwards unrecorded requests."""
+        cassette = str(tmp_path / "cassette.json")
+        live = FakeTransport(routes={"Order/searchOpen": {"success": True, "orders": []}})
+        transport = RecordReplayTransport(cassette, mode="auto", inner=live)
+        client = ProjectXClient(token="test-token", transport=transport)
+
+        client.orders.search_open(1)
+        client.orders.search_open(1)
+
+        assert len(live.requests) == 1
+        with open(cassette, "r", encoding="utf-8") as fh:
+            assert len(json.load(fh)["interactions"]) == 1